@@ -34,6 +34,11 @@ class AsyncTranscriptionIntegrator:
     def stop_async_support(self):
         """Stop async support and cleanup resources."""
         if self.executor:
+            try:
+                # Close pooled API connections on the loop that owns them
+                self.executor.run_async(self.async_service.close())
+            except Exception as e:
+                logger.warning(f"Error closing transcription HTTP session: {e}")
             self.executor.stop()
             self.executor = None
     
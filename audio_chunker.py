@@ -5,6 +5,7 @@ Splits large audio files into API-compatible chunks with overlap for continuity.
 """
 
 import os
+import sys
 import subprocess
 from pathlib import Path
 from dataclasses import dataclass
@@ -27,6 +28,16 @@ try:
 except ImportError:
     STREAMING_AVAILABLE = False
 
+# Silence-aligned boundary planning runs on the shared decoded PCM
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+try:
+    import numpy as np
+    from audio.trimming import AudioTrimmer
+    from audio.pcm_cache import get_pcm_cache
+    SILENCE_PLANNING_AVAILABLE = True
+except ImportError:
+    SILENCE_PLANNING_AVAILABLE = False
+
 @dataclass
 class AudioChunk:
     """Container for audio chunk information."""
@@ -53,6 +64,21 @@ class AudioChunk:
             'overlap_start': round(self.overlap_start, 2),
             'overlap_end': round(self.overlap_end, 2)
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'AudioChunk':
+        """Rebuild a chunk from its serialized form."""
+        return cls(
+            chunk_index=data['chunk_index'],
+            file_path=Path(data['file_path']),
+            start_time=data['start_time'],
+            end_time=data['end_time'],
+            duration=data['duration'],
+            file_size_bytes=data['file_size_bytes'],
+            file_size_mb=data['file_size_mb'],
+            overlap_start=data.get('overlap_start', 0.0),
+            overlap_end=data.get('overlap_end', 0.0)
+        )
 
 @dataclass
 class ChunkingResult:
@@ -64,6 +90,8 @@ class ChunkingResult:
     overlap_duration: float
     metadata_file: Path
     created_at: str
+    source_signature: Optional[str] = None  # Size/mtime of the original file, used to resume
+    resumed: bool = False
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -74,8 +102,28 @@ class ChunkingResult:
             'temp_directory': str(self.temp_directory),
             'overlap_duration': self.overlap_duration,
             'metadata_file': str(self.metadata_file),
-            'created_at': self.created_at
+            'created_at': self.created_at,
+            'source_signature': self.source_signature
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ChunkingResult':
+        """Rebuild a chunking result from chunking_metadata.json contents."""
+        return cls(
+            original_file=Path(data['original_file']),
+            chunks=[AudioChunk.from_dict(chunk) for chunk in data['chunks']],
+            total_chunks=data['total_chunks'],
+            temp_directory=Path(data['temp_directory']),
+            overlap_duration=data['overlap_duration'],
+            metadata_file=Path(data['metadata_file']),
+            created_at=data['created_at'],
+            source_signature=data.get('source_signature')
+        )
+    
+    @property
+    def checkpoint_dir(self) -> Path:
+        """Directory holding per-chunk transcription checkpoints."""
+        return self.temp_directory / 'checkpoints'
 
 class AudioChunker:
     """System for splitting large audio files into API-compatible chunks."""
@@ -83,8 +131,17 @@ class AudioChunker:
     def __init__(self, temp_base_dir: Optional[Path] = None, use_streaming: bool = True):
         """Initialize the audio chunker."""
         self.analyzer = AudioAnalyzer()
-        self.overlap_duration = 30.0  # 30 seconds overlap
+        self.overlap_duration = 3.0  # Seconds of overlap on each side; cuts land in pauses and stitching removes duplicates
         self.max_chunk_size_mb = 20.0  # Safe under 25MB API limit
+        
+        # Boundary planning: snap each cut to the longest pause near its ideal position
+        self.boundary_tolerance = 45.0  # Max seconds a cut may move from its ideal position
+        self.pause_params = {
+            "silence_threshold": "-35dB",  # Quieter than room noise between speakers
+            "min_silence_duration": "0.3"  # Sentence-level pauses
+        }
+        self.size_safety_margin = 0.95  # Headroom for VBR variation when estimating chunk sizes
+        self.trimmer = AudioTrimmer() if SILENCE_PLANNING_AVAILABLE else None
         self.temp_base_dir = temp_base_dir or Path(__file__).parent / 'output' / 'temp_chunks'
         self.temp_base_dir.mkdir(parents=True, exist_ok=True)
         self.use_streaming = use_streaming and STREAMING_AVAILABLE
@@ -142,7 +199,8 @@ class AudioChunker:
                 temp_directory=temp_dir,
                 overlap_duration=self.overlap_duration,
                 metadata_file=metadata_file,
-                created_at=datetime.now().isoformat()
+                created_at=datetime.now().isoformat(),
+                source_signature=self._source_signature(audio_file)
             )
             
             # Save metadata
@@ -161,8 +219,21 @@ class AudioChunker:
                 shutil.rmtree(temp_dir)
             raise
     
-    def chunk_audio_file(self, audio_file: Path, hearing_id: Optional[str] = None) -> ChunkingResult:
-        """Split an audio file into chunks suitable for API processing."""
+    def chunk_audio_file(self, audio_file: Path, hearing_id: Optional[str] = None, 
+                         resume: bool = False) -> ChunkingResult:
+        """
+        Split an audio file into chunks suitable for API processing.
+        
+        Args:
+            audio_file: Audio file to split
+            hearing_id: Hearing ID used to name the chunk directory
+            resume: Reuse chunks left by an interrupted run of the same file if present
+        """
+        if resume:
+            previous = self.find_resumable_chunks(audio_file, hearing_id)
+            if previous:
+                print(f"♻️  Resuming with {previous.total_chunks} existing chunks in {previous.temp_directory}")
+                return previous
         
         # Analyze the audio file first
         analysis = self.analyzer.analyze_file(audio_file)
@@ -198,12 +269,12 @@ class AudioChunker:
                 temp_directory=temp_dir,
                 overlap_duration=self.overlap_duration,
                 metadata_file=metadata_file,
-                created_at=datetime.now().isoformat()
+                created_at=datetime.now().isoformat(),
+                source_signature=self._source_signature(audio_file)
             )
             
             # Save metadata
-            with open(metadata_file, 'w') as f:
-                json.dump(result.to_dict(), f, indent=2)
+            self._save_metadata(result)
             
             print(f"✅ Successfully created {len(chunks)} chunks in {temp_dir}")
             return result
@@ -215,62 +286,256 @@ class AudioChunker:
                 shutil.rmtree(temp_dir)
             raise e
     
+    def _source_signature(self, audio_file: Path) -> str:
+        """Identify the exact source file and chunking settings a chunk set came from."""
+        stat = Path(audio_file).stat()
+        return f"{Path(audio_file).resolve()}|{stat.st_size}|{stat.st_mtime_ns}|{self.overlap_duration}|{self.max_chunk_size_mb}"
+    
+    def _save_metadata(self, result: ChunkingResult):
+        """Write chunking_metadata.json next to the chunks."""
+        with open(result.metadata_file, 'w') as f:
+            json.dump(result.to_dict(), f, indent=2)
+    
+    def find_resumable_chunks(self, audio_file: Path, hearing_id: Optional[str] = None) -> Optional[ChunkingResult]:
+        """
+        Find the most recent complete chunk set for this file left by an earlier run.
+        
+        Returns:
+            ChunkingResult marked as resumed, or None if no valid chunk set exists
+        """
+        signature = self._source_signature(audio_file)
+        hearing_prefix = hearing_id or "unknown"
+        
+        candidates = sorted(
+            self.temp_base_dir.glob(f"{hearing_prefix}_*/chunking_metadata.json"),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True
+        )
+        
+        for metadata_file in candidates:
+            try:
+                with open(metadata_file, 'r') as f:
+                    result = ChunkingResult.from_dict(json.load(f))
+            except (json.JSONDecodeError, KeyError, OSError) as e:
+                print(f"⚠️  Ignoring unreadable chunk metadata {metadata_file}: {e}")
+                continue
+            
+            if result.source_signature != signature:
+                continue
+            
+            if not self._validate_chunks(result.chunks):
+                continue
+            
+            # Chunk files must be exactly what was written (no truncated ffmpeg output)
+            if any(chunk.file_path.stat().st_size != chunk.file_size_bytes for chunk in result.chunks):
+                continue
+            
+            result.resumed = True
+            return result
+        
+        return None
+    
+    def save_chunk_checkpoint(self, result: ChunkingResult, chunk_index: int, 
+                              transcription: Optional[Dict[str, Any]] = None,
+                              error: Optional[str] = None):
+        """
+        Record the outcome of transcribing one chunk.
+        
+        Args:
+            result: Chunking result the chunk belongs to
+            chunk_index: Index of the chunk
+            transcription: Transcription result on success
+            error: Error message on failure
+        """
+        checkpoint_dir = result.checkpoint_dir
+        checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        
+        checkpoint = {
+            'chunk_index': chunk_index,
+            'status': 'failed' if error else 'completed',
+            'error': error,
+            'saved_at': datetime.now().isoformat(),
+            'result': transcription
+        }
+        
+        checkpoint_file = checkpoint_dir / f"chunk_{chunk_index:03d}.json"
+        tmp_file = checkpoint_file.with_suffix('.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump(checkpoint, f)
+        # Atomic rename so a crash mid-write never leaves a half checkpoint
+        tmp_file.replace(checkpoint_file)
+    
+    def load_chunk_checkpoints(self, result: ChunkingResult) -> Dict[int, Dict[str, Any]]:
+        """
+        Load transcription results of chunks that already completed.
+        
+        Returns:
+            Mapping of chunk index to saved transcription result (failed chunks omitted)
+        """
+        completed = {}
+        if not result.checkpoint_dir.exists():
+            return completed
+        
+        for checkpoint_file in result.checkpoint_dir.glob("chunk_*.json"):
+            try:
+                with open(checkpoint_file, 'r') as f:
+                    checkpoint = json.load(f)
+            except (json.JSONDecodeError, OSError):
+                continue
+            
+            if checkpoint.get('status') == 'completed' and checkpoint.get('result') is not None:
+                completed[checkpoint['chunk_index']] = checkpoint['result']
+        
+        return completed
+    
     def _calculate_chunk_parameters(self, analysis: AudioAnalysis) -> Dict[str, Any]:
-        """Calculate optimal chunk parameters based on audio analysis."""
+        """Calculate chunk boundaries, snapping cuts to pauses where possible."""
         
-        # Calculate target chunk duration in seconds
         total_duration = analysis.duration_seconds
-        target_chunks = analysis.estimated_chunks
+        target_chunks = max(1, analysis.estimated_chunks)
         
-        # Account for overlap in duration calculation
-        # Each chunk (except first and last) will have overlap on both sides
-        effective_overlap_per_chunk = self.overlap_duration
-        total_overlap_duration = (target_chunks - 1) * effective_overlap_per_chunk
+        cut_points, boundary_method = self._plan_cut_points(analysis, target_chunks)
         
         # Chunk duration without overlap
-        base_chunk_duration = (total_duration - total_overlap_duration) / target_chunks
+        base_chunk_duration = total_duration / (len(cut_points) + 1)
         
         # Actual chunk duration including overlap
-        chunk_duration = base_chunk_duration + self.overlap_duration
+        chunk_duration = base_chunk_duration + 2 * self.overlap_duration
+        
+        print(f"✂️  Planned {len(cut_points) + 1} chunks ({boundary_method} boundaries)")
         
         return {
-            'target_chunks': target_chunks,
+            'target_chunks': len(cut_points) + 1,
             'chunk_duration': chunk_duration,
             'base_chunk_duration': base_chunk_duration,
             'overlap_duration': self.overlap_duration,
-            'total_duration': total_duration
+            'total_duration': total_duration,
+            'cut_points': cut_points,
+            'boundary_method': boundary_method
         }
     
-    def _create_chunks(self, audio_file: Path, temp_dir: Path, chunk_params: Dict[str, Any]) -> List[AudioChunk]:
-        """Create audio chunks using ffmpeg."""
-        chunks = []
+    def _plan_cut_points(self, analysis: AudioAnalysis, target_chunks: int) -> tuple:
+        """
+        Plan where chunks are cut.
+        
+        Each cut starts from an even split of the remaining audio and moves to the
+        longest pause within boundary_tolerance, or to the quietest moment if the
+        window has no pause. Cuts never let a chunk (with overlap) exceed max_chunk_size_mb.
+        
+        Returns:
+            (cut times in seconds, 'silence_aligned' or 'uniform')
+        """
+        total_duration = analysis.duration_seconds
+        uniform = [total_duration * k / target_chunks for k in range(1, target_chunks)]
+        
+        if not SILENCE_PLANNING_AVAILABLE or total_duration <= 0 or target_chunks <= 1:
+            return uniform, 'uniform'
+        
+        try:
+            pcm = get_pcm_cache().get(analysis.file_path)
+            pauses = self.trimmer._detect_silence_pcm(pcm, self.pause_params)['silence_segments']
+        except Exception as e:
+            print(f"⚠️  Pause detection unavailable, using uniform boundaries: {e}")
+            return uniform, 'uniform'
+        
+        # Longest span whose estimated encoded size (overlap included) stays under the limit
+        bytes_per_second = analysis.file_size_bytes / total_duration
+        max_bytes = self.max_chunk_size_mb * 1024 * 1024 * self.size_safety_margin
+        max_span = max_bytes / bytes_per_second - 2 * self.overlap_duration
+        if max_span <= 2 * self.overlap_duration:
+            return uniform, 'uniform'
         
-        base_duration = chunk_params['base_chunk_duration']
+        cut_points = []
+        start = 0.0
+        
+        while True:
+            remaining_duration = total_duration - start
+            remaining_chunks = max(target_chunks - len(cut_points), 1)
+            if remaining_chunks == 1:
+                if remaining_duration <= max_span:
+                    break
+                remaining_chunks = 2  # Snapping pushed the tail over the size limit
+            
+            ideal = start + remaining_duration / remaining_chunks
+            tolerance = min(self.boundary_tolerance, (ideal - start) * 0.15)
+            window_end = min(ideal + tolerance, start + max_span)
+            window_start = max(min(ideal - tolerance, window_end), start + 2 * self.overlap_duration)
+            
+            cut = self._snap_cut(pcm, pauses, window_start, window_end, ideal)
+            cut_points.append(cut)
+            start = cut
+        
+        return cut_points, 'silence_aligned'
+    
+    def _snap_cut(self, pcm, pauses: List[Dict[str, Any]], window_start: float, 
+                  window_end: float, ideal: float) -> float:
+        """Pick the cut time within a window: middle of the longest pause, else the quietest frame."""
+        best = None
+        for pause in pauses:
+            if pause['end'] < window_start or pause['start'] > window_end:
+                continue
+            
+            midpoint = min(max((pause['start'] + pause['end']) / 2, window_start), window_end)
+            score = (pause['duration'], -abs(midpoint - ideal))
+            if best is None or score > best[0]:
+                best = (score, midpoint)
+        
+        if best is not None:
+            return best[1]
+        
+        # RMS fallback over 100ms frames of the decoded window
+        frame_size = max(1, int(pcm.sample_rate * 0.1))
+        samples = pcm.slice(window_start, window_end)
+        n_frames = len(samples) // frame_size
+        if n_frames == 0:
+            return ideal if window_start <= ideal <= window_end else window_end
+        
+        frames = np.asarray(samples[:n_frames * frame_size], dtype=np.float32).reshape(n_frames, frame_size)
+        rms = np.sqrt(np.mean(frames ** 2, axis=1))
+        quietest = int(np.argmin(rms))
+        return window_start + (quietest + 0.5) * frame_size / pcm.sample_rate
+    
+    def _chunk_spans(self, chunk_params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Chunk start/end times (overlap included) from the planned cut points."""
         overlap = chunk_params['overlap_duration']
         total_duration = chunk_params['total_duration']
+        boundaries = [0.0] + list(chunk_params['cut_points']) + [total_duration]
         
-        current_start = 0.0
-        chunk_index = 0
-        
-        while current_start < total_duration:
-            # Calculate chunk end time
-            chunk_end = min(current_start + base_duration + overlap, total_duration)
+        spans = []
+        for chunk_index in range(len(boundaries) - 1):
+            is_first = chunk_index == 0
+            is_last = chunk_index == len(boundaries) - 2
             
-            # For the first chunk, no overlap at the beginning
-            actual_start = current_start
-            if chunk_index > 0:
-                actual_start = max(0, current_start - overlap)
+            # No overlap before the first chunk or after the last one
+            start_time = boundaries[chunk_index] if is_first else max(0.0, boundaries[chunk_index] - overlap)
+            end_time = boundaries[chunk_index + 1] if is_last else min(total_duration, boundaries[chunk_index + 1] + overlap)
             
-            # Calculate overlap information
-            overlap_start = 0.0 if chunk_index == 0 else overlap
-            overlap_end = 0.0 if chunk_end >= total_duration else overlap
+            spans.append({
+                'chunk_index': chunk_index,
+                'start_time': start_time,
+                'end_time': end_time,
+                'duration': end_time - start_time,
+                'overlap_start': 0.0 if is_first else overlap,
+                'overlap_end': 0.0 if is_last else overlap
+            })
+        
+        return spans
+    
+    def _create_chunks(self, audio_file: Path, temp_dir: Path, chunk_params: Dict[str, Any]) -> List[AudioChunk]:
+        """Create audio chunks using ffmpeg."""
+        chunks = []
+        
+        for span in self._chunk_spans(chunk_params):
+            chunk_index = span['chunk_index']
+            actual_start = span['start_time']
+            chunk_end = span['end_time']
             
             # Create chunk file
             chunk_filename = f"chunk_{chunk_index:03d}.mp3"
             chunk_path = temp_dir / chunk_filename
             
             # Extract chunk using ffmpeg
-            self._extract_chunk(audio_file, chunk_path, actual_start, chunk_end - actual_start)
+            self._extract_chunk(audio_file, chunk_path, actual_start, span['duration'])
             
             # Get chunk file info
             chunk_size = chunk_path.stat().st_size
@@ -282,21 +547,17 @@ class AudioChunker:
                 file_path=chunk_path,
                 start_time=actual_start,
                 end_time=chunk_end,
-                duration=chunk_end - actual_start,
+                duration=span['duration'],
                 file_size_bytes=chunk_size,
                 file_size_mb=chunk_size_mb,
-                overlap_start=overlap_start,
-                overlap_end=overlap_end
+                overlap_start=span['overlap_start'],
+                overlap_end=span['overlap_end']
             )
             
             chunks.append(chunk)
             
             print(f"📦 Created chunk {chunk_index}: {chunk_size_mb:.2f}MB, "
                   f"{chunk.duration:.1f}s ({actual_start:.1f}s - {chunk_end:.1f}s)")
-            
-            # Move to next chunk
-            current_start += base_duration
-            chunk_index += 1
         
         return chunks
     
@@ -364,40 +625,7 @@ class AudioChunker:
     
     def _create_chunk_specifications(self, chunk_params: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Create chunk specifications for streaming processor."""
-        specs = []
-        
-        base_duration = chunk_params['base_chunk_duration']
-        overlap = chunk_params['overlap_duration']
-        total_duration = chunk_params['total_duration']
-        
-        current_start = 0.0
-        chunk_index = 0
-        
-        while current_start < total_duration:
-            # Calculate chunk end time
-            chunk_end = min(current_start + base_duration + overlap, total_duration)
-            
-            # For the first chunk, no overlap at the beginning
-            actual_start = current_start
-            if chunk_index > 0:
-                actual_start = max(0, current_start - overlap)
-            
-            spec = {
-                'chunk_index': chunk_index,
-                'start_time': actual_start,
-                'duration': chunk_end - actual_start,
-                'end_time': chunk_end,
-                'overlap_start': 0.0 if chunk_index == 0 else overlap,
-                'overlap_end': 0.0 if chunk_end >= total_duration else overlap
-            }
-            
-            specs.append(spec)
-            
-            # Move to next chunk start
-            current_start += base_duration
-            chunk_index += 1
-            
-        return specs
+        return self._chunk_spans(chunk_params)
     
     def _create_chunk_objects_from_files(self, chunk_paths: List[str], 
                                        chunk_specs: List[Dict[str, Any]], 
@@ -16,19 +16,21 @@ import logging
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
-import sqlite3
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 # Direct import from database_enhanced
-import sqlite3
 import os
 
+from api.search_index import index_transcript
+from api.transcript_catalog import catalog_transcript
+from storage.connection_pool import get_connection_pool
+
 def get_demo_db():
-    """Get demo database connection"""
+    """Get pooled demo database connection (close() returns it to the pool)"""
     db_path = Path(__file__).parent / 'data' / 'demo_enhanced_ui.db'
-    return sqlite3.connect(str(db_path))
+    return get_connection_pool(str(db_path)).acquire()
 
 # Use direct database connection instead of the complex import
 
@@ -180,6 +182,15 @@ class HearingProcessor:
             with open(transcript_file, 'w') as f:
                 json.dump(mock_transcript, f, indent=2)
             
+            # Index the new transcript's segments for search and list it in the catalog
+            conn = get_demo_db()
+            try:
+                index_transcript(conn, hearing['id'], mock_transcript)
+                catalog_transcript(conn, transcript_file, mock_transcript)
+                conn.commit()
+            finally:
+                conn.close()
+            
             logger.info(f"📄 Created mock transcript: {transcript_file}")
             
         except Exception as e:
@@ -446,7 +446,7 @@ const CommitteeDetail = ({ committee, onBack, onViewDetails }) => {
                       <div className="detail-row">
                         <span className="detail-label">Streams:</span>
                         <span className="detail-value">
-                          {Object.keys(hearing.streams || {}).join(', ') || 'None'}
+                          {(hearing.stream_types || []).join(', ') || 'None'}
                         </span>
                       </div>
                       <div className="detail-row">
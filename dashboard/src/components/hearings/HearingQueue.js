@@ -114,7 +114,7 @@ const HearingQueue = ({ onViewDetails, onTriggerCapture }) => {
           hearing_type: 'Executive Session',
           sync_status: 'synced',
           has_streams: true,
-          streams: { 'isvp': 'http://example.com/stream1' },
+          stream_types: ['isvp'],
           review_priority: 8,
           review_status: 'pending',
           sync_confidence: 0.95,
@@ -130,7 +130,7 @@ const HearingQueue = ({ onViewDetails, onTriggerCapture }) => {
           hearing_type: 'Oversight Hearing',
           sync_status: 'synced',
           has_streams: false,
-          streams: {},
+          stream_types: [],
           review_priority: 5,
           review_status: 'in_progress',
           sync_confidence: 0.78,
@@ -473,7 +473,7 @@ const HearingQueue = ({ onViewDetails, onTriggerCapture }) => {
                           color: hearing.has_streams ? '#10b981' : '#ef4444'
                         }}>
                           {hearing.has_streams ? <CheckCircle size={16} /> : <AlertCircle size={16} />}
-                          {hearing.has_streams ? `${Object.keys(hearing.streams).length} available` : 'None found'}
+                          {hearing.has_streams ? `${hearing.stream_types.length} available` : 'None found'}
                         </div>
                       </div>
 
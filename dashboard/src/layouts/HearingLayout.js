@@ -41,14 +41,8 @@ const HearingLayout = () => {
 
       // Fetch transcript if available
       try {
-        const transcriptResponse = await fetch(`${config.apiUrl}/transcript-browser/hearings`);
-        if (transcriptResponse.ok) {
-          const transcriptData = await transcriptResponse.json();
-          const hearingTranscript = transcriptData.transcripts.find(
-            t => t.hearing_id === parseInt(id)
-          );
-          setTranscript(hearingTranscript || null);
-        }
+        const transcriptResponse = await fetch(`${config.apiUrl}/transcript-browser/content/${id}`);
+        setTranscript(transcriptResponse.ok ? await transcriptResponse.json() : null);
       } catch (transcriptError) {
         console.warn('Failed to fetch transcript:', transcriptError);
         setTranscript(null);
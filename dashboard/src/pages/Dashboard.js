@@ -107,8 +107,8 @@ const Dashboard = () => {
           ...hearing,
           has_transcript: !!transcript,
           transcript_confidence: transcript?.confidence || 0,
-          transcript_segments: transcript?.segments?.length || 0,
-          speaker_review_status: calculateSpeakerReviewStatus(transcript)
+          transcript_segments: transcript?.segment_count || 0,
+          speaker_review_status: transcript?.speaker_review_status || 'no_transcript'
         };
       });
 
@@ -122,19 +122,6 @@ const Dashboard = () => {
     }
   };
 
-  const calculateSpeakerReviewStatus = (transcript) => {
-    if (!transcript?.segments) return 'no_transcript';
-    
-    const segments = transcript.segments;
-    const unknownSpeakers = segments.filter(s => 
-      s.speaker === 'UNKNOWN' || s.speaker === 'Speaker' || !s.speaker
-    ).length;
-    
-    if (unknownSpeakers === 0) return 'complete';
-    if (unknownSpeakers < segments.length / 2) return 'partial';
-    return 'needs_review';
-  };
-
   const applyFiltersAndSort = () => {
     let filtered = [...hearings];
 
@@ -4,6 +4,7 @@ Comprehensive Hearing Discovery Engine
 Discovers hearings across all Senate committees with ISVP detection
 """
 
+import sys
 import json
 import requests
 from pathlib import Path
@@ -17,6 +18,11 @@ from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
 import hashlib
 
+# Add src to path
+sys.path.append(str(Path(__file__).parent / 'src'))
+
+from sync.http_cache import get_http_cache
+
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -101,6 +107,24 @@ class HearingDiscoveryEngine:
         self.session.headers.update({
             'User-Agent': 'Senate Hearing Discovery System (Research/Academic)'
         })
+        
+        # Conditional requests, and hearings already cataloged by an earlier run
+        self.cache = get_http_cache()
+        self.known_hearings = self._load_known_hearings()
+    
+    def _load_known_hearings(self, catalog_file: str = "hearing_catalog.json") -> Dict[str, Hearing]:
+        """Hearings saved by the previous discovery run, by hearing ID"""
+        catalog_path = self.output_dir / catalog_file
+        if not catalog_path.exists():
+            return {}
+        
+        try:
+            with open(catalog_path, 'r') as f:
+                catalog = json.load(f)
+            return {hearing_id: Hearing(**hearing) for hearing_id, hearing in catalog.get("hearings", {}).items()}
+        except Exception as e:
+            logger.warning(f"Failed to load previous hearing catalog: {e}")
+            return {}
     
     def _load_committees(self) -> Dict:
         """Load committee structure"""
@@ -128,17 +152,28 @@ class HearingDiscoveryEngine:
         
         try:
             # Get committee main page
-            response = self.session.get(website_url, timeout=15)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
+            entry, changed = self.cache.fetch(self.session, website_url, timeout=15)
             
-            # Look for hearing-related links
-            hearing_links = self._find_hearing_links(soup, website_url)
+            if not changed and entry.parsed is not None:
+                # Main page unchanged since it was last parsed
+                hearing_links = entry.parsed
+            else:
+                soup = BeautifulSoup(entry.body, 'html.parser')
+                
+                # Look for hearing-related links
+                hearing_links = self._find_hearing_links(soup, website_url)
+                self.cache.set_parsed(website_url, hearing_links)
             
             # Extract hearing information
             for link_info in hearing_links:
                 try:
+                    hearing_id = self._generate_hearing_id(committee_code, link_info['text'], link_info.get('date'))
+                    if hearing_id in self.known_hearings:
+                        # Cataloged by an earlier run; its page is not fetched again
+                        self.cache.record(link_info['url'], 'skipped')
+                        hearings.append(self.known_hearings[hearing_id])
+                        continue
+                    
                     hearing = self._extract_hearing_info(link_info, committee_code, committee_data)
                     if hearing:
                         hearings.append(hearing)
@@ -233,10 +268,13 @@ class HearingDiscoveryEngine:
         hearing_url = link_info['url']
         
         try:
-            response = self.session.get(hearing_url, timeout=10)
-            response.raise_for_status()
+            entry, changed = self.cache.fetch(self.session, hearing_url, timeout=10)
+            
+            if not changed and entry.parsed is not None:
+                # Page unchanged since it was last parsed
+                return Hearing(**entry.parsed)
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(entry.body, 'html.parser')
             
             # Generate hearing ID
             hearing_id = self._generate_hearing_id(committee_code, link_info['text'], link_info.get('date'))
@@ -298,6 +336,8 @@ class HearingDiscoveryEngine:
             # Calculate processing priority
             hearing.processing_priority = self._calculate_processing_priority(hearing)
             
+            self.cache.set_parsed(hearing_url, asdict(hearing))
+            
             return hearing
             
         except Exception as e:
@@ -611,6 +651,7 @@ class HearingDiscoveryEngine:
         
         self.discovered_hearings = all_hearings
         logger.info(f"Total hearings discovered: {len(all_hearings)}")
+        logger.info(f"Page cache hit rates: {self.cache.get_domain_stats()}")
         
         return all_hearings
     
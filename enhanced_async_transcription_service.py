@@ -5,6 +5,7 @@ Implements concurrent chunk processing with rate limiting and resource optimizat
 """
 
 import os
+import sys
 import json
 import sqlite3
 import requests
@@ -22,8 +23,14 @@ import logging
 
 from audio_analyzer import AudioAnalyzer
 from audio_chunker import AudioChunker, ChunkingResult, AudioChunk
+from transcript_stitcher import TranscriptStitcher
 from progress_tracker import progress_tracker
 
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+from transcription.result_cache import get_transcription_cache
+from api.search_index import index_transcript
+from api.transcript_catalog import catalog_transcript
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -73,6 +80,7 @@ class ParallelProgressTracker:
         self.chunk_states = {}
         self.processing_start_times = {}
         self.chunk_velocities = {}
+        self.resumed_chunks = set()
         self.start_time = time.time()
         self.lock = asyncio.Lock()
         
@@ -122,6 +130,19 @@ class ParallelProgressTracker:
             }
             await self._update_overall_progress()
             
+    async def resume_chunk(self, chunk_index: int, result: Any = None):
+        """Mark chunk as completed from a checkpoint of an earlier run."""
+        async with self.lock:
+            self.resumed_chunks.add(chunk_index)
+            self.chunk_states[chunk_index] = {
+                'state': 'completed',
+                'timestamp': time.time(),
+                'progress': 100,
+                'resumed': True,
+                'result': result
+            }
+            await self._update_overall_progress()
+            
     async def fail_chunk(self, chunk_index: int, error: str):
         """Mark chunk as failed."""
         async with self.lock:
@@ -165,6 +186,8 @@ class ParallelProgressTracker:
             'total_chunks': total_chunks,
             'completed_chunks': completed,
             'failed_chunks': failed,
+            'resumed_chunks': len(self.resumed_chunks),
+            'fresh_chunks': completed - len(self.resumed_chunks),
             'chunk_progress': int(progress)
         }
         
@@ -187,6 +210,8 @@ class ParallelProgressTracker:
         
         # Remaining chunks
         remaining = total_chunks - completed
+        if remaining <= 0:
+            return 0
         
         # Adjust for parallel processing
         concurrent_factor = min(3, remaining)  # Max 3 concurrent
@@ -304,13 +329,14 @@ class ResourcePool:
 class EnhancedAsyncTranscriptionService:
     """Enhanced transcription service with parallel processing capabilities."""
     
-    def __init__(self, db_path=None, max_concurrent_chunks: int = 3):
+    def __init__(self, db_path=None, max_concurrent_chunks: int = 3, api_base_url: Optional[str] = None):
         """
         Initialize the enhanced async transcription service.
         
         Args:
             db_path: Database path for storing transcription metadata
             max_concurrent_chunks: Maximum chunks to process concurrently
+            api_base_url: Whisper API base URL (defaults to OPENAI_API_BASE or api.openai.com)
         """
         self.db_path = db_path or Path(__file__).parent / 'data' / 'demo_enhanced_ui.db'
         self.output_dir = Path(__file__).parent / 'output' / 'demo_transcription'
@@ -319,6 +345,7 @@ class EnhancedAsyncTranscriptionService:
         # Initialize components
         self.analyzer = AudioAnalyzer()
         self.chunker = AudioChunker()
+        self.stitcher = TranscriptStitcher()
         
         # Parallel processing configuration
         self.max_concurrent_chunks = max_concurrent_chunks
@@ -328,12 +355,66 @@ class EnhancedAsyncTranscriptionService:
         # Resource management
         self.resource_pool = ResourcePool()
         self.retry_manager = IntelligentRetryManager()
+        self.result_cache = get_transcription_cache()
         
         # Get OpenAI API key from keyring
         self.api_key = self._get_openai_key()
         
         # Configuration
         self.max_file_size_mb = 20  # 5MB buffer under OpenAI's 25MB limit
+        self.model = 'whisper-1'
+        self.api_base_url = (
+            api_base_url or os.getenv('OPENAI_API_BASE', 'https://api.openai.com/v1')
+        ).rstrip('/')
+        
+        # Long-lived HTTP session shared by all chunk uploads
+        self.upload_block_size = 256 * 1024  # Bytes read from disk per upload block
+        self.keepalive_timeout = 60  # Seconds idle connections stay open
+        self.dns_cache_ttl = 300  # Seconds resolved API hosts are cached
+        self.request_timeout = aiohttp.ClientTimeout(total=600, sock_connect=30)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.sessions_created = 0
+        
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use in the running loop."""
+        loop = asyncio.get_running_loop()
+        
+        if self._session is not None and not self._session.closed and self._session_loop is not loop:
+            # Sessions are bound to the loop they were created in; drop the stale one
+            logger.info("Event loop changed, replacing HTTP session")
+            self._session = None
+        
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrent_chunks * 2,
+                limit_per_host=self.max_concurrent_chunks,
+                keepalive_timeout=self.keepalive_timeout,
+                use_dns_cache=True,
+                ttl_dns_cache=self.dns_cache_ttl
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self.request_timeout
+            )
+            self._session_loop = loop
+            self.sessions_created += 1
+        
+        return self._session
+    
+    async def close(self):
+        """Close the shared HTTP session and its pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+    
+    async def __aenter__(self):
+        await self._get_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
         
     def _get_openai_key(self) -> Optional[str]:
         """Get OpenAI API key from keyring storage."""
@@ -377,7 +458,7 @@ class EnhancedAsyncTranscriptionService:
                 hearing_id, 'analyzing', 5, 'Analyzing audio file...'
             )
             
-            audio_info = self.analyzer.analyze_audio(audio_path)
+            audio_info = self.analyzer.analyze_file(Path(audio_path))
             logger.info(f"Audio analysis: {audio_info.duration_seconds}s, {audio_info.file_size_mb}MB")
             
             # Step 2: Determine processing approach
@@ -409,6 +490,7 @@ class EnhancedAsyncTranscriptionService:
         transcript_path = self.output_dir / f"hearing_{hearing_id}_transcript.json"
         with open(transcript_path, 'w') as f:
             json.dump(result, f, indent=2)
+        await asyncio.to_thread(self._index_transcript, hearing_id, transcript_path, result)
         
         progress_tracker.complete_operation(hearing_id, True)
         
@@ -418,6 +500,25 @@ class EnhancedAsyncTranscriptionService:
             'processing_method': 'direct'
         }
     
+    def _index_transcript(self, hearing_id: int, transcript_path: Path, transcript: Dict[str, Any]):
+        """Make a newly written transcript's segments searchable and list it in the catalog."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            try:
+                index_transcript(conn, hearing_id, transcript)
+            except sqlite3.Error as e:
+                logger.warning(f"Could not index transcript for hearing {hearing_id}: {e}")
+            
+            # List the transcript without rereading the file
+            try:
+                catalog_transcript(conn, transcript_path, transcript)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning(f"Could not catalog transcript for hearing {hearing_id}: {e}")
+            
+            conn.commit()
+        finally:
+            conn.close()
+    
     async def _transcribe_chunked_parallel(
         self, 
         audio_path: str, 
@@ -425,84 +526,115 @@ class EnhancedAsyncTranscriptionService:
         audio_info, 
         parallel_tracker: ParallelProgressTracker
     ) -> Dict[str, Any]:
-        """Parallel chunked transcription for large files."""
+        """
+        Parallel chunked transcription for large files.
+        
+        Each chunk's result is checkpointed next to chunking_metadata.json, so a
+        restarted job reuses the chunk set and only transcribes missing or failed chunks.
+        """
         
-        # Step 1: Create chunks
+        # Step 1: Create chunks (or pick up the chunk set of an interrupted run)
         progress_tracker.update_progress(
             hearing_id, 'chunking', 15, 'Creating audio chunks...'
         )
         
-        temp_dir = await self.resource_pool.get_temp_directory()
-        try:
-            chunking_result = self.chunker.chunk_audio(audio_path, str(temp_dir))
-            logger.info(f"Created {len(chunking_result.chunks)} chunks")
-            
-            # Step 2: Process chunks in parallel
-            progress_tracker.update_progress(
-                hearing_id, 'processing', 20, 'Starting parallel chunk processing...',
-                chunk_progress={
-                    'current_chunk': 0,
-                    'total_chunks': len(chunking_result.chunks),
-                    'completed_chunks': 0,
-                    'failed_chunks': 0,
-                    'chunk_progress': 0
-                }
-            )
-            
-            # Process chunks concurrently
-            tasks = []
-            for i, chunk in enumerate(chunking_result.chunks):
-                task = self._process_chunk_with_limits(
-                    chunk, i, len(chunking_result.chunks), parallel_tracker
-                )
-                tasks.append(task)
-            
-            # Execute with controlled concurrency
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Check for failures
-            failures = [r for r in results if isinstance(r, Exception)]
-            if failures:
-                raise Exception(f"Failed to process {len(failures)} chunks: {failures[0]}")
-            
-            # Step 3: Merge results
-            progress_tracker.update_progress(
-                hearing_id, 'merging', 85, 'Merging chunk transcripts...'
+        chunking_result = await asyncio.to_thread(
+            self.chunker.chunk_audio_file, Path(audio_path), str(hearing_id), True
+        )
+        total_chunks = len(chunking_result.chunks)
+        logger.info(f"Created {total_chunks} chunks")
+        
+        checkpoints = self.chunker.load_chunk_checkpoints(chunking_result)
+        pending = [chunk for chunk in chunking_result.chunks if chunk.chunk_index not in checkpoints]
+        if checkpoints:
+            logger.info(f"Resuming hearing {hearing_id}: {len(checkpoints)} chunks checkpointed, "
+                        f"{len(pending)} to transcribe")
+        
+        # Step 2: Process chunks in parallel
+        progress_tracker.update_progress(
+            hearing_id, 'processing', 20, 'Starting parallel chunk processing...',
+            chunk_progress={
+                'current_chunk': 0,
+                'total_chunks': total_chunks,
+                'completed_chunks': len(checkpoints),
+                'failed_chunks': 0,
+                'resumed_chunks': len(checkpoints),
+                'fresh_chunks': 0,
+                'chunk_progress': 0
+            }
+        )
+        
+        for chunk_index, result in sorted(checkpoints.items()):
+            await parallel_tracker.resume_chunk(chunk_index, result)
+        
+        # Process remaining chunks concurrently
+        tasks = []
+        for chunk in pending:
+            task = self._process_chunk_with_limits(
+                chunk, chunk.chunk_index, total_chunks, parallel_tracker, chunking_result
             )
-            
-            merged_transcript = self._merge_chunk_results(results, chunking_result)
-            
-            # Step 4: Save final transcript
-            transcript_path = self.output_dir / f"hearing_{hearing_id}_transcript.json"
-            with open(transcript_path, 'w') as f:
-                json.dump(merged_transcript, f, indent=2)
-            
-            # Step 5: Cleanup
-            progress_tracker.update_progress(
-                hearing_id, 'cleanup', 95, 'Cleaning up temporary files...'
+            tasks.append(task)
+        
+        # Execute with controlled concurrency
+        fresh_results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        # Check for failures; successful chunks stay checkpointed for the next attempt
+        failures = [r for r in fresh_results if isinstance(r, Exception)]
+        if failures:
+            raise Exception(
+                f"Failed to process {len(failures)} chunks: {failures[0]} "
+                f"(completed chunks checkpointed in {chunking_result.checkpoint_dir})"
             )
-            
-            progress_tracker.complete_operation(hearing_id, True)
-            
-            return {
-                'transcript_path': str(transcript_path),
-                'segments_count': len(merged_transcript.get('segments', [])),
-                'processing_method': 'chunked_parallel',
-                'chunks_processed': len(results),
-                'total_duration': merged_transcript.get('duration', 0)
-            }
-            
-        finally:
-            await self.resource_pool.return_temp_directory(temp_dir)
+        
+        results_by_index = dict(checkpoints)
+        for chunk, result in zip(pending, fresh_results):
+            results_by_index[chunk.chunk_index] = result
+        results = [results_by_index[chunk.chunk_index] for chunk in chunking_result.chunks]
+        
+        # Step 3: Merge results
+        progress_tracker.update_progress(
+            hearing_id, 'merging', 85, 'Merging chunk transcripts...'
+        )
+        
+        merged_transcript = self._merge_chunk_results(results, chunking_result)
+        merged_transcript['processing_metadata'].update({
+            'resumed_chunks': len(checkpoints),
+            'fresh_chunks': len(pending)
+        })
+        
+        # Step 4: Save final transcript
+        transcript_path = self.output_dir / f"hearing_{hearing_id}_transcript.json"
+        with open(transcript_path, 'w') as f:
+            json.dump(merged_transcript, f, indent=2)
+        await asyncio.to_thread(self._index_transcript, hearing_id, transcript_path, merged_transcript)
+        
+        # Step 5: Cleanup (chunks and checkpoints are only needed until the transcript is saved)
+        progress_tracker.update_progress(
+            hearing_id, 'cleanup', 95, 'Cleaning up temporary files...'
+        )
+        await asyncio.to_thread(self.chunker.cleanup_chunks, chunking_result)
+        
+        progress_tracker.complete_operation(hearing_id, True)
+        
+        return {
+            'transcript_path': str(transcript_path),
+            'segments_count': len(merged_transcript.get('segments', [])),
+            'processing_method': 'chunked_parallel',
+            'chunks_processed': len(results),
+            'resumed_chunks': len(checkpoints),
+            'fresh_chunks': len(pending),
+            'total_duration': merged_transcript.get('duration', 0)
+        }
     
     async def _process_chunk_with_limits(
         self, 
         chunk: AudioChunk, 
         chunk_index: int, 
         total_chunks: int,
-        parallel_tracker: ParallelProgressTracker
+        parallel_tracker: ParallelProgressTracker,
+        chunking_result: Optional[ChunkingResult] = None
     ) -> Dict[str, Any]:
-        """Process single chunk with rate limiting and error isolation."""
+        """Process single chunk with rate limiting, error isolation and checkpointing."""
         
         async with self.chunk_semaphore:  # Limit concurrency
             await parallel_tracker.start_chunk_processing(chunk_index)
@@ -525,6 +657,11 @@ class EnhancedAsyncTranscriptionService:
                         process_operation, chunk_index, e
                     )
                 
+                if chunking_result is not None:
+                    await asyncio.to_thread(
+                        self.chunker.save_chunk_checkpoint, chunking_result, chunk_index, result
+                    )
+                
                 await parallel_tracker.complete_chunk(chunk_index, result)
                 
                 logger.info(f"Completed chunk {chunk_index + 1}/{total_chunks}")
@@ -532,11 +669,34 @@ class EnhancedAsyncTranscriptionService:
                 
             except Exception as e:
                 logger.error(f"Failed to process chunk {chunk_index}: {e}")
+                if chunking_result is not None:
+                    await asyncio.to_thread(
+                        self.chunker.save_chunk_checkpoint, chunking_result, chunk_index, None, str(e)
+                    )
                 await parallel_tracker.fail_chunk(chunk_index, str(e))
                 raise
     
+    async def _stream_file(self, audio_path: str):
+        """Yield file contents in blocks, reading off the event loop."""
+        audio_file = await asyncio.to_thread(open, audio_path, 'rb')
+        try:
+            while True:
+                block = await asyncio.to_thread(audio_file.read, self.upload_block_size)
+                if not block:
+                    break
+                yield block
+        finally:
+            await asyncio.to_thread(audio_file.close)
+    
     async def _call_whisper_api(self, audio_path: str) -> Dict[str, Any]:
-        """Call OpenAI Whisper API with async HTTP client."""
+        """Call OpenAI Whisper API over the shared keep-alive session."""
+        # Identical audio bytes were already transcribed: skip the API entirely
+        cache_key = await asyncio.to_thread(self.result_cache.make_key, audio_path, self.model)
+        cached_result = await asyncio.to_thread(self.result_cache.get, cache_key)
+        if cached_result is not None:
+            logger.info(f"Using cached transcription for {Path(audio_path).name}")
+            return cached_result
+        
         if not self.api_key:
             raise Exception("OpenAI API key not available")
         
@@ -544,46 +704,42 @@ class EnhancedAsyncTranscriptionService:
             'Authorization': f'Bearer {self.api_key}'
         }
         
-        # Prepare file data
-        with open(audio_path, 'rb') as audio_file:
-            files = {
-                'file': audio_file,
-                'model': (None, 'whisper-1')
-            }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    'https://api.openai.com/v1/audio/transcriptions',
-                    headers=headers,
-                    data=files
-                ) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        error_text = await response.text()
-                        raise Exception(f"API call failed: {response.status} - {error_text}")
+        # Multipart body streamed from disk; rebuilt per attempt since the stream is single-use
+        form = aiohttp.FormData()
+        form.add_field('model', self.model)
+        form.add_field('response_format', 'verbose_json')
+        form.add_field('timestamp_granularities[]', 'segment')
+        form.add_field('timestamp_granularities[]', 'word')  # Word timestamps for overlap stitching
+        form.add_field(
+            'file',
+            self._stream_file(audio_path),
+            filename=Path(audio_path).name,
+            content_type='application/octet-stream'
+        )
+        
+        session = await self._get_session()
+        async with session.post(
+            f'{self.api_base_url}/audio/transcriptions',
+            headers=headers,
+            data=form
+        ) as response:
+            if response.status == 200:
+                result = await response.json()
+                await asyncio.to_thread(self.result_cache.put, cache_key, result)
+                return result
+            else:
+                error_text = await response.text()
+                raise Exception(f"API call failed: {response.status} - {error_text}")
     
     def _merge_chunk_results(self, results: List[Dict], chunking_result: ChunkingResult) -> Dict[str, Any]:
-        """Merge chunk transcription results into final transcript."""
-        merged_segments = []
-        total_duration = 0
-        
-        for i, (result, chunk) in enumerate(zip(results, chunking_result.chunks)):
-            if 'segments' in result:
-                for segment in result['segments']:
-                    # Adjust timestamps for chunk offset
-                    adjusted_segment = segment.copy()
-                    adjusted_segment['start'] = segment['start'] + chunk.start_time
-                    adjusted_segment['end'] = segment['end'] + chunk.start_time
-                    
-                    merged_segments.append(adjusted_segment)
-                    total_duration = max(total_duration, adjusted_segment['end'])
+        """Stitch chunk transcription results into final transcript, keeping overlap words once."""
+        stitched = self.stitcher.stitch(list(zip(chunking_result.chunks, results)))
+        merged_segments = stitched['segments']
         
-        # Sort segments by start time
-        merged_segments.sort(key=lambda x: x['start'])
+        total_duration = max((segment['end'] for segment in merged_segments), default=0)
         
         return {
-            'text': ' '.join([seg['text'] for seg in merged_segments]),
+            'text': stitched['text'],
             'segments': merged_segments,
             'duration': total_duration,
             'language': results[0].get('language', 'en') if results else 'en',
@@ -591,6 +747,7 @@ class EnhancedAsyncTranscriptionService:
                 'chunks_processed': len(results),
                 'total_chunks': len(chunking_result.chunks),
                 'processing_method': 'parallel_chunked',
+                'stitch_points': stitched['stitch_points'],
                 'processed_at': datetime.now().isoformat()
             }
         }
@@ -5,6 +5,7 @@ Supports both small files and chunked processing for large files.
 """
 
 import os
+import sys
 import json
 import sqlite3
 import requests
@@ -16,8 +17,13 @@ import time
 
 from audio_analyzer import AudioAnalyzer
 from audio_chunker import AudioChunker, ChunkingResult, AudioChunk
+from transcript_stitcher import TranscriptStitcher
 from progress_tracker import progress_tracker, ChunkedProgressCallback
 
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+from api.search_index import index_transcript
+from api.transcript_catalog import catalog_transcript
+
 # Import parallel processing capabilities
 try:
     from async_transcription_integration import (
@@ -41,6 +47,7 @@ class EnhancedTranscriptionService:
         # Initialize components
         self.analyzer = AudioAnalyzer()
         self.chunker = AudioChunker()
+        self.stitcher = TranscriptStitcher()
         
         # Get OpenAI API key from keyring
         self.api_key = self._get_openai_key()
@@ -177,7 +184,7 @@ class EnhancedTranscriptionService:
                 progress_callback("chunking", 10, f"Created {len(chunking_result.chunks)} chunks successfully")
             
             # Process each chunk
-            all_segments = []
+            chunk_results = []
             total_chunks = len(chunking_result.chunks)
             
             for i, chunk in enumerate(chunking_result.chunks):
@@ -188,10 +195,7 @@ class EnhancedTranscriptionService:
                 # Transcribe chunk with retries
                 chunk_segments = self._transcribe_chunk_with_retries(chunk, hearing_info, i, progress_callback, total_chunks)
                 
-                # Adjust timestamps for chunk position in original audio
-                adjusted_segments = self._adjust_chunk_timestamps(chunk_segments, chunk)
-                
-                all_segments.extend(adjusted_segments)
+                chunk_results.append((chunk, {'segments': chunk_segments}))
                 
                 progress_callback(f"processing_chunk_{i+1}_of_{total_chunks}", 100, 
                                 f"Completed chunk {i+1}/{total_chunks} - {len(chunk_segments)} segments")
@@ -203,8 +207,8 @@ class EnhancedTranscriptionService:
             if progress_callback:
                 progress_callback("merging", 90, "Merging chunk transcripts...")
             
-            # Merge segments and handle overlaps
-            merged_segments = self._merge_overlapping_segments(all_segments)
+            # Stitch chunk transcripts at word-aligned cut points in each overlap
+            merged_segments = self._stitch_chunk_segments(chunk_results)
             
             # Create final transcript
             full_text = " ".join([segment['text'].strip() for segment in merged_segments])
@@ -280,18 +284,19 @@ class EnhancedTranscriptionService:
             "Authorization": f"Bearer {self.api_key}"
         }
         
-        # Prepare audio file for upload
+        # Prepare audio file for upload (list form so both timestamp granularities are sent)
         with open(chunk.file_path, 'rb') as f:
-            files = {
-                'file': (chunk.file_path.name, f, 'audio/mpeg'),
-                'model': (None, 'whisper-1'),
-                'response_format': (None, 'verbose_json'),
-                'timestamp_granularities[]': (None, 'segment')
-            }
+            files = [
+                ('file', (chunk.file_path.name, f, 'audio/mpeg')),
+                ('model', (None, 'whisper-1')),
+                ('response_format', (None, 'verbose_json')),
+                ('timestamp_granularities[]', (None, 'segment')),
+                ('timestamp_granularities[]', (None, 'word'))  # Word timestamps for overlap stitching
+            ]
             
             # Add prompt for better transcription
             prompt = f"This is chunk {chunk_index + 1} of a US Senate hearing: {hearing_info.get('hearing_title', 'Senate Hearing')}"
-            files['prompt'] = (None, prompt)
+            files.append(('prompt', (None, prompt)))
             
             response = requests.post(url, headers=headers, files=files, timeout=300)  # 5 minute timeout
         
@@ -300,9 +305,10 @@ class EnhancedTranscriptionService:
         
         whisper_result = response.json()
         
-        # Convert segments to our format
+        # Convert segments to our format, keeping word timestamps for overlap stitching
         segments = []
-        for segment in whisper_result.get('segments', []):
+        words_by_segment = self.stitcher.assign_words(whisper_result)
+        for segment, words in zip(whisper_result.get('segments', []), words_by_segment):
             segments.append({
                 'start': segment.get('start', 0),
                 'end': segment.get('end', 0),
@@ -310,6 +316,7 @@ class EnhancedTranscriptionService:
                 'speaker': 'Unknown',  # Default speaker
                 'confidence': 1.0,
                 'chunk_index': chunk_index,
+                'words': words,
                 'review_metadata': {
                     'needs_review': False,
                     'has_correction': False,
@@ -321,44 +328,16 @@ class EnhancedTranscriptionService:
         print(f"✅ Chunk {chunk_index}: {len(segments)} segments, {whisper_result.get('duration', 0):.1f}s")
         return segments
     
-    def _adjust_chunk_timestamps(self, segments: List[Dict], chunk: AudioChunk) -> List[Dict]:
-        """Adjust segment timestamps to reflect position in original audio."""
-        
-        adjusted_segments = []
-        
-        for segment in segments:
-            # Adjust timestamps by adding chunk start time
-            adjusted_segment = segment.copy()
-            adjusted_segment['start'] = segment['start'] + chunk.start_time
-            adjusted_segment['end'] = segment['end'] + chunk.start_time
-            
-            adjusted_segments.append(adjusted_segment)
-        
-        return adjusted_segments
-    
-    def _merge_overlapping_segments(self, all_segments: List[Dict]) -> List[Dict]:
-        """Merge overlapping segments from different chunks."""
+    def _stitch_chunk_segments(self, chunk_results: List[tuple]) -> List[Dict]:
+        """Stitch chunk-relative segments into one timeline with each overlap word kept once."""
         
-        if not all_segments:
-            return []
+        stitched = self.stitcher.stitch(chunk_results)
         
-        # Sort segments by start time
-        sorted_segments = sorted(all_segments, key=lambda x: x['start'])
+        for point in stitched['stitch_points']:
+            print(f"🧵 Chunk {point['after_chunk']} -> {point['after_chunk'] + 1}: "
+                  f"cut at {point['cut_time']:.2f}s ({point['method']})")
         
-        merged_segments = []
-        overlap_threshold = 25.0  # 25 seconds (less than 30s overlap to account for processing differences)
-        
-        for segment in sorted_segments:
-            # Check if this segment overlaps with the last merged segment
-            if (merged_segments and 
-                segment['start'] < merged_segments[-1]['end'] and
-                segment['start'] > merged_segments[-1]['end'] - overlap_threshold):
-                
-                # This is likely an overlapping segment, skip it
-                # (keep the earlier segment which is likely more complete)
-                continue
-            
-            merged_segments.append(segment)
+        merged_segments = stitched['segments']
         
         # Renumber segments
         for i, segment in enumerate(merged_segments):
@@ -501,6 +480,18 @@ class EnhancedTranscriptionService:
             WHERE id = ?
         ''', (full_text, hearing_id))
         
+        # Make the transcript segments searchable
+        try:
+            index_transcript(conn, hearing_id, transcript_data)
+        except sqlite3.Error as e:
+            print(f"⚠️ Could not index transcript for search: {e}")
+        
+        # List the transcript without rereading the file
+        try:
+            catalog_transcript(conn, self.output_dir / f'hearing_{hearing_id}_transcript.json', transcript_data)
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️ Could not catalog transcript: {e}")
+        
         conn.commit()
         conn.close()
 
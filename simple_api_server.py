@@ -4,6 +4,7 @@ Simple API server for Phase 7C clean architecture.
 Serves hearing data with proper titles.
 """
 
+import sys
 import sqlite3
 from flask import Flask, jsonify, request
 from flask_cors import CORS
@@ -11,6 +12,9 @@ from pathlib import Path
 import json
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+from storage.connection_pool import get_connection_pool
+
 app = Flask(__name__)
 CORS(app)
 
@@ -18,10 +22,8 @@ CORS(app)
 DB_PATH = Path(__file__).parent / 'data' / 'demo_enhanced_ui.db'
 
 def get_db_connection():
-    """Get database connection."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+    """Get pooled database connection; close() returns it to the pool."""
+    return get_connection_pool(str(DB_PATH)).acquire(row_factory=sqlite3.Row)
 
 @app.route('/api/hearings', methods=['GET'])
 def get_all_hearings():
@@ -14,6 +14,11 @@ from typing import List, Dict, Any, Optional
 import keyring
 import time
 import subprocess
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+from api.search_index import index_transcript
+from api.transcript_catalog import catalog_transcript
 
 class SimpleTranscriptionService:
     """Simple transcription service that works reliably in Flask threads."""
@@ -278,6 +283,18 @@ class SimpleTranscriptionService:
                 WHERE id = ?
             ''', (transcript_json, datetime.now().isoformat(), hearing_id))
             
+            # Index the transcript segments for search
+            try:
+                index_transcript(conn, hearing_id, transcript_data)
+            except sqlite3.Error as e:
+                print(f"⚠️ Could not index transcript for search: {e}")
+            
+            # List the transcript without rereading the file
+            try:
+                catalog_transcript(conn, self.output_dir / f'hearing_{hearing_id}_transcript.json', transcript_data)
+            except (sqlite3.Error, OSError) as e:
+                print(f"⚠️ Could not catalog transcript: {e}")
+            
             conn.commit()
             conn.close()
             
@@ -0,0 +1,151 @@
+"""
+Async access to the hearing database for FastAPI route handlers
+Runs queries on a dedicated pool of worker threads so a slow query or a
+long write waits off the event loop; each worker uses its own pooled
+SQLite connection, so reads proceed in parallel under WAL
+"""
+
+import asyncio
+import functools
+import sqlite3
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Callable, Sequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_WORKERS = 8
+
+
+class AsyncDatabase:
+    """Awaitable wrapper around a UnifiedHearingDatabase or EnhancedUIDatabase"""
+
+    def __init__(self, db, executor: Optional[ThreadPoolExecutor] = None):
+        """
+        Initialize async database.
+
+        Args:
+            db: Synchronous database whose connection property is per-thread
+            executor: Worker threads for queries (default shared database executor)
+        """
+        self.db = db
+        self._executor = executor or get_db_executor()
+
+    async def run(self, func: Callable, *args, **kwargs):
+        """
+        Run a synchronous database function on a worker thread.
+
+        Any code using db.connection inside func gets that worker's connection,
+        so existing synchronous methods can be awaited unchanged.
+        """
+        return await run_in_db_executor(func, *args, executor=self._executor, **kwargs)
+
+    # Generic queries
+
+    async def fetch_all(self, sql: str, params: Sequence = ()) -> List[sqlite3.Row]:
+        return await self.run(self._fetch_all, sql, params)
+
+    async def fetch_one(self, sql: str, params: Sequence = ()) -> Optional[sqlite3.Row]:
+        return await self.run(self._fetch_one, sql, params)
+
+    async def fetch_value(self, sql: str, params: Sequence = (), default: Any = None) -> Any:
+        row = await self.fetch_one(sql, params)
+        return row[0] if row is not None else default
+
+    async def execute(self, sql: str, params: Sequence = ()) -> int:
+        """Run one write statement and commit; returns the affected row count"""
+        return await self.transaction(lambda conn: conn.execute(sql, params).rowcount)
+
+    async def transaction(self, func: Callable[[sqlite3.Connection], Any]) -> Any:
+        """
+        Run func(connection) on one worker thread and commit its writes.
+
+        Statements that must commit together belong in one transaction call,
+        since each call may run on a different worker and connection.
+        """
+        return await self.run(self._transaction, func)
+
+    def _fetch_all(self, sql: str, params: Sequence) -> List[sqlite3.Row]:
+        return self.db.connection.execute(sql, params).fetchall()
+
+    def _fetch_one(self, sql: str, params: Sequence) -> Optional[sqlite3.Row]:
+        return self.db.connection.execute(sql, params).fetchone()
+
+    def _transaction(self, func: Callable[[sqlite3.Connection], Any]) -> Any:
+        connection = self.db.connection
+        try:
+            result = func(connection)
+            connection.commit()
+            return result
+        except Exception:
+            connection.rollback()
+            raise
+
+    # Hearings
+
+    async def get_hearing(self, hearing_id) -> Optional[Dict[str, Any]]:
+        row = await self.fetch_one("SELECT * FROM hearings_unified WHERE id = ?", (hearing_id,))
+        return dict(row) if row is not None else None
+
+    async def insert_hearing(self, hearing_data: Dict[str, Any], source: str) -> int:
+        return await self.run(self.db.insert_hearing, hearing_data, source)
+
+    async def update_hearing(self, hearing_id: int, updates: Dict[str, Any], source: str):
+        return await self.run(self.db.update_hearing, hearing_id, updates, source)
+
+    async def get_sync_statistics(self) -> Dict[str, Any]:
+        return await self.run(self.db.get_sync_statistics)
+
+    # Reviews
+
+    async def create_review_assignment(self, hearing_id: str, assigned_to: str = None,
+                                       priority: int = 0, transcript_id: str = None) -> str:
+        return await self.run(self.db.create_review_assignment, hearing_id, assigned_to,
+                              priority, transcript_id)
+
+    async def get_review_queue(self, assigned_to: str = None, status: str = None,
+                               limit: int = 50) -> List[Dict]:
+        return await self.run(self.db.get_review_queue, assigned_to, status, limit)
+
+    async def update_assignment_status(self, assignment_id: str, status: str,
+                                       quality_score: float = None) -> bool:
+        return await self.run(self.db.update_assignment_status, assignment_id, status, quality_score)
+
+    # Alerts
+
+    async def create_alert(self, *args, **kwargs) -> str:
+        return await self.run(self.db.create_alert, *args, **kwargs)
+
+    async def get_active_alerts(self, severity: str = None, component: str = None) -> List[Dict]:
+        return await self.run(self.db.get_active_alerts, severity, component)
+
+    async def resolve_alert(self, alert_id: str, resolved_by: str = None) -> bool:
+        return await self.run(self.db.resolve_alert, alert_id, resolved_by)
+
+    # Sync status
+
+    async def update_sync_status(self, *args, **kwargs):
+        return await self.run(self.db.update_sync_status, *args, **kwargs)
+
+    async def get_sync_health(self) -> Dict[str, Any]:
+        return await self.run(self.db.get_sync_health)
+
+
+async def run_in_db_executor(func: Callable, *args, executor: Optional[ThreadPoolExecutor] = None, **kwargs):
+    """Await a synchronous database function run on the database worker threads"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor or get_db_executor(), functools.partial(func, *args, **kwargs))
+
+
+# Shared worker threads for database access
+_db_executor = None
+_executor_lock = threading.Lock()
+
+def get_db_executor() -> ThreadPoolExecutor:
+    """Get the shared database executor"""
+    global _db_executor
+    with _executor_lock:
+        if _db_executor is None:
+            _db_executor = ThreadPoolExecutor(max_workers=DEFAULT_DB_WORKERS, thread_name_prefix="db")
+        return _db_executor
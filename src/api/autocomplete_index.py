@@ -0,0 +1,398 @@
+"""
+In-memory prefix index for search auto-complete
+Holds hearing titles, committee codes, keywords, members and witnesses in
+sorted arrays of word-start keys searched with bisect, weighted by how often
+each term has been searched, so suggestions never touch the database
+"""
+
+import bisect
+import heapq
+import json
+import math
+import re
+import sqlite3
+import threading
+import logging
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+try:
+    from ..storage.connection_pool import get_connection_pool
+    from ..sync.database_schema import register_hearing_listener
+except ImportError:
+    from storage.connection_pool import get_connection_pool
+    from sync.database_schema import register_hearing_listener
+
+logger = logging.getLogger(__name__)
+
+# Base weight per suggestion category before popularity
+CATEGORY_WEIGHTS = {
+    "hearings": 1.0,
+    "committees": 0.9,
+    "participants": 0.8,
+    "keywords": 0.7,
+    "queries": 0.6
+}
+
+CATEGORY_TYPES = {
+    "hearings": "hearing",
+    "committees": "committee",
+    "participants": "participant",
+    "keywords": "keyword",
+    "queries": "query"
+}
+
+# Score multipliers by where the typed text matches an entry
+EXACT_MATCH = 1.0
+START_MATCH = 0.8   # Start of the entry's text
+WORD_MATCH = 0.6    # Start of a later word
+
+# Highest code point, so prefix + _KEY_END sorts after every key with that prefix
+_KEY_END = "\U0010ffff"
+
+def normalize(text: str) -> str:
+    """Lowercase, punctuation-free form used for prefix matching"""
+    return " ".join(re.findall(r"\w+", text.lower()))
+
+
+class AutocompleteIndex:
+    """
+    Sorted (key, entry id) arrays of word-start keys.
+
+    An entry nobody has searched for scores its category weight alone, so
+    those entries are kept in one array per category and match position,
+    where the first keys in a prefix's range are already the best. Searched
+    entries move to a separate, much smaller array ranked in full.
+    """
+
+    def __init__(self, top_k: int = 20):
+        """
+        Initialize auto-complete index.
+
+        Args:
+            top_k: Largest suggestion limit served
+        """
+        self.top_k = top_k
+        self.loaded = False
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self):
+        # (category, key starts the text) -> sorted (key, entry id) of never-searched entries
+        self._arrays: Dict[Tuple[str, bool], List[Tuple[str, int]]] = {
+            (category, at_start): [] for category in CATEGORY_WEIGHTS for at_start in (True, False)
+        }
+        # Sorted (key, entry id) of entries that have been searched for
+        self._searched: List[Tuple[str, int]] = []
+
+        # Entry id -> {text, key, category, popularity, hearings}
+        self._entries: Dict[int, Dict[str, Any]] = {}
+        self._entry_ids: Dict[Tuple[str, str], int] = {}
+        self._next_id = 0
+
+        # Hearing id -> entry ids it contributes, for incremental updates
+        self._hearing_entries: Dict[int, Set[int]] = {}
+
+    # Index maintenance
+
+    def load_from_db(self, conn: sqlite3.Connection):
+        """Build the index from every hearing in hearings_unified"""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(hearings_unified)")}
+        optional = [c for c in ("search_keywords", "participant_list", "witnesses") if c in columns]
+        select = ", ".join(["id", "hearing_title", "committee_code"] + optional)
+
+        cursor = conn.execute(f"SELECT {select} FROM hearings_unified")
+        names = [d[0] for d in cursor.description]
+
+        with self._lock:
+            self._reset()
+            for row in cursor:
+                hearing = dict(zip(names, row))
+                entry_ids = set()
+                for text, category in self._hearing_terms(hearing):
+                    entry_id, created = self._entry(text, category)
+                    if created:
+                        for array, key in self._placements(entry_id):
+                            array.append((key, entry_id))
+                    self._entries[entry_id]["hearings"].add(hearing["id"])
+                    entry_ids.add(entry_id)
+                self._hearing_entries[hearing["id"]] = entry_ids
+            # One sort per array instead of an insertion per key
+            for array in self._arrays.values():
+                array.sort()
+            self.loaded = True
+
+        logger.info(f"Auto-complete index loaded: {len(self._entries)} entries, {self._key_count()} keys "
+                    f"from {len(self._hearing_entries)} hearings")
+
+    def index_hearing(self, hearing_id: int, hearing: Dict[str, Any]):
+        """
+        Add or refresh one hearing's suggestions.
+
+        Args:
+            hearing_id: hearings_unified id
+            hearing: Hearing columns (hearing_title, committee_code and optionally
+                     search_keywords, participant_list, witnesses)
+        """
+        with self._lock:
+            if not self.loaded:
+                return  # Built in full on first use
+            self._remove_hearing(hearing_id)
+            self._add_hearing(hearing_id, hearing)
+
+    def remove_hearing(self, hearing_id: int):
+        """Drop suggestions only this hearing contributed"""
+        with self._lock:
+            if self.loaded:
+                self._remove_hearing(hearing_id)
+
+    def record_search(self, query: Optional[str], result_count: int = 0):
+        """
+        Count a search toward suggestion popularity.
+
+        The entry matching the query text gains weight; queries that found
+        results also become suggestions themselves.
+        """
+        key = normalize(query or "")
+        if not key:
+            return
+
+        with self._lock:
+            matched = [self._entry_ids[(category, key)] for category in CATEGORY_WEIGHTS
+                       if (category, key) in self._entry_ids]
+            if not matched and result_count > 0:
+                matched = [self._get_or_create_entry(query.strip(), "queries")]
+            for entry_id in matched:
+                if self._entries[entry_id]["popularity"] == 0:
+                    # Its score now depends on popularity: rank it with the searched entries
+                    self._unplace(entry_id)
+                    self._entries[entry_id]["popularity"] = 1
+                    self._place(entry_id)
+                else:
+                    self._entries[entry_id]["popularity"] += 1
+
+    def _hearing_terms(self, hearing: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """(text, category) suggestions contributed by a hearing"""
+        terms = []
+        if hearing.get("hearing_title"):
+            terms.append((hearing["hearing_title"], "hearings"))
+        if hearing.get("committee_code"):
+            terms.append((hearing["committee_code"], "committees"))
+        for keyword in (hearing.get("search_keywords") or "").split(","):
+            if keyword.strip():
+                terms.append((keyword.strip(), "keywords"))
+        for participant in (hearing.get("participant_list") or "").split(","):
+            if participant.strip():
+                terms.append((participant.strip(), "participants"))
+        for witness in self._witness_names(hearing.get("witnesses")):
+            terms.append((witness, "participants"))
+        return terms
+
+    @staticmethod
+    def _witness_names(witnesses: Any) -> List[str]:
+        """Witness names from the witnesses JSON column"""
+        if isinstance(witnesses, str):
+            try:
+                witnesses = json.loads(witnesses)
+            except json.JSONDecodeError:
+                return []
+        if isinstance(witnesses, dict):
+            witnesses = witnesses.get("witnesses") or list(witnesses.values())
+        names = []
+        for witness in witnesses or []:
+            if isinstance(witness, dict):
+                witness = witness.get("name")
+            if isinstance(witness, str) and witness.strip():
+                names.append(witness.strip())
+        return names
+
+    def _add_hearing(self, hearing_id: int, hearing: Dict[str, Any]):
+        entry_ids = set()
+        for text, category in self._hearing_terms(hearing):
+            entry_id = self._get_or_create_entry(text, category)
+            self._entries[entry_id]["hearings"].add(hearing_id)
+            entry_ids.add(entry_id)
+        self._hearing_entries[hearing_id] = entry_ids
+
+    def _remove_hearing(self, hearing_id: int):
+        for entry_id in self._hearing_entries.pop(hearing_id, set()):
+            entry = self._entries[entry_id]
+            entry["hearings"].discard(hearing_id)
+            if not entry["hearings"] and entry["category"] != "queries":
+                self._delete_entry(entry_id)
+
+    def _entry(self, text: str, category: str) -> Tuple[int, bool]:
+        """Entry id for a term, and whether it was just created (its keys not yet placed)"""
+        key = (category, normalize(text))
+        entry_id = self._entry_ids.get(key)
+        if entry_id is not None:
+            return entry_id, False
+
+        entry_id = self._next_id
+        self._next_id += 1
+        self._entry_ids[key] = entry_id
+        self._entries[entry_id] = {"text": text, "key": key[1], "category": category,
+                                   "popularity": 0, "hearings": set()}
+        return entry_id, True
+
+    def _get_or_create_entry(self, text: str, category: str) -> int:
+        entry_id, created = self._entry(text, category)
+        if created:
+            self._place(entry_id)
+        return entry_id
+
+    def _delete_entry(self, entry_id: int):
+        self._unplace(entry_id)
+        entry = self._entries.pop(entry_id)
+        del self._entry_ids[(entry["category"], entry["key"])]
+
+    def _placements(self, entry_id: int) -> List[Tuple[List[Tuple[str, int]], str]]:
+        """(array, key) for each of an entry's word-start keys"""
+        entry = self._entries[entry_id]
+        placements = []
+        for position, word_key in enumerate(self._word_keys(entry["key"])):
+            if entry["popularity"]:
+                placements.append((self._searched, word_key))
+            else:
+                placements.append((self._arrays[(entry["category"], position == 0)], word_key))
+        return placements
+
+    def _place(self, entry_id: int):
+        for array, key in self._placements(entry_id):
+            bisect.insort(array, (key, entry_id))
+
+    def _unplace(self, entry_id: int):
+        for array, key in self._placements(entry_id):
+            position = bisect.bisect_left(array, (key, entry_id))
+            if position < len(array) and array[position] == (key, entry_id):
+                del array[position]
+
+    @staticmethod
+    def _word_keys(key: str) -> List[str]:
+        """Keys for an entry: its text from the start of each word onward"""
+        words = key.split(" ")
+        return [" ".join(words[i:]) for i in range(len(words)) if words[i]]
+
+    def _key_count(self) -> int:
+        return len(self._searched) + sum(len(array) for array in self._arrays.values())
+
+    # Queries
+
+    def _score(self, entry_id: int) -> float:
+        entry = self._entries[entry_id]
+        return CATEGORY_WEIGHTS[entry["category"]] * (1.0 + math.log1p(entry["popularity"]))
+
+    @staticmethod
+    def _prefix_range(array: List[Tuple[str, int]], prefix: str) -> range:
+        """Positions of the keys starting with a prefix"""
+        start = bisect.bisect_left(array, (prefix,))
+        return range(start, bisect.bisect_left(array, (prefix + _KEY_END,), start))
+
+    def _match_quality(self, entry_id: int, word_key: str, prefix: str) -> float:
+        """Matches at the start of the text rank above mid-text word matches"""
+        entry_key = self._entries[entry_id]["key"]
+        if word_key != entry_key:
+            return WORD_MATCH
+        return EXACT_MATCH if entry_key == prefix else START_MATCH
+
+    def _prefix_top(self, prefix: str, limit: int) -> List[Tuple[float, int]]:
+        """Best entries for a typed prefix, ranked by match quality times weight"""
+        best: Dict[int, float] = {}
+
+        def consider(entry_id: int, score: float):
+            if score > best.get(entry_id, 0.0):
+                best[entry_id] = score
+
+        # Searched entries are few, so every match is scored
+        for position in self._prefix_range(self._searched, prefix):
+            word_key, entry_id = self._searched[position]
+            consider(entry_id, self._match_quality(entry_id, word_key, prefix) * self._score(entry_id))
+
+        # Within one never-searched array every match scores the same, so only
+        # the first few are needed; an exact match is a single lookup
+        for (category, at_start), array in self._arrays.items():
+            quality = START_MATCH if at_start else WORD_MATCH
+            if at_start:
+                exact = self._entry_ids.get((category, prefix))
+                if exact is not None:
+                    consider(exact, EXACT_MATCH * self._score(exact))
+
+            taken = set()
+            for position in self._prefix_range(array, prefix):
+                if len(taken) >= limit:
+                    break
+                entry_id = array[position][1]
+                taken.add(entry_id)
+                consider(entry_id, quality * CATEGORY_WEIGHTS[category])
+
+        return heapq.nlargest(limit, ((score, entry_id) for entry_id, score in best.items()))
+
+    def suggest(self, partial_query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Suggestions whose text, or one of its words, starts with the partial query.
+
+        Args:
+            partial_query: Text typed so far
+            limit: Maximum suggestions
+
+        Returns:
+            Suggestions with text, type, category and score, best first
+        """
+        prefix = normalize(partial_query)
+        if not prefix:
+            return []
+
+        with self._lock:
+            suggestions = []
+            for score, entry_id in self._prefix_top(prefix, min(limit, self.top_k)):
+                entry = self._entries[entry_id]
+                suggestions.append({
+                    "text": entry["text"],
+                    "type": CATEGORY_TYPES[entry["category"]],
+                    "category": entry["category"],
+                    "score": round(score, 4)
+                })
+
+        return suggestions
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "loaded": self.loaded,
+                "entries": len(self._entries),
+                "keys": self._key_count(),
+                "searched_entries": len({entry_id for _, entry_id in self._searched}),
+                "hearings": len(self._hearing_entries)
+            }
+
+
+# Auto-complete indexes per database file
+_autocomplete_indexes: Dict[str, AutocompleteIndex] = {}
+_indexes_lock = threading.Lock()
+
+def get_autocomplete_index(db_path: str) -> AutocompleteIndex:
+    """Get the auto-complete index for a database"""
+    key = str(Path(db_path).resolve())
+    with _indexes_lock:
+        if key not in _autocomplete_indexes:
+            _autocomplete_indexes[key] = AutocompleteIndex()
+        return _autocomplete_indexes[key]
+
+def _index_written_hearing(db_path: str, hearing_id: int, hearing: Optional[Dict[str, Any]]):
+    """Hearing write listener: refresh the hearing's suggestions if its index is in use"""
+    index = get_autocomplete_index(db_path)
+    if not index.loaded:
+        return
+
+    if hearing is None:
+        # Changed hearing: re-read the merged row
+        conn = get_connection_pool(db_path).thread_connection(row_factory=sqlite3.Row)
+        row = conn.execute("SELECT * FROM hearings_unified WHERE id = ?", (hearing_id,)).fetchone()
+        if row is None:
+            index.remove_hearing(hearing_id)
+            return
+        hearing = dict(row)
+
+    index.index_hearing(hearing_id, hearing)
+
+register_hearing_listener(_index_written_hearing)
@@ -6,13 +6,17 @@ and hearing data with proper authentication and rate limiting.
 """
 
 import requests
-import time
 import keyring
 import logging
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass
 from datetime import datetime
 
+try:
+    from ..sync.congress_api_enhanced import TokenBucket, get_congress_rate_limiter
+except ImportError:
+    from sync.congress_api_enhanced import TokenBucket, get_congress_rate_limiter
+
 
 @dataclass
 class APIResponse:
@@ -32,12 +36,13 @@ class CongressAPIClient:
     committees, hearings, and other congressional information.
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, rate_limiter: Optional[TokenBucket] = None):
         """
         Initialize Congress API client.
         
         Args:
             api_key: Optional API key. If not provided, will try to retrieve from keyring.
+            rate_limiter: Token bucket to draw from (default the one shared with the async client)
         """
         self.base_url = "https://api.congress.gov/v3"
         self.session = requests.Session()
@@ -60,9 +65,8 @@ class CongressAPIClient:
             'Accept': 'application/json'
         })
         
-        # Rate limiting (5,000 requests per hour = ~1.4 requests per second)
-        self.rate_limit_delay = 0.75  # Conservative 750ms between requests
-        self.last_request_time = 0
+        # Rate limiting (5,000 requests per hour per key, shared by every client in the process)
+        self.rate_limiter = rate_limiter or get_congress_rate_limiter()
     
     def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> APIResponse:
         """
@@ -76,10 +80,7 @@ class CongressAPIClient:
             APIResponse with result data or error information
         """
         # Rate limiting
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - time_since_last)
+        self.rate_limiter.wait()
         
         # Prepare request
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
@@ -90,7 +91,6 @@ class CongressAPIClient:
         try:
             self.logger.debug(f"Congress API request: {url}")
             response = self.session.get(url, params=request_params, timeout=30)
-            self.last_request_time = time.time()
             
             # Extract rate limit info
             rate_limit_remaining = response.headers.get('X-RateLimit-Remaining')
@@ -0,0 +1,450 @@
+"""
+Materialized dashboard statistics
+Small aggregate tables kept current by triggers on hearings_unified,
+review_assignments, system_alerts and quality_metrics, so dashboard
+endpoints read a handful of pre-summed rows instead of scanning the
+base tables on every poll. Time windows are served from per-day buckets.
+"""
+
+import sqlite3
+import logging
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+STATS_TABLES = {
+    # Per committee totals; earliest/latest come from stats_committee_dates
+    "stats_committees": """
+        CREATE TABLE IF NOT EXISTS stats_committees (
+            committee_code TEXT PRIMARY KEY,
+            hearings INTEGER NOT NULL DEFAULT 0,
+            confidence_sum REAL NOT NULL DEFAULT 0,
+            confidence_count INTEGER NOT NULL DEFAULT 0,
+            earliest_hearing TEXT,
+            latest_hearing TEXT
+        )
+    """,
+    # Hearing type breakdown ('' stands for no type)
+    "stats_committee_types": """
+        CREATE TABLE IF NOT EXISTS stats_committee_types (
+            committee_code TEXT NOT NULL,
+            hearing_type TEXT NOT NULL,
+            hearings INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (committee_code, hearing_type)
+        )
+    """,
+    # Hearings per committee and hearing date, for date ranges and recent activity
+    "stats_committee_dates": """
+        CREATE TABLE IF NOT EXISTS stats_committee_dates (
+            committee_code TEXT NOT NULL,
+            hearing_date TEXT NOT NULL,
+            hearings INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (committee_code, hearing_date)
+        )
+    """,
+    # Hearings by the day they were added, with review state of their assignments
+    "stats_hearings_daily": """
+        CREATE TABLE IF NOT EXISTS stats_hearings_daily (
+            day TEXT NOT NULL,
+            committee_code TEXT NOT NULL,
+            hearings INTEGER NOT NULL DEFAULT 0,
+            api_synced INTEGER NOT NULL DEFAULT 0,
+            website_synced INTEGER NOT NULL DEFAULT 0,
+            has_streams INTEGER NOT NULL DEFAULT 0,
+            pending_review INTEGER NOT NULL DEFAULT 0,
+            in_progress INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, committee_code)
+        )
+    """,
+    "stats_reviews_daily": """
+        CREATE TABLE IF NOT EXISTS stats_reviews_daily (
+            day TEXT PRIMARY KEY,
+            assignments INTEGER NOT NULL DEFAULT 0,
+            pending INTEGER NOT NULL DEFAULT 0,
+            in_progress INTEGER NOT NULL DEFAULT 0,
+            completed INTEGER NOT NULL DEFAULT 0,
+            duration_sum REAL NOT NULL DEFAULT 0,
+            duration_count INTEGER NOT NULL DEFAULT 0
+        )
+    """,
+    "stats_alerts_daily": """
+        CREATE TABLE IF NOT EXISTS stats_alerts_daily (
+            day TEXT NOT NULL,
+            severity TEXT NOT NULL,
+            alerts INTEGER NOT NULL DEFAULT 0,
+            active INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, severity)
+        )
+    """,
+    "stats_active_alerts": """
+        CREATE TABLE IF NOT EXISTS stats_active_alerts (
+            severity TEXT PRIMARY KEY,
+            alerts INTEGER NOT NULL DEFAULT 0
+        )
+    """,
+    "stats_quality_daily": """
+        CREATE TABLE IF NOT EXISTS stats_quality_daily (
+            day TEXT NOT NULL,
+            metric_type TEXT NOT NULL,
+            value_sum REAL NOT NULL DEFAULT 0,
+            value_count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, metric_type)
+        )
+    """
+}
+
+# Indexes for the remaining non-aggregate dashboard reads and trigger lookups
+STATS_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_hearings_unified_created_at ON hearings_unified(created_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_review_assignments_hearing_id ON review_assignments(hearing_id)",
+    "CREATE INDEX IF NOT EXISTS idx_review_assignments_completed_at ON review_assignments(completed_at DESC)"
+]
+
+REVIEW_STATUSES = ("pending", "in_progress", "completed")
+
+
+def _upsert(table: str, keys: List[str], values: Dict[str, str], select_from: Optional[str] = None) -> str:
+    """INSERT ... ON CONFLICT statement adding values onto an aggregate row"""
+    columns = list(values)
+    updates = ", ".join(f"{c} = {c} + excluded.{c}" for c in columns if c not in keys)
+    if select_from:
+        source = f"SELECT {', '.join(values.values())} FROM {select_from}"
+    else:
+        source = f"VALUES ({', '.join(values.values())})"
+    return (f"INSERT INTO {table} ({', '.join(columns)}) {source} "
+            f"ON CONFLICT({', '.join(keys)}) DO UPDATE SET {updates};")
+
+
+def _flag(condition: str) -> str:
+    """0/1 for a condition, treating NULL as false"""
+    return f"IFNULL({condition}, 0)"
+
+
+def _hearing_delta(ref: str, sign: str) -> str:
+    """Trigger statements applying one hearing row (NEW or OLD) with sign +1 or -1"""
+    confidence = f"{ref}.sync_confidence"
+    return "\n".join([
+        _upsert("stats_committees", ["committee_code"], {
+            "committee_code": f"{ref}.committee_code",
+            "hearings": sign,
+            "confidence_sum": f"{sign} * IFNULL({confidence}, 0)",
+            "confidence_count": f"{sign} * ({confidence} IS NOT NULL)"
+        }),
+        _upsert("stats_committee_types", ["committee_code", "hearing_type"], {
+            "committee_code": f"{ref}.committee_code",
+            "hearing_type": f"IFNULL({ref}.hearing_type, '')",
+            "hearings": sign
+        }),
+        _upsert("stats_committee_dates", ["committee_code", "hearing_date"], {
+            "committee_code": f"{ref}.committee_code",
+            "hearing_date": f"{ref}.hearing_date",
+            "hearings": sign
+        }),
+        _upsert("stats_hearings_daily", ["day", "committee_code"], {
+            "day": f"IFNULL(date({ref}.created_at), '')",
+            "committee_code": f"{ref}.committee_code",
+            "hearings": sign,
+            "api_synced": f"{sign} * " + _flag(f"{ref}.source_api = 1"),
+            "website_synced": f"{sign} * " + _flag(f"{ref}.source_website = 1"),
+            "has_streams": f"{sign} * " + _flag(f"{ref}.streams != '{{}}'"),
+            "pending_review": f"{sign} * (SELECT COUNT(*) FROM review_assignments "
+                              f"WHERE hearing_id = CAST({ref}.id AS TEXT) AND status = 'pending')",
+            "in_progress": f"{sign} * (SELECT COUNT(*) FROM review_assignments "
+                           f"WHERE hearing_id = CAST({ref}.id AS TEXT) AND status = 'in_progress')"
+        }),
+        f"DELETE FROM stats_committee_types WHERE committee_code = {ref}.committee_code "
+        f"AND hearing_type = IFNULL({ref}.hearing_type, '') AND hearings <= 0;",
+        f"DELETE FROM stats_committee_dates WHERE committee_code = {ref}.committee_code "
+        f"AND hearing_date = {ref}.hearing_date AND hearings <= 0;",
+        f"DELETE FROM stats_committees WHERE committee_code = {ref}.committee_code AND hearings <= 0;",
+        f"""UPDATE stats_committees SET
+            earliest_hearing = (SELECT MIN(hearing_date) FROM stats_committee_dates WHERE committee_code = {ref}.committee_code),
+            latest_hearing = (SELECT MAX(hearing_date) FROM stats_committee_dates WHERE committee_code = {ref}.committee_code)
+            WHERE committee_code = {ref}.committee_code;"""
+    ])
+
+
+def _review_delta(ref: str, sign: str) -> str:
+    """Trigger statements applying one review assignment row"""
+    completed = f"{ref}.status = 'completed' AND {ref}.actual_duration_minutes IS NOT NULL"
+    return "\n".join([
+        _upsert("stats_reviews_daily", ["day"], {
+            "day": f"IFNULL(date({ref}.created_at), '')",
+            "assignments": sign,
+            "pending": f"{sign} * " + _flag(f"{ref}.status = 'pending'"),
+            "in_progress": f"{sign} * " + _flag(f"{ref}.status = 'in_progress'"),
+            "completed": f"{sign} * " + _flag(f"{ref}.status = 'completed'"),
+            "duration_sum": f"{sign} * (CASE WHEN {completed} THEN {ref}.actual_duration_minutes ELSE 0 END)",
+            "duration_count": f"{sign} * " + _flag(completed)
+        }),
+        # Review state is also counted against the reviewed hearing's day
+        _upsert("stats_hearings_daily", ["day", "committee_code"], {
+            "day": "IFNULL(date(h.created_at), '')",
+            "committee_code": "h.committee_code",
+            "hearings": "0",
+            "api_synced": "0",
+            "website_synced": "0",
+            "has_streams": "0",
+            "pending_review": f"{sign} * " + _flag(f"{ref}.status = 'pending'"),
+            "in_progress": f"{sign} * " + _flag(f"{ref}.status = 'in_progress'")
+        }, select_from=f"hearings_unified h WHERE h.id = CAST({ref}.hearing_id AS INTEGER) "
+                       f"AND CAST(h.id AS TEXT) = {ref}.hearing_id")
+    ])
+
+
+def _alert_delta(ref: str, sign: str) -> str:
+    """Trigger statements applying one system alert row"""
+    active = _flag(f"{ref}.resolved = FALSE")
+    return "\n".join([
+        _upsert("stats_alerts_daily", ["day", "severity"], {
+            "day": f"IFNULL(date({ref}.created_at), '')",
+            "severity": f"{ref}.severity",
+            "alerts": sign,
+            "active": f"{sign} * {active}"
+        }),
+        _upsert("stats_active_alerts", ["severity"], {
+            "severity": f"{ref}.severity",
+            "alerts": f"{sign} * {active}"
+        })
+    ])
+
+
+def _quality_delta(ref: str, sign: str) -> str:
+    """Trigger statements applying one quality metric row"""
+    return _upsert("stats_quality_daily", ["day", "metric_type"], {
+        "day": f"IFNULL(date({ref}.recorded_at), '')",
+        "metric_type": f"{ref}.metric_type",
+        "value_sum": f"{sign} * {ref}.metric_value",
+        "value_count": sign
+    })
+
+
+# (base table, columns whose updates change the aggregates, delta builder)
+TRIGGER_SOURCES = [
+    ("hearings_unified", ["committee_code", "hearing_date", "hearing_type", "sync_confidence",
+                          "source_api", "source_website", "streams", "created_at"], _hearing_delta),
+    ("review_assignments", ["hearing_id", "status", "actual_duration_minutes", "created_at"], _review_delta),
+    ("system_alerts", ["severity", "resolved", "created_at"], _alert_delta),
+    ("quality_metrics", ["metric_type", "metric_value", "recorded_at"], _quality_delta)
+]
+
+
+def _trigger_sql(table: str, columns: List[str], delta) -> Dict[str, str]:
+    prefix = f"stats_{table}"
+    return {
+        f"{prefix}_ai": f"CREATE TRIGGER IF NOT EXISTS {prefix}_ai AFTER INSERT ON {table} BEGIN\n"
+                        f"{delta('NEW', '1')}\nEND",
+        f"{prefix}_ad": f"CREATE TRIGGER IF NOT EXISTS {prefix}_ad AFTER DELETE ON {table} BEGIN\n"
+                        f"{delta('OLD', '-1')}\nEND",
+        f"{prefix}_au": f"CREATE TRIGGER IF NOT EXISTS {prefix}_au AFTER UPDATE OF {', '.join(columns)} "
+                        f"ON {table} BEGIN\n{delta('OLD', '-1')}\n{delta('NEW', '1')}\nEND"
+    }
+
+
+def ensure_dashboard_stats(conn: sqlite3.Connection) -> bool:
+    """
+    Create the stats tables and their triggers, filling them on first creation.
+
+    Requires hearings_unified and the UI tables (review_assignments,
+    system_alerts, quality_metrics) to exist.
+
+    Returns:
+        True if the stats were built from scratch
+    """
+    existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    created = not set(STATS_TABLES) <= existing
+
+    for sql in STATS_TABLES.values():
+        conn.execute(sql)
+    for sql in STATS_INDEXES:
+        conn.execute(sql)
+    for table, columns, delta in TRIGGER_SOURCES:
+        for sql in _trigger_sql(table, columns, delta).values():
+            conn.execute(sql)
+
+    if created:
+        rebuild_dashboard_stats(conn)
+    return created
+
+
+def rebuild_dashboard_stats(conn: sqlite3.Connection):
+    """Recompute every stats table from the base tables"""
+    for table in STATS_TABLES:
+        conn.execute(f"DELETE FROM {table}")
+
+    conn.execute("""
+        INSERT INTO stats_committee_dates (committee_code, hearing_date, hearings)
+        SELECT committee_code, hearing_date, COUNT(*) FROM hearings_unified
+        GROUP BY committee_code, hearing_date
+    """)
+    conn.execute("""
+        INSERT INTO stats_committees (committee_code, hearings, confidence_sum, confidence_count,
+                                      earliest_hearing, latest_hearing)
+        SELECT committee_code, COUNT(*), IFNULL(SUM(sync_confidence), 0), COUNT(sync_confidence),
+               MIN(hearing_date), MAX(hearing_date)
+        FROM hearings_unified GROUP BY committee_code
+    """)
+    conn.execute("""
+        INSERT INTO stats_committee_types (committee_code, hearing_type, hearings)
+        SELECT committee_code, IFNULL(hearing_type, ''), COUNT(*) FROM hearings_unified
+        GROUP BY committee_code, IFNULL(hearing_type, '')
+    """)
+    conn.execute("""
+        INSERT INTO stats_hearings_daily (day, committee_code, hearings, api_synced, website_synced,
+                                          has_streams, pending_review, in_progress)
+        SELECT IFNULL(date(h.created_at), ''), h.committee_code, COUNT(*),
+               SUM(IFNULL(h.source_api = 1, 0)), SUM(IFNULL(h.source_website = 1, 0)),
+               SUM(IFNULL(h.streams != '{}', 0)),
+               IFNULL(SUM(r.pending), 0), IFNULL(SUM(r.in_progress), 0)
+        FROM hearings_unified h
+        LEFT JOIN (
+            SELECT hearing_id, SUM(IFNULL(status = 'pending', 0)) AS pending,
+                   SUM(IFNULL(status = 'in_progress', 0)) AS in_progress
+            FROM review_assignments GROUP BY hearing_id
+        ) r ON r.hearing_id = CAST(h.id AS TEXT)
+        GROUP BY 1, 2
+    """)
+    conn.execute("""
+        INSERT INTO stats_reviews_daily (day, assignments, pending, in_progress, completed,
+                                         duration_sum, duration_count)
+        SELECT IFNULL(date(created_at), ''), COUNT(*), SUM(IFNULL(status = 'pending', 0)),
+               SUM(IFNULL(status = 'in_progress', 0)), SUM(IFNULL(status = 'completed', 0)),
+               IFNULL(SUM(CASE WHEN status = 'completed' THEN actual_duration_minutes END), 0),
+               COUNT(CASE WHEN status = 'completed' THEN actual_duration_minutes END)
+        FROM review_assignments GROUP BY 1
+    """)
+    conn.execute("""
+        INSERT INTO stats_alerts_daily (day, severity, alerts, active)
+        SELECT IFNULL(date(created_at), ''), severity, COUNT(*), SUM(IFNULL(resolved = FALSE, 0))
+        FROM system_alerts GROUP BY 1, 2
+    """)
+    conn.execute("""
+        INSERT INTO stats_active_alerts (severity, alerts)
+        SELECT severity, SUM(IFNULL(resolved = FALSE, 0)) FROM system_alerts GROUP BY severity
+    """)
+    conn.execute("""
+        INSERT INTO stats_quality_daily (day, metric_type, value_sum, value_count)
+        SELECT IFNULL(date(recorded_at), ''), metric_type, SUM(metric_value), COUNT(*)
+        FROM quality_metrics GROUP BY 1, 2
+    """)
+    logger.info("Dashboard statistics rebuilt")
+
+
+# Reads
+
+def get_committee_summaries(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
+    """Hearing count, latest hearing and average sync confidence per committee"""
+    cursor = conn.execute("""
+        SELECT committee_code, hearings, latest_hearing,
+               CASE WHEN confidence_count > 0 THEN confidence_sum / confidence_count END
+        FROM stats_committees
+        ORDER BY hearings DESC
+    """)
+    return [
+        {"committee_code": row[0], "hearing_count": row[1], "latest_hearing": row[2], "avg_confidence": row[3]}
+        for row in cursor.fetchall()
+    ]
+
+
+def get_hearing_count(conn: sqlite3.Connection, committee_codes: Optional[List[str]] = None) -> int:
+    """Total hearings, optionally limited to some committees"""
+    if committee_codes:
+        placeholders = ", ".join("?" for _ in committee_codes)
+        return conn.execute(f"SELECT IFNULL(SUM(hearings), 0) FROM stats_committees "
+                            f"WHERE committee_code IN ({placeholders})", list(committee_codes)).fetchone()[0]
+    return conn.execute("SELECT IFNULL(SUM(hearings), 0) FROM stats_committees").fetchone()[0]
+
+
+def get_committee_stats(conn: sqlite3.Connection, committee_code: str, recent_days: int = 30) -> Dict[str, Any]:
+    """Totals, date range, hearing types and recent activity for one committee"""
+    row = conn.execute("""
+        SELECT hearings, earliest_hearing, latest_hearing,
+               CASE WHEN confidence_count > 0 THEN confidence_sum / confidence_count END
+        FROM stats_committees WHERE committee_code = ?
+    """, (committee_code,)).fetchone()
+
+    hearing_types = [
+        {"type": type_row[0], "count": type_row[1]}
+        for type_row in conn.execute("""
+            SELECT NULLIF(hearing_type, ''), hearings FROM stats_committee_types
+            WHERE committee_code = ? ORDER BY hearings DESC
+        """, (committee_code,)).fetchall()
+    ]
+
+    recent = conn.execute("""
+        SELECT IFNULL(SUM(hearings), 0) FROM stats_committee_dates
+        WHERE committee_code = ? AND hearing_date >= date('now', ?)
+    """, (committee_code, f"-{int(recent_days)} days")).fetchone()[0]
+
+    return {
+        "total_hearings": row[0] if row else 0,
+        "earliest_hearing": row[1] if row else None,
+        "latest_hearing": row[2] if row else None,
+        "avg_confidence": row[3] if row else None,
+        "hearing_type_count": sum(1 for t in hearing_types if t["type"] is not None),
+        "hearing_types": hearing_types,
+        "recent_activity": recent
+    }
+
+
+def get_dashboard_stats(conn: sqlite3.Connection, hearing_days: int = 30, review_days: int = 30,
+                        alert_days: int = 7) -> Dict[str, Dict[str, Any]]:
+    """Hearing, review and alert statistics over recent day windows"""
+    hearings = conn.execute("""
+        SELECT IFNULL(SUM(hearings), 0) AS total_hearings,
+               IFNULL(SUM(api_synced), 0) AS api_synced,
+               IFNULL(SUM(website_synced), 0) AS website_synced,
+               IFNULL(SUM(has_streams), 0) AS has_streams,
+               COUNT(DISTINCT CASE WHEN hearings > 0 THEN committee_code END) AS active_committees
+        FROM stats_hearings_daily WHERE day >= date('now', ?)
+    """, (f"-{int(hearing_days)} days",)).fetchone()
+
+    reviews = conn.execute("""
+        SELECT IFNULL(SUM(assignments), 0) AS total_assignments,
+               IFNULL(SUM(pending), 0) AS pending,
+               IFNULL(SUM(in_progress), 0) AS in_progress,
+               IFNULL(SUM(completed), 0) AS completed,
+               CASE WHEN SUM(duration_count) > 0 THEN SUM(duration_sum) / SUM(duration_count) END AS avg_review_time
+        FROM stats_reviews_daily WHERE day >= date('now', ?)
+    """, (f"-{int(review_days)} days",)).fetchone()
+
+    alerts = conn.execute("""
+        SELECT IFNULL(SUM(alerts), 0) AS total_alerts,
+               IFNULL(SUM(active), 0) AS active_alerts,
+               IFNULL(SUM(CASE WHEN severity = 'critical' THEN active ELSE 0 END), 0) AS critical_alerts
+        FROM stats_alerts_daily WHERE day >= date('now', ?)
+    """, (f"-{int(alert_days)} days",)).fetchone()
+
+    names = lambda cursor_row, keys: dict(zip(keys, cursor_row))
+    return {
+        "hearings": names(hearings, ["total_hearings", "api_synced", "website_synced",
+                                     "has_streams", "active_committees"]),
+        "reviews": names(reviews, ["total_assignments", "pending", "in_progress",
+                                   "completed", "avg_review_time"]),
+        "alerts": names(alerts, ["total_alerts", "active_alerts", "critical_alerts"])
+    }
+
+
+def get_queue_summary(conn: sqlite3.Connection, days: int = 14) -> Dict[str, Any]:
+    """Recently added hearings with their review state and capture readiness"""
+    row = conn.execute("""
+        SELECT IFNULL(SUM(hearings), 0), IFNULL(SUM(pending_review), 0),
+               IFNULL(SUM(in_progress), 0), IFNULL(SUM(has_streams), 0)
+        FROM stats_hearings_daily WHERE day >= date('now', ?)
+    """, (f"-{int(days)} days",)).fetchone()
+    return {"total": row[0], "pending_review": row[1], "in_progress": row[2], "ready_for_capture": row[3]}
+
+
+def get_active_alert_counts(conn: sqlite3.Connection) -> Dict[str, int]:
+    """Unresolved alerts per severity"""
+    return {row[0]: row[1] for row in conn.execute(
+        "SELECT severity, alerts FROM stats_active_alerts WHERE alerts > 0").fetchall()}
+
+
+def get_quality_averages(conn: sqlite3.Connection, days: int = 7) -> Dict[str, float]:
+    """Average value per quality metric type over recent days"""
+    return {row[0]: row[1] for row in conn.execute("""
+        SELECT metric_type, SUM(value_sum) / SUM(value_count)
+        FROM stats_quality_daily WHERE day >= date('now', ?)
+        GROUP BY metric_type HAVING SUM(value_count) > 0
+    """, (f"-{int(days)} days",)).fetchall()}
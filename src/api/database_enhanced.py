@@ -14,6 +14,8 @@ import uuid
 
 # Import the Phase 7A database
 from ..sync.database_schema import UnifiedHearingDatabase
+from . import dashboard_stats
+from .hearing_queue import apply_queue_migration
 
 logger = logging.getLogger(__name__)
 
@@ -126,6 +128,12 @@ class EnhancedUIDatabase(UnifiedHearingDatabase):
         # Create indexes for performance
         self._create_indexes()
         
+        # Typed review join and queue ordering columns for keyset pagination
+        apply_queue_migration(self.connection)
+        
+        # Trigger-maintained aggregates behind the dashboard endpoints
+        dashboard_stats.ensure_dashboard_stats(self.connection)
+        
         self.connection.commit()
         logger.info("Enhanced UI database schema created successfully")
     
@@ -218,7 +226,7 @@ class EnhancedUIDatabase(UnifiedHearingDatabase):
         cursor = self.connection.execute(f"""
             SELECT ra.*, h.hearing_title, h.committee_code, h.hearing_date
             FROM review_assignments ra
-            JOIN hearings_unified h ON ra.hearing_id = h.id
+            JOIN hearings_unified h ON h.id = ra.hearing_ref
             WHERE 1=1 {where_clause}
             ORDER BY ra.priority DESC, ra.created_at ASC
             LIMIT ?
@@ -435,6 +443,36 @@ class EnhancedUIDatabase(UnifiedHearingDatabase):
         
         return health_data
     
+    # Dashboard Statistics (materialized, see dashboard_stats)
+    def get_dashboard_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get hearing, review and alert statistics for the dashboard"""
+        return dashboard_stats.get_dashboard_stats(self.connection)
+    
+    def get_committee_summaries(self) -> List[Dict]:
+        """Get hearing count, latest hearing and confidence per committee"""
+        return dashboard_stats.get_committee_summaries(self.connection)
+    
+    def get_committee_stats(self, committee_code: str) -> Dict[str, Any]:
+        """Get totals, hearing types and recent activity for a committee"""
+        return dashboard_stats.get_committee_stats(self.connection, committee_code)
+    
+    def get_queue_summary(self, days: int = 14) -> Dict[str, Any]:
+        """Get review and capture state of recently added hearings"""
+        return dashboard_stats.get_queue_summary(self.connection, days)
+    
+    def get_active_alert_counts(self) -> Dict[str, int]:
+        """Get unresolved alert counts by severity"""
+        return dashboard_stats.get_active_alert_counts(self.connection)
+    
+    def get_quality_averages(self, days: int = 7) -> Dict[str, float]:
+        """Get average quality metric values over recent days"""
+        return dashboard_stats.get_quality_averages(self.connection, days)
+    
+    def rebuild_dashboard_stats(self):
+        """Recompute dashboard statistics from the base tables"""
+        dashboard_stats.rebuild_dashboard_stats(self.connection)
+        self.connection.commit()
+    
     # User Preferences Management
     def set_user_preference(self, user_id: str, key: str, value: str) -> bool:
         """Set user preference"""
@@ -459,10 +497,9 @@ class EnhancedUIDatabase(UnifiedHearingDatabase):
         return {row['preference_key']: row['preference_value'] for row in cursor.fetchall()}
     
     def close(self):
-        """Close database connection"""
-        if self.connection:
-            self.connection.close()
-            logger.info("Enhanced UI database connection closed")
+        """Close this thread's database connection"""
+        self._pool.close_thread_connection()
+        logger.info("Enhanced UI database connection closed")
 
 # Convenience function to get database instance
 def get_enhanced_db() -> EnhancedUIDatabase:
@@ -340,8 +340,7 @@ def setup_discovery_management_routes(app: FastAPI):
         """
         try:
             # Get from discovered hearings
-            hearings = discovery_service.get_discovered_hearings()
-            hearing = next((h for h in hearings if h.id == hearing_id), None)
+            hearing = discovery_service.get_discovered_hearing(hearing_id)
             
             if not hearing:
                 raise HTTPException(
@@ -277,6 +277,28 @@ class DiscoveryService:
             logger.error(f"Error getting hearing by URL: {e}")
             return None
     
+    def get_discovered_hearing(self, hearing_id: str) -> Optional[DiscoveredHearing]:
+        """
+        Get one discovered hearing by ID
+        
+        Args:
+            hearing_id: Hearing ID
+            
+        Returns:
+            The hearing, or None if not found
+        """
+        try:
+            cursor = self.db.connection.execute(
+                "SELECT * FROM discovered_hearings WHERE id = ?", (hearing_id,)
+            )
+            row = cursor.fetchone()
+            if row:
+                return self._row_to_discovered_hearing(row)
+            return None
+        except Exception as e:
+            logger.error(f"Error getting hearing {hearing_id}: {e}")
+            return None
+    
     def get_discovered_hearings(self, 
                                committee_codes: Optional[List[str]] = None,
                                status: Optional[str] = None,
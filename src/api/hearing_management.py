@@ -13,6 +13,10 @@ import json
 from pydantic import BaseModel
 
 from .database_enhanced import get_enhanced_db
+from .async_database import AsyncDatabase
+from .hearing_queue import fetch_queue_page, QueueCountCache
+from .dashboard_stats import get_hearing_count
+from ..storage.hearing_media import split_stream_types
 from ..sync.sync_orchestrator import SyncOrchestrator
 from ..sync.deduplication_engine import DeduplicationEngine
 from .capture_service import get_capture_service, CaptureException
@@ -20,6 +24,9 @@ from .transcription_service import get_transcription_service, TranscriptionExcep
 
 logger = logging.getLogger(__name__)
 
+# JSON text columns left out of queue listings
+LIST_OMITTED_FIELDS = ['streams', 'witnesses', 'documents', 'external_urls', 'location_info']
+
 # Pydantic models for request/response validation
 class HearingQueueFilter(BaseModel):
     committee_codes: Optional[List[str]] = None
@@ -50,6 +57,8 @@ class HearingManagementAPI:
     
     def __init__(self):
         self.db = get_enhanced_db()
+        self.async_db = AsyncDatabase(self.db)
+        self.queue_counts = QueueCountCache()
         self.sync_orchestrator = SyncOrchestrator()
         self.capture_service = get_capture_service()
         self.transcription_service = get_transcription_service()
@@ -63,8 +72,14 @@ class HearingManagementAPI:
                          date_to: Optional[str] = None,
                          has_streams: Optional[bool] = None,
                          limit: int = 100,
-                         offset: int = 0) -> Dict[str, Any]:
-        """Get hearing queue with filtering and pagination"""
+                         offset: int = 0,
+                         cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get hearing queue with filtering and pagination.
+        
+        Pass the returned next_cursor to get the following page; offset is
+        kept for older clients but walks every skipped row.
+        """
         
         try:
             # Build dynamic query conditions
@@ -93,63 +108,35 @@ class HearingManagementAPI:
                 params.append(date_to)
             
             if has_streams is not None:
-                if has_streams:
-                    conditions.append("h.streams IS NOT NULL AND h.streams != '{}'")
-                else:
-                    conditions.append("(h.streams IS NULL OR h.streams = '{}')")
-            
-            where_clause = " AND " + " AND ".join(conditions) if conditions else ""
-            
-            # Get total count
-            count_query = f"""
-                SELECT COUNT(*) as total
-                FROM hearings_unified h
-                WHERE 1=1 {where_clause}
-            """
+                conditions.append("h.has_audio_stream = ?")
+                params.append(1 if has_streams else 0)
             
-            cursor = self.db.connection.execute(count_query, params)
-            total_count = cursor.fetchone()['total']
+            # Unfiltered and committee totals come from the dashboard stats;
+            # other filter combinations are counted at most once a minute
+            if len(conditions) == (1 if committee_codes else 0):
+                total_count = get_hearing_count(self.db.connection, committee_codes)
+            else:
+                total_count = self.queue_counts.count(self.db.connection, conditions, params)
             
-            # Get hearings with pagination
-            params.extend([limit, offset])
+            try:
+                rows, next_cursor = fetch_queue_page(self.db.connection, conditions, params,
+                                                     limit=limit, cursor=cursor, offset=offset)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
             
-            hearings_query = f"""
-                SELECT h.*, 
-                       ra.status as review_status,
-                       ra.priority as review_priority,
-                       ra.assigned_to,
-                       ra.quality_score
-                FROM hearings_unified h
-                LEFT JOIN review_assignments ra ON CAST(h.id AS TEXT) = ra.hearing_id
-                WHERE 1=1 {where_clause}
-                ORDER BY 
-                    CASE WHEN ra.priority IS NOT NULL THEN ra.priority ELSE 0 END DESC,
-                    h.hearing_date DESC
-                LIMIT ? OFFSET ?
-            """
-            
-            cursor = self.db.connection.execute(hearings_query, params)
             hearings = []
             
-            for row in cursor.fetchall():
+            for row in rows:
                 hearing = dict(row)
                 
-                # Parse JSON fields (handle missing fields gracefully)
-                def safe_json_parse(value, default):
-                    if not value or value in ['{}', '[]', 'null', 'NULL']:
-                        return default
-                    try:
-                        return json.loads(value)
-                    except (json.JSONDecodeError, TypeError):
-                        return default
-                
-                hearing['streams'] = safe_json_parse(hearing.get('streams'), {})
-                hearing['witnesses'] = safe_json_parse(hearing.get('witnesses'), [])
-                hearing['documents'] = safe_json_parse(hearing.get('documents'), [])
-                hearing['external_urls'] = safe_json_parse(hearing.get('external_urls'), [])
+                # Full JSON fields are only returned by the details endpoint;
+                # the list uses the derived media columns instead
+                for field in LIST_OMITTED_FIELDS:
+                    hearing.pop(field, None)
+                hearing['stream_types'] = split_stream_types(hearing['stream_types'])
                 
                 # Add computed fields
-                hearing['has_streams'] = bool(hearing['streams'])
+                hearing['has_streams'] = bool(hearing['has_audio_stream'])
                 hearing['sync_sources'] = []
                 if hearing['source_api']:
                     hearing['sync_sources'].append('congress_api')
@@ -169,8 +156,9 @@ class HearingManagementAPI:
                 'pagination': {
                     'total': total_count,
                     'limit': limit,
-                    'offset': offset,
-                    'has_more': offset + limit < total_count
+                    'offset': 0 if cursor else offset,
+                    'next_cursor': next_cursor,
+                    'has_more': next_cursor is not None
                 },
                 'filters_applied': {
                     'committee_codes': committee_codes,
@@ -181,6 +169,8 @@ class HearingManagementAPI:
                 }
             }
             
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error getting hearing queue: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
@@ -201,7 +191,7 @@ class HearingManagementAPI:
                        ra.started_at as review_started_at,
                        ra.completed_at as review_completed_at
                 FROM hearings_unified h
-                LEFT JOIN review_assignments ra ON CAST(h.id AS TEXT) = ra.hearing_id
+                LEFT JOIN review_assignments ra ON ra.hearing_ref = h.id
                 WHERE h.id = ?
             """, (hearing_id,))
             
@@ -311,7 +301,7 @@ class HearingManagementAPI:
         
         try:
             # Get hearing details
-            hearing = self.get_hearing_details(hearing_id)
+            hearing = await self.async_db.run(self.get_hearing_details, hearing_id)
             
             if not hearing['has_streams']:
                 raise HTTPException(
@@ -325,19 +315,19 @@ class HearingManagementAPI:
                 logger.warning(f"Low capture readiness for hearing {hearing_id}: {readiness}")
             
             # Create review assignment if doesn't exist
-            cursor = self.db.connection.execute("""
+            assignment = await self.async_db.fetch_one("""
                 SELECT assignment_id FROM review_assignments 
                 WHERE hearing_id = ?
             """, (hearing_id,))
             
-            if not cursor.fetchone():
-                assignment_id = self.db.create_review_assignment(
+            if not assignment:
+                assignment_id = await self.async_db.create_review_assignment(
                     hearing_id=hearing_id,
                     priority=priority
                 )
             
             # Update sync status
-            self.db.update_sync_status(
+            await self.async_db.update_sync_status(
                 component="transcription",
                 status="healthy",
                 committee_code=hearing['committee_code'],
@@ -734,13 +724,15 @@ def setup_hearing_management_routes(app: FastAPI):
         date_to: Optional[str] = Query(None, description="End date filter (ISO format)"),
         has_streams: Optional[bool] = Query(None, description="Filter by stream availability"),
         limit: int = Query(100, ge=1, le=500, description="Results per page"),
-        offset: int = Query(0, ge=0, description="Results offset")
+        offset: int = Query(0, ge=0, description="Results offset (ignored when cursor is given)"),
+        cursor: Optional[str] = Query(None, description="next_cursor from the previous page")
     ):
         """Get hearing queue with optional filtering"""
         
         committee_list = committee_codes.split(',') if committee_codes else None
         
-        return api.get_hearing_queue(
+        return await api.async_db.run(
+            api.get_hearing_queue,
             committee_codes=committee_list,
             status=status,
             sync_status=sync_status,
@@ -748,13 +740,14 @@ def setup_hearing_management_routes(app: FastAPI):
             date_to=date_to,
             has_streams=has_streams,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor
         )
     
     @app.get("/api/hearings/{hearing_id}")
     async def get_hearing_details(hearing_id: str):
         """Get detailed hearing information"""
-        return api.get_hearing_details(hearing_id)
+        return await api.async_db.run(api.get_hearing_details, hearing_id)
     
     @app.put("/api/hearings/{hearing_id}/priority")
     async def update_hearing_priority(
@@ -763,7 +756,8 @@ def setup_hearing_management_routes(app: FastAPI):
         user_id: str = Query(..., description="User ID for audit trail")
     ):
         """Update hearing capture priority"""
-        return api.update_hearing_priority(
+        return await api.async_db.run(
+            api.update_hearing_priority,
             hearing_id=hearing_id,
             priority=priority_data.priority,
             user_id=user_id,
@@ -820,7 +814,7 @@ def setup_hearing_management_routes(app: FastAPI):
         limit: int = Query(50, ge=1, le=200, description="Maximum duplicates to return")
     ):
         """Get hearings requiring duplicate resolution"""
-        return api.get_duplicate_queue(limit=limit)
+        return await api.async_db.run(api.get_duplicate_queue, limit=limit)
     
     @app.post("/api/duplicates/resolve")
     async def resolve_duplicate(
@@ -828,4 +822,4 @@ def setup_hearing_management_routes(app: FastAPI):
         user_id: str = Query(..., description="User ID for audit trail")
     ):
         """Resolve duplicate hearing pair"""
-        return api.resolve_duplicate(resolution=resolution, user_id=user_id)
\ No newline at end of file
+        return await api.async_db.run(api.resolve_duplicate, resolution=resolution, user_id=user_id)
\ No newline at end of file
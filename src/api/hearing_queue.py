@@ -0,0 +1,213 @@
+"""
+Hearing queue ordering and keyset pagination
+The queue is ordered by (queue_priority, hearing_date, id), all stored on
+hearings_unified and covered by composite indexes, so any page is an index
+range scan from the previous page's last key instead of an OFFSET walk.
+queue_priority mirrors the highest review assignment priority, and
+review_assignments.hearing_ref is an INTEGER copy of hearing_id for joins;
+triggers keep both current for every writer.
+"""
+
+import base64
+import json
+import sqlite3
+import threading
+import time
+import logging
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+QUEUE_ORDER = "h.queue_priority DESC, h.hearing_date DESC, h.id DESC"
+
+# hearing_id as INTEGER when it is the text of a hearings_unified id, else NULL
+_TYPED_REF = "CASE WHEN CAST(CAST({0} AS INTEGER) AS TEXT) = {0} THEN CAST({0} AS INTEGER) END"
+
+_RECOMPUTE_PRIORITY = """
+    UPDATE hearings_unified SET queue_priority = (
+        SELECT IFNULL(MAX(priority), 0) FROM review_assignments WHERE hearing_ref = {0}
+    ) WHERE id = {0};
+"""
+
+QUEUE_COLUMNS = [
+    ("review_assignments", "hearing_ref INTEGER"),
+    ("hearings_unified", "queue_priority INTEGER NOT NULL DEFAULT 0")
+]
+
+QUEUE_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_review_assignments_hearing_ref "
+    "ON review_assignments(hearing_ref, priority DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_hearings_queue_order "
+    "ON hearings_unified(queue_priority DESC, hearing_date DESC, id DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_hearings_committee_queue_order "
+    "ON hearings_unified(committee_code, queue_priority DESC, hearing_date DESC, id DESC)"
+]
+
+QUEUE_TRIGGERS = {
+    "queue_review_assignments_ai": f"""
+        CREATE TRIGGER IF NOT EXISTS queue_review_assignments_ai AFTER INSERT ON review_assignments BEGIN
+            UPDATE review_assignments SET hearing_ref = {_TYPED_REF.format('NEW.hearing_id')}
+            WHERE rowid = NEW.rowid;
+            {_RECOMPUTE_PRIORITY.format(_TYPED_REF.format('NEW.hearing_id'))}
+        END
+    """,
+    "queue_review_assignments_au": f"""
+        CREATE TRIGGER IF NOT EXISTS queue_review_assignments_au
+        AFTER UPDATE OF hearing_id, priority ON review_assignments BEGIN
+            UPDATE review_assignments SET hearing_ref = {_TYPED_REF.format('NEW.hearing_id')}
+            WHERE rowid = NEW.rowid;
+            {_RECOMPUTE_PRIORITY.format('OLD.hearing_ref')}
+            {_RECOMPUTE_PRIORITY.format(_TYPED_REF.format('NEW.hearing_id'))}
+        END
+    """,
+    "queue_review_assignments_ad": f"""
+        CREATE TRIGGER IF NOT EXISTS queue_review_assignments_ad AFTER DELETE ON review_assignments BEGIN
+            {_RECOMPUTE_PRIORITY.format('OLD.hearing_ref')}
+        END
+    """
+}
+
+
+def _columns(conn: sqlite3.Connection, table: str) -> List[str]:
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table})").fetchall()]
+
+
+def apply_queue_migration(conn: sqlite3.Connection) -> bool:
+    """
+    Add the typed join and queue priority columns, their indexes and triggers.
+
+    Safe to run repeatedly; existing rows are backfilled when the columns
+    are first added.
+
+    Returns:
+        True if columns were added (first run on this database)
+    """
+    added = False
+    for table, column in QUEUE_COLUMNS:
+        if column.split()[0] not in _columns(conn, table):
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column}")
+            added = True
+
+    if added:
+        backfill_queue_columns(conn)
+
+    for sql in QUEUE_INDEXES:
+        conn.execute(sql)
+    for sql in QUEUE_TRIGGERS.values():
+        conn.execute(sql)
+    return added
+
+
+def backfill_queue_columns(conn: sqlite3.Connection):
+    """Recompute hearing_ref and queue_priority from review_assignments"""
+    conn.execute(f"UPDATE review_assignments SET hearing_ref = {_TYPED_REF.format('hearing_id')}")
+    conn.execute("""
+        UPDATE hearings_unified SET queue_priority = IFNULL((
+            SELECT MAX(priority) FROM review_assignments WHERE hearing_ref = hearings_unified.id
+        ), 0)
+    """)
+    logger.info("Backfilled hearing queue columns")
+
+
+# Cursors
+
+def encode_queue_cursor(row: Dict[str, Any]) -> str:
+    """Opaque cursor positioned after the given queue row"""
+    key = [row["queue_priority"], row["hearing_date"], row["id"]]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode().rstrip("=")
+
+
+def decode_queue_cursor(cursor: str) -> Tuple[int, str, int]:
+    """
+    Queue key from a cursor.
+
+    Raises:
+        ValueError: If the cursor was not produced by encode_queue_cursor
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        priority, hearing_date, hearing_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return int(priority), str(hearing_date), int(hearing_id)
+    except Exception as e:
+        raise ValueError(f"Invalid queue cursor: {cursor}") from e
+
+
+def fetch_queue_page(conn: sqlite3.Connection,
+                     conditions: Sequence[str],
+                     params: Sequence,
+                     limit: int = 100,
+                     cursor: Optional[str] = None,
+                     offset: int = 0) -> Tuple[List[sqlite3.Row], Optional[str]]:
+    """
+    One page of the hearing queue.
+
+    Args:
+        conn: Database connection (row factory sqlite3.Row)
+        conditions: SQL filters on hearings_unified aliased as h
+        params: Parameters for conditions
+        limit: Page size
+        cursor: next_cursor from the previous page
+        offset: Legacy offset, applied only when no cursor is given
+
+    Returns:
+        (rows, next_cursor); next_cursor is None on the last page
+    """
+    conditions = list(conditions)
+    params = list(params)
+    if cursor:
+        conditions.append("(h.queue_priority, h.hearing_date, h.id) < (?, ?, ?)")
+        params.extend(decode_queue_cursor(cursor))
+
+    where_clause = " AND " + " AND ".join(conditions) if conditions else ""
+
+    # The review columns come from the hearing's top priority assignment
+    rows = conn.execute(f"""
+        SELECT h.*,
+               ra.status as review_status,
+               ra.priority as review_priority,
+               ra.assigned_to,
+               ra.quality_score
+        FROM hearings_unified h
+        LEFT JOIN review_assignments ra ON ra.rowid = (
+            SELECT rowid FROM review_assignments
+            WHERE hearing_ref = h.id
+            ORDER BY priority DESC
+            LIMIT 1
+        )
+        WHERE 1=1 {where_clause}
+        ORDER BY {QUEUE_ORDER}
+        LIMIT ? OFFSET ?
+    """, params + [limit + 1, 0 if cursor else offset]).fetchall()
+
+    next_cursor = encode_queue_cursor(dict(rows[limit - 1])) if len(rows) > limit else None
+    return rows[:limit], next_cursor
+
+
+class QueueCountCache:
+    """Short-lived cache of filtered queue totals"""
+
+    def __init__(self, ttl_seconds: float = 60.0):
+        self.ttl_seconds = ttl_seconds
+        self._counts: Dict[tuple, Tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def count(self, conn: sqlite3.Connection, conditions: Sequence[str], params: Sequence) -> int:
+        """Total queue rows matching the filters, recounted at most once per ttl"""
+        key = (tuple(conditions), tuple(params))
+        now = time.monotonic()
+        with self._lock:
+            cached = self._counts.get(key)
+            if cached and cached[0] > now:
+                return cached[1]
+
+        where_clause = " AND " + " AND ".join(conditions) if conditions else ""
+        total = conn.execute(f"SELECT COUNT(*) FROM hearings_unified h WHERE 1=1 {where_clause}",
+                             list(params)).fetchone()[0]
+
+        with self._lock:
+            self._counts[key] = (now + self.ttl_seconds, total)
+        return total
+
+    def clear(self):
+        with self._lock:
+            self._counts.clear()
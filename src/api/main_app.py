@@ -8,6 +8,7 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
+import asyncio
 import logging
 from pathlib import Path
 import json
@@ -22,6 +23,13 @@ from search_management import setup_search_routes
 from transcript_management import setup_transcript_routes
 from discovery_management import setup_discovery_management_routes
 from database_enhanced import get_enhanced_db
+from async_database import AsyncDatabase
+try:
+    from ..storage.connection_pool import close_all_pools
+    from ..storage.hearing_media import split_stream_types
+except ImportError:
+    from storage.connection_pool import close_all_pools
+    from storage.hearing_media import split_stream_types
 try:
     from .health import router as health_router
 except ImportError as e:
@@ -61,6 +69,7 @@ class EnhancedUIApp:
         )
         
         self.db = get_enhanced_db()
+        self.async_db = AsyncDatabase(self.db)
         self.dashboard_api = DashboardDataAPI()
         
         self._setup_middleware()
@@ -166,6 +175,11 @@ class EnhancedUIApp:
                 logger.error(f"Error during startup bootstrap: {e}")
                 # Don't fail the startup if bootstrap fails
                 pass
+        
+        @self.app.on_event("shutdown")
+        async def shutdown_event():
+            """Close pooled database connections"""
+            close_all_pools()
     
     def _setup_routes(self):
         """Setup all API routes"""
@@ -241,17 +255,8 @@ class EnhancedUIApp:
         async def get_committees():
             """Get committee statistics and hearing counts"""
             try:
-                # Get committee stats from database
-                cursor = self.db.connection.execute("""
-                    SELECT 
-                        committee_code,
-                        COUNT(*) as hearing_count,
-                        MAX(hearing_date) as latest_hearing,
-                        AVG(sync_confidence) as avg_confidence
-                    FROM hearings_unified 
-                    GROUP BY committee_code
-                    ORDER BY hearing_count DESC
-                """)
+                # Get committee stats from the materialized dashboard stats
+                summaries = await self.async_db.run(self.db.get_committee_summaries)
                 
                 committees = []
                 committee_names = {
@@ -262,13 +267,13 @@ class EnhancedUIApp:
                     'HJUD': 'House Judiciary'
                 }
                 
-                for row in cursor.fetchall():
+                for summary in summaries:
                     committees.append({
-                        'code': row[0],
-                        'name': committee_names.get(row[0], row[0]),
-                        'hearing_count': row[1],
-                        'latest_hearing': row[2],
-                        'avg_confidence': round(row[3], 2) if row[3] else 0
+                        'code': summary['committee_code'],
+                        'name': committee_names.get(summary['committee_code'], summary['committee_code']),
+                        'hearing_count': summary['hearing_count'],
+                        'latest_hearing': summary['latest_hearing'],
+                        'avg_confidence': round(summary['avg_confidence'], 2) if summary['avg_confidence'] else 0
                     })
                 
                 return {
@@ -288,7 +293,7 @@ class EnhancedUIApp:
         async def get_committee_hearings(committee_code: str):
             """Get all hearings for a specific committee"""
             try:
-                cursor = self.db.connection.execute("""
+                rows = await self.async_db.fetch_all("""
                     SELECT 
                         id,
                         committee_code,
@@ -296,7 +301,11 @@ class EnhancedUIApp:
                         hearing_date,
                         hearing_type,
                         sync_confidence,
-                        streams,
+                        has_audio_stream,
+                        primary_stream_type,
+                        primary_stream_url,
+                        stream_types,
+                        witness_count,
                         created_at,
                         updated_at
                     FROM hearings_unified 
@@ -305,7 +314,7 @@ class EnhancedUIApp:
                 """, (committee_code.upper(),))
                 
                 hearings = []
-                for row in cursor.fetchall():
+                for row in rows:
                     hearings.append({
                         'id': row[0],
                         'committee_code': row[1],
@@ -313,9 +322,13 @@ class EnhancedUIApp:
                         'date': row[3],
                         'type': row[4],
                         'sync_confidence': row[5],
-                        'streams': json.loads(row[6]) if row[6] else {},
-                        'created_at': row[7],
-                        'updated_at': row[8]
+                        'has_audio_stream': bool(row[6]),
+                        'primary_stream_type': row[7],
+                        'primary_stream_url': row[8],
+                        'stream_types': split_stream_types(row[9]),
+                        'witness_count': row[10],
+                        'created_at': row[11],
+                        'updated_at': row[12]
                     })
                 
                 committee_names = {
@@ -346,7 +359,7 @@ class EnhancedUIApp:
         async def get_hearing_details(hearing_id: int):
             """Get details for a specific hearing"""
             try:
-                cursor = self.db.connection.execute("""
+                row = await self.async_db.fetch_one("""
                     SELECT 
                         id,
                         committee_code,
@@ -369,7 +382,6 @@ class EnhancedUIApp:
                     WHERE id = ?
                 """, (hearing_id,))
                 
-                row = cursor.fetchone()
                 if not row:
                     return JSONResponse(
                         status_code=404,
@@ -413,13 +425,12 @@ class EnhancedUIApp:
             """Capture audio for a specific hearing"""
             try:
                 # Get hearing details first
-                cursor = self.db.connection.execute("""
+                row = await self.async_db.fetch_one("""
                     SELECT hearing_title, streams, status, processing_stage 
                     FROM hearings_unified 
                     WHERE id = ?
                 """, (hearing_id,))
                 
-                row = cursor.fetchone()
                 if not row:
                     return JSONResponse(
                         status_code=404,
@@ -437,14 +448,13 @@ class EnhancedUIApp:
                     )
                 
                 # Update hearing status to indicate capture started
-                self.db.connection.execute("""
+                await self.async_db.execute("""
                     UPDATE hearings_unified 
                     SET status = 'processing', 
                         processing_stage = 'captured',
                         status_updated_at = ?
                     WHERE id = ?
                 """, (datetime.now().isoformat(), hearing_id))
-                self.db.connection.commit()
                 
                 # Return success response (in production, this would trigger actual capture)
                 return {
@@ -466,7 +476,7 @@ class EnhancedUIApp:
         async def get_hearing_status(hearing_id: int):
             """Get processing status for a specific hearing"""
             try:
-                cursor = self.db.connection.execute("""
+                row = await self.async_db.fetch_one("""
                     SELECT 
                         id, hearing_title, status, processing_stage, 
                         status_updated_at, assigned_reviewer, reviewer_notes
@@ -474,7 +484,6 @@ class EnhancedUIApp:
                     WHERE id = ?
                 """, (hearing_id,))
                 
-                row = cursor.fetchone()
                 if not row:
                     return JSONResponse(
                         status_code=404,
@@ -510,47 +519,8 @@ class EnhancedUIApp:
         async def get_committee_stats(committee_code: str):
             """Get detailed statistics for a specific committee"""
             try:
-                # Basic stats
-                cursor = self.db.connection.execute("""
-                    SELECT 
-                        COUNT(*) as total_hearings,
-                        MIN(hearing_date) as earliest_hearing,
-                        MAX(hearing_date) as latest_hearing,
-                        AVG(sync_confidence) as avg_confidence,
-                        COUNT(DISTINCT hearing_type) as hearing_types
-                    FROM hearings_unified 
-                    WHERE committee_code = ?
-                """, (committee_code.upper(),))
-                
-                stats_row = cursor.fetchone()
-                
-                # Hearing types breakdown
-                cursor = self.db.connection.execute("""
-                    SELECT 
-                        hearing_type,
-                        COUNT(*) as count
-                    FROM hearings_unified 
-                    WHERE committee_code = ?
-                    GROUP BY hearing_type
-                    ORDER BY count DESC
-                """, (committee_code.upper(),))
-                
-                hearing_types = []
-                for row in cursor.fetchall():
-                    hearing_types.append({
-                        'type': row[0],
-                        'count': row[1]
-                    })
-                
-                # Recent activity (last 30 days)
-                cursor = self.db.connection.execute("""
-                    SELECT COUNT(*) as recent_hearings
-                    FROM hearings_unified 
-                    WHERE committee_code = ? 
-                    AND hearing_date >= date('now', '-30 days')
-                """, (committee_code.upper(),))
-                
-                recent_activity = cursor.fetchone()[0]
+                # Totals, hearing type breakdown and last 30 days of activity
+                stats = await self.async_db.run(self.db.get_committee_stats, committee_code.upper())
                 
                 committee_names = {
                     'SCOM': 'Commerce, Science, and Transportation',
@@ -566,12 +536,12 @@ class EnhancedUIApp:
                         'name': committee_names.get(committee_code.upper(), committee_code.upper())
                     },
                     'stats': {
-                        'total_hearings': stats_row[0],
-                        'earliest_hearing': stats_row[1],
-                        'latest_hearing': stats_row[2],
-                        'avg_confidence': round(stats_row[3], 2) if stats_row[3] else 0,
-                        'hearing_types': hearing_types,
-                        'recent_activity': recent_activity
+                        'total_hearings': stats['total_hearings'],
+                        'earliest_hearing': stats['earliest_hearing'],
+                        'latest_hearing': stats['latest_hearing'],
+                        'avg_confidence': round(stats['avg_confidence'], 2) if stats['avg_confidence'] else 0,
+                        'hearing_types': stats['hearing_types'],
+                        'recent_activity': stats['recent_activity']
                     }
                 }
                 
@@ -780,17 +750,13 @@ class EnhancedUIApp:
             """Get system overview combining multiple data sources"""
             
             try:
-                # Get hearing queue summary
-                hearing_queue = self._get_hearing_queue_summary()
-                
-                # Get system health summary
-                health_summary = self._get_health_summary()
-                
-                # Get recent activity
-                recent_activity = self._get_recent_activity()
-                
-                # Get performance metrics
-                performance = self._get_performance_summary()
+                # Queue, health, activity and performance summaries query concurrently
+                hearing_queue, health_summary, recent_activity, performance = await asyncio.gather(
+                    self.async_db.run(self._get_hearing_queue_summary),
+                    self.async_db.run(self._get_health_summary),
+                    self.async_db.run(self._get_recent_activity),
+                    self.async_db.run(self._get_performance_summary)
+                )
                 
                 return {
                     "overview": {
@@ -811,46 +777,11 @@ class EnhancedUIApp:
             """Get enhanced statistics for dashboard"""
             
             try:
-                # Get hearing statistics
-                cursor = self.db.connection.execute("""
-                    SELECT 
-                        COUNT(*) as total_hearings,
-                        SUM(CASE WHEN source_api = 1 THEN 1 ELSE 0 END) as api_synced,
-                        SUM(CASE WHEN source_website = 1 THEN 1 ELSE 0 END) as website_synced,
-                        SUM(CASE WHEN streams IS NOT NULL AND streams != '{}' THEN 1 ELSE 0 END) as has_streams,
-                        COUNT(DISTINCT committee_code) as active_committees
-                    FROM hearings_unified
-                    WHERE created_at >= datetime('now', '-30 days')
-                """)
-                
-                hearing_stats = dict(cursor.fetchone())
-                
-                # Get review statistics
-                cursor = self.db.connection.execute("""
-                    SELECT 
-                        COUNT(*) as total_assignments,
-                        SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END) as pending,
-                        SUM(CASE WHEN status = 'in_progress' THEN 1 ELSE 0 END) as in_progress,
-                        SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed,
-                        AVG(CASE WHEN status = 'completed' AND actual_duration_minutes IS NOT NULL 
-                               THEN actual_duration_minutes ELSE NULL END) as avg_review_time
-                    FROM review_assignments
-                    WHERE created_at >= datetime('now', '-30 days')
-                """)
-                
-                review_stats = dict(cursor.fetchone())
-                
-                # Get alert statistics
-                cursor = self.db.connection.execute("""
-                    SELECT 
-                        COUNT(*) as total_alerts,
-                        SUM(CASE WHEN resolved = FALSE THEN 1 ELSE 0 END) as active_alerts,
-                        SUM(CASE WHEN severity = 'critical' AND resolved = FALSE THEN 1 ELSE 0 END) as critical_alerts
-                    FROM system_alerts
-                    WHERE created_at >= datetime('now', '-7 days')
-                """)
-                
-                alert_stats = dict(cursor.fetchone())
+                # Hearing (30 days), review (30 days) and alert (7 days) statistics
+                stats = await self.async_db.run(self.db.get_dashboard_stats)
+                hearing_stats = stats['hearings']
+                review_stats = stats['reviews']
+                alert_stats = stats['alerts']
                 
                 return {
                     "hearings": hearing_stats,
@@ -956,14 +887,10 @@ class EnhancedUIApp:
         async def admin_status():
             """Check system status for admin purposes"""
             try:
-                # Get database connection
-                db = get_enhanced_db()
-                
                 # Check if hearings_unified table exists
-                cursor = db.connection.execute("""
+                table_exists = await self.async_db.fetch_one("""
                     SELECT name FROM sqlite_master WHERE type='table' AND name='hearings_unified'
-                """)
-                table_exists = cursor.fetchone() is not None
+                """) is not None
                 
                 if not table_exists:
                     return {
@@ -976,12 +903,10 @@ class EnhancedUIApp:
                     }
                 
                 # Check committees (from hearings_unified table)
-                cursor = db.connection.execute("SELECT COUNT(DISTINCT committee_code) FROM hearings_unified")
-                committee_count = cursor.fetchone()[0]
+                committee_count = await self.async_db.fetch_value("SELECT COUNT(DISTINCT committee_code) FROM hearings_unified")
                 
                 # Check hearings
-                cursor = db.connection.execute("SELECT COUNT(*) FROM hearings_unified")
-                hearing_count = cursor.fetchone()[0]
+                hearing_count = await self.async_db.fetch_value("SELECT COUNT(*) FROM hearings_unified")
                 
                 return {
                     "status": "healthy",
@@ -1150,25 +1075,14 @@ class EnhancedUIApp:
     def _get_hearing_queue_summary(self) -> Dict[str, Any]:
         """Get hearing queue summary"""
         
-        cursor = self.db.connection.execute("""
-            SELECT 
-                COUNT(*) as total,
-                SUM(CASE WHEN ra.status = 'pending' THEN 1 ELSE 0 END) as pending_review,
-                SUM(CASE WHEN ra.status = 'in_progress' THEN 1 ELSE 0 END) as in_progress,
-                SUM(CASE WHEN h.streams IS NOT NULL AND h.streams != '{}' THEN 1 ELSE 0 END) as ready_for_capture
-            FROM hearings_unified h
-            LEFT JOIN review_assignments ra ON CAST(h.id AS TEXT) = ra.hearing_id
-            WHERE h.created_at >= datetime('now', '-14 days')
-        """)
-        
-        return dict(cursor.fetchone())
+        return self.db.get_queue_summary(days=14)
     
     def _get_health_summary(self) -> Dict[str, Any]:
         """Get system health summary"""
         
-        alerts = self.db.get_active_alerts()
-        critical_count = sum(1 for a in alerts if a['severity'] == 'critical')
-        high_count = sum(1 for a in alerts if a['severity'] == 'high')
+        alert_counts = self.db.get_active_alert_counts()
+        critical_count = alert_counts.get('critical', 0)
+        high_count = alert_counts.get('high', 0)
         
         if critical_count > 0:
             status = "critical"
@@ -1179,7 +1093,7 @@ class EnhancedUIApp:
         
         return {
             "status": status,
-            "active_alerts": len(alerts),
+            "active_alerts": sum(alert_counts.values()),
             "critical_alerts": critical_count,
             "high_alerts": high_count
         }
@@ -1202,7 +1116,7 @@ class EnhancedUIApp:
         cursor = self.db.connection.execute("""
             SELECT ra.completed_at, h.hearing_title, h.committee_code
             FROM review_assignments ra
-            JOIN hearings_unified h ON CAST(h.id AS TEXT) = ra.hearing_id
+            JOIN hearings_unified h ON h.id = ra.hearing_ref
             WHERE ra.completed_at >= datetime('now', '-24 hours')
             ORDER BY ra.completed_at DESC
             LIMIT 5
@@ -1219,14 +1133,7 @@ class EnhancedUIApp:
         """Get performance summary"""
         
         # Get average quality metrics from last 7 days
-        cursor = self.db.connection.execute("""
-            SELECT metric_type, AVG(metric_value) as avg_value
-            FROM quality_metrics
-            WHERE recorded_at >= datetime('now', '-7 days')
-            GROUP BY metric_type
-        """)
-        
-        quality_metrics = {row['metric_type']: row['avg_value'] for row in cursor.fetchall()}
+        quality_metrics = self.db.get_quality_averages(days=7)
         
         return {
             "average_accuracy": quality_metrics.get('accuracy_score', 0),
@@ -17,6 +17,7 @@ from .discovery_service import get_discovery_service
 from .capture_service import get_capture_service, CaptureException
 from .transcription_service import get_transcription_service, TranscriptionException
 from ..audio.trimming import get_audio_trimmer
+from ..audio.dead_air import DeadAirRemover, OffsetMap
 from ..speaker.enhanced_labeling import get_enhanced_speaker_labeler
 
 logger = logging.getLogger(__name__)
@@ -72,8 +73,7 @@ class PipelineController:
         """
         try:
             # Check if hearing exists
-            hearings = self.discovery_service.get_discovered_hearings()
-            hearing = next((h for h in hearings if h.id == hearing_id), None)
+            hearing = self.discovery_service.get_discovered_hearing(hearing_id)
             
             if not hearing:
                 raise ValueError(f"Hearing {hearing_id} not found")
@@ -132,10 +132,13 @@ class PipelineController:
             # Stage 3: Trim Audio
             await self._update_progress(hearing_id, ProcessingStage.TRIMMING, 50, "Trimming silence from audio")
             trimmed_path = await self._trim_audio(hearing_id, converted_path, options)
+            compacted_path, offset_map = await self._remove_dead_air(hearing_id, trimmed_path, options)
             
             # Stage 4: Transcribe Audio
             await self._update_progress(hearing_id, ProcessingStage.TRANSCRIBING, 70, "Transcribing audio to text")
-            transcript_path = await self._transcribe_audio(hearing_id, trimmed_path, options)
+            transcript_path = await self._transcribe_audio(hearing_id, compacted_path, options)
+            if offset_map is not None:
+                self._restore_transcript_timestamps(transcript_path, offset_map)
             
             # Stage 5: Speaker Labeling
             await self._update_progress(hearing_id, ProcessingStage.SPEAKER_LABELING, 90, "Adding speaker labels")
@@ -260,6 +263,34 @@ class PipelineController:
             logger.error(f"Audio trimming failed for {hearing_id}: {e}")
             raise
     
+    async def _remove_dead_air(self, hearing_id: str, audio_path: Path, options: Dict[str, Any]):
+        """Cut recesses and other long non-speech spans before transcription"""
+        dead_air_options = dict(options.get("dead_air", {}))
+        if not dead_air_options.pop("enabled", True):
+            return audio_path, None
+        
+        try:
+            remover = DeadAirRemover(**dead_air_options)
+            output_path = audio_path.parent / f"{audio_path.stem}_compacted.mp3"
+            result = await asyncio.to_thread(remover.remove_dead_air, audio_path, output_path)
+            
+            logger.info(f"Dead air removal for {hearing_id}: {result['removed_seconds']:.1f}s removed "
+                        f"in {len(result['dead_air_spans'])} spans")
+            return Path(result["output_path"]), result["offset_map"]
+            
+        except Exception as e:
+            # Compaction only saves transcription time; fall back to the full audio
+            logger.warning(f"Dead air removal failed for {hearing_id}, transcribing full audio: {e}")
+            return audio_path, None
+    
+    def _restore_transcript_timestamps(self, transcript_path: Path, offset_map: OffsetMap):
+        """Map transcript timestamps from the compacted audio back to the trimmed recording"""
+        with open(transcript_path, 'r') as f:
+            transcript = json.load(f)
+        
+        with open(transcript_path, 'w') as f:
+            json.dump(offset_map.restore_transcript(transcript), f, indent=2)
+    
     async def _transcribe_audio(self, hearing_id: str, audio_path: Path, options: Dict[str, Any]) -> Path:
         """Transcribe audio to text"""
         try:
@@ -299,8 +330,7 @@ class PipelineController:
                 transcript = json.load(f)
             
             # Get hearing information for committee context
-            hearings = self.discovery_service.get_discovered_hearings()
-            hearing = next((h for h in hearings if h.id == hearing_id), None)
+            hearing = self.discovery_service.get_discovered_hearing(hearing_id)
             
             committee_code = hearing.committee_code if hearing else "UNKNOWN"
             logger.info(f"Using committee code for speaker labeling: {committee_code}")
@@ -0,0 +1,65 @@
+"""
+Database migration for hearing queue keyset pagination
+Adds the typed review join column, the denormalized queue priority and
+the composite indexes the hearing queue pages through
+"""
+
+import sqlite3
+import logging
+
+try:
+    from .hearing_queue import apply_queue_migration, backfill_queue_columns
+except ImportError:
+    from hearing_queue import apply_queue_migration, backfill_queue_columns
+
+logger = logging.getLogger(__name__)
+
+class QueueMigration:
+    """Handles database migration for the hearing queue"""
+
+    def __init__(self, db_path: str = "data/demo_enhanced_ui.db"):
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path)
+
+    def run_migration(self):
+        """Run the hearing queue migration"""
+        logger.info("Starting hearing queue migration...")
+
+        try:
+            if not apply_queue_migration(self.connection):
+                # Columns already present; make sure they agree with review_assignments
+                backfill_queue_columns(self.connection)
+            self._verify_migration()
+            self.connection.commit()
+            logger.info("Hearing queue migration completed successfully")
+            return True
+        except Exception as e:
+            logger.error(f"Hearing queue migration failed: {e}")
+            self.connection.rollback()
+            return False
+        finally:
+            self.connection.close()
+
+    def _verify_migration(self):
+        """Check the queue indexes exist and are used for the queue order"""
+        cursor = self.connection.execute("""
+            SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%queue%'
+        """)
+        indexes = [row[0] for row in cursor.fetchall()]
+        logger.info(f"Queue indexes: {indexes}")
+
+        plan = self.connection.execute("""
+            EXPLAIN QUERY PLAN
+            SELECT id FROM hearings_unified h
+            ORDER BY h.queue_priority DESC, h.hearing_date DESC, h.id DESC LIMIT 100
+        """).fetchall()
+        if any("USE TEMP B-TREE" in row[-1] for row in plan):
+            logger.warning("Hearing queue order is not served by an index")
+
+def run_migration():
+    """Convenience function to run the migration"""
+    return QueueMigration().run_migration()
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    run_migration()
@@ -0,0 +1,421 @@
+"""
+SQLite FTS5 full-text index for hearing and transcript search
+Keeps a hearings_fts virtual table in sync with hearings_unified through
+triggers and adds transcript segment text, so searches use BM25 ranking and
+snippet() highlighting in SQL instead of LIKE scans re-scored in Python.
+Every transcript segment is also indexed on its own with its hearing,
+timestamps and speaker, so searches can return time-offset hits.
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Dict, Any, List
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "hearings_fts"
+
+# Columns mirrored from hearings_unified, in FTS column order
+HEARING_COLUMNS = ["hearing_title", "search_keywords", "participant_list",
+                   "content_summary", "full_text_content"]
+FTS_COLUMNS = HEARING_COLUMNS + ["transcript_text"]
+
+# BM25 weights per FTS column: a title hit outranks the same term in a transcript
+BM25_WEIGHTS = (10.0, 5.0, 3.0, 2.0, 1.0, 1.0)
+
+SEGMENT_TABLE = "transcript_segments"
+SEGMENT_FTS_TABLE = "transcript_segments_fts"
+
+# BM25 weights for segment text and speaker name
+SEGMENT_BM25_WEIGHTS = (1.0, 0.5)
+
+DEFAULT_TRANSCRIPT_DIR = Path("output/demo_transcription")
+
+def _column_list(prefix: str = "") -> str:
+    return ", ".join(f"{prefix}{column}" for column in HEARING_COLUMNS)
+
+def has_search_columns(conn: sqlite3.Connection) -> bool:
+    """Whether hearings_unified has the columns added by the search migration"""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(hearings_unified)")}
+    return set(HEARING_COLUMNS) <= columns
+
+def search_index_exists(conn: sqlite3.Connection) -> bool:
+    """Whether the FTS table and its sync triggers are installed"""
+    row = conn.execute(
+        "SELECT COUNT(*) FROM sqlite_master WHERE name IN (?, ?, ?, ?)",
+        (FTS_TABLE, f"{FTS_TABLE}_ai", f"{FTS_TABLE}_au", f"{FTS_TABLE}_ad")
+    ).fetchone()
+    return row[0] == 4
+
+def ensure_search_index(conn: sqlite3.Connection) -> bool:
+    """
+    Create the FTS table and the triggers that keep it in sync with
+    hearings_unified, loading the hearings already stored.
+
+    Args:
+        conn: Connection to the hearings database
+
+    Returns:
+        True if the index is available
+    """
+    if search_index_exists(conn):
+        return True
+    if not has_search_columns(conn):
+        return False
+
+    # Created and loaded in one transaction, so searches never see an empty index
+    try:
+        conn.executescript(f"""
+            BEGIN;
+
+            CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+                {", ".join(FTS_COLUMNS)},
+                tokenize = 'porter unicode61'
+            );
+
+            CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON hearings_unified BEGIN
+                INSERT INTO {FTS_TABLE}(rowid, {_column_list()})
+                VALUES (new.id, {_column_list("new.")});
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au
+            AFTER UPDATE OF {_column_list()} ON hearings_unified BEGIN
+                UPDATE {FTS_TABLE} SET {", ".join(f"{c} = new.{c}" for c in HEARING_COLUMNS)}
+                WHERE rowid = new.id;
+                -- Re-add a row that is missing from the index
+                INSERT INTO {FTS_TABLE}(rowid, {_column_list()})
+                SELECT new.id, {_column_list("new.")}
+                WHERE NOT EXISTS (SELECT 1 FROM {FTS_TABLE} WHERE rowid = new.id);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON hearings_unified BEGIN
+                DELETE FROM {FTS_TABLE} WHERE rowid = old.id;
+            END;
+
+            -- Hearings stored before the index existed
+            DELETE FROM {FTS_TABLE};
+            INSERT INTO {FTS_TABLE}(rowid, {_column_list()})
+            SELECT id, {_column_list()} FROM hearings_unified;
+
+            COMMIT;
+        """)
+    except sqlite3.Error:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+    logger.info(f"Created full-text search index {FTS_TABLE}")
+    return True
+
+def transcript_segments(transcript: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Segments from either transcript layout (top-level or under 'transcription')"""
+    segments = transcript.get("segments")
+    if segments is None:
+        segments = (transcript.get("transcription") or {}).get("segments")
+    return segments or []
+
+def transcript_text(transcript: Dict[str, Any]) -> str:
+    """Searchable text of every transcript segment"""
+    return " ".join(
+        segment.get("text", "").strip() for segment in transcript_segments(transcript)
+        if segment.get("text")
+    )
+
+def ensure_segment_index(conn: sqlite3.Connection):
+    """Create the per-segment table, its FTS5 index and sync triggers"""
+    conn.executescript(f"""
+        CREATE TABLE IF NOT EXISTS {SEGMENT_TABLE} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            hearing_id INTEGER NOT NULL,
+            segment_index INTEGER NOT NULL,
+            start_time REAL,
+            end_time REAL,
+            speaker TEXT,
+            text TEXT NOT NULL,
+            UNIQUE (hearing_id, segment_index)
+        );
+
+        -- Digest of the last indexed transcript per hearing, so unchanged rewrites are skipped
+        CREATE TABLE IF NOT EXISTS transcript_index_state (
+            hearing_id INTEGER PRIMARY KEY,
+            transcript_digest TEXT NOT NULL,
+            segment_count INTEGER NOT NULL,
+            indexed_at TEXT NOT NULL
+        );
+
+        CREATE VIRTUAL TABLE IF NOT EXISTS {SEGMENT_FTS_TABLE} USING fts5(
+            text, speaker,
+            content = '{SEGMENT_TABLE}', content_rowid = 'id',
+            tokenize = 'porter unicode61'
+        );
+
+        CREATE TRIGGER IF NOT EXISTS {SEGMENT_FTS_TABLE}_ai AFTER INSERT ON {SEGMENT_TABLE} BEGIN
+            INSERT INTO {SEGMENT_FTS_TABLE}(rowid, text, speaker) VALUES (new.id, new.text, new.speaker);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS {SEGMENT_FTS_TABLE}_ad AFTER DELETE ON {SEGMENT_TABLE} BEGIN
+            INSERT INTO {SEGMENT_FTS_TABLE}({SEGMENT_FTS_TABLE}, rowid, text, speaker)
+            VALUES ('delete', old.id, old.text, old.speaker);
+        END;
+
+        CREATE TRIGGER IF NOT EXISTS {SEGMENT_FTS_TABLE}_au AFTER UPDATE ON {SEGMENT_TABLE} BEGIN
+            INSERT INTO {SEGMENT_FTS_TABLE}({SEGMENT_FTS_TABLE}, rowid, text, speaker)
+            VALUES ('delete', old.id, old.text, old.speaker);
+            INSERT INTO {SEGMENT_FTS_TABLE}(rowid, text, speaker) VALUES (new.id, new.text, new.speaker);
+        END;
+    """)
+
+def _segment_speaker(segment: Dict[str, Any]) -> Optional[str]:
+    """Speaker label from a labeled segment, preferring the enhanced identification"""
+    enhanced = segment.get("enhanced_speaker")
+    if isinstance(enhanced, dict):
+        # Older labeled transcripts nest the identification
+        enhanced = enhanced.get("speaker_name")
+    if not isinstance(enhanced, str):
+        enhanced = None
+    return enhanced or segment.get("speaker") or None
+
+def _segment_rows(transcript: Dict[str, Any]) -> List[tuple]:
+    """(segment_index, start, end, speaker, text) for every non-empty segment"""
+    rows = []
+    for segment in transcript_segments(transcript):
+        text = (segment.get("text") or "").strip()
+        if not text:
+            continue
+        start = segment.get("start", segment.get("start_time"))
+        end = segment.get("end", segment.get("end_time"))
+        rows.append((len(rows), start, end, _segment_speaker(segment), text))
+    return rows
+
+def index_transcript_segments(conn: sqlite3.Connection, hearing_id: int,
+                              transcript: Dict[str, Any]) -> Optional[int]:
+    """
+    Replace a hearing's indexed segments with those of its latest transcript.
+
+    Args:
+        conn: Connection to the hearings database (caller commits)
+        hearing_id: hearings_unified id
+        transcript: Transcript dictionary
+
+    Returns:
+        Number of segments indexed, or None if the transcript was already indexed
+    """
+    ensure_segment_index(conn)
+
+    rows = _segment_rows(transcript)
+    digest = hashlib.sha256(json.dumps(rows).encode()).hexdigest()
+
+    state = conn.execute(
+        "SELECT transcript_digest FROM transcript_index_state WHERE hearing_id = ?", (hearing_id,)
+    ).fetchone()
+    if state and state[0] == digest:
+        return None
+
+    conn.execute(f"DELETE FROM {SEGMENT_TABLE} WHERE hearing_id = ?", (hearing_id,))
+    conn.executemany(
+        f"INSERT INTO {SEGMENT_TABLE} (hearing_id, segment_index, start_time, end_time, speaker, text) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        [(hearing_id,) + row for row in rows]
+    )
+    conn.execute(
+        "INSERT OR REPLACE INTO transcript_index_state (hearing_id, transcript_digest, segment_count, indexed_at) "
+        "VALUES (?, ?, ?, ?)",
+        (hearing_id, digest, len(rows), datetime.now().isoformat())
+    )
+    return len(rows)
+
+def index_transcript(conn: sqlite3.Connection, hearing_id: int, transcript: Dict[str, Any]) -> bool:
+    """
+    Add a hearing's transcript to the segment index and its text to the hearing index.
+
+    Called whenever a transcript is written so both indexes stay current
+    without rescanning transcript directories.
+
+    Args:
+        conn: Connection to the hearings database (caller commits)
+        hearing_id: hearings_unified id
+        transcript: Transcript dictionary
+
+    Returns:
+        True if the hearing row was indexed
+    """
+    index_transcript_segments(conn, hearing_id, transcript)
+
+    if not ensure_search_index(conn):
+        return False
+
+    text = transcript_text(transcript)
+    cursor = conn.execute(f"UPDATE {FTS_TABLE} SET transcript_text = ? WHERE rowid = ?", (text, hearing_id))
+    if cursor.rowcount:
+        return True
+
+    # Hearing row predates the index; copy its columns in with the transcript
+    cursor = conn.execute(f"""
+        INSERT INTO {FTS_TABLE}(rowid, {_column_list()}, transcript_text)
+        SELECT id, {_column_list()}, ? FROM hearings_unified WHERE id = ?
+    """, (text, hearing_id))
+    return cursor.rowcount > 0
+
+def rebuild_search_index(conn: sqlite3.Connection,
+                         transcript_dir: Optional[Path] = DEFAULT_TRANSCRIPT_DIR) -> Dict[str, int]:
+    """
+    Backfill the index from hearings_unified and saved transcript files.
+
+    Args:
+        conn: Connection to the hearings database (caller commits)
+        transcript_dir: Directory of hearing_<id>_transcript.json files
+
+    Returns:
+        Counts of indexed hearings and transcripts
+    """
+    if not ensure_search_index(conn):
+        raise RuntimeError("hearings_unified is missing search columns; run the search migration first")
+
+    conn.execute(f"DELETE FROM {FTS_TABLE}")
+    conn.execute(f"""
+        INSERT INTO {FTS_TABLE}(rowid, {_column_list()})
+        SELECT id, {_column_list()} FROM hearings_unified
+    """)
+    hearings = conn.execute(f"SELECT COUNT(*) FROM {FTS_TABLE}").fetchone()[0]
+
+    transcripts = 0
+    if transcript_dir and Path(transcript_dir).exists():
+        for transcript_file in sorted(Path(transcript_dir).glob("hearing_*_transcript.json")):
+            match = re.match(r"hearing_(\d+)_transcript\.json$", transcript_file.name)
+            if not match:
+                continue
+            try:
+                with open(transcript_file, 'r') as f:
+                    transcript = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Skipping unreadable transcript {transcript_file}: {e}")
+                continue
+            if index_transcript(conn, int(match.group(1)), transcript):
+                transcripts += 1
+
+    # Merge index b-trees after the bulk load
+    conn.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('optimize')")
+
+    return {"hearings": hearings, "transcripts": transcripts}
+
+def build_match_query(text: Optional[str]) -> Optional[str]:
+    """
+    Convert free text from the search box into an FTS5 MATCH expression.
+
+    Every term must match; terms are quoted so user punctuation cannot inject
+    FTS5 syntax, and the last term is a prefix so partial words match while typing.
+    """
+    if not text:
+        return None
+    terms = re.findall(r"\w+", text.lower())
+    if not terms:
+        return None
+    quoted = [f'"{term}"' for term in terms]
+    if re.search(r"\w$", text):
+        quoted[-1] += "*"
+    return " ".join(quoted)
+
+def search_segments(conn: sqlite3.Connection,
+                    text: str,
+                    hearing_id: Optional[int] = None,
+                    committee: Optional[str] = None,
+                    speaker: Optional[str] = None,
+                    limit: int = 20,
+                    offset: int = 0,
+                    context_segments: int = 1) -> Dict[str, Any]:
+    """
+    Find where in which hearing something was said.
+
+    Args:
+        conn: Connection to the hearings database
+        text: Search text
+        hearing_id: Restrict to one hearing
+        committee: Restrict to one committee code
+        speaker: Restrict to speakers whose label contains this text
+        limit: Hits per page
+        offset: Pagination offset
+        context_segments: Neighbouring segments returned on each side of a hit
+
+    Returns:
+        Dictionary with BM25-ranked hits (timestamps, snippet, context) and total_count
+    """
+    match_query = build_match_query(text)
+    if not match_query:
+        return {"hits": [], "total_count": 0}
+
+    ensure_segment_index(conn)
+
+    where_clauses = [f"{SEGMENT_FTS_TABLE} MATCH ?"]
+    params: List[Any] = [match_query]
+    if hearing_id is not None:
+        where_clauses.append("s.hearing_id = ?")
+        params.append(hearing_id)
+    if committee:
+        where_clauses.append("h.committee_code = ?")
+        params.append(committee)
+    if speaker:
+        where_clauses.append("s.speaker LIKE ?")
+        params.append(f"%{speaker}%")
+
+    from_sql = f"""
+        FROM {SEGMENT_FTS_TABLE}
+        JOIN {SEGMENT_TABLE} s ON s.id = {SEGMENT_FTS_TABLE}.rowid
+        LEFT JOIN hearings_unified h ON h.id = s.hearing_id
+        WHERE {" AND ".join(where_clauses)}
+    """
+    weights = ", ".join(str(w) for w in SEGMENT_BM25_WEIGHTS)
+
+    rows = conn.execute(f"""
+        SELECT s.hearing_id, s.segment_index, s.start_time, s.end_time, s.speaker, s.text,
+               snippet({SEGMENT_FTS_TABLE}, 0, '<mark>', '</mark>', '…', 24),
+               bm25({SEGMENT_FTS_TABLE}, {weights}) AS score,
+               h.hearing_title, h.committee_code, h.hearing_date
+        {from_sql}
+        ORDER BY score
+        LIMIT ? OFFSET ?
+    """, params + [limit, offset]).fetchall()
+
+    total_count = conn.execute(f"SELECT COUNT(*) {from_sql}", params).fetchone()[0]
+
+    hits = []
+    for row in rows:
+        (hit_hearing_id, segment_index, start_time, end_time, hit_speaker, hit_text,
+         snippet, score, title, committee_code, hearing_date) = row
+        hits.append({
+            "hearing_id": hit_hearing_id,
+            "hearing_title": title,
+            "committee_code": committee_code,
+            "hearing_date": hearing_date,
+            "segment_index": segment_index,
+            "start_time": start_time,
+            "end_time": end_time,
+            "speaker": hit_speaker,
+            "text": hit_text,
+            "snippet": snippet,
+            "score": round(-score, 4),
+            "context": _segment_context(conn, hit_hearing_id, segment_index, context_segments)
+        })
+
+    return {"hits": hits, "total_count": total_count}
+
+def _segment_context(conn: sqlite3.Connection, hearing_id: int,
+                     segment_index: int, window: int) -> Dict[str, List[Dict[str, Any]]]:
+    """Segments just before and after a hit, from the (hearing_id, segment_index) index"""
+    if window <= 0:
+        return {"before": [], "after": []}
+
+    rows = conn.execute(f"""
+        SELECT segment_index, start_time, end_time, speaker, text FROM {SEGMENT_TABLE}
+        WHERE hearing_id = ? AND segment_index BETWEEN ? AND ? AND segment_index != ?
+        ORDER BY segment_index
+    """, (hearing_id, segment_index - window, segment_index + window, segment_index)).fetchall()
+
+    context = {"before": [], "after": []}
+    for index, start_time, end_time, speaker, text in rows:
+        side = "before" if index < segment_index else "after"
+        context[side].append({"start_time": start_time, "end_time": end_time, "speaker": speaker, "text": text})
+    return context
@@ -14,6 +14,20 @@ import json
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 
+try:
+    from .search_index import FTS_TABLE, BM25_WEIGHTS, ensure_search_index, build_match_query, search_segments
+except ImportError:
+    from search_index import FTS_TABLE, BM25_WEIGHTS, ensure_search_index, build_match_query, search_segments
+
+try:
+    from .autocomplete_index import get_autocomplete_index
+    from ..storage.connection_pool import get_connection_pool
+    from .async_database import run_in_db_executor
+except ImportError:
+    from autocomplete_index import get_autocomplete_index
+    from storage.connection_pool import get_connection_pool
+    from async_database import run_in_db_executor
+
 logger = logging.getLogger(__name__)
 
 # Request/Response Models
@@ -48,6 +62,16 @@ class MemberSearchQuery(BaseModel):
     role: Optional[str] = None
     limit: int = Field(default=10, ge=1, le=50)
 
+class SegmentSearchQuery(BaseModel):
+    """Transcript segment search model"""
+    query: str
+    hearing_id: Optional[int] = None
+    committee: Optional[str] = None
+    speaker: Optional[str] = None
+    context: int = Field(default=1, ge=0, le=5)
+    limit: int = Field(default=20, ge=1, le=100)
+    offset: int = Field(default=0, ge=0)
+
 class SearchResult(BaseModel):
     """Single search result model"""
     id: int
@@ -70,6 +94,28 @@ class SearchResponse(BaseModel):
     search_metadata: Dict[str, Any]
     took_ms: int
 
+class SegmentHit(BaseModel):
+    """A transcript segment matching a search, with its position in the hearing"""
+    hearing_id: int
+    hearing_title: Optional[str]
+    committee_code: Optional[str]
+    hearing_date: Optional[str]
+    segment_index: int
+    start_time: Optional[float]
+    end_time: Optional[float]
+    speaker: Optional[str]
+    text: str
+    snippet: str
+    score: float
+    context: Dict[str, List[Dict[str, Any]]]
+
+class SegmentSearchResponse(BaseModel):
+    """Segment search response with hits and pagination"""
+    hits: List[SegmentHit]
+    total_count: int
+    page_info: Dict[str, Any]
+    took_ms: int
+
 class AutoCompleteResponse(BaseModel):
     """Auto-complete suggestions response"""
     suggestions: List[Dict[str, Any]]
@@ -91,14 +137,113 @@ class SearchStatsResponse(BaseModel):
 
 # Database connection utility
 def get_search_db():
-    """Get database connection for search operations"""
-    return sqlite3.connect("data/demo_enhanced_ui.db")
+    """Get pooled database connection for search operations (close() returns it to the pool)"""
+    return get_connection_pool("data/demo_enhanced_ui.db").acquire()
 
 class SearchManager:
     """Main search functionality manager"""
     
     def __init__(self):
         self.db_path = "data/demo_enhanced_ui.db"
+        self._fts_available = None
+    
+    def _use_fts(self, conn: sqlite3.Connection) -> bool:
+        """Install the FTS5 index on first use; fall back to LIKE if the schema predates it"""
+        if self._fts_available is None:
+            try:
+                self._fts_available = ensure_search_index(conn)
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Full-text index unavailable, using LIKE search: {e}")
+                self._fts_available = False
+        return self._fts_available
+    
+    def _text_search(self, conn: sqlite3.Connection, text: Optional[str], like_columns: List[str]) -> Dict[str, Any]:
+        """
+        SQL pieces for a text query.
+        
+        Uses an FTS5 MATCH with BM25 score and snippets when the index exists,
+        otherwise the original LIKE scan over like_columns.
+        """
+        match_query = build_match_query(text)
+        if match_query and self._use_fts(conn):
+            weights = ", ".join(str(w) for w in BM25_WEIGHTS)
+            return {
+                "join": f" JOIN {FTS_TABLE} ON {FTS_TABLE}.rowid = h.id",
+                "where": [f"{FTS_TABLE} MATCH ?"],
+                "params": [match_query],
+                "select": f""",
+                       bm25({FTS_TABLE}, {weights}) AS score,
+                       snippet({FTS_TABLE}, 0, '<mark>', '</mark>', '…', 16),
+                       snippet({FTS_TABLE}, 3, '<mark>', '</mark>', '…', 16),
+                       snippet({FTS_TABLE}, 5, '<mark>', '</mark>', '…', 24)""",
+                "ranked": True
+            }
+        
+        if text:
+            return {
+                "join": "",
+                "where": ["(" + " OR ".join(f"h.{column} LIKE ?" for column in like_columns) + ")"],
+                "params": [f"%{text}%"] * len(like_columns),
+                "select": "",
+                "ranked": False
+            }
+        
+        return {"join": "", "where": [], "params": [], "select": "", "ranked": False}
+    
+    def _run_search(self, cursor: sqlite3.Cursor, text_search: Dict[str, Any], where_clauses: List[str],
+                    params: List[Any], sort_by: str, sort_order: str, limit: int, offset: int):
+        """Execute a page query and its count; returns (rows, total_count)"""
+        where_clauses = text_search["where"] + where_clauses
+        params = text_search["params"] + params
+        
+        from_sql = " FROM hearings_unified h" + text_search["join"]
+        if where_clauses:
+            from_sql += " WHERE " + " AND ".join(where_clauses)
+        
+        base_sql = """
+            SELECT h.id, h.hearing_title, h.committee_code, h.hearing_date, h.hearing_type,
+                   h.status, h.processing_stage, h.content_summary, h.participant_list,
+                   h.search_keywords, h.full_text_content""" + text_search["select"] + from_sql
+        
+        # Best BM25 match first; other sorts keep the requested column order
+        if sort_by == "relevance" and text_search["ranked"]:
+            base_sql += " ORDER BY score"
+        else:
+            sort_column = self._get_sort_column(sort_by)
+            base_sql += f" ORDER BY h.{sort_column} {sort_order.upper()}"
+        
+        base_sql += " LIMIT ? OFFSET ?"
+        cursor.execute(base_sql, params + [limit, offset])
+        rows = cursor.fetchall()
+        
+        cursor.execute("SELECT COUNT(*)" + from_sql, params)
+        total_count = cursor.fetchone()[0]
+        
+        return rows, total_count
+    
+    def _build_result(self, row: tuple, query_text: Optional[str], ranked: bool) -> SearchResult:
+        """Search result from a row of _run_search"""
+        if ranked:
+            relevance_score = self._bm25_relevance(row[11])
+            highlights = self._snippet_highlights(row)
+        else:
+            relevance_score = self._calculate_relevance(row, query_text)
+            highlights = self._generate_highlights(row, query_text)
+        
+        return SearchResult(
+            id=row[0],
+            hearing_title=row[1],
+            committee_code=row[2],
+            hearing_date=row[3],
+            hearing_type=row[4],
+            status=row[5],
+            processing_stage=row[6],
+            content_summary=row[7],
+            participant_list=row[8],
+            relevance_score=relevance_score,
+            search_highlights=highlights
+        )
     
     def search_hearings(self, query: SearchQuery) -> SearchResponse:
         """Basic text search across hearings"""
@@ -108,73 +253,22 @@ class SearchManager:
         cursor = conn.cursor()
         
         try:
-            # Build SQL query
-            where_clauses = []
-            params = []
-            
-            if query.query:
-                # Full-text search across multiple fields
-                search_sql = """
-                    (hearing_title LIKE ? OR 
-                     search_keywords LIKE ? OR 
-                     participant_list LIKE ? OR 
-                     content_summary LIKE ? OR
-                     full_text_content LIKE ?)
-                """
-                search_term = f"%{query.query}%"
-                where_clauses.append(search_sql)
-                params.extend([search_term] * 5)
-            
-            # Build main query
-            base_sql = """
-                SELECT id, hearing_title, committee_code, hearing_date, hearing_type,
-                       status, processing_stage, content_summary, participant_list,
-                       search_keywords, full_text_content
-                FROM hearings_unified
-            """
-            
-            if where_clauses:
-                base_sql += " WHERE " + " AND ".join(where_clauses)
-            
-            # Add sorting
-            sort_column = self._get_sort_column(query.sort_by)
-            base_sql += f" ORDER BY {sort_column} {query.sort_order.upper()}"
-            
-            # Add pagination
-            base_sql += " LIMIT ? OFFSET ?"
-            params.extend([query.limit, query.offset])
-            
-            # Execute query
-            cursor.execute(base_sql, params)
-            rows = cursor.fetchall()
-            
-            # Get total count
-            count_sql = "SELECT COUNT(*) FROM hearings_unified"
-            if where_clauses:
-                count_sql += " WHERE " + " AND ".join(where_clauses)
-            cursor.execute(count_sql, params[:-2])  # Exclude LIMIT/OFFSET params
-            total_count = cursor.fetchone()[0]
+            # Full-text search across multiple fields
+            text_search = self._text_search(conn, query.query, [
+                "hearing_title", "search_keywords", "participant_list",
+                "content_summary", "full_text_content"
+            ])
+            
+            rows, total_count = self._run_search(
+                cursor, text_search, [], [],
+                query.sort_by, query.sort_order, query.limit, query.offset
+            )
             
             # Process results
-            results = []
-            for row in rows:
-                relevance_score = self._calculate_relevance(row, query.query)
-                highlights = self._generate_highlights(row, query.query)
-                
-                result = SearchResult(
-                    id=row[0],
-                    hearing_title=row[1],
-                    committee_code=row[2],
-                    hearing_date=row[3],
-                    hearing_type=row[4],
-                    status=row[5],
-                    processing_stage=row[6],
-                    content_summary=row[7],
-                    participant_list=row[8],
-                    relevance_score=relevance_score,
-                    search_highlights=highlights
-                )
-                results.append(result)
+            results = [self._build_result(row, query.query, text_search["ranked"]) for row in rows]
+            
+            # Searched terms gain auto-complete weight
+            self._autocomplete_index().record_search(query.query, total_count)
             
             # Calculate timing
             took_ms = int((datetime.now() - start_time).total_seconds() * 1000)
@@ -213,114 +307,67 @@ class SearchManager:
             filters_applied = {}
             
             # Text search
+            text_search = self._text_search(conn, query.query, [
+                "hearing_title", "search_keywords", "participant_list", "content_summary"
+            ])
             if query.query:
-                search_sql = """
-                    (hearing_title LIKE ? OR 
-                     search_keywords LIKE ? OR 
-                     participant_list LIKE ? OR 
-                     content_summary LIKE ?)
-                """
-                search_term = f"%{query.query}%"
-                where_clauses.append(search_sql)
-                params.extend([search_term] * 4)
                 filters_applied["text_query"] = query.query
             
             # Committee filter
             if query.committee:
-                where_clauses.append("committee_code = ?")
+                where_clauses.append("h.committee_code = ?")
                 params.append(query.committee)
                 filters_applied["committee"] = query.committee
             
             # Status filters
             if query.status:
-                where_clauses.append("status = ?")
+                where_clauses.append("h.status = ?")
                 params.append(query.status)
                 filters_applied["status"] = query.status
             
             if query.processing_stage:
-                where_clauses.append("processing_stage = ?")
+                where_clauses.append("h.processing_stage = ?")
                 params.append(query.processing_stage)
                 filters_applied["processing_stage"] = query.processing_stage
             
             # Hearing type filter
             if query.hearing_type:
-                where_clauses.append("hearing_type LIKE ?")
+                where_clauses.append("h.hearing_type LIKE ?")
                 params.append(f"%{query.hearing_type}%")
                 filters_applied["hearing_type"] = query.hearing_type
             
             # Date range filters
             if query.date_from:
-                where_clauses.append("hearing_date >= ?")
+                where_clauses.append("h.hearing_date >= ?")
                 params.append(query.date_from)
                 filters_applied["date_from"] = query.date_from
             
             if query.date_to:
-                where_clauses.append("hearing_date <= ?")
+                where_clauses.append("h.hearing_date <= ?")
                 params.append(query.date_to)
                 filters_applied["date_to"] = query.date_to
             
             # Participant filter
             if query.participants:
-                where_clauses.append("participant_list LIKE ?")
+                where_clauses.append("h.participant_list LIKE ?")
                 params.append(f"%{query.participants}%")
                 filters_applied["participants"] = query.participants
             
             # Reviewer filter
             if query.assigned_reviewer:
-                where_clauses.append("assigned_reviewer = ?")
+                where_clauses.append("h.assigned_reviewer = ?")
                 params.append(query.assigned_reviewer)
                 filters_applied["assigned_reviewer"] = query.assigned_reviewer
             
-            # Build main query
-            base_sql = """
-                SELECT id, hearing_title, committee_code, hearing_date, hearing_type,
-                       status, processing_stage, content_summary, participant_list,
-                       search_keywords, full_text_content
-                FROM hearings_unified
-            """
-            
-            if where_clauses:
-                base_sql += " WHERE " + " AND ".join(where_clauses)
-            
-            # Add sorting
-            sort_column = self._get_sort_column(query.sort_by)
-            base_sql += f" ORDER BY {sort_column} {query.sort_order.upper()}"
-            
-            # Add pagination
-            base_sql += " LIMIT ? OFFSET ?"
-            params.extend([query.limit, query.offset])
-            
-            # Execute query
-            cursor.execute(base_sql, params)
-            rows = cursor.fetchall()
-            
-            # Get total count
-            count_sql = "SELECT COUNT(*) FROM hearings_unified"
-            if where_clauses:
-                count_sql += " WHERE " + " AND ".join(where_clauses)
-            cursor.execute(count_sql, params[:-2])
-            total_count = cursor.fetchone()[0]
+            rows, total_count = self._run_search(
+                cursor, text_search, where_clauses, params,
+                query.sort_by, query.sort_order, query.limit, query.offset
+            )
             
             # Process results
-            results = []
-            for row in rows:
-                relevance_score = self._calculate_relevance(row, query.query)
-                highlights = self._generate_highlights(row, query.query)
-                
-                result = SearchResult(
-                    id=row[0],
-                    hearing_title=row[1],
-                    committee_code=row[2],
-                    hearing_date=row[3],
-                    hearing_type=row[4],
-                    status=row[5],
-                    processing_stage=row[6],
-                    content_summary=row[7],
-                    participant_list=row[8],
-                    relevance_score=relevance_score,
-                    search_highlights=highlights
-                )
-                results.append(result)
+            results = [self._build_result(row, query.query, text_search["ranked"]) for row in rows]
+            
+            self._autocomplete_index().record_search(query.query, total_count)
             
             took_ms = int((datetime.now() - start_time).total_seconds() * 1000)
             
@@ -345,6 +392,41 @@ class SearchManager:
         finally:
             conn.close()
     
+    def search_segments(self, query: SegmentSearchQuery) -> SegmentSearchResponse:
+        """Search transcript segments for where in which hearing something was said"""
+        start_time = datetime.now()
+        
+        conn = get_search_db()
+        
+        try:
+            found = search_segments(
+                conn, query.query,
+                hearing_id=query.hearing_id,
+                committee=query.committee,
+                speaker=query.speaker,
+                limit=query.limit,
+                offset=query.offset,
+                context_segments=query.context
+            )
+            total_count = found["total_count"]
+            
+            took_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+            
+            return SegmentSearchResponse(
+                hits=[SegmentHit(**hit) for hit in found["hits"]],
+                total_count=total_count,
+                page_info={
+                    "current_page": (query.offset // query.limit) + 1,
+                    "total_pages": (total_count + query.limit - 1) // query.limit,
+                    "has_next": query.offset + query.limit < total_count,
+                    "has_prev": query.offset > 0
+                },
+                took_ms=took_ms
+            )
+            
+        finally:
+            conn.close()
+    
     def search_members(self, query: MemberSearchQuery) -> List[Dict[str, Any]]:
         """Search for committee members and participants"""
         conn = get_search_db()
@@ -397,78 +479,34 @@ class SearchManager:
         finally:
             conn.close()
     
+    def _autocomplete_index(self):
+        """In-memory suggestion index, built from the database on first use"""
+        index = get_autocomplete_index(self.db_path)
+        if not index.loaded:
+            conn = get_search_db()
+            try:
+                index.load_from_db(conn)
+            finally:
+                conn.close()
+        return index
+    
     def get_autocomplete_suggestions(self, partial_query: str, limit: int = 10) -> AutoCompleteResponse:
         """Get auto-complete suggestions for search queries"""
-        conn = get_search_db()
-        cursor = conn.cursor()
+        suggestions = self._autocomplete_index().suggest(partial_query, limit)
         
-        try:
-            suggestions = []
-            categories = {
-                "hearings": [],
-                "committees": [],
-                "participants": [],
-                "keywords": []
-            }
-            
-            # Hearing title suggestions
-            cursor.execute(
-                "SELECT DISTINCT hearing_title FROM hearings_unified WHERE hearing_title LIKE ? LIMIT ?",
-                (f"%{partial_query}%", limit)
-            )
-            for row in cursor.fetchall():
-                title = row[0]
-                suggestions.append({
-                    "text": title,
-                    "type": "hearing",
-                    "category": "hearings",
-                    "score": self._calculate_suggestion_score(title, partial_query)
-                })
-                categories["hearings"].append(title)
-            
-            # Committee suggestions
-            cursor.execute(
-                "SELECT DISTINCT committee_code FROM hearings_unified WHERE committee_code LIKE ? LIMIT ?",
-                (f"%{partial_query}%", limit)
-            )
-            for row in cursor.fetchall():
-                committee = row[0]
-                suggestions.append({
-                    "text": committee,
-                    "type": "committee",
-                    "category": "committees",
-                    "score": self._calculate_suggestion_score(committee, partial_query)
-                })
-                categories["committees"].append(committee)
-            
-            # Keyword suggestions
-            cursor.execute(
-                "SELECT DISTINCT search_keywords FROM hearings_unified WHERE search_keywords LIKE ? LIMIT ?",
-                (f"%{partial_query}%", limit)
-            )
-            for row in cursor.fetchall():
-                keywords = row[0]
-                if keywords:
-                    for keyword in keywords.split(", "):
-                        if partial_query.lower() in keyword.lower():
-                            suggestions.append({
-                                "text": keyword,
-                                "type": "keyword",
-                                "category": "keywords",
-                                "score": self._calculate_suggestion_score(keyword, partial_query)
-                            })
-                            categories["keywords"].append(keyword)
-            
-            # Sort by relevance score
-            suggestions.sort(key=lambda x: x["score"], reverse=True)
-            
-            return AutoCompleteResponse(
-                suggestions=suggestions[:limit],
-                categories=categories
-            )
-            
-        finally:
-            conn.close()
+        categories = {
+            "hearings": [],
+            "committees": [],
+            "participants": [],
+            "keywords": []
+        }
+        for suggestion in suggestions:
+            categories.setdefault(suggestion["category"], []).append(suggestion["text"])
+        
+        return AutoCompleteResponse(
+            suggestions=suggestions,
+            categories=categories
+        )
     
     def _get_sort_column(self, sort_by: str) -> str:
         """Get SQL column name for sorting"""
@@ -526,6 +564,21 @@ class SearchManager:
         
         return highlights
     
+    @staticmethod
+    def _bm25_relevance(bm25_score: float) -> float:
+        """Map an FTS5 bm25() score (negative, lower is better) onto 0-1"""
+        strength = max(-bm25_score, 0.0)
+        return round(strength / (1.0 + strength), 4)
+    
+    @staticmethod
+    def _snippet_highlights(row: tuple) -> Dict[str, List[str]]:
+        """Highlights from the snippet() columns of an FTS row"""
+        highlights = {}
+        for key, snippet in zip(("title", "summary", "transcript"), row[12:15]):
+            if snippet and "<mark>" in snippet:
+                highlights[key] = [snippet]
+        return highlights
+    
     def _highlight_text(self, text: str, query: str) -> str:
         """Add highlighting markers to text"""
         pattern = re.compile(re.escape(query), re.IGNORECASE)
@@ -578,7 +631,7 @@ async def search_hearings(
             sort_by=sort_by,
             sort_order=sort_order
         )
-        return search_manager.search_hearings(search_query)
+        return await run_in_db_executor(search_manager.search_hearings, search_query)
     except Exception as e:
         logger.error(f"Search error: {e}")
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
@@ -587,11 +640,37 @@ async def search_hearings(
 async def advanced_search(query: AdvancedSearchQuery):
     """Advanced search with multiple filters"""
     try:
-        return search_manager.advanced_search(query)
+        return await run_in_db_executor(search_manager.advanced_search, query)
     except Exception as e:
         logger.error(f"Advanced search error: {e}")
         raise HTTPException(status_code=500, detail=f"Advanced search failed: {str(e)}")
 
+@router.get("/segments", response_model=SegmentSearchResponse)
+async def search_transcript_segments(
+    q: str = Query(..., min_length=1, description="Text spoken in the hearing"),
+    hearing_id: Optional[int] = Query(None, description="Restrict to one hearing"),
+    committee: Optional[str] = Query(None, description="Committee code filter"),
+    speaker: Optional[str] = Query(None, description="Speaker name filter"),
+    context: int = Query(1, ge=0, le=5, description="Neighbouring segments on each side of a hit"),
+    limit: int = Query(20, ge=1, le=100, description="Number of hits per page"),
+    offset: int = Query(0, ge=0, description="Pagination offset")
+):
+    """Find where in which hearing something was said"""
+    try:
+        query = SegmentSearchQuery(
+            query=q,
+            hearing_id=hearing_id,
+            committee=committee,
+            speaker=speaker,
+            context=context,
+            limit=limit,
+            offset=offset
+        )
+        return await run_in_db_executor(search_manager.search_segments, query)
+    except Exception as e:
+        logger.error(f"Segment search error: {e}")
+        raise HTTPException(status_code=500, detail=f"Segment search failed: {str(e)}")
+
 @router.get("/members")
 async def search_members(
     name: Optional[str] = Query(None, description="Member name to search"),
@@ -602,7 +681,7 @@ async def search_members(
     """Search for committee members and participants"""
     try:
         query = MemberSearchQuery(name=name, committee=committee, role=role, limit=limit)
-        return search_manager.search_members(query)
+        return await run_in_db_executor(search_manager.search_members, query)
     except Exception as e:
         logger.error(f"Member search error: {e}")
         raise HTTPException(status_code=500, detail=f"Member search failed: {str(e)}")
@@ -8,6 +8,11 @@ import logging
 from datetime import datetime
 import json
 
+try:
+    from .search_index import rebuild_search_index, search_index_exists
+except ImportError:
+    from search_index import rebuild_search_index, search_index_exists
+
 logger = logging.getLogger(__name__)
 
 class SearchMigration:
@@ -25,6 +30,7 @@ class SearchMigration:
             self._add_search_columns()
             self._create_search_indexes()
             self._populate_search_fields()
+            self._backfill_search_index()
             self._verify_migration()
             self.connection.commit()
             logger.info("Search migration completed successfully")
@@ -129,6 +135,14 @@ class SearchMigration:
         
         logger.info(f"Updated search fields for {len(hearings)} hearings")
     
+    def _backfill_search_index(self):
+        """Create the FTS5 index with its sync triggers and load existing hearings and transcripts"""
+        logger.info("Backfilling full-text search index...")
+        
+        counts = rebuild_search_index(self.connection)
+        
+        logger.info(f"Indexed {counts['hearings']} hearings and {counts['transcripts']} transcripts")
+    
     def _extract_keywords(self, title: str) -> str:
         """Extract searchable keywords from hearing title"""
         if not title:
@@ -248,6 +262,15 @@ class SearchMigration:
             logger.warning(f"Only {populated_count}/{total_count} hearings have search data")
         else:
             logger.info(f"All {total_count} hearings have search data populated")
+        
+        # Check that the full-text index covers every hearing
+        if not search_index_exists(self.connection):
+            raise Exception("Full-text search index was not created")
+        
+        cursor.execute("SELECT COUNT(*) FROM hearings_fts")
+        indexed_count = cursor.fetchone()[0]
+        if indexed_count != total_count:
+            raise Exception(f"Full-text index has {indexed_count}/{total_count} hearings")
 
 def run_search_migration():
     """Main entry point for search migration"""
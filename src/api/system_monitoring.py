@@ -14,6 +14,7 @@ import asyncio
 from pydantic import BaseModel
 
 from .database_enhanced import get_enhanced_db
+from .async_database import AsyncDatabase
 from ..sync.sync_orchestrator import SyncOrchestrator
 
 logger = logging.getLogger(__name__)
@@ -37,6 +38,7 @@ class SystemMonitoringAPI:
     
     def __init__(self):
         self.db = get_enhanced_db()
+        self.async_db = AsyncDatabase(self.db)
         self.sync_orchestrator = SyncOrchestrator()
         self.active_connections: List[WebSocket] = []
     
@@ -240,7 +242,7 @@ class SystemMonitoringAPI:
                        ra.started_at as review_started, ra.completed_at as review_completed,
                        h.created_at, h.updated_at
                 FROM hearings_unified h
-                LEFT JOIN review_assignments ra ON CAST(h.id AS TEXT) = ra.hearing_id
+                LEFT JOIN review_assignments ra ON ra.hearing_ref = h.id
                 WHERE 1=1 {where_clause}
                 ORDER BY h.hearing_date DESC, h.created_at DESC
                 LIMIT 100
@@ -441,7 +443,7 @@ class SystemMonitoringAPI:
                     COUNT(ra.hearing_id) as in_review,
                     SUM(CASE WHEN ra.status = 'completed' THEN 1 ELSE 0 END) as completed
                 FROM hearings_unified h
-                LEFT JOIN review_assignments ra ON CAST(h.id AS TEXT) = ra.hearing_id
+                LEFT JOIN review_assignments ra ON ra.hearing_ref = h.id
                 WHERE h.created_at >= datetime('now', '-7 days')
             """)
             
@@ -720,7 +722,7 @@ def setup_system_monitoring_routes(app: FastAPI):
         include_details: bool = Query(True, description="Include detailed component information")
     ):
         """Get comprehensive system health status"""
-        return api.get_system_health(include_details=include_details)
+        return await api.async_db.run(api.get_system_health, include_details=include_details)
     
     @app.get("/api/system/sync-status")
     async def get_sync_status(
@@ -728,7 +730,7 @@ def setup_system_monitoring_routes(app: FastAPI):
         committee_code: Optional[str] = Query(None, description="Filter by committee")
     ):
         """Get real-time sync status"""
-        return api.get_sync_status(component=component, committee_code=committee_code)
+        return await api.async_db.run(api.get_sync_status, component=component, committee_code=committee_code)
     
     @app.get("/api/system/pipeline-status")
     async def get_pipeline_status(
@@ -740,7 +742,7 @@ def setup_system_monitoring_routes(app: FastAPI):
         hearing_id_list = hearing_ids.split(',') if hearing_ids else None
         stages_list = stages.split(',') if stages else None
         
-        return api.get_pipeline_status(hearing_ids=hearing_id_list, stages=stages_list)
+        return await api.async_db.run(api.get_pipeline_status, hearing_ids=hearing_id_list, stages=stages_list)
     
     @app.get("/api/system/alerts")
     async def get_active_alerts(
@@ -749,7 +751,7 @@ def setup_system_monitoring_routes(app: FastAPI):
         limit: int = Query(100, ge=1, le=500, description="Maximum alerts to return")
     ):
         """Get active system alerts"""
-        return api.get_active_alerts(severity=severity, component=component, limit=limit)
+        return await api.async_db.run(api.get_active_alerts, severity=severity, component=component, limit=limit)
     
     @app.post("/api/system/alerts/{alert_id}/resolve")
     async def resolve_alert(
@@ -758,7 +760,8 @@ def setup_system_monitoring_routes(app: FastAPI):
         user_id: str = Query(..., description="User ID for audit trail")
     ):
         """Resolve a system alert"""
-        return api.resolve_alert(
+        return await api.async_db.run(
+            api.resolve_alert,
             alert_id=alert_id,
             user_id=user_id,
             resolution_notes=resolution.resolution_notes
@@ -0,0 +1,368 @@
+"""
+Transcript catalog
+One row per transcript file with the facts listing views show (hearing,
+segment count, duration, confidence, size, mtime, corrections), so lists
+and stats are a single query instead of a directory glob that json.loads
+every file. Writers record a transcript when they save it, and an mtime
+scan picks up files changed by anything else; only new or modified files
+are parsed.
+"""
+
+import os
+import re
+import json
+import time
+import sqlite3
+import fnmatch
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Callable, Iterable, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+CATALOG_TABLE = "transcript_catalog"
+
+# Speaker labels that mean the segment still needs speaker review
+UNKNOWN_SPEAKERS = ("", "UNKNOWN", "Speaker")
+
+_HEARING_FILE = re.compile(r"hearing_(\d+)_")
+
+# hearings_unified columns joined into listings
+HEARING_COLUMNS = ["hearing_title", "committee_code", "hearing_date", "hearing_type", "status", "processing_stage"]
+
+PathLike = Union[str, Path]
+
+
+CATALOG_SCHEMA = [
+    f"""
+    CREATE TABLE IF NOT EXISTS {CATALOG_TABLE} (
+        path TEXT PRIMARY KEY,
+        filename TEXT NOT NULL,
+        hearing_id INTEGER,
+        committee TEXT,
+        audio_file TEXT,
+        pipeline_version TEXT,
+        processed_at TEXT,
+        segment_count INTEGER NOT NULL DEFAULT 0,
+        unknown_speaker_segments INTEGER NOT NULL DEFAULT 0,
+        duration REAL,
+        confidence REAL,
+        size INTEGER NOT NULL,
+        mtime REAL NOT NULL,
+        ctime REAL NOT NULL,
+        has_corrections INTEGER NOT NULL DEFAULT 0,
+        parse_error TEXT,
+        cataloged_at TEXT NOT NULL
+    )
+    """,
+    f"CREATE INDEX IF NOT EXISTS idx_transcript_catalog_hearing ON {CATALOG_TABLE}(hearing_id)",
+    f"CREATE INDEX IF NOT EXISTS idx_transcript_catalog_mtime ON {CATALOG_TABLE}(mtime DESC)"
+]
+
+
+def ensure_transcript_catalog(conn: sqlite3.Connection):
+    """Create the catalog table and its indexes"""
+    # Statement by statement: executescript would commit the caller's transaction
+    for sql in CATALOG_SCHEMA:
+        conn.execute(sql)
+
+
+def catalog_key(path: PathLike) -> str:
+    """Catalog key for a transcript path (absolute, not symlink-resolved)"""
+    return os.path.abspath(str(path))
+
+
+def _under(root: PathLike, column: str = "path"):
+    """SQL condition and params for catalog rows below root, as a primary key range"""
+    prefix = catalog_key(root) + os.sep
+    return f"{column} >= ? AND {column} < ?", [prefix, prefix[:-1] + chr(ord(os.sep) + 1)]
+
+
+def _dicts(cursor: sqlite3.Cursor) -> List[Dict[str, Any]]:
+    columns = [d[0] for d in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def _segments(transcript: Dict[str, Any]) -> List[Dict[str, Any]]:
+    # Segments sit at the top level or under 'transcription'
+    segments = transcript.get("segments")
+    if segments is None:
+        segments = (transcript.get("transcription") or {}).get("segments")
+    return segments if isinstance(segments, list) else []
+
+
+def _first(*values):
+    return next((value for value in values if value is not None), None)
+
+
+def transcript_metadata(path: PathLike, transcript: Dict[str, Any]) -> Dict[str, Any]:
+    """Catalog fields taken from a parsed transcript"""
+    transcription = transcript.get("transcription") or {}
+    segments = _segments(transcript)
+
+    hearing_id = transcript.get("hearing_id")
+    if hearing_id is None:
+        match = _HEARING_FILE.match(Path(path).name)
+        hearing_id = int(match.group(1)) if match else None
+
+    duration = _first(transcript.get("total_duration"), transcript.get("duration"),
+                      transcription.get("duration"))
+    if duration is None and segments:
+        duration = max((s.get("end_time", s.get("end")) or 0 for s in segments if isinstance(s, dict)),
+                       default=None)
+
+    return {
+        "hearing_id": hearing_id,
+        "committee": _first(transcript.get("committee"), transcript.get("committee_code")),
+        "audio_file": transcript.get("audio_file"),
+        "pipeline_version": transcript.get("pipeline_version"),
+        "processed_at": _first(transcript.get("processed_at"), transcript.get("transcription_date")),
+        "segment_count": len(segments),
+        "unknown_speaker_segments": sum(
+            1 for s in segments if isinstance(s, dict) and (s.get("speaker") or "") in UNKNOWN_SPEAKERS
+        ),
+        "duration": duration,
+        "confidence": _first(transcript.get("confidence"), transcript.get("confidence_score"),
+                             transcription.get("confidence"))
+    }
+
+
+def catalog_transcript(conn: sqlite3.Connection,
+                       path: PathLike,
+                       transcript: Optional[Dict[str, Any]] = None,
+                       stat: Optional[os.stat_result] = None) -> Dict[str, Any]:
+    """
+    Add or refresh one transcript's catalog row (caller commits).
+
+    Args:
+        conn: Connection holding the catalog
+        path: Transcript file, already written
+        transcript: Parsed content when the caller has it; read from disk otherwise
+        stat: File stat when the caller has it
+
+    Returns:
+        The catalog row values
+    """
+    ensure_transcript_catalog(conn)
+    stat = stat or os.stat(path)
+
+    parse_error = None
+    if transcript is None:
+        try:
+            with open(path, 'r') as f:
+                transcript = json.load(f)
+            if not isinstance(transcript, dict):
+                raise ValueError("transcript is not a JSON object")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read transcript {path}: {e}")
+            transcript, parse_error = {}, str(e)
+
+    row = {
+        "path": catalog_key(path),
+        "filename": Path(path).name,
+        **transcript_metadata(path, transcript),
+        "size": stat.st_size,
+        "mtime": stat.st_mtime,
+        "ctime": stat.st_ctime,
+        "parse_error": parse_error,
+        "cataloged_at": datetime.now().isoformat()
+    }
+
+    # has_corrections is owned by set_has_corrections and survives a refresh
+    columns = list(row)
+    conn.execute(f"""
+        INSERT INTO {CATALOG_TABLE} ({", ".join(columns)})
+        VALUES ({", ".join("?" for _ in columns)})
+        ON CONFLICT(path) DO UPDATE SET
+            {", ".join(f"{c} = excluded.{c}" for c in columns if c != "path")}
+    """, [row[c] for c in columns])
+    return row
+
+
+def set_has_corrections(conn: sqlite3.Connection, paths: Iterable[PathLike], has_corrections: bool = True):
+    """Flag transcripts as having (or not having) speaker corrections"""
+    ensure_transcript_catalog(conn)
+    conn.executemany(f"UPDATE {CATALOG_TABLE} SET has_corrections = ? WHERE path = ?",
+                     [(int(has_corrections), catalog_key(path)) for path in paths])
+
+
+def reconcile_catalog(conn: sqlite3.Connection,
+                      root: PathLike,
+                      pattern: str = "*.json",
+                      recursive: bool = False,
+                      corrected_paths: Optional[Iterable[PathLike]] = None) -> Dict[str, int]:
+    """
+    Bring the catalog in line with the transcript files under root (caller commits).
+
+    Files are compared by size and mtime; only new or changed files are parsed,
+    and rows for deleted files are dropped.
+
+    Args:
+        conn: Connection holding the catalog
+        root: Transcript directory
+        pattern: Filename pattern of transcript files
+        recursive: Also scan subdirectories
+        corrected_paths: Transcripts with active corrections; when given,
+            has_corrections is brought in line with it
+
+    Returns:
+        Counts of added, updated, removed and unchanged transcripts
+    """
+    ensure_transcript_catalog(conn)
+    root = Path(root)
+    prefix = catalog_key(root) + os.sep
+    scope, scope_params = _under(root)
+
+    on_disk = {}
+    if root.exists():
+        for path in (root.rglob(pattern) if recursive else root.glob(pattern)):
+            try:
+                on_disk[catalog_key(path)] = (path, path.stat())
+            except OSError:
+                continue  # Removed between listing and stat
+
+    def in_scope(key: str) -> bool:
+        return (fnmatch.fnmatch(os.path.basename(key), pattern)
+                and (recursive or os.sep not in key[len(prefix):]))
+
+    cataloged = {
+        row[0]: (row[1], row[2])
+        for row in conn.execute(f"SELECT path, size, mtime FROM {CATALOG_TABLE} WHERE {scope}",
+                                scope_params).fetchall()
+        if in_scope(row[0])
+    }
+
+    counts = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+    for key, (path, stat) in on_disk.items():
+        known = cataloged.get(key)
+        if known == (stat.st_size, stat.st_mtime):
+            counts["unchanged"] += 1
+            continue
+        catalog_transcript(conn, path, stat=stat)
+        counts["updated" if known else "added"] += 1
+
+    removed = [key for key in cataloged if key not in on_disk]
+    conn.executemany(f"DELETE FROM {CATALOG_TABLE} WHERE path = ?", [(key,) for key in removed])
+    counts["removed"] = len(removed)
+
+    if corrected_paths is not None:
+        corrected = {catalog_key(path) for path in corrected_paths}
+        flags = conn.execute(f"SELECT path, has_corrections FROM {CATALOG_TABLE} WHERE {scope}",
+                             scope_params).fetchall()
+        conn.executemany(f"UPDATE {CATALOG_TABLE} SET has_corrections = ? WHERE path = ?", [
+            (int(path in corrected), path) for path, flag in flags if bool(flag) != (path in corrected)
+        ])
+
+    if counts["added"] or counts["updated"] or counts["removed"]:
+        logger.info(f"Reconciled transcript catalog for {root}: {counts}")
+    return counts
+
+
+def speaker_review_status(segment_count: int, unknown_speaker_segments: int) -> str:
+    """Speaker review state shown for a transcript, from its catalog counts"""
+    if not segment_count:
+        return "no_transcript"
+    if unknown_speaker_segments == 0:
+        return "complete"
+    if unknown_speaker_segments < segment_count / 2:
+        return "partial"
+    return "needs_review"
+
+
+class TranscriptCatalog:
+    """
+    Catalog of the transcripts under one directory.
+
+    reconcile() rescans at most once per scan_interval, so listing endpoints
+    can call it on every request.
+    """
+
+    def __init__(self, root: PathLike, pattern: str = "*.json", recursive: bool = False,
+                 scan_interval: float = 30.0):
+        self.root = Path(root)
+        self.pattern = pattern
+        self.recursive = recursive
+        self.scan_interval = scan_interval
+        self._next_scan = 0.0
+        self._lock = threading.Lock()
+
+    def reconcile(self, conn: sqlite3.Connection, force: bool = False,
+                  corrected_paths: Optional[Callable[[], Iterable[PathLike]]] = None) -> Optional[Dict[str, int]]:
+        """
+        Rescan the directory if the last scan is older than scan_interval (commits).
+
+        Args:
+            conn: Connection holding the catalog
+            force: Scan regardless of scan_interval
+            corrected_paths: Returns the transcripts with active corrections;
+                only called when a scan runs
+        """
+        with self._lock:
+            now = time.monotonic()
+            if not force and now < self._next_scan:
+                return None
+            self._next_scan = now + self.scan_interval
+
+        counts = reconcile_catalog(conn, self.root, self.pattern, self.recursive,
+                                   corrected_paths() if corrected_paths else None)
+        conn.commit()
+        return counts
+
+    def record(self, conn: sqlite3.Connection, path: PathLike,
+               transcript: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Catalog a transcript that was just written (commits)"""
+        row = catalog_transcript(conn, path, transcript)
+        conn.commit()
+        return row
+
+    def list_transcripts(self, conn: sqlite3.Connection, name_glob: Optional[str] = None,
+                         include_hearings: bool = False) -> List[Dict[str, Any]]:
+        """
+        Cataloged transcripts under the directory, newest first.
+
+        Args:
+            conn: Connection holding the catalog
+            name_glob: Only filenames matching this GLOB pattern
+            include_hearings: Add hearing title, committee and status from
+                hearings_unified (same database only)
+        """
+        scope, params = _under(self.root, "c.path")
+        conditions = [scope, "c.parse_error IS NULL"]
+        if name_glob:
+            conditions.append("c.filename GLOB ?")
+            params.append(name_glob)
+
+        hearing_columns, hearing_join = "", ""
+        if include_hearings:
+            # status and processing_stage come from the status migration
+            present = {row[1] for row in conn.execute("PRAGMA table_info(hearings_unified)").fetchall()}
+            hearing_columns = "".join(f", h.{c}" if c in present else f", NULL AS {c}" for c in HEARING_COLUMNS)
+            hearing_join = "LEFT JOIN hearings_unified h ON h.id = c.hearing_id"
+
+        return _dicts(conn.execute(f"""
+            SELECT c.*{hearing_columns}
+            FROM {CATALOG_TABLE} c {hearing_join}
+            WHERE {" AND ".join(conditions)}
+            ORDER BY c.mtime DESC
+        """, params))
+
+    def stats(self, conn: sqlite3.Connection) -> Dict[str, Any]:
+        """Totals, per-committee and per-day counts and average confidence"""
+        condition, params = _under(self.root)
+        scope = f"FROM {CATALOG_TABLE} WHERE {condition} AND parse_error IS NULL"
+
+        totals = conn.execute(f"SELECT COUNT(*), IFNULL(SUM(size), 0), AVG(confidence) {scope}",
+                              params).fetchone()
+        by_committee = conn.execute(f"SELECT IFNULL(committee, 'Unknown'), COUNT(*) {scope} GROUP BY 1",
+                                    params).fetchall()
+        by_date = conn.execute(f"SELECT date(ctime, 'unixepoch', 'localtime'), COUNT(*) {scope} GROUP BY 1",
+                               params).fetchall()
+        return {
+            "total_transcripts": totals[0],
+            "total_size": totals[1],
+            "by_committee": {row[0]: row[1] for row in by_committee},
+            "by_date": {row[0]: row[1] for row in by_date},
+            "average_confidence": round(totals[2], 3) if totals[2] is not None else 0
+        }
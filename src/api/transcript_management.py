@@ -8,57 +8,52 @@ import logging
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Any, Optional
-from fastapi import APIRouter, HTTPException, Response
-from fastapi.responses import JSONResponse, FileResponse
+import asyncio
+from fastapi import APIRouter, HTTPException, Response, Query
+from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
 import sqlite3
 
+try:
+    from .async_database import run_in_db_executor
+    from .transcript_catalog import TranscriptCatalog, speaker_review_status
+    from .transcript_segments import (MAX_PAGE_SEGMENTS, get_segment_index_cache,
+                                      stream_transcript_ndjson, transcript_page)
+except ImportError:
+    from async_database import run_in_db_executor
+    from transcript_catalog import TranscriptCatalog, speaker_review_status
+    from transcript_segments import (MAX_PAGE_SEGMENTS, get_segment_index_cache,
+                                     stream_transcript_ndjson, transcript_page)
+
 logger = logging.getLogger(__name__)
 
+TRANSCRIPT_DIR = Path('output/demo_transcription')
+
 def setup_transcript_routes(app, db):
     """Setup transcript management routes"""
     
     router = APIRouter(prefix="/api/transcript-browser", tags=["transcript-management"])
+    catalog = TranscriptCatalog(TRANSCRIPT_DIR)
+    
+    def list_catalog(name_glob: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Catalog rows with hearing details, after picking up changed files"""
+        catalog.reconcile(db.connection)
+        return catalog.list_transcripts(db.connection, name_glob=name_glob, include_hearings=True)
+    
+    def catalog_stats() -> Dict[str, Any]:
+        catalog.reconcile(db.connection)
+        return catalog.stats(db.connection)
     
     @router.get("/hearings")
     async def get_hearing_transcripts():
         """Get list of hearing transcripts generated by the processing pipeline"""
         try:
-            transcript_dir = Path('output/demo_transcription')
-            transcripts = []
-            
-            if transcript_dir.exists():
-                # Find all hearing transcript files
-                for transcript_file in transcript_dir.glob("hearing_*_transcript.json"):
-                    try:
-                        with open(transcript_file, 'r') as f:
-                            transcript_data = json.load(f)
-                        
-                        # Get additional hearing info from database if available
-                        if transcript_data.get('hearing_id'):
-                            hearing_info = get_hearing_info(db, transcript_data['hearing_id'])
-                            if hearing_info:
-                                transcript_data.update(hearing_info)
-                        
-                        transcript_data['file_path'] = str(transcript_file)
-                        transcript_data['filename'] = transcript_file.name
-                        transcript_data['file_size'] = transcript_file.stat().st_size
-                        transcript_data['created_at'] = datetime.fromtimestamp(
-                            transcript_file.stat().st_ctime
-                        ).isoformat()
-                        
-                        transcripts.append(transcript_data)
-                        
-                    except Exception as e:
-                        logger.error(f"Error reading transcript {transcript_file}: {e}")
-                        continue
-            
-            # Sort by creation date, newest first
-            transcripts.sort(key=lambda x: x.get('created_at', ''), reverse=True)
+            rows = await run_in_db_executor(list_catalog, "hearing_*_transcript.json")
+            transcripts = [transcript_summary(row) for row in rows]
             
             return JSONResponse({
                 "transcripts": transcripts,
                 "total": len(transcripts),
-                "transcript_dir": str(transcript_dir)
+                "transcript_dir": str(TRANSCRIPT_DIR)
             })
             
         except Exception as e:
@@ -66,44 +61,51 @@ def setup_transcript_routes(app, db):
             raise HTTPException(status_code=500, detail=f"Failed to fetch transcripts: {str(e)}")
     
     @router.get("/content/{transcript_id}")
-    async def get_transcript_content(transcript_id: str):
-        """Get full content of a specific transcript"""
+    async def get_transcript_content(
+        transcript_id: str,
+        start: Optional[int] = Query(None, ge=0, description="Index of the first segment"),
+        limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SEGMENTS, description="Segments per page"),
+        start_time: Optional[float] = Query(None, ge=0, description="Window start in seconds"),
+        end_time: Optional[float] = Query(None, ge=0, description="Window end in seconds"),
+        format: str = Query("json", pattern="^(json|ndjson)$", description="json or ndjson (streamed)")
+    ):
+        """
+        Get content of a specific transcript.
+        
+        With start/limit or a time window, only that range of segments is
+        read, through the transcript's segment index, and the response has a
+        'pagination' entry; next_start fetches the following page. With
+        format=ndjson the range is streamed as a header line then one line
+        per segment. Without any of these the full transcript is returned.
+        """
         try:
-            transcript_dir = Path('output/demo_transcription')
-            
-            # Handle different transcript ID formats
-            possible_files = [
-                transcript_dir / f"hearing_{transcript_id}_transcript.json",
-                transcript_dir / f"{transcript_id}.json",
-                transcript_dir / transcript_id
-            ]
-            
-            transcript_file = None
-            for file_path in possible_files:
-                if file_path.exists():
-                    transcript_file = file_path
-                    break
-            
+            transcript_file = find_transcript_file(transcript_id)
             if not transcript_file:
                 raise HTTPException(status_code=404, detail=f"Transcript {transcript_id} not found")
             
-            with open(transcript_file, 'r') as f:
-                transcript_data = json.load(f)
-            
-            # Add file metadata
-            stat = transcript_file.stat()
-            transcript_data['file_metadata'] = {
-                'filename': transcript_file.name,
-                'file_size': stat.st_size,
-                'created_at': datetime.fromtimestamp(stat.st_ctime).isoformat(),
-                'modified_at': datetime.fromtimestamp(stat.st_mtime).isoformat()
-            }
-            
+            paged = format == "ndjson" or any(
+                value is not None for value in (start, limit, start_time, end_time))
+            if not paged:
+                transcript_data = await asyncio.to_thread(load_transcript, transcript_file)
+                return JSONResponse(transcript_data)
+            
+            index = await asyncio.to_thread(get_segment_index_cache().get, transcript_file)
+            if format == "ndjson":
+                return StreamingResponse(
+                    stream_transcript_ndjson(index, start or 0, limit, start_time, end_time),
+                    media_type="application/x-ndjson"
+                )
+            
+            transcript_data = await asyncio.to_thread(
+                transcript_page, index, start or 0, limit, start_time, end_time)
+            transcript_data['file_metadata'] = file_metadata(transcript_file)
             return JSONResponse(transcript_data)
             
+        except HTTPException:
+            raise
         except FileNotFoundError:
             raise HTTPException(status_code=404, detail=f"Transcript {transcript_id} not found")
-        except json.JSONDecodeError:
+        except (json.JSONDecodeError, ValueError):
             raise HTTPException(status_code=500, detail=f"Invalid transcript format for {transcript_id}")
         except Exception as e:
             logger.error(f"Error fetching transcript {transcript_id}: {e}")
@@ -113,19 +115,7 @@ def setup_transcript_routes(app, db):
     async def download_transcript(transcript_id: str):
         """Download transcript file"""
         try:
-            transcript_dir = Path('output/demo_transcription')
-            
-            possible_files = [
-                transcript_dir / f"hearing_{transcript_id}_transcript.json",
-                transcript_dir / f"{transcript_id}.json",
-                transcript_dir / transcript_id
-            ]
-            
-            transcript_file = None
-            for file_path in possible_files:
-                if file_path.exists():
-                    transcript_file = file_path
-                    break
+            transcript_file = find_transcript_file(transcript_id)
             
             if not transcript_file:
                 raise HTTPException(status_code=404, detail=f"Transcript {transcript_id} not found")
@@ -136,6 +126,8 @@ def setup_transcript_routes(app, db):
                 media_type='application/json'
             )
             
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"Error downloading transcript {transcript_id}: {e}")
             raise HTTPException(status_code=500, detail=f"Failed to download transcript: {str(e)}")
@@ -144,64 +136,7 @@ def setup_transcript_routes(app, db):
     async def get_transcript_stats():
         """Get transcript statistics"""
         try:
-            transcript_dir = Path('output/demo_transcription')
-            
-            if not transcript_dir.exists():
-                return JSONResponse({
-                    "total_transcripts": 0,
-                    "total_size": 0,
-                    "by_committee": {},
-                    "by_date": {},
-                    "average_confidence": 0
-                })
-            
-            transcripts = []
-            total_size = 0
-            
-            for transcript_file in transcript_dir.glob("*.json"):
-                try:
-                    with open(transcript_file, 'r') as f:
-                        transcript_data = json.load(f)
-                    
-                    stat = transcript_file.stat()
-                    total_size += stat.st_size
-                    
-                    transcript_data['file_size'] = stat.st_size
-                    transcript_data['created_date'] = datetime.fromtimestamp(
-                        stat.st_ctime
-                    ).strftime('%Y-%m-%d')
-                    
-                    transcripts.append(transcript_data)
-                    
-                except Exception as e:
-                    logger.error(f"Error reading transcript {transcript_file}: {e}")
-                    continue
-            
-            # Calculate statistics
-            by_committee = {}
-            by_date = {}
-            total_confidence = 0
-            confidence_count = 0
-            
-            for transcript in transcripts:
-                committee = transcript.get('committee', 'Unknown')
-                date = transcript.get('created_date', 'Unknown')
-                confidence = transcript.get('confidence')
-                
-                by_committee[committee] = by_committee.get(committee, 0) + 1
-                by_date[date] = by_date.get(date, 0) + 1
-                
-                if confidence is not None:
-                    total_confidence += confidence
-                    confidence_count += 1
-            
-            return JSONResponse({
-                "total_transcripts": len(transcripts),
-                "total_size": total_size,
-                "by_committee": by_committee,
-                "by_date": by_date,
-                "average_confidence": round(total_confidence / confidence_count, 3) if confidence_count > 0 else 0
-            })
+            return JSONResponse(await run_in_db_executor(catalog_stats))
             
         except Exception as e:
             logger.error(f"Error calculating transcript stats: {e}")
@@ -212,27 +147,57 @@ def setup_transcript_routes(app, db):
     
     logger.info("Transcript management routes configured")
 
-def get_hearing_info(db, hearing_id: int) -> Optional[Dict[str, Any]]:
-    """Get additional hearing information from database"""
-    try:
-        cursor = db.connection.execute("""
-            SELECT hearing_title, committee_code, hearing_date, hearing_type, 
-                   status, processing_stage
-            FROM hearings_unified 
-            WHERE id = ?
-        """, (hearing_id,))
-        
-        row = cursor.fetchone()
-        if row:
-            return {
-                'hearing_title': row[0],
-                'committee_code': row[1], 
-                'hearing_date': row[2],
-                'hearing_type': row[3],
-                'status': row[4],
-                'processing_stage': row[5]
-            }
-    except Exception as e:
-        logger.error(f"Error fetching hearing info for {hearing_id}: {e}")
+def find_transcript_file(transcript_id: str) -> Optional[Path]:
+    """Transcript file for an ID, trying the different ID formats"""
+    possible_files = [
+        TRANSCRIPT_DIR / f"hearing_{transcript_id}_transcript.json",
+        TRANSCRIPT_DIR / f"{transcript_id}.json",
+        TRANSCRIPT_DIR / transcript_id
+    ]
+    
+    for file_path in possible_files:
+        if file_path.is_file():
+            return file_path
+    return None
+
+def file_metadata(transcript_file: Path) -> Dict[str, Any]:
+    stat = transcript_file.stat()
+    return {
+        'filename': transcript_file.name,
+        'file_size': stat.st_size,
+        'created_at': datetime.fromtimestamp(stat.st_ctime).isoformat(),
+        'modified_at': datetime.fromtimestamp(stat.st_mtime).isoformat()
+    }
+
+def load_transcript(transcript_file: Path) -> Dict[str, Any]:
+    """Full transcript with file metadata"""
+    with open(transcript_file, 'r') as f:
+        transcript_data = json.load(f)
     
-    return None
\ No newline at end of file
+    # Add file metadata
+    transcript_data['file_metadata'] = file_metadata(transcript_file)
+    return transcript_data
+
+def transcript_summary(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Listing entry for a cataloged transcript; full content comes from /content"""
+    return {
+        'hearing_id': row['hearing_id'],
+        'committee': row['committee'],
+        'confidence': row['confidence'],
+        'total_duration': row['duration'],
+        'processed_at': row['processed_at'],
+        'segment_count': row['segment_count'],
+        'speaker_review_status': speaker_review_status(row['segment_count'], row['unknown_speaker_segments']),
+        'has_corrections': bool(row['has_corrections']),
+        'hearing_title': row['hearing_title'],
+        'committee_code': row['committee_code'],
+        'hearing_date': row['hearing_date'],
+        'hearing_type': row['hearing_type'],
+        'status': row['status'],
+        'processing_stage': row['processing_stage'],
+        'file_path': str(TRANSCRIPT_DIR / row['filename']),
+        'filename': row['filename'],
+        'file_size': row['size'],
+        'created_at': datetime.fromtimestamp(row['ctime']).isoformat(),
+        'modified_at': datetime.fromtimestamp(row['mtime']).isoformat()
+    }
@@ -0,0 +1,386 @@
+"""
+Segment index for paging and streaming transcript content
+A compact per-transcript index records where each segment sits in the
+transcript file (byte offsets) and its start and end time, plus the small
+envelope of everything outside the segment list. Any range of segments, by
+index or time window, is then one seek and one read of just those bytes,
+so long hearings with word-level timestamps are never parsed whole to
+serve a page. Indexes are rebuilt when the file's size or mtime changes and
+are kept in memory and on disk.
+"""
+
+import os
+import re
+import json
+import math
+import hashlib
+import logging
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_DIR = Path(__file__).parent.parent.parent / 'data' / 'segment_index'
+
+INDEX_FORMAT_VERSION = 1
+
+# Largest page a client may ask for in one response
+MAX_PAGE_SEGMENTS = 5000
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+PathLike = Union[str, Path]
+
+
+def _skip(text: str, pos: int) -> int:
+    return _WHITESPACE.match(text, pos).end()
+
+
+def _segment_time(segment: Any, *keys: str) -> float:
+    if isinstance(segment, dict):
+        for key in keys:
+            value = segment.get(key)
+            if isinstance(value, (int, float)):
+                return float(value)
+    return math.nan
+
+
+class SegmentIndex:
+    """Byte offsets and times of one transcript file's segments"""
+
+    def __init__(self, path: str, size: int, mtime_ns: int, segments_path: List[str],
+                 envelope: Dict[str, Any], offsets: array, starts: array, ends: array):
+        self.path = path
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.segments_path = segments_path  # Keys leading to the segment list, e.g. ["transcription", "segments"]
+        self.envelope = envelope  # Transcript content without the segment list
+        self.offsets = offsets  # Start and end byte of each segment, interleaved
+        self.starts = starts
+        self.ends = ends
+        # Times that never decrease allow binary search for time windows
+        self.time_ordered = all(not math.isnan(t) for t in starts) and all(not math.isnan(t) for t in ends) \
+            and all(a <= b for a, b in zip(starts, starts[1:])) and all(a <= b for a, b in zip(ends, ends[1:]))
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def matches(self, stat: os.stat_result) -> bool:
+        """Whether the index describes the file as it is now"""
+        return self.size == stat.st_size and self.mtime_ns == stat.st_mtime_ns
+
+    def time_window(self, start_time: Optional[float] = None, end_time: Optional[float] = None) -> Tuple[int, int]:
+        """Index range of the segments overlapping [start_time, end_time)"""
+        if start_time is None and end_time is None:
+            return 0, len(self)
+        start_time = -math.inf if start_time is None else start_time
+        end_time = math.inf if end_time is None else end_time
+
+        if self.time_ordered:
+            return bisect_right(self.ends, start_time), bisect_left(self.starts, end_time)
+
+        # Out-of-order or untimed segments: scan the times, still without parsing JSON
+        inside = [i for i, (s, e) in enumerate(zip(self.starts, self.ends)) if e > start_time and s < end_time]
+        return (inside[0], inside[-1] + 1) if inside else (0, 0)
+
+    def resolve(self, start: int = 0, limit: Optional[int] = None,
+                start_time: Optional[float] = None, end_time: Optional[float] = None) -> Tuple[int, int, int]:
+        """
+        Segment range for a request.
+
+        Returns:
+            (first, stop, window_stop): the page is [first, stop); window_stop
+            ends the selected window, so stop < window_stop means more pages
+        """
+        window_start, window_stop = self.time_window(start_time, end_time)
+        first = min(max(start, window_start), max(window_stop, window_start))
+        stop = window_stop if limit is None else min(window_stop, first + limit)
+        return first, max(stop, first), window_stop
+
+    def _span(self, first: int, stop: int) -> Tuple[int, int]:
+        return self.offsets[2 * first], self.offsets[2 * stop - 1]
+
+    def read_raw(self, first: int, stop: int, batch_bytes: int = 1024 * 1024) -> Iterator[bytes]:
+        """
+        Raw JSON bytes of segments [first, stop), one per segment, reading in batches.
+
+        Raw newlines can only be formatting whitespace in JSON, so they are
+        dropped and each segment fits on one line.
+        """
+        if first >= stop:
+            return
+        with open(self.path, 'rb') as f:
+            i = first
+            while i < stop:
+                # Take whole segments up to roughly batch_bytes per read
+                j = i + 1
+                while j < stop and self.offsets[2 * j + 1] - self.offsets[2 * i] <= batch_bytes:
+                    j += 1
+                block_start, block_end = self._span(i, j)
+                f.seek(block_start)
+                block = f.read(block_end - block_start)
+                for k in range(i, j):
+                    raw = block[self.offsets[2 * k] - block_start:self.offsets[2 * k + 1] - block_start]
+                    yield raw.replace(b"\n", b"").replace(b"\r", b"")
+                i = j
+
+    def read_segments(self, first: int, stop: int) -> List[Dict[str, Any]]:
+        """Parsed segments [first, stop)"""
+        return [json.loads(raw) for raw in self.read_raw(first, stop)]
+
+    def with_segments(self, segments: List[Any]) -> Dict[str, Any]:
+        """The envelope with a segment list placed where the file keeps it"""
+        transcript = dict(self.envelope)
+        if not self.segments_path:
+            transcript["segments"] = segments
+            return transcript
+        parent = transcript
+        for key in self.segments_path[:-1]:
+            parent[key] = dict(parent.get(key) or {})
+            parent = parent[key]
+        parent[self.segments_path[-1]] = segments
+        return transcript
+
+    # Persistence
+
+    def to_bytes(self) -> bytes:
+        header = json.dumps({
+            "version": INDEX_FORMAT_VERSION, "path": self.path, "size": self.size, "mtime_ns": self.mtime_ns,
+            "count": len(self), "segments_path": self.segments_path, "envelope": self.envelope
+        }).encode()
+        return header + b"\n" + self.offsets.tobytes() + self.starts.tobytes() + self.ends.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SegmentIndex":
+        newline = data.index(b"\n")
+        header = json.loads(data[:newline])
+        if header.get("version") != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported segment index version {header.get('version')}")
+
+        count = header["count"]
+        offsets, starts, ends = array('Q'), array('d'), array('d')
+        body = memoryview(data)[newline + 1:]
+        if len(body) != 32 * count:
+            raise ValueError("Truncated segment index")
+        offsets.frombytes(body[:16 * count])
+        starts.frombytes(body[16 * count:24 * count])
+        ends.frombytes(body[24 * count:32 * count])
+        return cls(header["path"], header["size"], header["mtime_ns"], header["segments_path"],
+                   header["envelope"], offsets, starts, ends)
+
+
+def build_segment_index(path: PathLike) -> SegmentIndex:
+    """
+    Index a transcript file.
+
+    Segments are found at the top level or under 'transcription', the two
+    layouts the pipeline writes.
+
+    Raises:
+        ValueError: If the file is not a JSON object
+    """
+    path = os.path.abspath(str(path))
+    stat = os.stat(path)
+    with open(path, 'rb') as f:
+        raw = f.read()
+    text = raw.decode('utf-8')
+
+    spans: List[Tuple[int, int]] = []
+    starts, ends = array('d'), array('d')
+    found: List[List[str]] = []
+
+    def scan_object(pos: int, keys: List[str]) -> Tuple[Dict[str, Any], int]:
+        """Parse an object, recording the segment list instead of keeping it"""
+        members: Dict[str, Any] = {}
+        pos = _skip(text, pos + 1)
+        if text[pos] == '}':
+            return members, pos + 1
+        while True:
+            key, pos = _decoder.raw_decode(text, pos)
+            pos = _skip(text, pos)
+            if text[pos] != ':':
+                raise ValueError(f"Expected ':' at {pos}")
+            pos = _skip(text, pos + 1)
+
+            if key == "segments" and text[pos] == '[' and not found:
+                found.append(keys + [key])
+                pos = scan_segments(pos)
+            elif key == "transcription" and not keys and text[pos] == '{':
+                members[key], pos = scan_object(pos, [key])
+            else:
+                members[key], pos = _decoder.raw_decode(text, pos)
+
+            pos = _skip(text, pos)
+            if text[pos] == '}':
+                return members, pos + 1
+            if text[pos] != ',':
+                raise ValueError(f"Expected ',' or '}}' at {pos}")
+            pos = _skip(text, pos + 1)
+
+    def scan_segments(pos: int) -> int:
+        pos = _skip(text, pos + 1)
+        if text[pos] == ']':
+            return pos + 1
+        while True:
+            segment, end = _decoder.raw_decode(text, pos)
+            spans.append((pos, end))
+            starts.append(_segment_time(segment, "start_time", "start"))
+            ends.append(_segment_time(segment, "end_time", "end"))
+            pos = _skip(text, end)
+            if text[pos] == ']':
+                return pos + 1
+            if text[pos] != ',':
+                raise ValueError(f"Expected ',' or ']' at {pos}")
+            pos = _skip(text, pos + 1)
+
+    try:
+        pos = _skip(text, 0)
+        if text[pos:pos + 1] != '{':
+            raise ValueError("transcript is not a JSON object")
+        envelope, _ = scan_object(pos, [])
+    except (IndexError, json.JSONDecodeError) as e:
+        raise ValueError(f"Invalid transcript JSON in {path}: {e}") from e
+
+    # Character offsets are byte offsets unless the file has non-ASCII text
+    offsets = array('Q')
+    if len(raw) == len(text):
+        for start, end in spans:
+            offsets.extend((start, end))
+    else:
+        byte_pos, char_pos = 0, 0
+        for start, end in spans:
+            byte_pos += len(text[char_pos:start].encode('utf-8'))
+            segment_start = byte_pos
+            byte_pos += len(text[start:end].encode('utf-8'))
+            offsets.extend((segment_start, byte_pos))
+            char_pos = end
+
+    return SegmentIndex(path, stat.st_size, stat.st_mtime_ns, found[0] if found else [],
+                        envelope, offsets, starts, ends)
+
+
+class SegmentIndexCache:
+    """Segment indexes in memory (LRU) and on disk, rebuilt when a transcript changes"""
+
+    def __init__(self, index_dir: Optional[Path] = None, max_entries: int = 64):
+        """
+        Initialize segment index cache.
+
+        Args:
+            index_dir: Directory for persisted indexes
+            max_entries: Indexes kept in memory
+        """
+        self.index_dir = Path(index_dir or os.environ.get('SEGMENT_INDEX_DIR') or DEFAULT_INDEX_DIR)
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self._indexes: "OrderedDict[str, SegmentIndex]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "builds": 0}
+
+    def _index_file(self, path: str) -> Path:
+        return self.index_dir / f"{hashlib.sha1(path.encode()).hexdigest()}.idx"
+
+    def get(self, path: PathLike) -> SegmentIndex:
+        """
+        Current index for a transcript file.
+
+        Raises:
+            FileNotFoundError: If the transcript does not exist
+            ValueError: If the transcript is not valid JSON
+        """
+        path = os.path.abspath(str(path))
+        stat = os.stat(path)
+
+        with self._lock:
+            index = self._indexes.get(path)
+            if index is not None and index.matches(stat):
+                self._indexes.move_to_end(path)
+                self.stats["memory_hits"] += 1
+                return index
+
+        index_file = self._index_file(path)
+        index = None
+        try:
+            index = SegmentIndex.from_bytes(index_file.read_bytes())
+            if index.path != path or not index.matches(stat):
+                index = None
+        except FileNotFoundError:
+            pass
+        except (ValueError, KeyError) as e:
+            logger.warning(f"Discarding unreadable segment index for {path}: {e}")
+
+        if index is not None:
+            stat_key = "disk_hits"
+        else:
+            stat_key = "builds"
+            index = build_segment_index(path)
+            tmp_file = index_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                tmp_file.write_bytes(index.to_bytes())
+                # Atomic rename so concurrent readers never see a partial index
+                tmp_file.replace(index_file)
+            except OSError as e:
+                logger.warning(f"Could not persist segment index for {path}: {e}")
+                tmp_file.unlink(missing_ok=True)
+
+        with self._lock:
+            self.stats[stat_key] += 1
+            self._indexes[path] = index
+            self._indexes.move_to_end(path)
+            while len(self._indexes) > self.max_entries:
+                self._indexes.popitem(last=False)
+        return index
+
+
+def transcript_page(index: SegmentIndex, start: int = 0, limit: Optional[int] = None,
+                    start_time: Optional[float] = None, end_time: Optional[float] = None) -> Dict[str, Any]:
+    """
+    One page of a transcript: the envelope, the page's segments where the
+    file keeps them, and pagination details.
+    """
+    first, stop, window_stop = index.resolve(start, limit, start_time, end_time)
+    transcript = index.with_segments(index.read_segments(first, stop))
+    transcript["pagination"] = pagination(index, first, stop, window_stop)
+    return transcript
+
+
+def pagination(index: SegmentIndex, first: int, stop: int, window_stop: int) -> Dict[str, Any]:
+    return {
+        "start": first,
+        "count": stop - first,
+        "total_segments": len(index),
+        "next_start": stop if stop < window_stop else None
+    }
+
+
+def stream_transcript_ndjson(index: SegmentIndex, start: int = 0, limit: Optional[int] = None,
+                             start_time: Optional[float] = None,
+                             end_time: Optional[float] = None) -> Iterator[bytes]:
+    """
+    Transcript range as NDJSON: a header line with the envelope and
+    pagination, then one line per segment copied from the file unparsed.
+    """
+    first, stop, window_stop = index.resolve(start, limit, start_time, end_time)
+    header = {"type": "header", "transcript": index.envelope, "segments_path": index.segments_path,
+              "pagination": pagination(index, first, stop, window_stop)}
+    yield json.dumps(header).encode() + b"\n"
+    for raw in index.read_raw(first, stop):
+        yield raw + b"\n"
+
+
+# Global cache instance
+_segment_index_cache = None
+_cache_lock = threading.Lock()
+
+def get_segment_index_cache() -> SegmentIndexCache:
+    """Get the shared segment index cache"""
+    global _segment_index_cache
+    with _cache_lock:
+        if _segment_index_cache is None:
+            _segment_index_cache = SegmentIndexCache()
+        return _segment_index_cache
@@ -3,5 +3,8 @@ Audio processing module for Senate Hearing Audio Capture
 """
 
 from .trimming import AudioTrimmer, get_audio_trimmer
+from .pcm_cache import DecodedAudio, PCMCache, get_pcm_cache
+from .dead_air import DeadAirRemover, OffsetMap, get_dead_air_remover
 
-__all__ = ['AudioTrimmer', 'get_audio_trimmer']
\ No newline at end of file
+__all__ = ['AudioTrimmer', 'get_audio_trimmer', 'DecodedAudio', 'PCMCache', 'get_pcm_cache',
+           'DeadAirRemover', 'OffsetMap', 'get_dead_air_remover']
\ No newline at end of file
@@ -0,0 +1,333 @@
+"""
+Dead Air Removal for congressional hearings
+Finds every long non-speech span (pre-gavel silence, recesses, vote breaks),
+builds a compacted audio file without them, and maps transcript timestamps
+from the compacted file back to the original recording
+"""
+
+import bisect
+import json
+import logging
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+import numpy as np
+
+from .pcm_cache import DecodedAudio, PCM_SCALE, get_pcm_cache
+
+logger = logging.getLogger(__name__)
+
+
+class OffsetMap:
+    """Maps times in a compacted audio file back to the original recording"""
+
+    def __init__(self, kept_spans: List[Dict[str, float]], original_duration: float):
+        """
+        Initialize offset map.
+
+        Args:
+            kept_spans: Time-ordered spans of original audio kept in the compacted
+                        file, each with original_start, original_end and compacted_start
+            original_duration: Duration of the original recording in seconds
+        """
+        self.kept_spans = kept_spans
+        self.original_duration = original_duration
+        self._compacted_starts = [span["compacted_start"] for span in kept_spans]
+
+    @classmethod
+    def from_kept_ranges(cls, ranges: List[tuple], original_duration: float) -> "OffsetMap":
+        """Build a map from (start, end) ranges of original audio kept in order"""
+        kept_spans = []
+        compacted_start = 0.0
+        for start, end in ranges:
+            kept_spans.append({
+                "original_start": round(start, 3),
+                "original_end": round(end, 3),
+                "compacted_start": round(compacted_start, 3)
+            })
+            compacted_start += round(end, 3) - round(start, 3)
+        return cls(kept_spans, original_duration)
+
+    @classmethod
+    def identity(cls, duration: float) -> "OffsetMap":
+        """Map for audio that was not compacted"""
+        return cls.from_kept_ranges([(0.0, duration)], duration)
+
+    @property
+    def compacted_duration(self) -> float:
+        if not self.kept_spans:
+            return 0.0
+        last = self.kept_spans[-1]
+        return last["compacted_start"] + last["original_end"] - last["original_start"]
+
+    @property
+    def removed_seconds(self) -> float:
+        return max(0.0, self.original_duration - self.compacted_duration)
+
+    def to_original(self, t: float, is_end: bool = False) -> float:
+        """
+        Convert a compacted-file timestamp to original-recording time.
+
+        Args:
+            t: Time in the compacted file (seconds)
+            is_end: Resolve a time exactly on a splice to the end of the earlier
+                    span rather than the start of the later one
+
+        Returns:
+            Time in the original recording (seconds)
+        """
+        if not self.kept_spans:
+            return t
+
+        if is_end:
+            index = bisect.bisect_left(self._compacted_starts, t) - 1
+        else:
+            index = bisect.bisect_right(self._compacted_starts, t) - 1
+        span = self.kept_spans[max(index, 0)]
+
+        original = span["original_start"] + (t - span["compacted_start"])
+        # Whisper may report times slightly past a span (or the file) end
+        if index < len(self.kept_spans) - 1:
+            original = min(original, span["original_end"])
+        return round(max(original, 0.0), 3)
+
+    def restore_transcript(self, transcript: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Restore original-recording timestamps on every segment and word.
+
+        Args:
+            transcript: Transcription result timed against the compacted file
+
+        Returns:
+            Copy of the transcript with segment, nested word and top-level word
+            timestamps mapped back to the original recording
+        """
+        restored = dict(transcript)
+
+        if "segments" in transcript:
+            segments = []
+            for segment in transcript["segments"]:
+                segment = self._restore_item(segment)
+                if segment.get("words"):
+                    segment["words"] = [self._restore_item(word) for word in segment["words"]]
+                segments.append(segment)
+            restored["segments"] = segments
+
+        if transcript.get("words"):
+            restored["words"] = [self._restore_item(word) for word in transcript["words"]]
+
+        if "duration" in transcript:
+            restored["duration"] = self.original_duration
+
+        restored["dead_air_removal"] = {
+            "removed_seconds": round(self.removed_seconds, 3),
+            "compacted_duration": round(self.compacted_duration, 3),
+            "original_duration": round(self.original_duration, 3),
+            "kept_spans": len(self.kept_spans)
+        }
+        return restored
+
+    def _restore_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        restored = dict(item)
+        if "start" in item:
+            restored["start"] = self.to_original(item["start"])
+        if "end" in item:
+            restored["end"] = self.to_original(item["end"], is_end=True)
+            if "start" in restored:
+                restored["end"] = max(restored["end"], restored["start"])
+        return restored
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "original_duration": self.original_duration,
+            "compacted_duration": self.compacted_duration,
+            "kept_spans": self.kept_spans
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "OffsetMap":
+        return cls(data["kept_spans"], data["original_duration"])
+
+    def save(self, path: Path):
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, path: Path) -> "OffsetMap":
+        with open(path, 'r') as f:
+            return cls.from_dict(json.load(f))
+
+
+class DeadAirRemover:
+    """Voice-activity-based removal of long non-speech spans before transcription"""
+
+    def __init__(self,
+                 min_dead_air: float = 20.0,
+                 speech_threshold_db: float = -40.0,
+                 min_speech_duration: float = 0.5,
+                 padding: float = 1.0,
+                 frame_duration: float = 0.03):
+        """
+        Initialize dead air remover.
+
+        Args:
+            min_dead_air: Shortest non-speech span removed (seconds)
+            speech_threshold_db: Frame RMS level (dBFS) above which a frame counts as voice
+            min_speech_duration: Voice bursts shorter than this (gavels, coughs) stay dead air
+            padding: Audio kept on each side of a removed span so words are not clipped
+            frame_duration: VAD frame length (seconds)
+        """
+        self.min_dead_air = min_dead_air
+        self.speech_threshold_db = speech_threshold_db
+        self.min_speech_duration = min_speech_duration
+        self.padding = padding
+        self.frame_duration = frame_duration
+
+    def detect_dead_air(self, pcm: DecodedAudio) -> List[Dict[str, float]]:
+        """
+        Find non-speech spans of at least min_dead_air seconds.
+
+        Args:
+            pcm: Decoded 16kHz mono PCM for the whole file
+
+        Returns:
+            Removable spans (start, end, duration) with padding already applied
+        """
+        frame_size = max(1, int(pcm.sample_rate * self.frame_duration))
+        frame_seconds = frame_size / pcm.sample_rate
+
+        rms = self._frame_rms(pcm.samples, frame_size)
+        threshold = (10 ** (self.speech_threshold_db / 20)) * PCM_SCALE
+        voiced = rms > threshold
+
+        # Voice bursts too short to be speech do not interrupt a dead air span
+        min_speech_frames = int(np.ceil(self.min_speech_duration / frame_seconds))
+        for start, end in self._runs(voiced):
+            if end - start < min_speech_frames:
+                voiced[start:end] = False
+
+        dead_air = []
+        for start, end in self._runs(~voiced):
+            start_time = float(start * frame_seconds)
+            end_time = float(min(end * frame_seconds, pcm.duration))
+            if end_time - start_time < self.min_dead_air:
+                continue
+
+            # Keep padding next to speech; the file edges need none
+            cut_start = start_time + self.padding if start > 0 else 0.0
+            cut_end = end_time - self.padding if end < len(voiced) else pcm.duration
+            if cut_end > cut_start:
+                dead_air.append({
+                    "start": round(cut_start, 3),
+                    "end": round(cut_end, 3),
+                    "duration": round(cut_end - cut_start, 3)
+                })
+
+        return dead_air
+
+    @staticmethod
+    def _frame_rms(samples: np.ndarray, frame_size: int, block_frames: int = 6000) -> np.ndarray:
+        """RMS amplitude per frame, processed in blocks to bound memory"""
+        n_frames = -(-len(samples) // frame_size)
+        rms = np.zeros(n_frames, dtype=np.float64)
+        block_size = frame_size * block_frames
+
+        for block_start in range(0, len(samples), block_size):
+            block = np.asarray(samples[block_start:block_start + block_size], dtype=np.float64)
+            pad = (-len(block)) % frame_size
+            if pad:
+                block = np.pad(block, (0, pad))
+            first_frame = block_start // frame_size
+            block_rms = np.sqrt(np.mean(block.reshape(-1, frame_size) ** 2, axis=1))
+            rms[first_frame:first_frame + len(block_rms)] = block_rms
+
+        return rms
+
+    @staticmethod
+    def _runs(mask: np.ndarray) -> List[tuple]:
+        """(start, end) frame indices of each run of True values"""
+        padded = np.concatenate(([False], mask, [False]))
+        changes = np.flatnonzero(padded[1:] != padded[:-1])
+        return list(zip(changes[0::2], changes[1::2]))
+
+    def build_offset_map(self, duration: float, dead_air: List[Dict[str, float]]) -> OffsetMap:
+        """Offset map for the audio left after removing the dead air spans"""
+        kept = []
+        position = 0.0
+        for span in dead_air:
+            if span["start"] > position:
+                kept.append((position, span["start"]))
+            position = max(position, span["end"])
+        if duration > position:
+            kept.append((position, duration))
+        return OffsetMap.from_kept_ranges(kept, duration)
+
+    def remove_dead_air(self, audio_path: Path, output_path: Optional[Path] = None) -> Dict[str, Any]:
+        """
+        Build a compacted copy of the audio without dead air.
+
+        Args:
+            audio_path: Path to input audio file
+            output_path: Path for the compacted file (optional)
+
+        Returns:
+            Dictionary with the audio path to transcribe, its offset map and removal stats
+        """
+        if output_path is None:
+            output_path = audio_path.parent / f"{audio_path.stem}_compacted.mp3"
+
+        logger.info(f"Detecting dead air in: {audio_path}")
+        pcm = get_pcm_cache().get(audio_path)
+        dead_air = self.detect_dead_air(pcm)
+        offset_map = self.build_offset_map(pcm.duration, dead_air)
+
+        result = {
+            "input_path": str(audio_path),
+            "output_path": str(audio_path),
+            "dead_air_spans": dead_air,
+            "offset_map": offset_map,
+            "original_duration": pcm.duration,
+            "compacted_duration": offset_map.compacted_duration,
+            "removed_seconds": offset_map.removed_seconds
+        }
+
+        if not dead_air:
+            logger.info("No dead air found; transcribing original audio")
+            return result
+
+        # One decode/encode pass keeping only the speech spans
+        selection = "+".join(
+            f"between(t,{span['original_start']},{span['original_end']})"
+            for span in offset_map.kept_spans
+        )
+        cmd = [
+            "ffmpeg", "-i", str(audio_path),
+            "-af", f"aselect='{selection}',asetpts=N/SR/TB",
+            "-c:a", "libmp3lame",
+            "-b:a", "128k",
+            "-y",
+            str(output_path)
+        ]
+
+        process = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
+        if process.returncode != 0:
+            raise RuntimeError(f"FFmpeg dead air removal failed: {process.stderr}")
+
+        offset_map.save(output_path.with_name(f"{output_path.stem}_offset_map.json"))
+        result["output_path"] = str(output_path)
+
+        logger.info(f"Removed {len(dead_air)} dead air spans: {offset_map.removed_seconds:.1f}s of "
+                    f"{pcm.duration:.1f}s ({offset_map.removed_seconds / max(pcm.duration, 1e-9) * 100:.1f}%)")
+        return result
+
+
+# Global dead air remover instance
+_dead_air_remover = None
+
+def get_dead_air_remover() -> DeadAirRemover:
+    """Get dead air remover singleton"""
+    global _dead_air_remover
+    if _dead_air_remover is None:
+        _dead_air_remover = DeadAirRemover()
+    return _dead_air_remover
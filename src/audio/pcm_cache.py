@@ -0,0 +1,238 @@
+"""
+Decoded PCM Cache for hearing audio
+Decodes each audio file once to 16 kHz mono int16 PCM and memory-maps it so
+preprocessing, trimming, voice matching and quality testing can slice the
+same buffer instead of spawning ffmpeg for every window or segment
+"""
+
+import hashlib
+import logging
+import os
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+PCM_SAMPLE_RATE = 16000
+PCM_DTYPE = np.int16
+PCM_SCALE = 32768.0
+
+
+class DecodedAudio:
+    """Read-only view over a memory-mapped 16 kHz mono int16 decode"""
+
+    def __init__(self, source_path: Path, pcm_path: Path, sample_rate: int = PCM_SAMPLE_RATE):
+        self.source_path = source_path
+        self.pcm_path = pcm_path
+        self.sample_rate = sample_rate
+
+        if pcm_path.stat().st_size == 0:
+            # np.memmap refuses zero-length files
+            self.samples = np.zeros(0, dtype=PCM_DTYPE)
+        else:
+            self.samples = np.memmap(pcm_path, dtype=PCM_DTYPE, mode='r')
+
+    @property
+    def num_samples(self) -> int:
+        return int(self.samples.shape[0])
+
+    @property
+    def duration(self) -> float:
+        """Duration of the decoded audio in seconds"""
+        return self.num_samples / self.sample_rate
+
+    def _index(self, seconds: float) -> int:
+        return int(min(max(seconds, 0.0) * self.sample_rate, self.num_samples))
+
+    def slice(self, start_time: float, end_time: Optional[float] = None) -> np.ndarray:
+        """
+        Zero-copy int16 view of the samples between two timestamps
+
+        Args:
+            start_time: Start time in seconds
+            end_time: End time in seconds (end of file if None)
+
+        Returns:
+            int16 view into the memory-mapped buffer
+        """
+        start = self._index(start_time)
+        end = self.num_samples if end_time is None else self._index(end_time)
+        return self.samples[start:max(start, end)]
+
+    def slice_float(self, start_time: float, end_time: Optional[float] = None) -> np.ndarray:
+        """Samples between two timestamps as float32 normalized to [-1, 1]"""
+        return to_float(self.slice(start_time, end_time))
+
+
+def to_float(samples: np.ndarray) -> np.ndarray:
+    """Convert int16 PCM samples to float32 in [-1, 1]"""
+    return samples.astype(np.float32) / PCM_SCALE
+
+
+class PCMCache:
+    """Hearing-level cache of decoded PCM files keyed by source path, size and mtime"""
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_cache_bytes: int = 8 * 1024 ** 3):
+        """
+        Initialize PCM cache
+
+        Args:
+            cache_dir: Directory for decoded .pcm files
+            max_cache_bytes: Total size above which least recently used decodes are evicted
+        """
+        self.cache_dir = cache_dir or Path(tempfile.gettempdir()) / "senate_pcm_cache"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_cache_bytes = max_cache_bytes
+        self.sample_rate = PCM_SAMPLE_RATE
+
+        self._open: Dict[str, DecodedAudio] = {}
+        self._lock = threading.Lock()
+        # One lock per decode so different files decode concurrently
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self.stats = {"hits": 0, "decodes": 0, "decode_failures": 0}
+
+    def _cache_key(self, audio_path: Path) -> str:
+        """Cache key that changes whenever the source file is rewritten"""
+        stat = audio_path.stat()
+        raw = f"{audio_path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}|{self.sample_rate}"
+        return hashlib.sha1(raw.encode()).hexdigest()
+
+    def get(self, audio_path: Path) -> DecodedAudio:
+        """
+        Get the decoded PCM for an audio file, decoding it on first use
+
+        Args:
+            audio_path: Path to source audio file (any format ffmpeg reads)
+
+        Returns:
+            DecodedAudio backed by a memory-mapped file
+        """
+        audio_path = Path(audio_path)
+        key = self._cache_key(audio_path)
+
+        with self._lock:
+            decoded = self._open.get(key)
+            if decoded is not None:
+                self.stats["hits"] += 1
+                return decoded
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            try:
+                with self._lock:
+                    # Another thread may have finished this decode while we waited
+                    decoded = self._open.get(key)
+                    if decoded is not None:
+                        self.stats["hits"] += 1
+                        return decoded
+
+                pcm_path = self.cache_dir / f"{key}.pcm"
+                if pcm_path.exists():
+                    with self._lock:
+                        self.stats["hits"] += 1
+                    os.utime(pcm_path)  # Mark as recently used for eviction
+                    decoded = DecodedAudio(audio_path, pcm_path, self.sample_rate)
+                else:
+                    # Decode outside the cache-wide lock
+                    self._decode(audio_path, pcm_path)
+                    decoded = DecodedAudio(audio_path, pcm_path, self.sample_rate)
+                    with self._lock:
+                        self._evict(keep=pcm_path)
+
+                with self._lock:
+                    self._open[key] = decoded
+                return decoded
+            finally:
+                # Dropped on failure too, so failed keys do not pile up
+                with self._lock:
+                    self._key_locks.pop(key, None)
+
+    def _decode(self, audio_path: Path, pcm_path: Path):
+        """Decode audio to raw PCM with a single ffmpeg run"""
+        logger.info(f"Decoding {audio_path} to PCM cache")
+        tmp_path = pcm_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+
+        cmd = [
+            "ffmpeg", "-y", "-v", "quiet",
+            "-i", str(audio_path),
+            "-ar", str(self.sample_rate),  # 16kHz sample rate
+            "-ac", "1",                    # Mono
+            "-f", "s16le",                 # 16-bit little-endian PCM
+            str(tmp_path)
+        ]
+
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            if result.returncode != 0 or not tmp_path.exists():
+                with self._lock:
+                    self.stats["decode_failures"] += 1
+                raise RuntimeError(f"FFmpeg PCM decode failed for {audio_path}: {result.stderr}")
+
+            # Atomic rename so concurrent readers never see a partial decode
+            tmp_path.replace(pcm_path)
+            with self._lock:
+                self.stats["decodes"] += 1
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    def _evict(self, keep: Path):
+        """Remove least recently used decodes until the cache fits its size cap"""
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob("*.pcm"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_cache_bytes:
+                break
+            if path == keep:
+                continue
+            # Drop any open view first; existing memmaps stay valid on POSIX
+            self._open.pop(path.stem, None)
+            try:
+                path.unlink()
+                total -= size
+            except FileNotFoundError:
+                continue
+
+    def invalidate(self, audio_path: Path):
+        """Drop the cached decode for an audio file"""
+        audio_path = Path(audio_path)
+        if not audio_path.exists():
+            return
+        key = self._cache_key(audio_path)
+        with self._lock:
+            self._open.pop(key, None)
+            pcm_path = self.cache_dir / f"{key}.pcm"
+            if pcm_path.exists():
+                pcm_path.unlink()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache hit/decode statistics"""
+        return {
+            **self.stats,
+            "open_buffers": len(self._open),
+            "cache_dir": str(self.cache_dir)
+        }
+
+# Global PCM cache instance
+_pcm_cache = None
+
+def get_pcm_cache() -> PCMCache:
+    """Get PCM cache singleton"""
+    global _pcm_cache
+    if _pcm_cache is None:
+        _pcm_cache = PCMCache()
+    return _pcm_cache
@@ -12,6 +12,8 @@ import json
 import wave
 import numpy as np
 
+from .pcm_cache import DecodedAudio, get_pcm_cache
+
 logger = logging.getLogger(__name__)
 
 class AudioTrimmer:
@@ -49,25 +51,10 @@ class AudioTrimmer:
             
             logger.info(f"Analyzing silence in audio file: {audio_path}")
             
-            # Use FFmpeg to detect silence
-            cmd = [
-                "ffmpeg", "-y",
-                "-i", str(audio_path),
-                "-af", f"silencedetect=noise={params['silence_threshold']}:d={params['min_silence_duration']}",
-                "-f", "null",
-                "-"
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-            
-            if result.returncode != 0:
-                raise RuntimeError(f"FFmpeg silence detection failed: {result.stderr}")
-            
-            # Parse silence detection output
-            silence_info = self._parse_silence_output(result.stderr)
-            
-            # Get audio duration
-            duration = self._get_audio_duration(audio_path)
+            # Detect silence on the shared decoded PCM instead of another full FFmpeg decode
+            pcm = get_pcm_cache().get(audio_path)
+            silence_info = self._detect_silence_pcm(pcm, params)
+            duration = pcm.duration
             
             analysis_result = {
                 "audio_path": str(audio_path),
@@ -238,6 +225,74 @@ class AudioTrimmer:
             logger.error(f"Smart trim failed for {audio_path}: {e}")
             raise
     
+    def _detect_silence_pcm(self, pcm: DecodedAudio, params: Dict[str, Any],
+                            frame_duration: float = 0.01) -> Dict[str, Any]:
+        """
+        Detect silence runs on decoded PCM, mirroring FFmpeg silencedetect
+        
+        A frame is silent when its peak amplitude is below the noise threshold;
+        runs of silent frames at least min_silence_duration long are reported
+        in the same format as _parse_silence_output.
+        """
+        threshold = self._parse_noise_threshold(params["silence_threshold"]) * 32768.0
+        min_duration = float(params["min_silence_duration"])
+        
+        frame_size = max(1, int(pcm.sample_rate * frame_duration))
+        frame_peaks = self._frame_peaks(pcm.samples, frame_size)
+        silent = frame_peaks < threshold
+        
+        # Locate run boundaries of silent frames
+        padded = np.concatenate(([False], silent, [False]))
+        changes = np.flatnonzero(padded[1:] != padded[:-1])
+        run_starts, run_ends = changes[0::2], changes[1::2]
+        
+        silence_segments = []
+        total_silence = 0.0
+        
+        for start_frame, end_frame in zip(run_starts, run_ends):
+            start_time = float(start_frame * frame_size / pcm.sample_rate)
+            end_time = float(min(end_frame * frame_size / pcm.sample_rate, pcm.duration))
+            duration = end_time - start_time
+            
+            if duration >= min_duration:
+                silence_segments.append({
+                    "start": round(start_time, 3),
+                    "end": round(end_time, 3),
+                    "duration": round(duration, 3)
+                })
+                total_silence += duration
+        
+        return {
+            "silence_segments": silence_segments,
+            "total_silence": total_silence
+        }
+    
+    @staticmethod
+    def _frame_peaks(samples: np.ndarray, frame_size: int, block_frames: int = 6000) -> np.ndarray:
+        """Peak absolute amplitude per frame, processed in blocks to bound memory"""
+        n_frames = -(-len(samples) // frame_size)
+        peaks = np.zeros(n_frames, dtype=np.int32)
+        block_size = frame_size * block_frames
+        
+        for block_start in range(0, len(samples), block_size):
+            block = np.asarray(samples[block_start:block_start + block_size], dtype=np.int32)
+            pad = (-len(block)) % frame_size
+            if pad:
+                block = np.pad(block, (0, pad))
+            first_frame = block_start // frame_size
+            block_peaks = np.abs(block).reshape(-1, frame_size).max(axis=1)
+            peaks[first_frame:first_frame + len(block_peaks)] = block_peaks
+        
+        return peaks
+    
+    @staticmethod
+    def _parse_noise_threshold(value: Any) -> float:
+        """Convert an FFmpeg noise threshold ("-30dB" or amplitude ratio) to linear amplitude"""
+        text = str(value).strip()
+        if text.lower().endswith("db"):
+            return float(10 ** (float(text[:-2]) / 20))
+        return float(text)
+    
     def _parse_silence_output(self, ffmpeg_output: str) -> Dict[str, Any]:
         """Parse FFmpeg silence detection output"""
         silence_segments = []
@@ -15,6 +15,12 @@ import subprocess
 import json
 from datetime import datetime
 
+try:
+    from .audio.pcm_cache import DecodedAudio, get_pcm_cache, to_float
+except ImportError:
+    # Running as a script from src/
+    from audio.pcm_cache import DecodedAudio, get_pcm_cache, to_float
+
 
 class AudioPreprocessor:
     """
@@ -27,7 +33,8 @@ class AudioPreprocessor:
     def __init__(self, 
                  min_speech_duration: float = 60.0,
                  speech_threshold: float = 0.02,
-                 segment_duration: float = 30.0):
+                 segment_duration: float = 30.0,
+                 energy_frame_duration: float = 0.1):
         """
         Initialize audio preprocessor.
         
@@ -35,10 +42,12 @@ class AudioPreprocessor:
             min_speech_duration: Minimum sustained speech to consider hearing start (seconds)
             speech_threshold: RMS threshold for speech detection
             segment_duration: Duration of analysis segments (seconds)
+            energy_frame_duration: Short frame length for energy variance (seconds)
         """
         self.min_speech_duration = min_speech_duration
         self.speech_threshold = speech_threshold
         self.segment_duration = segment_duration
+        self.energy_frame_duration = energy_frame_duration
         self.logger = logging.getLogger(__name__)
         
     def analyze_speech_activity(self, audio_file: Path) -> Dict:
@@ -53,30 +62,18 @@ class AudioPreprocessor:
         """
         self.logger.info(f"🔍 Analyzing speech activity: {audio_file.name}")
         
-        # Get audio metadata first
-        metadata = self._get_audio_metadata(audio_file)
-        if not metadata:
-            return {"error": "Could not read audio metadata"}
+        # Decode once; every analysis window slices the shared buffer
+        try:
+            pcm = get_pcm_cache().get(audio_file)
+        except Exception as e:
+            self.logger.error(f"Error decoding audio: {e}")
+            return {"error": "Could not decode audio"}
             
-        duration = float(metadata.get('duration', 0))
+        duration = pcm.duration
         self.logger.info(f"   Audio duration: {duration/60:.1f} minutes")
         
-        # Analyze audio in segments
-        segments = []
-        current_time = 0.0
-        
-        while current_time < duration:
-            segment_end = min(current_time + self.segment_duration, duration)
-            
-            # Extract segment for analysis
-            segment_info = self._analyze_segment(
-                audio_file, current_time, segment_end
-            )
-            
-            if segment_info:
-                segments.append(segment_info)
-                
-            current_time += self.segment_duration
+        # Features for every window in one pass over the decoded buffer
+        segments = self._analyze_windows(pcm)
             
         self.logger.info(f"   Analyzed {len(segments)} segments")
         
@@ -112,64 +109,90 @@ class AudioPreprocessor:
             self.logger.error(f"Error getting audio metadata: {e}")
             return None
     
-    def _analyze_segment(self, audio_file: Path, start_time: float, end_time: float) -> Optional[Dict]:
+    def _analyze_windows(self, pcm: DecodedAudio, block_windows: int = 16) -> List[Dict]:
         """
-        Analyze a single audio segment for speech activity.
+        Analyze every segment_duration window of the decoded audio.
+        
+        Windows are reshaped into a 2-D array and reduced along rows, a block of
+        windows at a time so a multi-hour hearing never needs a full float copy.
         
         Args:
-            audio_file: Path to audio file
-            start_time: Segment start time in seconds
-            end_time: Segment end time in seconds
+            pcm: Decoded 16kHz mono PCM for the whole file
+            block_windows: Windows converted to float per block
             
         Returns:
-            Segment analysis dictionary
+            List of segment analysis dictionaries, one per window
         """
-        try:
-            # Extract segment to temporary WAV for analysis
-            segment_duration = end_time - start_time
-            
-            # Use ffmpeg to extract segment and convert to raw audio data
-            cmd = [
-                'ffmpeg', '-y', '-v', 'quiet',
-                '-i', str(audio_file),
-                '-ss', str(start_time),
-                '-t', str(segment_duration),
-                '-ar', '16000',  # 16kHz sample rate
-                '-ac', '1',      # Mono
-                '-f', 's16le',   # 16-bit little-endian PCM
-                '-'              # Output to stdout
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True)
-            
-            if result.returncode != 0:
-                return None
-                
-            # Convert bytes to numpy array
-            audio_data = np.frombuffer(result.stdout, dtype=np.int16)
-            
-            if len(audio_data) == 0:
-                return None
+        window_size = max(1, int(round(self.segment_duration * pcm.sample_rate)))
+        frame_size = max(1, int(self.energy_frame_duration * pcm.sample_rate))
+        n_samples = pcm.num_samples
+        
+        rms, zcr, energy_variance = [], [], []
+        full_windows = n_samples // window_size
+        
+        for first in range(0, full_windows, block_windows):
+            count = min(block_windows, full_windows - first)
+            block = pcm.samples[first * window_size:(first + count) * window_size]
+            features = self._window_features(block.reshape(count, window_size), frame_size)
+            for values, out in zip(features, (rms, zcr, energy_variance)):
+                out.extend(values.tolist())
                 
-            # Calculate RMS (Root Mean Square) for speech activity
-            audio_float = audio_data.astype(np.float32) / 32768.0  # Normalize to [-1, 1]
-            rms = np.sqrt(np.mean(audio_float ** 2))
-            
-            # Simple speech detection based on RMS threshold
-            has_speech = rms > self.speech_threshold
-            
-            return {
+        # Trailing partial window
+        tail = pcm.samples[full_windows * window_size:]
+        if len(tail):
+            features = self._window_features(tail.reshape(1, -1), frame_size)
+            for values, out in zip(features, (rms, zcr, energy_variance)):
+                out.extend(values.tolist())
+        
+        segments = []
+        for i, (window_rms, window_zcr, window_variance) in enumerate(zip(rms, zcr, energy_variance)):
+            start_time = i * self.segment_duration
+            end_time = min(start_time + self.segment_duration, pcm.duration)
+            segments.append({
                 "start_time": float(start_time),
                 "end_time": float(end_time),
-                "duration": float(segment_duration),
-                "rms": float(rms),
-                "has_speech": bool(has_speech),
-                "speech_confidence": float(min(rms / self.speech_threshold, 2.0))  # Cap at 2.0
-            }
+                "duration": float(end_time - start_time),
+                "rms": float(window_rms),
+                "zero_crossing_rate": float(window_zcr),
+                "energy_variance": float(window_variance),
+                "has_speech": bool(window_rms > self.speech_threshold),
+                "speech_confidence": float(min(window_rms / self.speech_threshold, 2.0))  # Cap at 2.0
+            })
             
-        except Exception as e:
-            self.logger.error(f"Error analyzing segment {start_time}-{end_time}: {e}")
-            return None
+        return segments
+    
+    @staticmethod
+    def _window_features(windows: np.ndarray, frame_size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Per-row RMS, zero-crossing rate and short-frame energy variance.
+        
+        Args:
+            windows: int16 array of shape (n_windows, window_size)
+            frame_size: Samples per short frame for the energy variance
+            
+        Returns:
+            (rms, zero_crossing_rate, energy_variance) arrays of length n_windows
+        """
+        audio_float = to_float(windows)  # Normalize to [-1, 1]
+        
+        # Calculate RMS (Root Mean Square) for speech activity
+        rms = np.sqrt(np.mean(audio_float ** 2, axis=1))
+        
+        # Fraction of adjacent samples that change sign
+        signs = np.signbit(windows)
+        crossings = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1)
+        zcr = crossings / max(windows.shape[1] - 1, 1)
+        
+        # Speech alternates syllables and gaps, so its short-frame energy varies
+        # far more than steady noise or music at the same RMS
+        n_frames = windows.shape[1] // frame_size
+        if n_frames:
+            frames = audio_float[:, :n_frames * frame_size].reshape(windows.shape[0], n_frames, frame_size)
+            energy_variance = np.var(np.mean(frames ** 2, axis=2), axis=1)
+        else:
+            energy_variance = np.zeros(windows.shape[0], dtype=np.float32)
+        
+        return rms, zcr, energy_variance
     
     def _find_content_start(self, segments: List[Dict]) -> Optional[float]:
         """
@@ -64,7 +64,8 @@ class AudioQualityTester:
             # Basic file info
             basic_info = self._get_basic_audio_info(file_path)
             
-            # Load audio for analysis
+            # Load audio at its native rate; spectral and quality metrics
+            # depend on it, so the shared 16kHz PCM cache is not used here
             audio_data, sample_rate = librosa.load(str(file_path), sr=None, mono=False)
             
             # Ensure mono for analysis (average channels if stereo)
@@ -180,6 +180,20 @@ class CorrectionStore:
             logger.error(f"Error checking corrections: {e}")
             return False
     
+    def corrected_transcripts(self) -> List[str]:
+        """Transcript files with any active corrections."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                rows = conn.execute(
+                    "SELECT DISTINCT transcript_file FROM corrections WHERE is_active = 1"
+                ).fetchall()
+                
+                return [row[0] for row in rows]
+                
+        except Exception as e:
+            logger.error(f"Error listing corrected transcripts: {e}")
+            return []
+    
     def get_correction_stats(self, transcript_file: str) -> Dict[str, Any]:
         """Get correction statistics for a transcript."""
         try:
@@ -9,19 +9,33 @@ FastAPI backend to support transcript review interface:
 - Export correction data
 """
 
+import os
 import json
+import sqlite3
+import asyncio
 import logging
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
-from fastapi import FastAPI, HTTPException, UploadFile, File
+from fastapi import FastAPI, HTTPException, UploadFile, File, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from .correction_store import CorrectionStore
 from .review_utils import ReviewUtils
 
+try:
+    from ..api.async_database import run_in_db_executor
+    from ..api.transcript_catalog import TranscriptCatalog, catalog_key, set_has_corrections
+    from ..api.transcript_segments import MAX_PAGE_SEGMENTS, SegmentIndex, get_segment_index_cache, pagination
+except ImportError:
+    from api.async_database import run_in_db_executor
+    from api.transcript_catalog import TranscriptCatalog, catalog_key, set_has_corrections
+    from api.transcript_segments import MAX_PAGE_SEGMENTS, SegmentIndex, get_segment_index_cache, pagination
+
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +76,11 @@ class ReviewAPI:
         self.data_dir = data_dir or Path("output")
         self.correction_store = CorrectionStore()
         self.review_utils = ReviewUtils()
+        # Transcript metadata is cataloged alongside the corrections
+        self.catalog = TranscriptCatalog(self.data_dir, pattern="*transcript*.json", recursive=True)
+        # Needs-review totals for paged transcripts, per file version
+        self._needs_review_counts: Dict[str, tuple] = {}
+        self._needs_review_lock = threading.Lock()
         
         # Setup CORS for React frontend
         self.app.add_middleware(
@@ -86,50 +105,83 @@ class ReviewAPI:
         async def list_transcripts():
             """List available transcripts for review."""
             try:
-                transcripts = []
-                for file_path in self.data_dir.glob("**/*transcript*.json"):
-                    try:
-                        with open(file_path, 'r') as f:
-                            data = json.load(f)
-                        
-                        # Extract metadata
-                        transcript_info = {
-                            "file_path": str(file_path),
-                            "filename": file_path.name,
-                            "hearing_id": data.get("hearing_id", "unknown"),
-                            "audio_file": data.get("audio_file", "unknown"),
-                            "pipeline_version": data.get("pipeline_version", "unknown"),
-                            "created": file_path.stat().st_mtime,
-                            "segments_count": len(data.get("transcription", {}).get("segments", [])),
-                            "has_corrections": self.correction_store.has_corrections(str(file_path))
-                        }
-                        transcripts.append(transcript_info)
-                    except Exception as e:
-                        logger.warning(f"Could not process {file_path}: {e}")
-                        continue
+                # Reconciling stats the transcript tree; keep it off the event loop
+                rows = await run_in_db_executor(self._list_catalog_rows)
+                
+                root = catalog_key(self.data_dir)
+                transcripts = [
+                    {
+                        "file_path": str(self.data_dir / os.path.relpath(row["path"], root)),
+                        "filename": row["filename"],
+                        "hearing_id": row["hearing_id"] if row["hearing_id"] is not None else "unknown",
+                        "audio_file": row["audio_file"] or "unknown",
+                        "pipeline_version": row["pipeline_version"] or "unknown",
+                        "created": row["mtime"],
+                        "segments_count": row["segment_count"],
+                        "has_corrections": bool(row["has_corrections"])
+                    }
+                    for row in rows
+                ]
                 
-                return {"transcripts": sorted(transcripts, key=lambda x: x["created"], reverse=True)}
+                # Catalog rows are already newest first
+                return {"transcripts": transcripts}
             
             except Exception as e:
                 logger.error(f"Error listing transcripts: {e}")
                 raise HTTPException(status_code=500, detail=str(e))
         
         @self.app.get("/transcripts/{transcript_id}")
-        async def get_transcript(transcript_id: str):
-            """Get transcript data for review."""
+        async def get_transcript(
+            transcript_id: str,
+            start: Optional[int] = Query(None, ge=0),
+            limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SEGMENTS),
+            start_time: Optional[float] = Query(None, ge=0),
+            end_time: Optional[float] = Query(None, ge=0),
+            format: str = Query("json", pattern="^(json|ndjson)$")
+        ):
+            """
+            Get transcript data for review.
+            
+            start/limit or start_time/end_time return one page of segments,
+            read through the transcript's segment index, with a 'pagination'
+            entry; format=ndjson streams the range one segment per line.
+            """
             try:
                 # Find transcript file
                 transcript_file = self._find_transcript_file(transcript_id)
                 if not transcript_file:
                     raise HTTPException(status_code=404, detail="Transcript not found")
                 
+                # Add existing corrections
+                corrections = self.correction_store.get_corrections(str(transcript_file))
+                
+                paged = format == "ndjson" or any(
+                    value is not None for value in (start, limit, start_time, end_time))
+                if paged:
+                    index = await asyncio.to_thread(get_segment_index_cache().get, transcript_file)
+                    page = await asyncio.to_thread(
+                        self._review_page, index, corrections, start or 0, limit, start_time, end_time
+                    )
+                    if format == "ndjson":
+                        return StreamingResponse(
+                            self._stream_review_page(page, transcript_file, corrections),
+                            media_type="application/x-ndjson"
+                        )
+                    
+                    transcript = index.with_segments(page["segments"])
+                    transcript["review_metadata"] = page["review_metadata"]
+                    transcript["pagination"] = page["pagination"]
+                    return {
+                        "transcript": transcript,
+                        "file_path": str(transcript_file),
+                        "corrections_count": len(corrections),
+                        "review_ready": True
+                    }
+                
                 # Load transcript data
                 with open(transcript_file, 'r') as f:
                     transcript_data = json.load(f)
                 
-                # Add existing corrections
-                corrections = self.correction_store.get_corrections(str(transcript_file))
-                
                 # Enhance transcript with review metadata
                 enhanced_transcript = self.review_utils.prepare_for_review(
                     transcript_data, corrections
@@ -142,6 +194,8 @@ class ReviewAPI:
                     "review_ready": True
                 }
                 
+            except HTTPException:
+                raise
             except Exception as e:
                 logger.error(f"Error loading transcript {transcript_id}: {e}")
                 raise HTTPException(status_code=500, detail=str(e))
@@ -162,6 +216,7 @@ class ReviewAPI:
                     confidence=assignment.confidence,
                     reviewer_id=assignment.reviewer_id
                 )
+                await run_in_db_executor(self._mark_corrected, transcript_file)
                 
                 return {
                     "correction_id": correction_id,
@@ -192,6 +247,7 @@ class ReviewAPI:
                         reviewer_id=assignment.reviewer_id
                     )
                     correction_ids.append(correction_id)
+                await run_in_db_executor(self._mark_corrected, transcript_file)
                 
                 return {
                     "correction_ids": correction_ids,
@@ -246,6 +302,8 @@ class ReviewAPI:
                 export_path = transcript_file.parent / f"{transcript_file.stem}_corrected.json"
                 with open(export_path, 'w') as f:
                     json.dump(corrected_transcript, f, indent=2, default=str)
+                with self._catalog_connection() as conn:
+                    self.catalog.record(conn, export_path)
                 
                 return {
                     "export_path": str(export_path),
@@ -257,6 +315,82 @@ class ReviewAPI:
                 logger.error(f"Error exporting transcript: {e}")
                 raise HTTPException(status_code=500, detail=str(e))
     
+    def _catalog_connection(self) -> sqlite3.Connection:
+        """Connection to the corrections database, which holds the transcript catalog"""
+        return sqlite3.connect(self.correction_store.db_path)
+    
+    def _list_catalog_rows(self) -> List[Dict[str, Any]]:
+        """Reconcile the catalog with the transcript tree and list it, newest first"""
+        with self._catalog_connection() as conn:
+            self.catalog.reconcile(conn, corrected_paths=self.correction_store.corrected_transcripts)
+            return self.catalog.list_transcripts(conn)
+    
+    def _mark_corrected(self, transcript_file: Path):
+        """Flag a transcript as corrected in the catalog without waiting for a rescan"""
+        with self._catalog_connection() as conn:
+            set_has_corrections(conn, [transcript_file])
+    
+    def _review_page(
+        self,
+        index: SegmentIndex,
+        corrections: List[Dict[str, Any]],
+        start: int,
+        limit: Optional[int],
+        start_time: Optional[float],
+        end_time: Optional[float]
+    ) -> Dict[str, Any]:
+        """One page of segments with review metadata, reading only that range."""
+        first, stop, window_stop = index.resolve(start, limit, start_time, end_time)
+        corrections_by_segment = {correction["segment_id"]: correction for correction in corrections}
+        segments = self.review_utils.prepare_segments_for_review(
+            index.envelope, index.read_segments(first, stop), first, corrections_by_segment
+        )
+        
+        return {
+            "envelope": index.envelope,
+            "segments_path": index.segments_path,
+            "segments": segments,
+            "review_metadata": self.review_utils.review_summary(
+                len(index), self._needs_review_count(index), corrections
+            ),
+            "pagination": pagination(index, first, stop, window_stop)
+        }
+    
+    def _needs_review_count(self, index: SegmentIndex) -> int:
+        """Segments needing review in the whole transcript, counted once per file version."""
+        key = (index.size, index.mtime_ns)
+        with self._needs_review_lock:
+            cached = self._needs_review_counts.get(index.path)
+        if cached and cached[0] == key:
+            return cached[1]
+        
+        count = self.review_utils.count_needs_review(
+            json.loads(raw) for raw in index.read_raw(0, len(index))
+        )
+        with self._needs_review_lock:
+            self._needs_review_counts[index.path] = (key, count)
+        return count
+    
+    def _stream_review_page(
+        self,
+        page: Dict[str, Any],
+        transcript_file: Path,
+        corrections: List[Dict[str, Any]]
+    ):
+        """NDJSON lines for a review page: a header, then one line per segment."""
+        header = {
+            "type": "header",
+            "transcript": page["envelope"],
+            "segments_path": page["segments_path"],
+            "review_metadata": page["review_metadata"],
+            "pagination": page["pagination"],
+            "file_path": str(transcript_file),
+            "corrections_count": len(corrections)
+        }
+        yield json.dumps(header, default=str).encode() + b"\n"
+        for segment in page["segments"]:
+            yield json.dumps(segment, default=str).encode() + b"\n"
+    
     def _find_transcript_file(self, transcript_id: str) -> Optional[Path]:
         """Find transcript file by ID or filename."""
         # Try direct filename match
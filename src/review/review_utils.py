@@ -39,27 +39,10 @@ class ReviewUtils:
                     corrections_by_segment[segment_id] = correction
             
             # Enhance segments with review metadata
-            enhanced_segments = []
             segments = transcript_data.get("transcription", {}).get("segments", [])
-            
-            for i, segment in enumerate(segments):
-                enhanced_segment = segment.copy()
-                segment_id = segment.get("id", i)
-                
-                # Add review metadata
-                enhanced_segment.update({
-                    "review_metadata": {
-                        "segment_index": i,
-                        "needs_review": self._segment_needs_review(segment),
-                        "has_correction": segment_id in corrections_by_segment,
-                        "correction": corrections_by_segment.get(segment_id),
-                        "speaker_options": self._get_speaker_options(transcript_data),
-                        "confidence_level": self._assess_confidence(segment),
-                        "duration_seconds": segment.get("end", 0) - segment.get("start", 0)
-                    }
-                })
-                
-                enhanced_segments.append(enhanced_segment)
+            enhanced_segments = self.prepare_segments_for_review(
+                transcript_data, segments, 0, corrections_by_segment
+            )
             
             # Calculate overall review statistics
             review_stats = self._calculate_review_stats(enhanced_segments, existing_corrections)
@@ -82,6 +65,59 @@ class ReviewUtils:
             logger.error(f"Error preparing transcript for review: {e}")
             raise
     
+    def prepare_segments_for_review(
+        self,
+        transcript_data: Dict[str, Any],
+        segments: List[Dict[str, Any]],
+        first_index: int,
+        corrections_by_segment: Dict[Any, Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Add review metadata to a run of segments starting at first_index."""
+        speaker_options = self._get_speaker_options(transcript_data)
+        enhanced_segments = []
+        
+        for i, segment in enumerate(segments, start=first_index):
+            enhanced_segment = segment.copy()
+            segment_id = segment.get("id", i)
+            
+            # Add review metadata
+            enhanced_segment.update({
+                "review_metadata": {
+                    "segment_index": i,
+                    "needs_review": self._segment_needs_review(segment),
+                    "has_correction": segment_id in corrections_by_segment,
+                    "correction": corrections_by_segment.get(segment_id),
+                    "speaker_options": speaker_options,
+                    "confidence_level": self._assess_confidence(segment),
+                    "duration_seconds": segment.get("end", 0) - segment.get("start", 0)
+                }
+            })
+            
+            enhanced_segments.append(enhanced_segment)
+        
+        return enhanced_segments
+    
+    def count_needs_review(self, segments) -> int:
+        """Number of segments needing review, from any iterable of segments."""
+        return sum(1 for segment in segments if self._segment_needs_review(segment))
+    
+    def review_summary(
+        self,
+        total_segments: int,
+        needs_review: int,
+        corrections: List[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Transcript-level review metadata from segment counts and corrections."""
+        review_stats = self._summarize_review(needs_review, corrections)
+        return {
+            "total_segments": total_segments,
+            "needs_review_count": review_stats["needs_review"],
+            "corrected_count": review_stats["corrected"],
+            "completion_percentage": review_stats["completion_percentage"],
+            "estimated_review_time": review_stats["estimated_time"],
+            "speaker_summary": review_stats["speaker_summary"]
+        }
+    
     def apply_corrections(
         self, 
         transcript_data: Dict[str, Any], 
@@ -207,8 +243,15 @@ class ReviewUtils:
         corrections: List[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Calculate review progress statistics."""
-        total_segments = len(segments)
         needs_review = sum(1 for s in segments if s["review_metadata"]["needs_review"])
+        return self._summarize_review(needs_review, corrections)
+    
+    def _summarize_review(
+        self,
+        needs_review: int,
+        corrections: List[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Review progress from the number of segments needing review."""
         corrected = len(corrections) if corrections else 0
         
         completion_percentage = 0
@@ -0,0 +1 @@
+"""Shared SQLite storage helpers used by both the sync and API layers."""
@@ -0,0 +1,251 @@
+"""
+SQLite connection pooling for the API, sync and background services
+Hands out per-thread and per-request connections tuned for concurrent
+access: WAL journaling lets dashboard reads proceed while the sync
+orchestrator writes, and a shared busy timeout absorbs brief lock waits
+"""
+
+import queue
+import sqlite3
+import threading
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, Optional, Callable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUSY_TIMEOUT_MS = 5000
+DEFAULT_MMAP_SIZE = 256 * 1024 * 1024
+DEFAULT_CACHE_SIZE_KB = 16 * 1024
+DEFAULT_CACHED_STATEMENTS = 256
+
+_UNSET = object()
+
+
+class PooledConnection:
+    """
+    Wrapper around a pooled sqlite3 connection.
+
+    Behaves like the connection it wraps, except close() hands it back to the
+    pool instead of closing it, so code written against plain connections
+    gains pooling without changes.
+    """
+
+    def __init__(self, pool: "SQLiteConnectionPool", connection: sqlite3.Connection):
+        object.__setattr__(self, "_pool", pool)
+        object.__setattr__(self, "_connection", connection)
+
+    def __getattr__(self, name):
+        connection = object.__getattribute__(self, "_connection")
+        if connection is None:
+            raise sqlite3.ProgrammingError("Cannot operate on a connection returned to the pool")
+        return getattr(connection, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._connection, name, value)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Same transaction semantics as sqlite3.Connection's context manager
+        if exc_type is None:
+            self._connection.commit()
+        else:
+            self._connection.rollback()
+        return False
+
+    def close(self):
+        """Return the connection to the pool"""
+        connection = object.__getattribute__(self, "_connection")
+        if connection is not None:
+            object.__setattr__(self, "_connection", None)
+            self._pool._release(connection)
+
+    def __del__(self):
+        # Connections dropped without close() still go back to the pool
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class SQLiteConnectionPool:
+    """Pool of tuned SQLite connections for one database file"""
+
+    def __init__(self,
+                 db_path: str,
+                 max_idle: int = 8,
+                 busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS,
+                 mmap_size: int = DEFAULT_MMAP_SIZE,
+                 cache_size_kb: int = DEFAULT_CACHE_SIZE_KB,
+                 cached_statements: int = DEFAULT_CACHED_STATEMENTS):
+        """
+        Initialize connection pool.
+
+        Args:
+            db_path: SQLite database file
+            max_idle: Idle connections kept for reuse; extras are closed on release
+            busy_timeout_ms: How long a connection waits on a locked database
+            mmap_size: Bytes of the database file read through memory mapping
+            cache_size_kb: Page cache per connection (KiB)
+            cached_statements: Prepared statements cached per connection
+        """
+        self.db_path = str(db_path)
+        self.max_idle = max_idle
+        self.busy_timeout_ms = busy_timeout_ms
+        self.mmap_size = mmap_size
+        self.cache_size_kb = cache_size_kb
+        self.cached_statements = cached_statements
+
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._local = threading.local()
+        self._thread_connections: Dict[int, sqlite3.Connection] = {}
+        self._lock = threading.Lock()
+        self._stats = {"created": 0, "reused": 0, "in_use": 0}
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with the pool's pragmas applied"""
+        connection = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout_ms / 1000,
+            check_same_thread=False,
+            cached_statements=self.cached_statements
+        )
+        connection.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}")
+        try:
+            # Persistent per database file; readers no longer block on writers
+            connection.execute("PRAGMA journal_mode = WAL")
+        except sqlite3.OperationalError as e:
+            logger.warning(f"WAL journaling unavailable for {self.db_path}: {e}")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        connection.execute(f"PRAGMA cache_size = -{int(self.cache_size_kb)}")
+        connection.execute("PRAGMA temp_store = MEMORY")
+
+        with self._lock:
+            self._stats["created"] += 1
+        return connection
+
+    def acquire(self, row_factory: Optional[Callable] = None) -> PooledConnection:
+        """
+        Check out a connection for one request or unit of work.
+
+        Args:
+            row_factory: Row factory for this checkout (default plain tuples)
+
+        Returns:
+            Pooled connection; close() returns it to the pool
+        """
+        try:
+            connection = self._idle.get_nowait()
+            with self._lock:
+                self._stats["reused"] += 1
+        except queue.Empty:
+            connection = self._connect()
+
+        connection.row_factory = row_factory
+        with self._lock:
+            self._stats["in_use"] += 1
+        return PooledConnection(self, connection)
+
+    @contextmanager
+    def connection(self, row_factory: Optional[Callable] = None):
+        """Connection checked out for the duration of a with block"""
+        pooled = self.acquire(row_factory)
+        try:
+            yield pooled
+        finally:
+            pooled.close()
+
+    def _release(self, connection: sqlite3.Connection):
+        with self._lock:
+            self._stats["in_use"] -= 1
+
+        try:
+            # Never hand the next borrower an open transaction
+            if connection.in_transaction:
+                connection.rollback()
+        except sqlite3.Error:
+            connection.close()
+            return
+
+        if self._idle.qsize() < self.max_idle:
+            self._idle.put(connection)
+        else:
+            connection.close()
+
+    def thread_connection(self, row_factory: Optional[Callable] = _UNSET) -> sqlite3.Connection:
+        """
+        Connection owned by the calling thread.
+
+        Long-lived database objects use this so each worker thread, and the
+        event loop thread, keeps its own connection instead of sharing one.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._connect()
+            self._local.connection = connection
+            with self._lock:
+                self._thread_connections[threading.get_ident()] = connection
+        if row_factory is not _UNSET:
+            connection.row_factory = row_factory
+        return connection
+
+    def close_thread_connection(self):
+        """Close the calling thread's connection, if it has one"""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            self._local.connection = None
+            with self._lock:
+                self._thread_connections.pop(threading.get_ident(), None)
+            connection.close()
+
+    def close_all(self):
+        """Close idle and per-thread connections (checked-out ones close on release)"""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+        with self._lock:
+            thread_connections = list(self._thread_connections.values())
+            self._thread_connections.clear()
+        for connection in thread_connections:
+            try:
+                connection.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "db_path": self.db_path,
+                "idle": self._idle.qsize(),
+                "thread_connections": len(self._thread_connections),
+                **self._stats
+            }
+
+
+# Connection pools per database file
+_pools: Dict[str, SQLiteConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+def get_connection_pool(db_path: str) -> SQLiteConnectionPool:
+    """Get the connection pool for a database"""
+    key = str(Path(db_path).resolve())
+    with _pools_lock:
+        if key not in _pools:
+            Path(key).parent.mkdir(parents=True, exist_ok=True)
+            _pools[key] = SQLiteConnectionPool(key)
+        return _pools[key]
+
+def close_all_pools():
+    """Close every pool's connections, e.g. on application shutdown"""
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close_all()
@@ -0,0 +1,119 @@
+"""
+Derived media columns for hearings_unified
+Typed copies of the facts list views show and filter on (stream
+availability, stream types, primary stream URL, witness count), computed
+from the streams and witnesses JSON by triggers whenever a hearing is
+written, so list endpoints never parse JSON per row. Full JSON is parsed
+only where a single hearing is returned.
+"""
+
+import sqlite3
+import logging
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+MEDIA_COLUMNS = [
+    "has_audio_stream INTEGER NOT NULL DEFAULT 0",
+    "primary_stream_type TEXT",
+    "primary_stream_url TEXT",
+    "stream_types TEXT",  # Comma-separated stream keys
+    "witness_count INTEGER NOT NULL DEFAULT 0"
+]
+
+MEDIA_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_hearings_has_audio_stream "
+    "ON hearings_unified(has_audio_stream, hearing_date DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_hearings_committee_audio "
+    "ON hearings_unified(committee_code, has_audio_stream)",
+    "CREATE INDEX IF NOT EXISTS idx_hearings_primary_stream_type "
+    "ON hearings_unified(primary_stream_type)"
+]
+
+
+def _json(column: str, empty: str) -> str:
+    """Column value when it is valid JSON, else an empty document"""
+    return f"CASE WHEN json_valid({column}) THEN {column} ELSE '{empty}' END"
+
+
+def _streams(ref: str) -> str:
+    """Stream entries with a usable value, in document order"""
+    return (f"json_each({_json(f'{ref}.streams', '{}')}) "
+            f"WHERE json_each.value IS NOT NULL AND json_each.value NOT IN ('', '{{}}', '[]')")
+
+
+def _stream_url(value: str = "json_each.value") -> str:
+    # Entries are URL strings, or objects carrying a url
+    return (f"CASE WHEN json_each.type = 'text' THEN {value} "
+            f"WHEN json_each.type = 'object' THEN json_extract({value}, '$.url') END")
+
+
+def media_values(ref: str) -> dict:
+    """SQL expressions for each derived column from a hearings_unified row"""
+    witnesses = _json(f"{ref}.witnesses", "[]")
+    return {
+        "has_audio_stream": f"EXISTS (SELECT 1 FROM {_streams(ref)})",
+        "primary_stream_type": f"(SELECT CASE WHEN json_each.fullkey LIKE '$.%' THEN json_each.key END "
+                               f"FROM {_streams(ref)} ORDER BY json_each.id LIMIT 1)",
+        "primary_stream_url": f"(SELECT {_stream_url()} FROM {_streams(ref)} ORDER BY json_each.id LIMIT 1)",
+        "stream_types": f"(SELECT group_concat(json_each.key, ',') FROM {_streams(ref)} "
+                        f"AND json_each.fullkey LIKE '$.%')",
+        "witness_count": f"CASE json_type({witnesses}) "
+                         f"WHEN 'array' THEN json_array_length({witnesses}) "
+                         f"WHEN 'object' THEN (SELECT COUNT(*) FROM json_each({witnesses})) ELSE 0 END"
+    }
+
+
+def _update_sql(ref: str, where: str) -> str:
+    assignments = ",\n            ".join(f"{column} = {sql}" for column, sql in media_values(ref).items())
+    return f"UPDATE hearings_unified SET\n            {assignments}\n        WHERE {where};"
+
+
+MEDIA_TRIGGERS = {
+    "hearing_media_ai": f"""
+        CREATE TRIGGER IF NOT EXISTS hearing_media_ai AFTER INSERT ON hearings_unified BEGIN
+        {_update_sql('NEW', 'id = NEW.id')}
+        END
+    """,
+    "hearing_media_au": f"""
+        CREATE TRIGGER IF NOT EXISTS hearing_media_au
+        AFTER UPDATE OF streams, witnesses ON hearings_unified BEGIN
+        {_update_sql('NEW', 'id = NEW.id')}
+        END
+    """
+}
+
+
+def ensure_media_columns(conn: sqlite3.Connection) -> bool:
+    """
+    Add the derived media columns, indexes and triggers to hearings_unified.
+
+    Existing rows are backfilled when the columns are first added.
+
+    Returns:
+        True if the columns were added
+    """
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(hearings_unified)").fetchall()}
+    missing = [column for column in MEDIA_COLUMNS if column.split()[0] not in existing]
+    for column in missing:
+        conn.execute(f"ALTER TABLE hearings_unified ADD COLUMN {column}")
+
+    for sql in MEDIA_INDEXES:
+        conn.execute(sql)
+    for sql in MEDIA_TRIGGERS.values():
+        conn.execute(sql)
+
+    if missing:
+        refresh_media_columns(conn)
+        logger.info(f"Added derived media columns to hearings_unified: {[c.split()[0] for c in missing]}")
+    return bool(missing)
+
+
+def refresh_media_columns(conn: sqlite3.Connection):
+    """Recompute the derived media columns for every hearing"""
+    conn.execute(_update_sql("hearings_unified", "1=1"))
+
+
+def split_stream_types(stream_types: Optional[str]) -> List[str]:
+    """stream_types column as a list"""
+    return stream_types.split(",") if stream_types else []
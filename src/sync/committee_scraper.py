@@ -5,16 +5,19 @@ Part of Phase 7A: Automated Data Synchronization
 
 import requests
 import time
+import zlib
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
 from datetime import datetime, timedelta
 import json
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from .http_cache import HTTPCache, CachedResponse, get_http_cache
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -34,7 +37,7 @@ class ScrapedHearing:
 class CommitteeWebsiteScraper:
     """Scraper for committee websites to find real-time hearing updates"""
     
-    def __init__(self):
+    def __init__(self, cache: Optional[HTTPCache] = None):
         """Initialize committee website scraper"""
         self.session = requests.Session()
         self.session.headers.update({
@@ -46,6 +49,9 @@ class CommitteeWebsiteScraper:
             'Upgrade-Insecure-Requests': '1'
         })
         
+        # Conditional requests, and parsed results for pages that have not changed
+        self.cache = cache or get_http_cache()
+        
         # Committee-specific configuration
         self.committee_configs = {
             'SCOM': {
@@ -120,8 +126,17 @@ class CommitteeWebsiteScraper:
             }
         }
     
-    def scrape_committee_hearings(self, committee_code: str, days_back: int = 7) -> List[ScrapedHearing]:
-        """Scrape hearings for a specific committee"""
+    def scrape_committee_hearings(self, committee_code: str, days_back: int = 7,
+                                  known_source_ids: Optional[Set[str]] = None) -> List[ScrapedHearing]:
+        """
+        Scrape hearings for a specific committee
+        
+        Args:
+            committee_code: Committee to scrape
+            days_back: Only return hearings this recent (future hearings included)
+            known_source_ids: committee_source_id values already stored; their
+                              hearing pages are not fetched again
+        """
         
         if committee_code not in self.committee_configs:
             logger.warning(f"No scraper configuration for committee {committee_code}")
@@ -133,21 +148,30 @@ class CommitteeWebsiteScraper:
         try:
             # Get hearings list page
             hearings_url = urljoin(config['base_url'], config['hearings_path'])
-            response = self._make_request(hearings_url)
+            page = self._fetch_page(hearings_url)
             
-            if not response:
+            if not page:
                 return []
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find hearing links
-            hearing_links = self._extract_hearing_links(soup, config)
+            entry, changed = page
+            if not changed and entry.parsed is not None:
+                # Listing unchanged since it was last parsed
+                hearing_links = entry.parsed['links']
+            else:
+                soup = BeautifulSoup(entry.body, 'html.parser')
+                
+                # Find hearing links
+                hearing_links = self._extract_hearing_links(soup, config)
+                self.cache.set_parsed(hearings_url, {'links': hearing_links})
             logger.info(f"Found {len(hearing_links)} potential hearing links for {committee_code}")
             
             # Process each hearing page
             hearings = []
             for link_url in hearing_links[:20]:  # Limit to recent 20 to avoid overload
                 try:
+                    if self._is_known_page(link_url, known_source_ids):
+                        continue
+                    
                     hearing = self._scrape_hearing_page(link_url, committee_code, config)
                     if hearing and self._is_recent_hearing(hearing.hearing_date, days_back):
                         hearings.append(hearing)
@@ -185,6 +209,36 @@ class CommitteeWebsiteScraper:
         
         return None
     
+    def _fetch_page(self, url: str, retries: int = 3) -> Optional[Tuple[CachedResponse, bool]]:
+        """Conditional request through the HTTP cache, with retry logic"""
+        
+        for attempt in range(retries):
+            try:
+                return self.cache.fetch(self.session, url, timeout=30)
+            
+            except requests.exceptions.RequestException as e:
+                logger.warning(f"Request failed for {url} (attempt {attempt + 1}): {e}")
+                if attempt < retries - 1:
+                    time.sleep(2 ** attempt)  # Exponential backoff
+                else:
+                    logger.error(f"All retries failed for {url}")
+                    return None
+        
+        return None
+    
+    def _is_known_page(self, url: str, known_source_ids: Optional[Set[str]]) -> bool:
+        """Whether a hearing page was parsed into a hearing that is already stored"""
+        
+        if not known_source_ids:
+            return False
+        
+        entry = self.cache.get(url)
+        if entry is None or not entry.parsed or entry.parsed.get('committee_source_id') not in known_source_ids:
+            return False
+        
+        self.cache.record(url, 'skipped')
+        return True
+    
     def _extract_hearing_links(self, soup: BeautifulSoup, config: Dict[str, Any]) -> List[str]:
         """Extract hearing page links from committee hearings list"""
         
@@ -214,11 +268,16 @@ class CommitteeWebsiteScraper:
     def _scrape_hearing_page(self, url: str, committee_code: str, config: Dict[str, Any]) -> Optional[ScrapedHearing]:
         """Scrape individual hearing page for detailed information"""
         
-        response = self._make_request(url)
-        if not response:
+        page = self._fetch_page(url)
+        if not page:
             return None
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        entry, changed = page
+        if not changed and entry.parsed and 'hearing' in entry.parsed:
+            # Page unchanged since it was last parsed
+            return ScrapedHearing(**entry.parsed['hearing'], raw_html=entry.text[:10000])
+        
+        soup = BeautifulSoup(entry.body, 'html.parser')
         selectors = config['selectors']
         
         try:
@@ -243,7 +302,7 @@ class CommitteeWebsiteScraper:
             # Generate unique identifier
             source_id = self._generate_source_id(url, title, hearing_date)
             
-            return ScrapedHearing(
+            hearing = ScrapedHearing(
                 committee_source_id=source_id,
                 committee_code=committee_code,
                 hearing_title=title,
@@ -253,8 +312,14 @@ class CommitteeWebsiteScraper:
                 documents=documents,
                 witnesses=witnesses,
                 status='discovered',
-                raw_html=response.text[:10000]  # Store first 10KB for debugging
+                raw_html=entry.text[:10000]  # Store first 10KB for debugging
             )
+            
+            parsed = asdict(hearing)
+            del parsed['raw_html']
+            self.cache.set_parsed(url, {'committee_source_id': source_id, 'hearing': parsed})
+            
+            return hearing
         
         except Exception as e:
             logger.error(f"Error parsing hearing page {url}: {e}")
@@ -384,9 +449,9 @@ class CommitteeWebsiteScraper:
     def _generate_source_id(self, url: str, title: str, date: str) -> str:
         """Generate unique source identifier for hearing"""
         
-        # Extract path from URL for uniqueness
+        # Extract path from URL for uniqueness; crc32 is stable across runs, unlike hash()
         parsed = urlparse(url)
-        path_hash = hash(parsed.path) % 100000
+        path_hash = zlib.crc32(parsed.path.encode()) % 100000
         
         # Create readable ID
         date_clean = date.replace('-', '')
@@ -0,0 +1,186 @@
+"""
+Concurrent async Congress.gov API client.
+Committees and meeting-detail pages are fetched concurrently over pooled
+connections, paced by a token bucket shared by every client in the process,
+and revalidated against a local response cache with conditional requests.
+"""
+
+import asyncio
+import json
+import time
+import logging
+from typing import Dict, List, Optional, Any, Union
+
+import aiohttp
+
+from .congress_api_enhanced import CongressAPIEnhanced, HearingRecord, TokenBucket
+from .http_cache import HTTPCache, cache_key, get_http_cache
+
+logger = logging.getLogger(__name__)
+
+class AsyncCongressAPI(CongressAPIEnhanced):
+    """Async Congress API client sharing the enhanced client's meeting parsing"""
+    
+    def __init__(self, api_key: Optional[str] = None, rate_limiter: Optional[TokenBucket] = None,
+                 cache: Optional[HTTPCache] = None, max_connections: int = 10,
+                 max_retries: int = 3, base_url: Optional[str] = None):
+        """
+        Args:
+            api_key: Congress.gov API key (default CONGRESS_API_KEY)
+            rate_limiter: Token bucket to draw from (default the shared one)
+            cache: Response cache for conditional requests (default data/http_cache.db)
+            max_connections: Pooled connections open at once
+            max_retries: Retries after 429 or 5xx responses
+            base_url: API root, e.g. for a local mirror
+        """
+        super().__init__(api_key, rate_limiter)
+        if base_url:
+            self.base_url = base_url.rstrip('/')
+        self.cache = cache or get_http_cache()
+        self.max_connections = max_connections
+        self.max_retries = max_retries
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.request_stats = {'requests': 0, 'not_modified': 0, 'retries': 0, 'errors': 0}
+        self.fetch_seconds: Dict[str, float] = {}  # Wall time of each committee's last fetch
+    
+    async def __aenter__(self) -> 'AsyncCongressAPI':
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=dict(self.session.headers),
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self._session
+    
+    async def close(self):
+        """Close pooled connections"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    def _url(self, endpoint: str) -> str:
+        if endpoint.startswith(('http://', 'https://')):
+            return endpoint  # Detail links come back absolute
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
+    
+    async def _fetch_json(self, endpoint: str, params: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+        """Rate-limited conditional GET; unchanged responses come from the cache"""
+        
+        url = self._url(endpoint)
+        params = dict(params or {})
+        params['format'] = 'json'
+        key = cache_key(url, params)
+        # Cache reads and writes are SQLite calls, so they run in worker threads
+        cached = await asyncio.to_thread(self.cache.get, key)
+        headers = self.cache.conditional_headers(cached)
+        params['api_key'] = self.api_key
+        
+        session = await self._get_session()
+        
+        for attempt in range(self.max_retries + 1):
+            await self.rate_limiter.acquire()
+            self.request_stats['requests'] += 1
+            
+            try:
+                async with session.get(url, params=params, headers=headers) as response:
+                    if response.status == 304 and cached is not None:
+                        self.request_stats['not_modified'] += 1
+                        await asyncio.to_thread(self.cache.mark_validated, key)
+                        self.cache.record(key, 'not_modified')
+                        return json.loads(cached.body)
+                    
+                    if response.status == 429 or response.status >= 500:
+                        if attempt < self.max_retries:
+                            retry_after = response.headers.get('Retry-After')
+                            delay = float(retry_after) if retry_after and retry_after.isdigit() else 2 ** attempt
+                            logger.warning(f"API returned {response.status} for {key}, retrying in {delay}s")
+                            self.request_stats['retries'] += 1
+                            await asyncio.sleep(delay)
+                            continue
+                    
+                    response.raise_for_status()
+                    body = await response.read()
+                    data = json.loads(body)
+                    entry = await asyncio.to_thread(self.cache.store, key, body, response.headers.get('ETag'),
+                                                    response.headers.get('Last-Modified'))
+                    if cached is None:
+                        self.cache.record(key, 'new')
+                    else:
+                        self.cache.record(key, 'unchanged' if cached.body_hash == entry.body_hash else 'changed')
+                    return data
+            
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(f"API request failed for {key}: {e}")
+                self.request_stats['errors'] += 1
+                return None
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to parse JSON response from {key}: {e}")
+                self.request_stats['errors'] += 1
+                return None
+        
+        return None
+    
+    async def _with_details(self, meeting: Dict[str, Any]) -> Dict[str, Any]:
+        """Meeting list entry merged with its detail page, when it links one"""
+        
+        if not meeting.get('url'):
+            return meeting
+        
+        response = await self._fetch_json(meeting['url'])
+        if not response:
+            return meeting
+        
+        return {**meeting, **response.get('committeeMeeting', response)}
+    
+    async def fetch_committee_meetings(self, committee_code: str, days_back: int = 30,
+                                       days_forward: int = 30, include_details: bool = True) -> List[HearingRecord]:
+        """Async get_committee_meetings; detail pages are fetched concurrently"""
+        
+        endpoint, params = self._meetings_request(committee_code, days_back, days_forward)
+        
+        response = await self._fetch_json(endpoint, params)
+        if not response:
+            logger.warning(f"No response for committee {committee_code} meetings")
+            return []
+        
+        meetings = response.get('meetings', [])
+        logger.info(f"Found {len(meetings)} meetings for {committee_code}")
+        
+        if include_details:
+            meetings = await asyncio.gather(*(self._with_details(meeting) for meeting in meetings))
+        
+        return self._process_meetings(meetings, committee_code)
+    
+    async def fetch_committees(self, committee_codes: List[str],
+                               days_back: int = 30) -> Dict[str, Union[List[HearingRecord], Exception]]:
+        """
+        Fetch several committees concurrently, within the shared rate budget.
+        
+        Returns:
+            Hearing records per committee, or the exception its fetch raised;
+            how long each committee took is kept in fetch_seconds
+        """
+        
+        fetched = await asyncio.gather(
+            *(self._timed_fetch(code, days_back) for code in committee_codes),
+            return_exceptions=True
+        )
+        return dict(zip(committee_codes, fetched))
+    
+    async def _timed_fetch(self, committee_code: str, days_back: int) -> List[HearingRecord]:
+        """fetch_committee_meetings, recording its duration in fetch_seconds"""
+        start = time.perf_counter()
+        try:
+            return await self.fetch_committee_meetings(committee_code, days_back=days_back)
+        finally:
+            self.fetch_seconds[committee_code] = time.perf_counter() - start
+    
+    def get_request_stats(self) -> Dict[str, Any]:
+        """Request, revalidation and rate limiter counters"""
+        return {**self.request_stats, 'rate_limiter': self.rate_limiter.get_stats()}
@@ -4,9 +4,11 @@ Part of Phase 7A: Automated Data Synchronization
 """
 
 import os
+import asyncio
 import requests
 import time
 import logging
+import threading
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 import json
@@ -29,35 +31,91 @@ class HearingRecord:
     witnesses: List[Dict[str, Any]]
     raw_data: Dict[str, Any]
 
-class RateLimiter:
-    """Simple rate limiter for API calls"""
+# Congress.gov allows 5,000 requests per hour per key
+CONGRESS_API_HOURLY_LIMIT = 5000
+CONGRESS_API_BURST = 20
+
+class TokenBucket:
+    """Token bucket rate limiter, safe to share across threads and event loops"""
     
-    def __init__(self, calls: int = 10, period: int = 60):
-        self.calls = calls
-        self.period = period
-        self.call_times = []
+    def __init__(self, rate: float, capacity: int):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Largest burst allowed after an idle period
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.acquired = 0
+        self.waited_seconds = 0.0
     
-    def wait_if_needed(self):
-        """Wait if rate limit would be exceeded"""
-        now = time.time()
-        
-        # Remove calls outside the current period
-        self.call_times = [t for t in self.call_times if now - t < self.period]
-        
-        # If we're at the limit, wait
-        if len(self.call_times) >= self.calls:
-            sleep_time = self.period - (now - self.call_times[0]) + 0.1
-            if sleep_time > 0:
-                logger.info(f"Rate limit reached, waiting {sleep_time:.2f} seconds")
-                time.sleep(sleep_time)
-        
-        self.call_times.append(now)
+    def _reserve(self) -> float:
+        """Take a token, returning how long the caller must wait for it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Going negative queues callers in arrival order
+            self._tokens -= 1
+            self.acquired += 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.waited_seconds += delay
+            return delay
+    
+    async def acquire(self):
+        """Wait until a request fits in the rate budget"""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    def wait(self):
+        """Blocking acquire, for synchronous clients sharing the budget"""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+    
+    def available(self) -> float:
+        """Tokens a caller could take now without waiting"""
+        with self._lock:
+            tokens = self._tokens + (time.monotonic() - self._updated) * self.rate
+            return max(0.0, min(self.capacity, tokens))
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Configured rate and how much callers have waited"""
+        with self._lock:
+            return {
+                'rate_per_second': self.rate,
+                'capacity': self.capacity,
+                'acquired': self.acquired,
+                'waited_seconds': round(self.waited_seconds, 3)
+            }
+
+
+_congress_rate_limiter: Optional[TokenBucket] = None
+_limiter_lock = threading.Lock()
+
+def get_congress_rate_limiter() -> TokenBucket:
+    """Process-wide token bucket for the Congress.gov API key's quota"""
+    global _congress_rate_limiter
+    with _limiter_lock:
+        if _congress_rate_limiter is None:
+            _congress_rate_limiter = TokenBucket(CONGRESS_API_HOURLY_LIMIT / 3600, CONGRESS_API_BURST)
+        return _congress_rate_limiter
 
 class CongressAPIEnhanced:
     """Enhanced Congress API client for comprehensive hearing data"""
     
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize enhanced Congress API client"""
+    def __init__(self, api_key: Optional[str] = None, rate_limiter: Optional[TokenBucket] = None):
+        """
+        Initialize enhanced Congress API client
+        
+        Args:
+            api_key: Congress.gov API key (default CONGRESS_API_KEY)
+            rate_limiter: Token bucket to draw from (default the one shared by every client)
+        """
         self.api_key = api_key or os.getenv('CONGRESS_API_KEY')
         if not self.api_key:
             raise ValueError("Congress API key required. Set CONGRESS_API_KEY environment variable.")
@@ -68,7 +126,7 @@ class CongressAPIEnhanced:
             'User-Agent': 'Senate-Hearing-Capture-Agent/1.0 (Educational Research)',
             'Accept': 'application/json'
         })
-        self.rate_limiter = RateLimiter(calls=10, period=60)
+        self.rate_limiter = rate_limiter or get_congress_rate_limiter()
         
         # Committee code mapping for standardization
         self.committee_codes = {
@@ -85,7 +143,7 @@ class CongressAPIEnhanced:
     def _make_request(self, endpoint: str, params: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
         """Make rate-limited API request with error handling"""
         
-        self.rate_limiter.wait_if_needed()
+        self.rate_limiter.wait()
         
         if params is None:
             params = {}
@@ -112,6 +170,21 @@ class CongressAPIEnhanced:
                               days_back: int = 30, days_forward: int = 30) -> List[HearingRecord]:
         """Get committee meetings with comprehensive metadata"""
         
+        endpoint, params = self._meetings_request(committee_code, days_back, days_forward)
+        
+        response = self._make_request(endpoint, params)
+        if not response:
+            logger.warning(f"No response for committee {committee_code} meetings")
+            return []
+        
+        meetings = response.get('meetings', [])
+        logger.info(f"Found {len(meetings)} meetings for {committee_code}")
+        
+        return self._process_meetings(meetings, committee_code)
+    
+    def _meetings_request(self, committee_code: str, days_back: int, days_forward: int) -> tuple:
+        """Endpoint and params for a committee's meetings in a date range"""
+        
         # Calculate date range
         start_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
         end_date = (datetime.now() + timedelta(days=days_forward)).strftime('%Y-%m-%d')
@@ -129,15 +202,11 @@ class CongressAPIEnhanced:
             'limit': 250  # Maximum allowed
         }
         
-        response = self._make_request(endpoint, params)
-        if not response:
-            logger.warning(f"No response for committee {committee_code} meetings")
-            return []
-        
-        meetings = response.get('meetings', [])
-        logger.info(f"Found {len(meetings)} meetings for {committee_code}")
+        return endpoint, params
+    
+    def _process_meetings(self, meetings: List[Dict[str, Any]], committee_code: str) -> List[HearingRecord]:
+        """Process each meeting to extract hearing data"""
         
-        # Process each meeting to extract hearing data
         hearing_records = []
         for meeting in meetings:
             try:
@@ -301,7 +370,7 @@ class CongressAPIEnhanced:
         
         status = {
             'api_accessible': False,
-            'rate_limit_remaining': len(self.rate_limiter.call_times),
+            'rate_limit_remaining': int(self.rate_limiter.available()),
             'rate_limit_reset_time': None,
             'last_request_time': None
         }
@@ -6,12 +6,59 @@ Part of Phase 7A: Automated Data Synchronization
 import sqlite3
 import logging
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Callable
 import json
+import time
 from datetime import datetime
 
+try:
+    from ..storage.connection_pool import get_connection_pool
+    from ..storage.hearing_media import ensure_media_columns
+    from .incremental_dedup import ensure_dedup_tracking
+except ImportError:
+    # Fallback for running this module directly
+    import sys
+    sys.path.append(str(Path(__file__).parent.parent))
+    from storage.connection_pool import get_connection_pool
+    from storage.hearing_media import ensure_media_columns
+    from sync.incremental_dedup import ensure_dedup_tracking
+
 logger = logging.getLogger(__name__)
 
+JSON_HEARING_FIELDS = ('streams', 'documents', 'witnesses', 'location_info')
+
+# Values sqlite3 binds as they are; other fields must be one of these
+SQL_VALUE_TYPES = (type(None), int, float, str, bytes)
+
+INSERT_HEARING_SQL = """
+    INSERT INTO hearings_unified (
+        congress_api_id, committee_source_id, committee_code,
+        hearing_title, hearing_date, hearing_type,
+        source_api, source_website, 
+        last_api_sync, last_website_sync,
+        streams, documents, witnesses,
+        meeting_status, location_info,
+        sync_confidence, created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Called as listener(db_path, hearing_id, hearing) after each committed hearing write
+HearingListener = Callable[[str, int, Optional[Dict[str, Any]]], None]
+
+_hearing_listeners: List[HearingListener] = []
+
+def register_hearing_listener(listener: HearingListener):
+    """
+    Register a callback for hearing writes, so layers that keep derived
+    in-memory state (such as the API's auto-complete index) stay current
+    without this module importing them.
+    
+    The listener receives the written fields for a new hearing, or None when
+    an existing hearing changed and its stored row should be re-read.
+    """
+    if listener not in _hearing_listeners:
+        _hearing_listeners.append(listener)
+
 class UnifiedHearingDatabase:
     """Manages unified hearing database with multi-source tracking"""
     
@@ -19,10 +66,14 @@ class UnifiedHearingDatabase:
         """Initialize database connection and ensure schema exists"""
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
-        self.connection.row_factory = sqlite3.Row
+        self._pool = get_connection_pool(str(self.db_path))
         self._create_schema()
     
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Pooled connection for the calling thread, so concurrent routes never share one"""
+        return self._pool.thread_connection(row_factory=sqlite3.Row)
+    
     def _create_schema(self):
         """Create unified hearing schema if it doesn't exist"""
         
@@ -115,6 +166,12 @@ class UnifiedHearingDatabase:
             )
         """)
         
+        # Typed stream and witness facts for list views, kept current by triggers
+        ensure_media_columns(self.connection)
+        
+        # Change log and pair decisions for incremental deduplication
+        ensure_dedup_tracking(self.connection)
+        
         self.connection.commit()
         
         # Initialize default priority committees if table is empty
@@ -174,22 +231,46 @@ class UnifiedHearingDatabase:
         
         now = datetime.now().isoformat()
         
+        cursor = self.connection.cursor()
+        cursor.execute(INSERT_HEARING_SQL, self._insert_values(hearing_data, source, now))
+        
+        hearing_id = cursor.lastrowid
+        self.connection.commit()
+        
+        # Record sync history
+        self.record_sync_event(hearing_id, source, 'create', hearing_data)
+        
+        self._notify_hearing_written(hearing_id, hearing_data)
+        
+        return hearing_id
+    
+    def update_hearing(self, hearing_id: int, updates: Dict[str, Any], source: str):
+        """Update existing hearing with change tracking"""
+        
+        now = datetime.now().isoformat()
+        
+        set_sql, values = self._update_assignments(updates, source, now)
+        values.append(hearing_id)  # For WHERE clause
+        
+        query = f"UPDATE hearings_unified SET {set_sql} WHERE id = ?"
+        
+        self.connection.execute(query, values)
+        self.connection.commit()
+        
+        # Record sync history
+        self.record_sync_event(hearing_id, source, 'update', updates)
+        
+        # Keep in-memory auto-complete current
+        self._notify_hearing_written(hearing_id)
+    
+    def _insert_values(self, hearing_data: Dict[str, Any], source: str, now: str) -> tuple:
+        """Parameters for INSERT_HEARING_SQL"""
+        
         # Determine source flags
         source_api = 1 if source == 'congress_api' else 0
         source_website = 1 if source == 'website_scraper' else 0
         
-        cursor = self.connection.cursor()
-        cursor.execute("""
-            INSERT INTO hearings_unified (
-                congress_api_id, committee_source_id, committee_code,
-                hearing_title, hearing_date, hearing_type,
-                source_api, source_website, 
-                last_api_sync, last_website_sync,
-                streams, documents, witnesses,
-                meeting_status, location_info,
-                sync_confidence, created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        return (
             hearing_data.get('congress_api_id'),
             hearing_data.get('committee_source_id'),
             hearing_data['committee_code'],
@@ -206,32 +287,17 @@ class UnifiedHearingDatabase:
             json.dumps(hearing_data.get('location_info', {})),
             hearing_data.get('sync_confidence', 1.0),
             now, now
-        ))
-        
-        hearing_id = cursor.lastrowid
-        self.connection.commit()
-        
-        # Record sync history
-        self.record_sync_event(hearing_id, source, 'create', hearing_data)
-        
-        return hearing_id
+        )
     
-    def update_hearing(self, hearing_id: int, updates: Dict[str, Any], source: str):
-        """Update existing hearing with change tracking"""
+    def _update_assignments(self, updates: Dict[str, Any], source: str, now: str) -> tuple:
+        """SET clause and its parameters for an update with source tracking"""
         
-        now = datetime.now().isoformat()
-        
-        # Build update query dynamically
         set_clauses = []
         values = []
         
         for key, value in updates.items():
-            if key in ['streams', 'documents', 'witnesses', 'location_info']:
-                set_clauses.append(f"{key} = ?")
-                values.append(json.dumps(value))
-            else:
-                set_clauses.append(f"{key} = ?") 
-                values.append(value)
+            set_clauses.append(f"{key} = ?")
+            values.append(json.dumps(value) if key in JSON_HEARING_FIELDS else value)
         
         # Update source tracking
         if source == 'congress_api':
@@ -243,15 +309,172 @@ class UnifiedHearingDatabase:
         
         set_clauses.append("updated_at = ?")
         values.append(now)
-        values.append(hearing_id)  # For WHERE clause
         
-        query = f"UPDATE hearings_unified SET {', '.join(set_clauses)} WHERE id = ?"
+        return ', '.join(set_clauses), values
+    
+    def upsert_hearings(self, hearings: List[Dict[str, Any]], source: str,
+                        match_threshold: float = 0.8) -> Dict[str, Any]:
+        """
+        Insert or update a batch of hearings in a single transaction.
+        
+        Each hearing is matched the way find_potential_duplicates matches one,
+        against stored hearings and against earlier hearings in the batch, and
+        updates its best match above match_threshold or is inserted. Candidates
+        are loaded in one query, matched in memory, and the writes and their
+        sync history rows are applied with executemany and one commit.
+        Hearings that could not be written (missing required fields, unknown
+        columns, values SQLite cannot store) are skipped and counted in
+        errors before anything is written, so they never roll back the rest.
+        
+        Args:
+            hearings: Hearings in database format, in processing order
+            source: Sync source ('congress_api', 'website_scraper')
+            match_threshold: Similarity above which a hearing updates its match
+            
+        Returns:
+            discovered/updated/errors counts, hearing_ids in input order (None
+            for hearings that failed) and per-phase timings in seconds
+        """
         
-        self.connection.execute(query, values)
-        self.connection.commit()
+        conn = self.connection
+        now = datetime.now().isoformat()
+        timings = {}
+        errors = 0
+        hearing_ids = [None] * len(hearings)
+        
+        phase_start = time.perf_counter()
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(hearings_unified)")}
+        valid = []
+        for position, hearing_data in enumerate(hearings):
+            try:
+                # Anything executemany would reject fails this hearing, not the batch
+                for field in ('committee_code', 'hearing_title', 'hearing_date'):
+                    if hearing_data.get(field) is None:
+                        raise ValueError(f"missing {field}")
+                unknown = sorted(set(hearing_data) - columns)
+                if unknown:
+                    raise ValueError(f"unknown columns {unknown}")
+                for key, value in hearing_data.items():
+                    if key not in JSON_HEARING_FIELDS and not isinstance(value, SQL_VALUE_TYPES):
+                        raise TypeError(f"{key} is a {type(value).__name__}")
+                changes = json.dumps(hearing_data)
+                valid.append((position, hearing_data, changes))
+            except (ValueError, TypeError) as e:
+                logger.error(f"Skipping hearing {hearing_data.get('congress_api_id')}: {e}")
+                errors += 1
+        
+        if not conn.in_transaction:
+            # Hold the write lock from candidate load to commit
+            conn.execute("BEGIN IMMEDIATE")
         
-        # Record sync history
-        self.record_sync_event(hearing_id, source, 'update', updates)
+        try:
+            # Same-day candidates for every committee in the batch, in one query
+            dates = sorted({hearing_data['hearing_date'] for _, hearing_data, _ in valid})
+            days = dict(conn.execute(
+                "SELECT value, date(value) FROM json_each(?)", (json.dumps(dates),)
+            ).fetchall())
+            committees = sorted({hearing_data['committee_code'] for _, hearing_data, _ in valid})
+            pool = {}
+            for row in conn.execute("""
+                SELECT id, hearing_title, hearing_date, committee_code, date(hearing_date) AS day
+                FROM hearings_unified
+                WHERE committee_code IN (SELECT value FROM json_each(?))
+                AND date(hearing_date) IN (SELECT value FROM json_each(?))
+                ORDER BY id
+            """, (json.dumps(committees), json.dumps(sorted(set(filter(None, days.values())))))):
+                pool.setdefault((row['committee_code'], row['day']), []).append(dict(row))
+            timings['load'] = time.perf_counter() - phase_start
+            
+            # Match in memory; inserts join the pool for later hearings in the batch
+            phase_start = time.perf_counter()
+            operations = []
+            for position, hearing_data, changes in valid:
+                day = days.get(hearing_data['hearing_date'])
+                best, best_score = None, 0.6
+                if day is not None:
+                    for candidate in pool.get((hearing_data['committee_code'], day), []):
+                        score = self._calculate_similarity(hearing_data, candidate)
+                        if score > best_score:
+                            best, best_score = candidate, score
+                
+                if best is not None and best_score > match_threshold:
+                    operations.append(('update', best, position, hearing_data, changes))
+                    best.update({key: hearing_data[key] for key in ('hearing_title', 'hearing_date')
+                                 if key in hearing_data})
+                else:
+                    record = {
+                        'id': None,
+                        'hearing_title': hearing_data['hearing_title'],
+                        'hearing_date': hearing_data['hearing_date'],
+                        'committee_code': hearing_data['committee_code']
+                    }
+                    if day is not None:
+                        pool.setdefault((hearing_data['committee_code'], day), []).append(record)
+                    operations.append(('create', record, position, hearing_data, changes))
+            timings['match'] = time.perf_counter() - phase_start
+            
+            phase_start = time.perf_counter()
+            creates = [operation for operation in operations if operation[0] == 'create']
+            if creates:
+                before = conn.execute("SELECT COALESCE(MAX(id), 0) FROM hearings_unified").fetchone()[0]
+                conn.executemany(INSERT_HEARING_SQL, [
+                    self._insert_values(hearing_data, source, now) for _, _, _, hearing_data, _ in creates
+                ])
+                new_ids = [row[0] for row in conn.execute(
+                    "SELECT id FROM hearings_unified WHERE id > ? ORDER BY id", (before,)
+                )]
+                for (_, record, _, _, _), hearing_id in zip(creates, new_ids):
+                    record['id'] = hearing_id
+            
+            # Consecutive updates with the same columns share a statement, in order
+            batch_sql, batch = None, []
+            for kind, record, _, hearing_data, _ in operations:
+                if kind != 'update':
+                    continue
+                set_sql, values = self._update_assignments(hearing_data, source, now)
+                if set_sql != batch_sql and batch:
+                    conn.executemany(f"UPDATE hearings_unified SET {batch_sql} WHERE id = ?", batch)
+                    batch = []
+                batch_sql = set_sql
+                batch.append(values + [record['id']])
+            if batch:
+                conn.executemany(f"UPDATE hearings_unified SET {batch_sql} WHERE id = ?", batch)
+            
+            conn.executemany("""
+                INSERT INTO sync_history (
+                    hearing_id, sync_source, sync_type, changes_detected, success
+                ) VALUES (?, ?, ?, ?, ?)
+            """, [(record['id'], source, kind, changes, 1) for kind, record, _, _, changes in operations])
+            conn.commit()
+            timings['write'] = time.perf_counter() - phase_start
+        except Exception:
+            conn.rollback()
+            raise
+        
+        # Keep listeners' in-memory state current
+        phase_start = time.perf_counter()
+        refreshed = set()
+        for kind, record, position, hearing_data, _ in operations:
+            hearing_ids[position] = record['id']
+            if kind == 'create':
+                self._notify_hearing_written(record['id'], hearing_data)
+            elif record['id'] not in refreshed:
+                refreshed.add(record['id'])
+                self._notify_hearing_written(record['id'])
+        timings['index'] = time.perf_counter() - phase_start
+        
+        return {
+            'discovered': len(creates),
+            'updated': len(operations) - len(creates),
+            'errors': errors,
+            'hearing_ids': hearing_ids,
+            'timings': timings
+        }
+    
+    def _notify_hearing_written(self, hearing_id: int, hearing_data: Optional[Dict[str, Any]] = None):
+        """Tell registered listeners a hearing was created (with its fields) or changed"""
+        for listener in _hearing_listeners:
+            listener(str(self.db_path), hearing_id, hearing_data)
     
     def find_potential_duplicates(self, hearing_data: Dict[str, Any]) -> list:
         """Find potential duplicate hearings based on multiple criteria"""
@@ -456,9 +679,8 @@ class UnifiedHearingDatabase:
         return [dict(row) for row in cursor.fetchall()]
     
     def close(self):
-        """Close database connection"""
-        if self.connection:
-            self.connection.close()
+        """Close this thread's database connection"""
+        self._pool.close_thread_connection()
 
 if __name__ == "__main__":
     # Test database creation
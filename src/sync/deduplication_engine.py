@@ -8,12 +8,19 @@ from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime, timedelta
 import json
 import re
-from dataclasses import dataclass
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field as dataclass_field
 from difflib import SequenceMatcher
 import hashlib
 
 logger = logging.getLogger(__name__)
 
+# Hearings further apart than this are never duplicates
+DATE_WINDOW_DAYS = 30
+
+# Bounds the per-title cache across runs
+TITLE_CACHE_SIZE = 100000
+
 @dataclass
 class DuplicationMatch:
     """Represents a potential duplicate match between hearings"""
@@ -24,6 +31,20 @@ class DuplicationMatch:
     match_factors: Dict[str, float]
     recommended_action: str  # 'auto_merge', 'manual_review', 'ignore'
 
+@dataclass
+class HearingProfile:
+    """Per-hearing values reused by every comparison the hearing takes part in"""
+    committee_code: Any
+    day: Optional[int]  # Date ordinal, None if the date does not parse
+    normalized_title: str
+    key_phrases: set
+    title_chars: Counter
+    time_info: Optional[str]
+    room: str
+    building: str
+    has_witnesses: bool
+    witness_names: set = dataclass_field(default_factory=set)
+
 class DeduplicationEngine:
     """Intelligent engine for detecting and merging duplicate hearing records"""
     
@@ -51,55 +72,151 @@ class DeduplicationEngine:
             (r'\b(the|a|an)\b', ''),
             (r'\bexecutive\s*session\s*\d*\b', 'executive session')
         ]
+        self._compiled_normalizations = [
+            (re.compile(pattern), replacement) for pattern, replacement in self.title_normalizations
+        ]
+        
+        # Normalized title, key phrases and character counts per raw title
+        self._title_cache: Dict[str, Tuple[str, set, Counter]] = {}
     
     def find_duplicates(self, hearings: List[Dict[str, Any]]) -> List[DuplicationMatch]:
-        """Find potential duplicate hearings in a list"""
+        """
+        Find potential duplicate hearings in a list.
+        
+        Only hearings of the same committee within DATE_WINDOW_DAYS of each
+        other (or with an unparseable date) can match, so candidates are
+        drawn from committee blocks sorted by date instead of every pair.
+        """
         
         logger.info(f"Analyzing {len(hearings)} hearings for duplicates")
         
-        matches = []
+        profiles = [self.profile_hearing(hearing) for hearing in hearings]
+        scored = []
+        candidates = 0
+        
+        for i, j in self.candidate_pairs(profiles):
+            candidates += 1
+            hearing1, hearing2 = hearings[i], hearings[j]
+            
+            # Skip if same record
+            if hearing1.get('id') == hearing2.get('id'):
+                continue
+            
+            # Calculate similarity
+            match = self._calculate_similarity(
+                hearing1, hearing2, profiles[i], profiles[j], min_score=self.manual_review_threshold
+            )
+            
+            if match and match.similarity_score >= self.manual_review_threshold:
+                scored.append((i, j, match))
         
-        # Compare each hearing with every other hearing
-        for i, hearing1 in enumerate(hearings):
-            for j, hearing2 in enumerate(hearings[i+1:], i+1):
-                
-                # Skip if same record
-                if hearing1.get('id') == hearing2.get('id'):
-                    continue
-                
-                # Calculate similarity
-                match = self._calculate_similarity(hearing1, hearing2)
-                
-                if match and match.similarity_score >= self.manual_review_threshold:
-                    matches.append(match)
-        
-        # Sort by similarity score (highest first)
+        # Sort by similarity score (highest first), ties in input order
+        scored.sort(key=lambda item: (item[0], item[1]))
+        matches = [match for _, _, match in scored]
         matches.sort(key=lambda m: m.similarity_score, reverse=True)
         
-        logger.info(f"Found {len(matches)} potential duplicate pairs")
+        logger.info(f"Found {len(matches)} potential duplicate pairs from {candidates} candidate pairs")
         return matches
     
-    def _calculate_similarity(self, hearing1: Dict[str, Any], hearing2: Dict[str, Any]) -> Optional[DuplicationMatch]:
-        """Calculate similarity score between two hearings"""
+    def candidate_pairs(self, profiles: List[HearingProfile]):
+        """
+        Index pairs (i < j) that pass the committee and date compatibility check.
+        
+        Each committee's dated hearings are swept in date order, pairing only
+        those within the date window; undated hearings pair with the whole
+        committee, as the compatibility check lets them through.
+        """
+        blocks = defaultdict(list)
+        for index, profile in enumerate(profiles):
+            blocks[profile.committee_code].append(index)
+        
+        for members in blocks.values():
+            dated = sorted((profiles[i].day, i) for i in members if profiles[i].day is not None)
+            undated = [i for i in members if profiles[i].day is None]
+            
+            for position, (day, i) in enumerate(dated):
+                for other_day, j in dated[position + 1:]:
+                    if other_day - day > DATE_WINDOW_DAYS:
+                        break
+                    yield (i, j) if i < j else (j, i)
+            
+            paired = set()
+            for i in undated:
+                paired.add(i)
+                for j in members:
+                    # Pairs of undated hearings are produced once
+                    if j not in paired:
+                        yield (i, j) if i < j else (j, i)
+    
+    def profile_hearing(self, hearing: Dict[str, Any]) -> HearingProfile:
+        """Parse and normalize the fields the similarity factors compare"""
+        
+        try:
+            day = datetime.strptime(hearing.get('hearing_date', ''), '%Y-%m-%d').toordinal()
+        except (ValueError, TypeError):
+            day = None
+        
+        normalized_title, key_phrases, title_chars = self._title_profile(hearing.get('hearing_title', ''))
+        
+        location = self._parse_json_field(hearing.get('location_info'), {})
+        if not isinstance(location, dict):
+            location = {}
+        
+        witnesses = self._parse_json_field(hearing.get('witnesses'), [])
+        witness_names = set()
+        for witness in witnesses if isinstance(witnesses, list) else []:
+            if isinstance(witness, dict):
+                name = (witness.get('name') or '').lower().strip()
+                if name:
+                    witness_names.add(name)
+        
+        return HearingProfile(
+            committee_code=hearing.get('committee_code'),
+            day=day,
+            normalized_title=normalized_title,
+            key_phrases=key_phrases,
+            title_chars=title_chars,
+            time_info=self._extract_time_info(hearing),
+            room=str(location.get('room', '')).lower().strip(),
+            building=str(location.get('building', '')).lower().strip(),
+            has_witnesses=bool(witnesses),
+            witness_names=witness_names
+        )
+    
+    def _parse_json_field(self, value: Any, default: Any) -> Any:
+        """Value of a field stored either parsed or as a JSON string"""
+        if isinstance(value, str):
+            try:
+                return json.loads(value)
+            except json.JSONDecodeError:
+                return default
+        return value if value is not None else default
+    
+    def _calculate_similarity(self, hearing1: Dict[str, Any], hearing2: Dict[str, Any],
+                              profile1: Optional[HearingProfile] = None,
+                              profile2: Optional[HearingProfile] = None,
+                              min_score: Optional[float] = None) -> Optional[DuplicationMatch]:
+        """
+        Calculate similarity score between two hearings.
+        
+        With min_score, pairs whose title cannot lift them to that score are
+        dropped (None) before the costly title comparison.
+        """
+        
+        profile1 = profile1 or self.profile_hearing(hearing1)
+        profile2 = profile2 or self.profile_hearing(hearing2)
         
         # Quick filters to avoid unnecessary computation
-        if not self._quick_compatibility_check(hearing1, hearing2):
+        if not self._profiles_compatible(profile1, profile2):
             return None
         
         match_factors = {}
         
-        # 1. Title similarity (40% weight)
-        title_score = self._calculate_title_similarity(
-            hearing1.get('hearing_title', ''),
-            hearing2.get('hearing_title', '')
-        )
-        match_factors['title_similarity'] = title_score
+        # 1. Title similarity (40% weight) - scored last, below
+        match_factors['title_similarity'] = 0.0
         
         # 2. Date proximity (30% weight)
-        date_score = self._calculate_date_proximity(
-            hearing1.get('hearing_date', ''),
-            hearing2.get('hearing_date', '')
-        )
+        date_score = self._day_proximity(profile1.day, profile2.day)
         match_factors['date_proximity'] = date_score
         
         # 3. Committee match (10% weight)
@@ -110,17 +227,35 @@ class DeduplicationEngine:
         match_factors['committee_match'] = committee_score
         
         # 4. Time proximity if available (10% weight)
-        time_score = self._calculate_time_proximity(hearing1, hearing2)
+        time_score = self._time_proximity(profile1.time_info, profile2.time_info)
         match_factors['time_proximity'] = time_score
         
         # 5. Location similarity (5% weight)
-        location_score = self._calculate_location_similarity(hearing1, hearing2)
+        location_score = self._location_similarity(profile1, profile2)
         match_factors['location_similarity'] = location_score
         
         # 6. Witness overlap (5% weight)
-        witness_score = self._calculate_witness_overlap(hearing1, hearing2)
+        witness_score = self._witness_overlap(profile1, profile2)
         match_factors['witness_overlap'] = witness_score
         
+        other_score = sum(
+            score * self.similarity_weights[factor]
+            for factor, score in match_factors.items()
+        )
+        min_title = None
+        if min_score is not None:
+            # Title score needed to reach min_score, with slack for rounding
+            min_title = (min_score - other_score) / self.similarity_weights['title_similarity'] - 1e-9
+        
+        title_score = self._title_similarity(
+            profile1.normalized_title, profile1.key_phrases,
+            profile2.normalized_title, profile2.key_phrases,
+            min_title, profile1.title_chars, profile2.title_chars
+        )
+        if title_score is None:
+            return None
+        match_factors['title_similarity'] = title_score
+        
         # Calculate weighted similarity score
         total_score = sum(
             score * self.similarity_weights[factor]
@@ -159,7 +294,7 @@ class DeduplicationEngine:
             date1 = datetime.strptime(hearing1.get('hearing_date', ''), '%Y-%m-%d')
             date2 = datetime.strptime(hearing2.get('hearing_date', ''), '%Y-%m-%d')
             
-            if abs((date1 - date2).days) > 30:
+            if abs((date1 - date2).days) > DATE_WINDOW_DAYS:
                 return False
         except (ValueError, TypeError):
             # If date parsing fails, continue with analysis
@@ -167,45 +302,90 @@ class DeduplicationEngine:
         
         return True
     
+    def _profiles_compatible(self, profile1: HearingProfile, profile2: HearingProfile) -> bool:
+        """_quick_compatibility_check on parsed profiles"""
+        
+        if profile1.committee_code != profile2.committee_code:
+            return False
+        
+        if profile1.day is not None and profile2.day is not None:
+            return abs(profile1.day - profile2.day) <= DATE_WINDOW_DAYS
+        
+        return True
+    
     def _calculate_title_similarity(self, title1: str, title2: str) -> float:
         """Calculate similarity between hearing titles"""
         
-        if not title1 or not title2:
-            return 0.0
-        
-        # Normalize titles
-        norm_title1 = self._normalize_title(title1)
-        norm_title2 = self._normalize_title(title2)
+        norm_title1, phrases1, _ = self._title_profile(title1)
+        norm_title2, phrases2, _ = self._title_profile(title2)
+        return self._title_similarity(norm_title1, phrases1, norm_title2, phrases2)
+    
+    def _title_similarity(self, norm_title1: str, phrases1: set, norm_title2: str, phrases2: set,
+                          min_score: Optional[float] = None, chars1: Optional[Counter] = None,
+                          chars2: Optional[Counter] = None) -> Optional[float]:
+        """
+        Similarity of normalized titles; None if it is certainly below min_score.
+        
+        The key phrase bonus is cheap, so it is computed first. The length and
+        shared-character upper bounds on SequenceMatcher's ratio (its
+        real_quick_ratio and quick_ratio, here from cached character counts)
+        then rule out hopeless pairs before a matcher is built.
+        """
         
         if not norm_title1 or not norm_title2:
-            return 0.0
-        
-        # Use sequence matcher for similarity
-        similarity = SequenceMatcher(None, norm_title1, norm_title2).ratio()
+            return 0.0 if min_score is None or min_score <= 0.0 else None
         
         # Boost score for exact matches of key phrases
-        key_phrases = self._extract_key_phrases(norm_title1) | self._extract_key_phrases(norm_title2)
-        exact_matches = 0
+        key_phrases = phrases1 | phrases2
+        phrase_bonus = 0.0
+        if key_phrases:
+            exact_matches = sum(
+                1 for phrase in key_phrases if phrase in norm_title1 and phrase in norm_title2
+            )
+            # Bonus for exact phrase matches
+            phrase_bonus = (exact_matches / len(key_phrases)) * 0.2
         
-        for phrase in key_phrases:
-            if phrase in norm_title1 and phrase in norm_title2:
-                exact_matches += 1
+        if min_score is not None:
+            if min_score > 1.0:
+                return None
+            needed = min_score - phrase_bonus
+            length = len(norm_title1) + len(norm_title2)
+            if 2.0 * min(len(norm_title1), len(norm_title2)) / length < needed:
+                return None
+            if chars1 is not None and chars2 is not None:
+                if 2.0 * sum((chars1 & chars2).values()) / length < needed:
+                    return None
         
-        # Bonus for exact phrase matches
+        # Use sequence matcher for similarity
+        similarity = SequenceMatcher(None, norm_title1, norm_title2).ratio()
         if key_phrases:
-            phrase_bonus = (exact_matches / len(key_phrases)) * 0.2
             similarity = min(1.0, similarity + phrase_bonus)
         
+        if min_score is not None and similarity < min_score:
+            return None
         return similarity
     
+    def _title_profile(self, title: str) -> Tuple[str, set, Counter]:
+        """Normalized title, its key phrases and character counts, cached per title"""
+        
+        title = title or ''
+        cached = self._title_cache.get(title)
+        if cached is None:
+            normalized = self._normalize_title(title) if title else ''
+            cached = (normalized, self._extract_key_phrases(normalized), Counter(normalized))
+            if len(self._title_cache) >= TITLE_CACHE_SIZE:
+                self._title_cache.clear()
+            self._title_cache[title] = cached
+        return cached
+    
     def _normalize_title(self, title: str) -> str:
         """Normalize hearing title for comparison"""
         
         normalized = title.lower().strip()
         
         # Apply normalization patterns
-        for pattern, replacement in self.title_normalizations:
-            normalized = re.sub(pattern, replacement, normalized)
+        for pattern, replacement in self._compiled_normalizations:
+            normalized = pattern.sub(replacement, normalized)
         
         # Remove extra whitespace
         normalized = re.sub(r'\s+', ' ', normalized).strip()
@@ -235,33 +415,37 @@ class DeduplicationEngine:
     def _calculate_date_proximity(self, date1: str, date2: str) -> float:
         """Calculate proximity score based on hearing dates"""
         
-        try:
-            dt1 = datetime.strptime(date1, '%Y-%m-%d')
-            dt2 = datetime.strptime(date2, '%Y-%m-%d')
-            
-            # Exact date match
-            if dt1 == dt2:
-                return 1.0
-            
-            # Calculate days difference
-            days_diff = abs((dt1 - dt2).days)
-            
-            # Score decreases with distance
-            if days_diff == 0:
-                return 1.0
-            elif days_diff <= 1:
-                return 0.8
-            elif days_diff <= 3:
-                return 0.6
-            elif days_diff <= 7:
-                return 0.4
-            elif days_diff <= 14:
-                return 0.2
-            else:
-                return 0.0
+        days = []
+        for date in (date1, date2):
+            try:
+                days.append(datetime.strptime(date, '%Y-%m-%d').toordinal())
+            except (ValueError, TypeError):
+                days.append(None)
         
-        except (ValueError, TypeError):
+        return self._day_proximity(*days)
+    
+    def _day_proximity(self, day1: Optional[int], day2: Optional[int]) -> float:
+        """Date proximity of two date ordinals (None when the date did not parse)"""
+        
+        if day1 is None or day2 is None:
             return 0.5  # Neutral score if dates can't be parsed
+        
+        # Calculate days difference
+        days_diff = abs(day1 - day2)
+        
+        # Score decreases with distance
+        if days_diff == 0:
+            return 1.0
+        elif days_diff <= 1:
+            return 0.8
+        elif days_diff <= 3:
+            return 0.6
+        elif days_diff <= 7:
+            return 0.4
+        elif days_diff <= 14:
+            return 0.2
+        else:
+            return 0.0
     
     def _calculate_committee_match(self, committee1: str, committee2: str) -> float:
         """Calculate committee match score"""
@@ -275,31 +459,27 @@ class DeduplicationEngine:
         """Calculate time proximity if time information is available"""
         
         # Extract time from location_info or other fields
-        time1 = self._extract_time_info(hearing1)
-        time2 = self._extract_time_info(hearing2)
+        return self._time_proximity(self._extract_time_info(hearing1), self._extract_time_info(hearing2))
+    
+    def _time_proximity(self, time1: Optional[str], time2: Optional[str]) -> float:
+        """Time proximity of two extracted hearing times"""
         
         if not time1 or not time2:
             return 0.5  # Neutral score if no time info
         
-        try:
-            # Simple time comparison
-            if time1 == time2:
-                return 1.0
-            else:
-                return 0.3  # Partial match if times are different
-        except:
-            return 0.5
+        # Simple time comparison
+        if time1 == time2:
+            return 1.0
+        else:
+            return 0.3  # Partial match if times are different
     
     def _extract_time_info(self, hearing: Dict[str, Any]) -> Optional[str]:
         """Extract time information from hearing record"""
         
         # Check location_info for time
-        location_info = hearing.get('location_info', {})
-        if isinstance(location_info, str):
-            try:
-                location_info = json.loads(location_info)
-            except json.JSONDecodeError:
-                location_info = {}
+        location_info = self._parse_json_field(hearing.get('location_info'), {})
+        if not isinstance(location_info, dict):
+            location_info = {}
         
         # Look for time in various fields
         time_patterns = [
@@ -324,23 +504,14 @@ class DeduplicationEngine:
     def _calculate_location_similarity(self, hearing1: Dict[str, Any], hearing2: Dict[str, Any]) -> float:
         """Calculate location similarity score"""
         
-        loc1 = hearing1.get('location_info', {})
-        loc2 = hearing2.get('location_info', {})
-        
-        # Parse JSON if needed
-        for loc in [loc1, loc2]:
-            if isinstance(loc, str):
-                try:
-                    loc = json.loads(loc)
-                except json.JSONDecodeError:
-                    loc = {}
+        return self._location_similarity(self.profile_hearing(hearing1), self.profile_hearing(hearing2))
+    
+    def _location_similarity(self, profile1: HearingProfile, profile2: HearingProfile) -> float:
+        """Location similarity from parsed room and building"""
         
         # Compare room and building information
-        room1 = str(loc1.get('room', '')).lower().strip()
-        room2 = str(loc2.get('room', '')).lower().strip()
-        
-        building1 = str(loc1.get('building', '')).lower().strip()
-        building2 = str(loc2.get('building', '')).lower().strip()
+        room1, room2 = profile1.room, profile2.room
+        building1, building2 = profile1.building, profile2.building
         
         if not room1 and not room2 and not building1 and not building2:
             return 0.5  # Neutral if no location info
@@ -361,38 +532,19 @@ class DeduplicationEngine:
     def _calculate_witness_overlap(self, hearing1: Dict[str, Any], hearing2: Dict[str, Any]) -> float:
         """Calculate overlap in witness lists"""
         
-        witnesses1 = hearing1.get('witnesses', [])
-        witnesses2 = hearing2.get('witnesses', [])
-        
-        # Parse JSON if needed
-        for witnesses in [witnesses1, witnesses2]:
-            if isinstance(witnesses, str):
-                try:
-                    witnesses = json.loads(witnesses)
-                except json.JSONDecodeError:
-                    witnesses = []
+        return self._witness_overlap(self.profile_hearing(hearing1), self.profile_hearing(hearing2))
+    
+    def _witness_overlap(self, profile1: HearingProfile, profile2: HearingProfile) -> float:
+        """Witness overlap from parsed witness names"""
         
-        if not witnesses1 and not witnesses2:
+        if not profile1.has_witnesses and not profile2.has_witnesses:
             return 0.5  # Neutral if no witness info
         
-        if not witnesses1 or not witnesses2:
+        if not profile1.has_witnesses or not profile2.has_witnesses:
             return 0.2  # Low score if one has witnesses, other doesn't
         
-        # Extract witness names
-        names1 = set()
-        names2 = set()
-        
-        for witness in witnesses1:
-            if isinstance(witness, dict):
-                name = witness.get('name', '').lower().strip()
-                if name:
-                    names1.add(name)
-        
-        for witness in witnesses2:
-            if isinstance(witness, dict):
-                name = witness.get('name', '').lower().strip()
-                if name:
-                    names2.add(name)
+        names1 = profile1.witness_names
+        names2 = profile2.witness_names
         
         if not names1 or not names2:
             return 0.2
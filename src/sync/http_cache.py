@@ -0,0 +1,223 @@
+"""
+Disk-backed HTTP response cache for conditional requests.
+Stores each response body with its ETag/Last-Modified validators so repeat
+fetches can ask the server whether anything changed instead of re-downloading,
+plus a body hash and whatever the caller parsed from it, so pages that come
+back unchanged need not be parsed again.
+"""
+
+import sqlite3
+import json
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple
+from datetime import datetime
+from dataclasses import dataclass
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+try:
+    from ..storage.connection_pool import get_connection_pool
+except ImportError:
+    from storage.connection_pool import get_connection_pool
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that never belong in a cache key
+SECRET_PARAMS = {'api_key'}
+
+# Lookup outcomes that avoided downloading or re-parsing a page
+HIT_OUTCOMES = ('not_modified', 'unchanged', 'skipped')
+
+@dataclass
+class CachedResponse:
+    """A stored response and the validators to revalidate it"""
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: bytes
+    body_hash: str
+    fetched_at: str
+    validated_at: str
+    parsed: Optional[Any] = None
+    
+    @property
+    def text(self) -> str:
+        """Body decoded as text"""
+        return self.body.decode('utf-8', errors='replace')
+
+def cache_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Canonical URL for a request: query merged with params, sorted, secrets dropped"""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    query += [(str(key), str(value)) for key, value in (params or {}).items()]
+    query = sorted((key, value) for key, value in query if key not in SECRET_PARAMS)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ''))
+
+class HTTPCache:
+    """URL-keyed response cache in SQLite"""
+    
+    def __init__(self, db_path: str = "data/http_cache.db"):
+        self.db_path = Path(db_path)
+        self._pool = get_connection_pool(str(self.db_path))
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                body BLOB NOT NULL,
+                body_hash TEXT NOT NULL,
+                fetched_at TEXT NOT NULL,
+                validated_at TEXT NOT NULL
+            )
+        """)
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(http_cache)")}
+        if 'parsed' not in columns:
+            # Caller's parse of the stored body, cleared when the body changes
+            self.connection.execute("ALTER TABLE http_cache ADD COLUMN parsed TEXT")
+        self.connection.commit()
+        
+        self._lock = threading.Lock()
+        self._domain_stats: Dict[str, Dict[str, int]] = {}
+    
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Pooled connection for the calling thread"""
+        return self._pool.thread_connection()
+    
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Stored response for a cache key, if any"""
+        row = self.connection.execute("""
+            SELECT url, etag, last_modified, body, body_hash, fetched_at, validated_at, parsed
+            FROM http_cache WHERE url = ?
+        """, (url,)).fetchone()
+        if row is None:
+            return None
+        return CachedResponse(*row[:7], parsed=json.loads(row[7]) if row[7] else None)
+    
+    def conditional_headers(self, entry: Optional[CachedResponse]) -> Dict[str, str]:
+        """If-None-Match/If-Modified-Since headers for revalidating an entry"""
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+        return headers
+    
+    def store(self, url: str, body: bytes, etag: Optional[str] = None,
+              last_modified: Optional[str] = None) -> CachedResponse:
+        """Save a fresh response under its cache key, keeping its parse if the body is the same"""
+        now = datetime.now().isoformat()
+        entry = CachedResponse(url, etag, last_modified, body, hashlib.sha256(body).hexdigest(), now, now)
+        self.connection.execute("""
+            INSERT INTO http_cache
+                (url, etag, last_modified, body, body_hash, fetched_at, validated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(url) DO UPDATE SET
+                etag = excluded.etag,
+                last_modified = excluded.last_modified,
+                body = excluded.body,
+                body_hash = excluded.body_hash,
+                fetched_at = excluded.fetched_at,
+                validated_at = excluded.validated_at,
+                parsed = CASE WHEN http_cache.body_hash = excluded.body_hash THEN http_cache.parsed END
+        """, (entry.url, entry.etag, entry.last_modified, entry.body, entry.body_hash,
+              entry.fetched_at, entry.validated_at))
+        self.connection.commit()
+        return entry
+    
+    def set_parsed(self, url: str, parsed: Any):
+        """Keep what was parsed from a stored body, for reuse while it is unchanged"""
+        self.connection.execute("UPDATE http_cache SET parsed = ? WHERE url = ?", (json.dumps(parsed), url))
+        self.connection.commit()
+    
+    def fetch(self, session, url: str, timeout: int = 30) -> Tuple[CachedResponse, bool]:
+        """
+        Conditional GET through a requests session.
+        
+        Args:
+            session: requests.Session to send the request with
+            url: Page URL, also the cache key
+            timeout: Request timeout in seconds
+            
+        Returns:
+            The current response and whether its body changed since the last
+            fetch; an unchanged entry still carries its stored parse
+        """
+        cached = self.get(url)
+        response = session.get(url, headers=self.conditional_headers(cached), timeout=timeout)
+        
+        if response.status_code == 304 and cached is not None:
+            self.mark_validated(url)
+            self.record(url, 'not_modified')
+            return cached, False
+        
+        response.raise_for_status()
+        entry = self.store(url, response.content, response.headers.get('ETag'),
+                           response.headers.get('Last-Modified'))
+        
+        if cached is not None and cached.body_hash == entry.body_hash:
+            # Re-sent without validators, but nothing in it changed
+            entry.parsed = cached.parsed
+            self.record(url, 'unchanged')
+            return entry, False
+        
+        self.record(url, 'new' if cached is None else 'changed')
+        return entry, True
+    
+    def record(self, url: str, outcome: str):
+        """
+        Count a lookup for its domain's hit rate.
+        
+        Args:
+            url: URL looked up
+            outcome: not_modified, unchanged or skipped (hits), new or changed
+        """
+        domain = urlsplit(url).netloc
+        with self._lock:
+            counts = self._domain_stats.setdefault(domain, {})
+            counts[outcome] = counts.get(outcome, 0) + 1
+    
+    def get_domain_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Lookup outcomes and hit rate per domain since startup"""
+        with self._lock:
+            stats = {}
+            for domain, counts in self._domain_stats.items():
+                lookups = sum(counts.values())
+                hits = sum(counts.get(outcome, 0) for outcome in HIT_OUTCOMES)
+                stats[domain] = {
+                    **counts,
+                    'lookups': lookups,
+                    'hits': hits,
+                    'hit_rate': round(hits / lookups, 3) if lookups else 0.0
+                }
+            return stats
+    
+    def mark_validated(self, url: str):
+        """Record that the server confirmed a stored response is current"""
+        self.connection.execute(
+            "UPDATE http_cache SET validated_at = ? WHERE url = ?", (datetime.now().isoformat(), url)
+        )
+        self.connection.commit()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Entry count, stored bytes and per-domain hit rates"""
+        entries, size = self.connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(body)), 0) FROM http_cache"
+        ).fetchone()
+        return {"entries": entries, "bytes": size, "domains": self.get_domain_stats()}
+
+
+# HTTP caches per database file
+_http_caches: Dict[str, HTTPCache] = {}
+_caches_lock = threading.Lock()
+
+def get_http_cache(db_path: str = "data/http_cache.db") -> HTTPCache:
+    """Get the HTTP response cache for a database file"""
+    key = str(Path(db_path).resolve())
+    with _caches_lock:
+        if key not in _http_caches:
+            _http_caches[key] = HTTPCache(key)
+        return _http_caches[key]
@@ -0,0 +1,302 @@
+"""
+Change-tracked deduplication for hearings_unified.
+Part of Phase 7A: Automated Data Synchronization
+
+Triggers log every hearing whose dedup-relevant fields change in
+dedup_changes, each with a rising sequence number. A dedup run handles only
+hearings changed since the previous run's watermark, comparing each against
+the committee/date-window candidates fetched by index, and stores every pair
+decision (match or not, with its factor scores) with fingerprints of the
+two hearings' parsed dedup fields. A pair is rescored only when one of
+those fingerprints differs, so rewrites that leave what dedup compares
+unchanged (such as a merge filling an empty JSON field) cost nothing.
+"""
+
+import json
+import hashlib
+import logging
+import sqlite3
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from .deduplication_engine import DATE_WINDOW_DAYS, DeduplicationEngine, DuplicationMatch, HearingProfile
+
+logger = logging.getLogger(__name__)
+
+# Fields the similarity factors read; changing any of them invalidates decisions
+DEDUP_FIELDS = ["committee_code", "hearing_title", "hearing_date", "location_info", "witnesses", "sync_status"]
+
+HEARING_COLUMNS = "h.id, h.committee_code, h.hearing_title, h.hearing_date, h.location_info, h.witnesses"
+
+ACTIVE_HEARING = "COALESCE(h.sync_status, '') NOT LIKE 'merged_into_%'"
+
+# Real YYYY-MM-DD dates, the ones the engine parses to a day; they sort as text,
+# so the window is an index range. date() rolls 2025-02-30 over to March and
+# returns NULL for anything else, so only valid dates come back unchanged.
+CANONICAL_DATE = "COALESCE(date(h.hearing_date, '+0 days') = h.hearing_date AND h.hearing_date >= '0001', 0)"
+
+DEDUP_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS dedup_changes (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        hearing_id INTEGER NOT NULL UNIQUE
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS dedup_decisions (
+        primary_id INTEGER NOT NULL,
+        secondary_id INTEGER NOT NULL,
+        primary_fingerprint TEXT NOT NULL,  -- profile_fingerprint of each hearing when scored
+        secondary_fingerprint TEXT NOT NULL,
+        similarity_score REAL NOT NULL,
+        confidence_level TEXT NOT NULL,
+        recommended_action TEXT NOT NULL,
+        match_factors TEXT NOT NULL,  -- JSON
+        decided_at TEXT NOT NULL,
+        PRIMARY KEY (primary_id, secondary_id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS dedup_runs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        sync_run_id TEXT,
+        watermark INTEGER NOT NULL,  -- Highest dedup_changes.seq handled
+        hearings_checked INTEGER DEFAULT 0,
+        pairs_scored INTEGER DEFAULT 0,
+        pairs_reused INTEGER DEFAULT 0,
+        auto_merged INTEGER DEFAULT 0,
+        manual_review INTEGER DEFAULT 0,
+        execution_time_seconds REAL,
+        completed_at TEXT DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_dedup_decisions_action ON dedup_decisions(recommended_action)",
+    "CREATE INDEX IF NOT EXISTS idx_hearings_committee_date ON hearings_unified(committee_code, hearing_date)"
+]
+
+_changed = " OR ".join(f"NEW.{field} IS NOT OLD.{field}" for field in DEDUP_FIELDS)
+
+DEDUP_TRIGGERS = {
+    "dedup_changes_ai": """
+        CREATE TRIGGER IF NOT EXISTS dedup_changes_ai AFTER INSERT ON hearings_unified BEGIN
+            INSERT OR REPLACE INTO dedup_changes (hearing_id) VALUES (NEW.id);
+        END
+    """,
+    "dedup_changes_au": f"""
+        CREATE TRIGGER IF NOT EXISTS dedup_changes_au
+        AFTER UPDATE OF {', '.join(DEDUP_FIELDS)} ON hearings_unified
+        WHEN {_changed} BEGIN
+            INSERT OR REPLACE INTO dedup_changes (hearing_id) VALUES (NEW.id);
+        END
+    """
+}
+
+
+def ensure_dedup_tracking(conn: sqlite3.Connection) -> bool:
+    """
+    Add the change log, decision and run tables and the change triggers.
+
+    Existing hearings are logged as changed when tracking is first added,
+    so the first run deduplicates them all.
+
+    Returns:
+        True if tracking was added
+    """
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'dedup_changes'"
+    ).fetchone() is not None
+
+    for sql in DEDUP_SCHEMA:
+        conn.execute(sql)
+    for sql in DEDUP_TRIGGERS.values():
+        conn.execute(sql)
+
+    if not exists:
+        conn.execute("INSERT INTO dedup_changes (hearing_id) SELECT id FROM hearings_unified ORDER BY id")
+        logger.info("Added dedup change tracking to hearings_unified")
+    return not exists
+
+
+def profile_fingerprint(profile: HearingProfile) -> str:
+    """Digest of everything the similarity factors read from a hearing"""
+    fields = [profile.committee_code, profile.day, profile.normalized_title, profile.time_info,
+              profile.room, profile.building, profile.has_witnesses, sorted(profile.witness_names)]
+    return hashlib.sha1(json.dumps(fields).encode()).hexdigest()
+
+
+def dedup_watermark(conn: sqlite3.Connection) -> int:
+    """Highest change sequence handled by a completed run"""
+    row = conn.execute("SELECT MAX(watermark) FROM dedup_runs").fetchone()
+    return row[0] or 0
+
+
+class IncrementalDeduplicator:
+    """Deduplicates only hearings changed since the last run"""
+
+    def __init__(self, db, engine: Optional[DeduplicationEngine] = None):
+        """
+        Initialize incremental deduplicator.
+
+        Args:
+            db: UnifiedHearingDatabase holding the hearings
+            engine: Similarity scoring and thresholds
+        """
+        self.db = db
+        self.engine = engine or DeduplicationEngine()
+        self._committee_rows: Dict[Any, Dict[str, List]] = {}
+
+    def run(self, sync_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Score changed hearings against their candidates, merge new
+        auto-merge matches and record the run's watermark.
+
+        Returns:
+            Run statistics
+        """
+        start_time = datetime.now()
+        conn = self.db.connection
+        watermark = dedup_watermark(conn)
+        head = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM dedup_changes").fetchone()[0]
+
+        changed = self._fetch(f"""
+            SELECT {HEARING_COLUMNS}
+            FROM dedup_changes c JOIN hearings_unified h ON h.id = c.hearing_id
+            WHERE c.seq > ? AND c.seq <= ? AND {ACTIVE_HEARING}
+            ORDER BY c.seq
+        """, (watermark, head))
+
+        self._committee_rows = {}
+        decided_at = datetime.now().isoformat()
+        seen = set()
+        decisions = []
+        matches: List[DuplicationMatch] = []
+        pairs_reused = 0
+
+        for hearing, profile, fingerprint in changed:
+            for other, other_profile, other_fingerprint in self._candidates(hearing, profile):
+                if other['id'] == hearing['id']:
+                    continue
+                key = (min(hearing['id'], other['id']), max(hearing['id'], other['id']))
+                if key in seen or not self.engine._profiles_compatible(profile, other_profile):
+                    continue
+                seen.add(key)
+
+                # Lower id is the primary, so a pair is always stored one way round
+                if hearing['id'] < other['id']:
+                    first, second = (hearing, profile, fingerprint), (other, other_profile, other_fingerprint)
+                else:
+                    first, second = (other, other_profile, other_fingerprint), (hearing, profile, fingerprint)
+
+                stored = conn.execute(
+                    "SELECT primary_fingerprint, secondary_fingerprint FROM dedup_decisions "
+                    "WHERE primary_id = ? AND secondary_id = ?", key
+                ).fetchone()
+                if stored is not None and tuple(stored) == (first[2], second[2]):
+                    pairs_reused += 1
+                    continue
+
+                match = self.engine._calculate_similarity(first[0], second[0], first[1], second[1])
+                decisions.append((
+                    match.primary_id, match.secondary_id, first[2], second[2], match.similarity_score,
+                    match.confidence_level, match.recommended_action, json.dumps(match.match_factors),
+                    decided_at
+                ))
+                if match.similarity_score >= self.engine.manual_review_threshold:
+                    matches.append(match)
+
+        conn.executemany("""
+            INSERT OR REPLACE INTO dedup_decisions (
+                primary_id, secondary_id, primary_fingerprint, secondary_fingerprint, similarity_score,
+                confidence_level, recommended_action, match_factors, decided_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, decisions)
+        conn.commit()
+
+        auto_merged, manual_review = self._apply(matches)
+
+        stats = {
+            'sync_run_id': sync_id,
+            'watermark': head,
+            'hearings_checked': len(changed),
+            'pairs_scored': len(decisions),
+            'pairs_reused': pairs_reused,
+            'auto_merged': auto_merged,
+            'manual_review': manual_review,
+            'execution_time_seconds': (datetime.now() - start_time).total_seconds()
+        }
+        conn.execute("""
+            INSERT INTO dedup_runs (
+                sync_run_id, watermark, hearings_checked, pairs_scored, pairs_reused,
+                auto_merged, manual_review, execution_time_seconds
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, (sync_id, head, stats['hearings_checked'], stats['pairs_scored'], pairs_reused,
+              auto_merged, manual_review, stats['execution_time_seconds']))
+        conn.commit()
+
+        logger.info(f"Incremental deduplication: {len(changed)} changed hearings, "
+                    f"{len(decisions)} pairs scored, {pairs_reused} reused, "
+                    f"{auto_merged} auto-merged, {manual_review} need manual review")
+        return stats
+
+    def _apply(self, matches: List[DuplicationMatch]) -> Tuple[int, int]:
+        """Merge auto-merge matches (best first) and log the ones needing review"""
+        merged = set()
+        auto_merged = 0
+        manual_review = 0
+
+        for match in sorted(matches, key=lambda m: m.similarity_score, reverse=True):
+            if match.primary_id in merged or match.secondary_id in merged:
+                continue
+
+            if match.recommended_action == 'auto_merge':
+                # Automatically merge high-confidence duplicates
+                self.db.merge_hearing_records(match.primary_id, match.secondary_id, match.similarity_score)
+                merged.add(match.secondary_id)
+                auto_merged += 1
+
+            elif match.recommended_action == 'manual_review':
+                # Log for manual review
+                logger.info(f"Manual review needed: hearings {match.primary_id} and {match.secondary_id} "
+                            f"(similarity: {match.similarity_score:.3f})")
+                manual_review += 1
+
+        return auto_merged, manual_review
+
+    def _fetch(self, sql: str, params: tuple) -> List[Tuple[Dict[str, Any], HearingProfile, str]]:
+        """Hearing rows with their profiles and profile fingerprints"""
+        rows = []
+        for row in self.db.connection.execute(sql, params).fetchall():
+            hearing = dict(row)
+            profile = self.engine.profile_hearing(hearing)
+            rows.append((hearing, profile, profile_fingerprint(profile)))
+        return rows
+
+    def _candidates(self, hearing: Dict[str, Any],
+                    profile: HearingProfile) -> List[Tuple[Dict[str, Any], HearingProfile, str]]:
+        """Active hearings the compatibility check could accept for this hearing"""
+        committee = hearing['committee_code']
+        if profile.day is None:
+            # Undated hearings are compatible with their whole committee
+            return self._committee(committee, 'all')
+
+        low = date.fromordinal(profile.day - DATE_WINDOW_DAYS).isoformat()
+        high = date.fromordinal(profile.day + DATE_WINDOW_DAYS).isoformat()
+        window = self._fetch(f"""
+            SELECT {HEARING_COLUMNS}
+            FROM hearings_unified h
+            WHERE h.committee_code = ? AND h.hearing_date BETWEEN ? AND ?
+            AND {CANONICAL_DATE} AND {ACTIVE_HEARING}
+        """, (committee, low, high))
+        return window + self._committee(committee, 'undated')
+
+    def _committee(self, committee: Any, which: str) -> List[Tuple[Dict[str, Any], HearingProfile, str]]:
+        """All of a committee's active hearings, or those without a canonical date, once per run"""
+        cached = self._committee_rows.setdefault(committee, {})
+        if which not in cached:
+            condition = "" if which == 'all' else f"AND NOT {CANONICAL_DATE}"
+            cached[which] = self._fetch(f"""
+                SELECT {HEARING_COLUMNS}
+                FROM hearings_unified h
+                WHERE h.committee_code = ? {condition} AND {ACTIVE_HEARING}
+            """, (committee,))
+        return cached[which]
@@ -14,8 +14,10 @@ from dataclasses import dataclass
 
 from .database_schema import UnifiedHearingDatabase
 from .congress_api_enhanced import CongressAPIEnhanced, HearingRecord
+from .congress_api_async import AsyncCongressAPI
 from .committee_scraper import CommitteeWebsiteScraper, ScrapedHearing
 from .deduplication_engine import DeduplicationEngine, DuplicationMatch
+from .incremental_dedup import IncrementalDeduplicator
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +44,7 @@ class SyncOrchestrator:
         self.congress_api = None  # Initialize only if API key available
         self.committee_scraper = CommitteeWebsiteScraper()
         self.dedup_engine = DeduplicationEngine()
+        self.incremental_dedup = IncrementalDeduplicator(self.db, self.dedup_engine)
         
         # Try to initialize Congress API
         try:
@@ -55,9 +58,11 @@ class SyncOrchestrator:
             'api_daily_sync_hour': 12,  # 12 PM ET (Congress.gov updates at noon)
             'website_sync_hours': [8, 14, 20],  # 8 AM, 2 PM, 8 PM
             'max_concurrent_committees': 3,
+            'api_max_connections': 10,  # pooled Congress API connections
             'retry_attempts': 3,
             'retry_delay': 30,  # seconds
-            'circuit_breaker_threshold': 5  # failures before disabling source
+            'circuit_breaker_threshold': 5,  # failures before disabling source
+            'incremental_dedup': True  # only hearings changed since the last dedup run
         }
         
         # Circuit breaker state
@@ -136,42 +141,47 @@ class SyncOrchestrator:
         logger.info(f"Starting Congress API sync for {len(committee_codes)} committees")
         results = {}
         
+        # Fetch every committee concurrently, paced by the shared API rate budget
+        fetch_start = time.time()
+        async with AsyncCongressAPI(
+            self.congress_api.api_key,
+            max_connections=self.sync_config['api_max_connections'],
+            base_url=self.congress_api.base_url
+        ) as client:
+            fetched = await client.fetch_committees(committee_codes, days_back=30)
+        fetch_time = time.time() - fetch_start
+        fetch_seconds = client.fetch_seconds
+        logger.info(f"Fetched {len(committee_codes)} committees from Congress API in {fetch_time:.2f}s: "
+                    f"{client.get_request_stats()}")
+        
         for committee_code in committee_codes:
-            start_time = time.time()
+            # Fetches overlapped, so each committee is charged its own fetch time
+            start_time = time.time() - fetch_seconds.get(committee_code, 0.0)
             
             try:
-                # Get hearings from API
-                hearings = self.congress_api.get_committee_meetings(committee_code, days_back=30)
+                hearings = fetched[committee_code]
+                if isinstance(hearings, Exception):
+                    raise hearings
                 
-                discovered = 0
-                updated = 0
                 errors = 0
+                hearing_batch = []
                 
                 for hearing in hearings:
                     try:
                         # Convert to database format
-                        hearing_data = self._convert_api_hearing(hearing)
-                        
-                        # Check for existing records
-                        duplicates = self.db.find_potential_duplicates(hearing_data)
-                        
-                        if duplicates and duplicates[0]['similarity_score'] > 0.8:
-                            # Update existing record
-                            self.db.update_hearing(
-                                duplicates[0]['id'], 
-                                hearing_data, 
-                                'congress_api'
-                            )
-                            updated += 1
-                        else:
-                            # Insert new record
-                            self.db.insert_hearing(hearing_data, 'congress_api')
-                            discovered += 1
-                    
+                        hearing_batch.append(self._convert_api_hearing(hearing))
                     except Exception as e:
                         logger.error(f"Error processing API hearing {hearing.congress_api_id}: {e}")
                         errors += 1
                 
+                # Match, insert and update the committee's hearings in one transaction
+                upsert = self.db.upsert_hearings(hearing_batch, 'congress_api')
+                discovered = upsert['discovered']
+                updated = upsert['updated']
+                errors += upsert['errors']
+                logger.info(f"API upsert for {committee_code}: {discovered} new, {updated} updated; " +
+                            ", ".join(f"{phase} {seconds:.3f}s" for phase, seconds in upsert['timings'].items()))
+                
                 execution_time = time.time() - start_time
                 
                 results[f"{committee_code}_api"] = SyncResult(
@@ -245,16 +255,32 @@ class SyncOrchestrator:
                         error_message=str(e)
                     )
         
+        logger.info(f"Website cache hit rates: {self.committee_scraper.cache.get_domain_stats()}")
+        
         return results
     
+    def _known_source_ids(self, committee_code: str) -> set:
+        """committee_source_id values already stored for a committee"""
+        
+        rows = self.db.connection.execute("""
+            SELECT committee_source_id FROM hearings_unified
+            WHERE committee_code = ? AND committee_source_id IS NOT NULL
+        """, (committee_code,)).fetchall()
+        
+        return {row[0] for row in rows}
+    
     def _scrape_single_committee(self, committee_code: str, sync_id: str) -> SyncResult:
         """Scrape hearings for a single committee"""
         
         start_time = time.time()
         
         try:
-            # Scrape committee hearings
-            hearings = self.committee_scraper.scrape_committee_hearings(committee_code, days_back=14)
+            # Scrape committee hearings, skipping pages of hearings already stored
+            hearings = self.committee_scraper.scrape_committee_hearings(
+                committee_code,
+                days_back=14,
+                known_source_ids=self._known_source_ids(committee_code)
+            )
             
             discovered = 0
             updated = 0
@@ -323,12 +349,24 @@ class SyncOrchestrator:
                 error_message=str(e)
             )
     
-    async def _run_deduplication(self, sync_id: str):
-        """Run deduplication on recent hearings"""
+    async def _run_deduplication(self, sync_id: str, incremental: Optional[bool] = None):
+        """
+        Run deduplication.
+        
+        Incremental runs score only hearings changed since the previous run
+        against their indexed candidates, reusing stored pair decisions; full
+        runs rescan all recent hearings.
+        """
         
         logger.info("Starting deduplication analysis")
         
+        if incremental is None:
+            incremental = self.sync_config['incremental_dedup']
+        
         try:
+            if incremental:
+                return self.incremental_dedup.run(sync_id)
+            
             # Get recent hearings (last 60 days)
             cursor = self.db.connection.cursor()
             cursor.execute("""
@@ -0,0 +1,202 @@
+"""
+Content-addressed cache of transcription results.
+
+Results are keyed by the SHA-256 of the audio bytes together with the model,
+prompt and language used, so re-transcribing identical audio (pipeline resets,
+retries, or two hearings sharing one stream) never calls Whisper again.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Any, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent.parent / 'data' / 'transcription_cache'
+
+
+class TranscriptionCache:
+    """On-disk JSON cache of transcription results with an LRU size cap."""
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_cache_bytes: int = 2 * 1024 ** 3):
+        """
+        Initialize transcription cache.
+
+        Args:
+            cache_dir: Directory for cached result files
+            max_cache_bytes: Total size above which least recently used results are evicted
+        """
+        self.cache_dir = Path(cache_dir or os.environ.get('TRANSCRIPTION_CACHE_DIR') or DEFAULT_CACHE_DIR)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_cache_bytes = max_cache_bytes
+        self.hash_block_size = 1024 * 1024
+
+        # Audio digests memoized by (path, size, mtime) so unchanged files are hashed once
+        self._digests: Dict[Tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+
+    def audio_digest(self, audio_path: Union[str, Path]) -> str:
+        """SHA-256 of an audio file's bytes."""
+        audio_path = Path(audio_path)
+        stat = audio_path.stat()
+        memo_key = (str(audio_path.resolve()), stat.st_size, stat.st_mtime_ns)
+
+        with self._lock:
+            digest = self._digests.get(memo_key)
+        if digest is not None:
+            return digest
+
+        sha256 = hashlib.sha256()
+        with open(audio_path, 'rb') as f:
+            for block in iter(lambda: f.read(self.hash_block_size), b''):
+                sha256.update(block)
+        digest = sha256.hexdigest()
+
+        with self._lock:
+            self._digests[memo_key] = digest
+        return digest
+
+    def make_key(
+        self,
+        audio_path: Union[str, Path],
+        model: str,
+        prompt: Optional[str] = None,
+        language: Optional[str] = None
+    ) -> str:
+        """
+        Cache key for transcribing an audio file with given settings.
+
+        Args:
+            audio_path: Path to the exact audio bytes sent for transcription
+            model: Model identifier (API model name or local model size)
+            prompt: Prompt passed to the model, if any
+            language: Language code passed to the model, if any
+
+        Returns:
+            Hex digest identifying the result
+        """
+        raw = json.dumps([self.audio_digest(audio_path), model, prompt or '', language or ''])
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached result.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Cached result, or None on a miss
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'r') as f:
+                result = json.load(f)
+        except FileNotFoundError:
+            with self._lock:
+                self.stats["misses"] += 1
+            return None
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Discarding unreadable transcription cache entry {key}: {e}")
+            entry_path.unlink(missing_ok=True)
+            with self._lock:
+                self.stats["misses"] += 1
+            return None
+
+        try:
+            os.utime(entry_path)  # Mark as recently used for eviction
+        except FileNotFoundError:
+            pass
+
+        with self._lock:
+            self.stats["hits"] += 1
+        return result
+
+    def put(self, key: str, result: Dict[str, Any]):
+        """
+        Store a result.
+
+        Args:
+            key: Key from make_key
+            result: JSON-serializable transcription result
+        """
+        entry_path = self._entry_path(key)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = entry_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(result, f, default=self._json_default)
+            # Atomic rename so concurrent readers never see a partial result
+            tmp_path.replace(entry_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+        with self._lock:
+            self.stats["writes"] += 1
+            self._evict(keep=entry_path)
+
+    @staticmethod
+    def _json_default(value):
+        """Serialize numpy scalars/arrays returned by local Whisper."""
+        if hasattr(value, 'tolist'):
+            return value.tolist()
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    def _evict(self, keep: Path):
+        """Remove least recently used results until the cache fits its size cap."""
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        if total <= self.max_cache_bytes:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_cache_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                path.unlink()
+                total -= size
+                self.stats["evictions"] += 1
+            except FileNotFoundError:
+                continue
+
+    def invalidate(self, key: str):
+        """Drop a cached result."""
+        self._entry_path(key).unlink(missing_ok=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss statistics."""
+        return {
+            **self.stats,
+            "cache_dir": str(self.cache_dir)
+        }
+
+# Global transcription cache instance
+_transcription_cache = None
+
+def get_transcription_cache() -> TranscriptionCache:
+    """Get transcription cache singleton."""
+    global _transcription_cache
+    if _transcription_cache is None:
+        _transcription_cache = TranscriptionCache()
+    return _transcription_cache
@@ -12,6 +12,11 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
 import json
 
+try:
+    from .result_cache import get_transcription_cache
+except ImportError:
+    from transcription.result_cache import get_transcription_cache
+
 # Note: Hearing import handled dynamically to avoid circular imports
 
 
@@ -35,6 +40,9 @@ class WhisperTranscriber:
         self.model_size = model_size
         self.model = None
         
+        # Results keyed by audio content so re-transcription skips the model
+        self.result_cache = get_transcription_cache()
+        
         # Model performance characteristics for congressional use
         self.model_specs = {
             "tiny": {"speed": "fastest", "accuracy": "lowest", "vram": "~39MB"},
@@ -81,9 +89,6 @@ class WhisperTranscriber:
         Returns:
             Dictionary with transcription results and metadata
         """
-        # Ensure model is loaded
-        self.load_model()
-        
         audio_path = Path(audio_path)
         if not audio_path.exists():
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
@@ -102,15 +107,28 @@ class WhisperTranscriber:
         start_time = time.time()
         
         try:
-            # Whisper transcription with congressional optimizations
-            result = self.model.transcribe(
-                str(audio_path),
-                language=language,
-                initial_prompt=initial_prompt,
-                verbose=False,
-                word_timestamps=True,  # Enable word-level timestamps
-                condition_on_previous_text=True  # Better coherence for long hearings
+            cache_key = self.result_cache.make_key(
+                audio_path, f"local-whisper-{self.model_size}", initial_prompt, language
             )
+            result = self.result_cache.get(cache_key)
+            cached = result is not None
+            
+            if cached:
+                self.logger.info("Using cached transcription for identical audio")
+            else:
+                # Ensure model is loaded
+                self.load_model()
+                
+                # Whisper transcription with congressional optimizations
+                result = self.model.transcribe(
+                    str(audio_path),
+                    language=language,
+                    initial_prompt=initial_prompt,
+                    verbose=False,
+                    word_timestamps=True,  # Enable word-level timestamps
+                    condition_on_previous_text=True  # Better coherence for long hearings
+                )
+                self.result_cache.put(cache_key, result)
             
             transcription_time = time.time() - start_time
             audio_duration = result.get('duration', 0)
@@ -136,7 +154,8 @@ class WhisperTranscriber:
                     'speed_ratio': speed_ratio,
                     'initial_prompt': initial_prompt,
                     'word_timestamps': True,
-                    'whisper_version': whisper.__version__
+                    'whisper_version': whisper.__version__,
+                    'cached_result': cached
                 },
                 'quality_metrics': self._calculate_quality_metrics(result)
             }
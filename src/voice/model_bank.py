@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Speaker Model Bank for Phase 6B
+
+Resident, stacked representation of every speaker voice model:
+- Loads all GMMs, scaler statistics and baseline likelihoods once
+- Scores one feature vector or a batch of N against all K models in a
+  single vectorized log-likelihood computation
+- Reloads only when model files change (mtime) or the bank is invalidated
+"""
+
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Tuple
+
+import numpy as np
+import joblib
+
+
+logger = logging.getLogger(__name__)
+
+
+def safe_model_name(senator_name: str) -> str:
+    """File-system name used for a senator's voice model files."""
+    return senator_name.replace(' ', '_').replace('.', '_')
+
+
+class SpeakerModelBank:
+    """All speaker GMMs stacked into padded numpy arrays for vectorized scoring."""
+
+    def __init__(self, models_dir: Path, check_interval: float = 5.0, batch_rows: int = 64):
+        """Initialize speaker model bank."""
+        self.models_dir = models_dir
+        self.check_interval = check_interval  # Seconds between model file mtime checks
+        self.batch_rows = batch_rows  # Rows scored per chunk to bound memory
+
+        self.version = 0
+        self._lock = threading.RLock()
+        self._stale = True
+        self._last_check = 0.0
+        self._signature: Dict[str, Tuple[int, int]] = {}
+
+        self._reset_arrays()
+
+    def _reset_arrays(self):
+        """Clear the stacked model arrays."""
+        self.safe_names: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.metadata: List[Dict[str, Any]] = []
+        self.feature_dimension = 0
+
+        self.scaler_means = np.empty((0, 0))        # (K, D)
+        self.scaler_scales = np.empty((0, 0))       # (K, D)
+        self.log_weights = np.empty((0, 0))         # (K, C) padded with -inf
+        self.means = np.empty((0, 0, 0))            # (K, C, D)
+        self.precisions_cholesky = np.empty((0, 0, 0, 0))  # (K, C, D, D)
+        self.log_det_cholesky = np.empty((0, 0))    # (K, C)
+        self.baselines = np.empty(0)                # (K,)
+        self.training_samples = np.empty(0, dtype=int)
+
+    def invalidate(self):
+        """Force a reload on next use (called after models are rebuilt)."""
+        with self._lock:
+            self._stale = True
+
+    def _model_files(self) -> Dict[str, Tuple[Path, Path]]:
+        """Metadata/GMM file pairs for every saved model."""
+        files = {}
+        for metadata_path in self.models_dir.glob("*_model.json"):
+            safe_name = metadata_path.stem[:-len('_model')]
+            gmm_path = self.models_dir / f"{safe_name}_gmm.joblib"
+            if gmm_path.exists():
+                files[safe_name] = (metadata_path, gmm_path)
+        return files
+
+    def _current_signature(self, files: Dict[str, Tuple[Path, Path]]) -> Dict[str, Tuple[int, int]]:
+        """Modification times of all model files, used to detect changes."""
+        signature = {}
+        for safe_name, (metadata_path, gmm_path) in files.items():
+            try:
+                signature[safe_name] = (metadata_path.stat().st_mtime_ns, gmm_path.stat().st_mtime_ns)
+            except FileNotFoundError:
+                continue
+        return signature
+
+    def ensure_loaded(self):
+        """Reload the bank if it was invalidated or any model file changed on disk."""
+        with self._lock:
+            now = time.monotonic()
+            if not self._stale and now - self._last_check < self.check_interval:
+                return
+
+            self._last_check = now
+            files = self._model_files()
+            signature = self._current_signature(files)
+
+            if self._stale or signature != self._signature:
+                self._load(files, signature)
+
+    def _load(self, files: Dict[str, Tuple[Path, Path]], signature: Dict[str, Tuple[int, int]]):
+        """Load every model from disk and stack it into padded arrays."""
+        loaded = []
+        for safe_name in sorted(files):
+            metadata_path, gmm_path = files[safe_name]
+            try:
+                with open(metadata_path, 'r') as f:
+                    voice_model = json.load(f)
+                model_data = joblib.load(gmm_path)
+                loaded.append((safe_name, voice_model, model_data))
+            except Exception as e:
+                logger.error(f"Error loading speaker model {safe_name}: {e}")
+
+        self._reset_arrays()
+
+        # All models must share the feature dimension of the extractor
+        dimensions = [np.asarray(data['gmm'].means_).shape[1] for _, _, data in loaded]
+        if dimensions:
+            self.feature_dimension = max(set(dimensions), key=dimensions.count)
+            skipped = [name for (name, _, _), dim in zip(loaded, dimensions) if dim != self.feature_dimension]
+            if skipped:
+                logger.warning(f"Skipping speaker models with mismatched feature dimension: {skipped}")
+            loaded = [entry for entry, dim in zip(loaded, dimensions) if dim == self.feature_dimension]
+
+        if loaded:
+            n_models = len(loaded)
+            n_dims = self.feature_dimension
+            n_components = max(data['gmm'].n_components for _, _, data in loaded)
+
+            self.scaler_means = np.zeros((n_models, n_dims))
+            self.scaler_scales = np.ones((n_models, n_dims))
+            self.log_weights = np.full((n_models, n_components), -np.inf)
+            self.means = np.zeros((n_models, n_components, n_dims))
+            self.precisions_cholesky = np.tile(np.eye(n_dims), (n_models, n_components, 1, 1))
+            self.log_det_cholesky = np.zeros((n_models, n_components))
+            self.baselines = np.zeros(n_models)
+            self.training_samples = np.zeros(n_models, dtype=int)
+
+            for k, (safe_name, voice_model, model_data) in enumerate(loaded):
+                gmm = model_data['gmm']
+                n = gmm.n_components
+                precisions_cholesky = self._full_precisions_cholesky(gmm, n_dims)
+
+                self.scaler_means[k] = model_data['scaler_mean']
+                self.scaler_scales[k] = model_data['scaler_scale']
+                self.log_weights[k, :n] = np.log(gmm.weights_)
+                self.means[k, :n] = gmm.means_
+                self.precisions_cholesky[k, :n] = precisions_cholesky
+                self.log_det_cholesky[k, :n] = np.sum(
+                    np.log(np.diagonal(precisions_cholesky, axis1=1, axis2=2)), axis=1
+                )
+                self.baselines[k] = voice_model.get('log_likelihood', -100)
+                self.training_samples[k] = voice_model.get('training_samples', 0)
+
+                self.safe_names.append(safe_name)
+                self.index[safe_name] = k
+                self.metadata.append(voice_model)
+
+        self._signature = signature
+        self._stale = False
+        self.version += 1
+        logger.info(f"Loaded {len(self.safe_names)} speaker models into model bank (version {self.version})")
+
+    @staticmethod
+    def _full_precisions_cholesky(gmm, n_dims: int) -> np.ndarray:
+        """Per-component precision Cholesky factors as (C, D, D) for any covariance type."""
+        precisions_cholesky = np.asarray(gmm.precisions_cholesky_)
+        n = gmm.n_components
+
+        if gmm.covariance_type == 'full':
+            return precisions_cholesky
+        if gmm.covariance_type == 'tied':
+            return np.tile(precisions_cholesky, (n, 1, 1))
+        if gmm.covariance_type == 'diag':
+            return np.stack([np.diag(row) for row in precisions_cholesky])
+        # spherical
+        return np.stack([np.eye(n_dims) * value for value in precisions_cholesky])
+
+    def __len__(self) -> int:
+        self.ensure_loaded()
+        return len(self.safe_names)
+
+    def has_model(self, senator_name: str) -> bool:
+        """Whether a model is loaded for a senator."""
+        self.ensure_loaded()
+        return safe_model_name(senator_name) in self.index
+
+    def score_samples(
+        self,
+        feature_matrix: np.ndarray,
+        model_indices: Optional[List[int]] = None
+    ) -> np.ndarray:
+        """
+        Per-sample log-likelihood of N feature vectors under K models.
+
+        Args:
+            feature_matrix: (N, D) or (D,) raw (unnormalized) feature vectors
+            model_indices: Subset of bank indices to score (all models if None)
+
+        Returns:
+            (N, K) array of log-likelihoods, equivalent to gmm.score_samples per model
+        """
+        self.ensure_loaded()
+
+        X = np.atleast_2d(np.asarray(feature_matrix, dtype=np.float64))
+        if model_indices is None:
+            model_indices = list(range(len(self.safe_names)))
+
+        if len(X) == 0 or not model_indices:
+            return np.zeros((len(X), len(model_indices)))
+
+        idx = np.asarray(model_indices)
+        scaler_means = self.scaler_means[idx]
+        scaler_scales = self.scaler_scales[idx]
+        log_weights = self.log_weights[idx]
+        precisions_cholesky = self.precisions_cholesky[idx]
+        log_det = self.log_det_cholesky[idx]
+
+        # Project component means once: (K, C, D)
+        projected_means = np.einsum('kcd,kcde->kce', self.means[idx], precisions_cholesky)
+        log_norm = -0.5 * self.feature_dimension * np.log(2 * np.pi)
+
+        scores = np.empty((len(X), len(idx)))
+        for start in range(0, len(X), self.batch_rows):
+            chunk = X[start:start + self.batch_rows]
+
+            # Each model normalizes with its own scaler: (K, n, D)
+            normalized = (chunk[None, :, :] - scaler_means[:, None, :]) / scaler_scales[:, None, :]
+
+            # Mahalanobis terms for every model/component/sample: (K, C, n)
+            projected = np.einsum('knd,kcde->kcne', normalized, precisions_cholesky)
+            projected -= projected_means[:, :, None, :]
+            log_prob = log_norm - 0.5 * np.sum(projected ** 2, axis=3) + log_det[:, :, None]
+
+            # Mixture log-likelihood via logsumexp over components
+            weighted = log_prob + log_weights[:, :, None]
+            peak = np.max(weighted, axis=1, keepdims=True)
+            log_likelihood = peak[:, 0, :] + np.log(np.sum(np.exp(weighted - peak), axis=1))
+
+            scores[start:start + len(chunk)] = log_likelihood.T
+
+        return scores
+
+    def score_candidates(
+        self,
+        feature_matrix: np.ndarray,
+        candidate_senators: Optional[List[str]] = None
+    ) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Score feature vectors against the named candidates that have models.
+
+        Returns:
+            (candidate names, (N, K) log-likelihoods, (K,) baselines, (K,) training samples)
+        """
+        self.ensure_loaded()
+
+        if candidate_senators is None:
+            candidate_senators = [
+                model.get('senator_name') or name.replace('_', ' ')
+                for name, model in zip(self.safe_names, self.metadata)
+            ]
+
+        names = []
+        indices = []
+        for senator_name in candidate_senators:
+            model_index = self.index.get(safe_model_name(senator_name))
+            if model_index is not None:
+                names.append(senator_name)
+                indices.append(model_index)
+
+        scores = self.score_samples(feature_matrix, indices)
+        return names, scores, self.baselines[indices], self.training_samples[indices]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get bank size and reload version."""
+        return {
+            'loaded_models': len(self.safe_names),
+            'feature_dimension': self.feature_dimension,
+            'version': self.version
+        }
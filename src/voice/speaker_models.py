@@ -374,52 +374,137 @@ class SpeakerModelManager:
             # Extract features from audio segment
             features = self.voice_processor.extract_voice_features(audio_segment_path)
             
-            if not features:
-                return {
-                    'recognized_speaker': None,
-                    'confidence_score': 0.0,
-                    'error': 'Feature extraction failed'
-                }
+            return self._recognize_from_features(features, str(audio_segment_path), candidate_senators)
+            
+        except Exception as e:
+            logger.error(f"Error recognizing speaker in {audio_segment_path}: {e}")
+            return {
+                'recognized_speaker': None,
+                'confidence_score': 0.0,
+                'error': str(e)
+            }
+    
+    def recognize_speaker_in_samples(
+        self, 
+        samples: np.ndarray,
+        sample_rate: int,
+        segment_id: str,
+        candidate_senators: List[str] = None
+    ) -> Dict[str, Any]:
+        """Recognize speaker in in-memory audio samples using voice models."""
+        try:
+            features = self.voice_processor.extract_voice_features_from_samples(
+                samples, sample_rate, segment_id
+            )
+            
+            return self._recognize_from_features(features, segment_id, candidate_senators)
             
-            # Identify speaker
-            similarities = self.voice_processor.identify_speaker(
-                features['feature_vector'], 
+        except Exception as e:
+            logger.error(f"Error recognizing speaker in {segment_id}: {e}")
+            return {
+                'recognized_speaker': None,
+                'confidence_score': 0.0,
+                'error': str(e)
+            }
+    
+    def recognize_feature_matrix(
+        self,
+        feature_matrix: np.ndarray,
+        segment_ids: List[str],
+        candidate_senators: List[str] = None,
+        quality_scores: List[float] = None
+    ) -> List[Dict[str, Any]]:
+        """Recognize speakers for a stacked feature matrix and record all results in one transaction."""
+        try:
+            quality_scores = quality_scores or [0.0] * len(segment_ids)
+            
+            all_similarities = self.voice_processor.identify_speakers_batch(
+                feature_matrix, 
                 candidate_senators
             )
             
-            if not similarities:
-                return {
-                    'recognized_speaker': None,
-                    'confidence_score': 0.0,
-                    'error': 'No speaker models available'
-                }
+            results = []
+            to_save = []
             
-            # Get best match
-            best_match = similarities[0]
+            for segment_id, similarities, quality in zip(segment_ids, all_similarities, quality_scores):
+                if not similarities:
+                    results.append({
+                        'recognized_speaker': None,
+                        'confidence_score': 0.0,
+                        'error': 'No speaker models available'
+                    })
+                    continue
+                
+                best_match = similarities[0]
+                results.append({
+                    'recognized_speaker': best_match['senator_name'],
+                    'confidence_score': best_match['similarity_score'],
+                    'confidence_level': best_match['confidence_level'],
+                    'all_similarities': similarities,
+                    'audio_quality': quality
+                })
+                to_save.append((len(results) - 1, segment_id, similarities))
             
-            # Save recognition result
-            result_id = self._save_recognition_result(audio_segment_path, similarities)
+            # Save recognition results
+            result_ids = self._save_recognition_results([(sid, sims) for _, sid, sims in to_save])
+            for (result_index, _, _), result_id in zip(to_save, result_ids):
+                results[result_index]['result_id'] = result_id
             
-            return {
-                'recognized_speaker': best_match['senator_name'],
-                'confidence_score': best_match['similarity_score'],
-                'confidence_level': best_match['confidence_level'],
-                'all_similarities': similarities,
-                'result_id': result_id,
-                'audio_quality': features.get('quality_score', 0.0)
-            }
+            return results
             
         except Exception as e:
-            logger.error(f"Error recognizing speaker in {audio_segment_path}: {e}")
-            return {
+            logger.error(f"Error in batch speaker recognition: {e}")
+            return [{
                 'recognized_speaker': None,
                 'confidence_score': 0.0,
                 'error': str(e)
+            } for _ in segment_ids]
+    
+    def _recognize_from_features(
+        self,
+        features: Optional[Dict[str, Any]],
+        segment_id: str,
+        candidate_senators: List[str] = None
+    ) -> Dict[str, Any]:
+        """Match extracted voice features against speaker models and record the result."""
+        if not features:
+            return {
+                'recognized_speaker': None,
+                'confidence_score': 0.0,
+                'error': 'Feature extraction failed'
+            }
+        
+        # Identify speaker
+        similarities = self.voice_processor.identify_speaker(
+            features['feature_vector'], 
+            candidate_senators
+        )
+        
+        if not similarities:
+            return {
+                'recognized_speaker': None,
+                'confidence_score': 0.0,
+                'error': 'No speaker models available'
             }
+        
+        # Get best match
+        best_match = similarities[0]
+        
+        # Save recognition result
+        result_id = self._save_recognition_result(segment_id, similarities)
+        
+        return {
+            'recognized_speaker': best_match['senator_name'],
+            'confidence_score': best_match['similarity_score'],
+            'confidence_level': best_match['confidence_level'],
+            'all_similarities': similarities,
+            'result_id': result_id,
+            'audio_quality': features.get('quality_score', 0.0)
+        }
     
     def _save_recognition_result(
         self, 
-        audio_segment_path: Path, 
+        audio_segment_id: str, 
         similarities: List[Dict[str, Any]]
     ) -> str:
         """Save speaker recognition result to database."""
@@ -437,7 +522,7 @@ class SpeakerModelManager:
                     "VALUES (?, ?, ?, ?, ?, ?)",
                     (
                         result_id,
-                        str(audio_segment_path),
+                        str(audio_segment_id),
                         best_match.get('senator_name'),
                         best_match.get('similarity_score', 0.0),
                         json.dumps(similarities),
@@ -451,6 +536,48 @@ class SpeakerModelManager:
             logger.error(f"Error saving recognition result: {e}")
             return ""
     
+    def _save_recognition_results(
+        self, 
+        results: List[Tuple[str, List[Dict[str, Any]]]]
+    ) -> List[str]:
+        """Save many speaker recognition results in a single transaction."""
+        try:
+            if not results:
+                return []
+            
+            batch_stamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+            timestamp = datetime.now().isoformat()
+            
+            rows = []
+            result_ids = []
+            for index, (audio_segment_id, similarities) in enumerate(results):
+                result_id = f"recognition_{batch_stamp}_{index:05d}"
+                best_match = similarities[0] if similarities else {}
+                rows.append((
+                    result_id,
+                    str(audio_segment_id),
+                    best_match.get('senator_name'),
+                    best_match.get('similarity_score', 0.0),
+                    json.dumps(similarities),
+                    timestamp
+                ))
+                result_ids.append(result_id)
+            
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executemany(
+                    "INSERT INTO recognition_results "
+                    "(id, audio_segment_id, recognized_speaker, confidence_score, "
+                    "similarity_scores, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+            
+            return result_ids
+            
+        except Exception as e:
+            logger.error(f"Error saving recognition results: {e}")
+            return [""] * len(results)
+    
     def integrate_with_phase6a_corrections(self) -> Dict[str, Any]:
         """Integrate with Phase 6A human corrections for learning."""
         try:
@@ -26,6 +26,12 @@ except ImportError:
     sys.path.append(str(Path(__file__).parent.parent))
     from enrichment.transcript_enricher import TranscriptEnricher
 
+try:
+    from ..audio.pcm_cache import DecodedAudio, get_pcm_cache
+except ImportError:
+    # Fallback for testing
+    from audio.pcm_cache import DecodedAudio, get_pcm_cache
+
 
 logger = logging.getLogger(__name__)
 
@@ -66,47 +72,29 @@ class VoiceMatcher:
             
             enhanced_segments = []
             
+            # Decode the hearing once; segments are sliced from the shared buffer
+            pcm = get_pcm_cache().get(audio_file)
+            
             for segment in transcript_segments:
                 try:
                     # Extract audio segment
                     segment_audio = self._extract_audio_segment(
-                        audio_file, 
+                        pcm, 
                         segment.get('start', 0), 
                         segment.get('end', 0)
                     )
                     
-                    if segment_audio:
+                    if segment_audio is not None:
                         # Get voice-based identification
                         voice_result = self._identify_speaker_by_voice(
                             segment_audio, 
-                            hearing_context
-                        )
-                        
-                        # Get text-based identification (existing system)
-                        text_result = self._identify_speaker_by_text(
-                            segment, 
-                            hearing_context
+                            hearing_context,
+                            segment_id=self._segment_id(audio_file, segment)
                         )
                         
-                        # Combine voice and text identification
-                        combined_result = self._combine_identification_results(
-                            voice_result, 
-                            text_result, 
-                            segment
+                        enhanced_segments.append(
+                            self._build_enhanced_segment(segment, voice_result, hearing_context)
                         )
-                        
-                        # Update segment with enhanced identification
-                        enhanced_segment = segment.copy()
-                        enhanced_segment.update({
-                            'voice_identification': voice_result,
-                            'text_identification': text_result,
-                            'enhanced_speaker': combined_result['speaker'],
-                            'enhanced_confidence': combined_result['confidence'],
-                            'identification_method': combined_result['method'],
-                            'identification_sources': combined_result['sources']
-                        })
-                        
-                        enhanced_segments.append(enhanced_segment)
                     else:
                         # No audio available, use original segment
                         enhanced_segments.append(segment)
@@ -122,16 +110,103 @@ class VoiceMatcher:
             logger.error(f"Error enhancing speaker identification: {e}")
             return transcript_segments  # Return original segments on error
     
+    def enhance_speaker_identification_batch(
+        self,
+        audio_file: Path,
+        transcript_segments: List[Dict[str, Any]],
+        hearing_context: Dict[str, Any] = None
+    ) -> List[Dict[str, Any]]:
+        """Enhance speaker identification for all segments in one batched pass."""
+        try:
+            logger.info(f"Batch enhancing speaker identification for {audio_file} "
+                       f"({len(transcript_segments)} segments)")
+            
+            # Decode once and extract features for every usable segment as a stacked matrix
+            pcm = get_pcm_cache().get(audio_file)
+            spans = [(segment.get('start', 0), segment.get('end', 0)) for segment in transcript_segments]
+            extraction = self.voice_processor.extract_feature_matrix(pcm, spans)
+            
+            indices = extraction['indices']
+            segment_ids = [self._segment_id(audio_file, transcript_segments[i]) for i in indices]
+            
+            # Score all segments in one pass and record results in a single transaction
+            recognition_results = []
+            if indices:
+                recognition_results = self.model_manager.recognize_feature_matrix(
+                    extraction['feature_matrix'],
+                    segment_ids,
+                    self._get_candidate_speakers(hearing_context),
+                    extraction['quality_scores']
+                )
+            voice_results = dict(zip(indices, recognition_results))
+            
+            enhanced_segments = []
+            for index, segment in enumerate(transcript_segments):
+                try:
+                    recognition_result = voice_results.get(index)
+                    if recognition_result is None:
+                        # No usable audio, use original segment
+                        enhanced_segments.append(segment)
+                        continue
+                    
+                    voice_result = self._voice_result_from_recognition(recognition_result)
+                    enhanced_segments.append(
+                        self._build_enhanced_segment(segment, voice_result, hearing_context)
+                    )
+                
+                except Exception as e:
+                    logger.error(f"Error enhancing segment {segment.get('id', 'unknown')}: {e}")
+                    enhanced_segments.append(segment)
+            
+            logger.info(f"Batch enhanced {len(voice_results)} of {len(enhanced_segments)} segments "
+                       f"with voice recognition")
+            return enhanced_segments
+            
+        except Exception as e:
+            logger.error(f"Error in batch speaker identification: {e}")
+            return transcript_segments  # Return original segments on error
+    
+    def _build_enhanced_segment(
+        self,
+        segment: Dict[str, Any],
+        voice_result: Dict[str, Any],
+        hearing_context: Dict[str, Any] = None
+    ) -> Dict[str, Any]:
+        """Combine voice and text identification into an enhanced copy of a segment."""
+        # Get text-based identification (existing system)
+        text_result = self._identify_speaker_by_text(
+            segment, 
+            hearing_context
+        )
+        
+        # Combine voice and text identification
+        combined_result = self._combine_identification_results(
+            voice_result, 
+            text_result, 
+            segment
+        )
+        
+        # Update segment with enhanced identification
+        enhanced_segment = segment.copy()
+        enhanced_segment.update({
+            'voice_identification': voice_result,
+            'text_identification': text_result,
+            'enhanced_speaker': combined_result['speaker'],
+            'enhanced_confidence': combined_result['confidence'],
+            'identification_method': combined_result['method'],
+            'identification_sources': combined_result['sources']
+        })
+        
+        return enhanced_segment
+    
     def _extract_audio_segment(
         self, 
-        audio_file: Path, 
+        pcm: DecodedAudio, 
         start_time: float, 
         end_time: float
-    ) -> Optional[Path]:
-        """Extract audio segment for voice analysis."""
+    ) -> Optional[np.ndarray]:
+        """Extract audio segment for voice analysis as float samples."""
         try:
-            import subprocess
-            
             if end_time <= start_time:
                 return None
             
@@ -139,64 +214,41 @@ class VoiceMatcher:
             if duration < 1.0:  # Too short for reliable voice recognition
                 return None
             
-            # Create temporary segment file
-            segment_file = Path(f"/tmp/segment_{start_time}_{end_time}.wav")
-            
-            # Use ffmpeg to extract segment
-            cmd = [
-                'ffmpeg',
-                '-i', str(audio_file),
-                '-ss', str(start_time),
-                '-t', str(duration),
-                '-ac', '1',  # Mono
-                '-ar', '16000',  # 16kHz sample rate
-                '-y',  # Overwrite
-                str(segment_file)
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode == 0 and segment_file.exists():
-                return segment_file
-            else:
-                logger.error(f"ffmpeg error: {result.stderr}")
+            samples = pcm.slice_float(start_time, end_time)
+            
+            if len(samples) == 0:
                 return None
             
+            return samples
+            
         except Exception as e:
             logger.error(f"Error extracting audio segment: {e}")
             return None
     
+    def _segment_id(self, audio_file: Path, segment: Dict[str, Any]) -> str:
+        """Identifier recorded with recognition results for a transcript segment."""
+        return f"{audio_file}:segment_{segment.get('start', 0)}_{segment.get('end', 0)}"
+    
     def _identify_speaker_by_voice(
         self, 
-        audio_segment: Path, 
-        hearing_context: Dict[str, Any] = None
+        audio_segment: np.ndarray, 
+        hearing_context: Dict[str, Any] = None,
+        segment_id: str = ''
     ) -> Dict[str, Any]:
         """Identify speaker using voice recognition."""
         try:
             # Get candidate speakers from hearing context
             candidate_speakers = self._get_candidate_speakers(hearing_context)
             
-            # Perform voice recognition
-            recognition_result = self.model_manager.recognize_speaker_in_audio(
+            # Perform voice recognition on the in-memory samples
+            recognition_result = self.model_manager.recognize_speaker_in_samples(
                 audio_segment, 
+                self.voice_processor.sample_rate,
+                segment_id,
                 candidate_speakers
             )
             
-            # Clean up temporary file
-            try:
-                audio_segment.unlink()
-            except:
-                pass
-            
-            return {
-                'method': 'voice_recognition',
-                'speaker': recognition_result.get('recognized_speaker'),
-                'confidence': recognition_result.get('confidence_score', 0.0),
-                'confidence_level': recognition_result.get('confidence_level', 'very_low'),
-                'all_similarities': recognition_result.get('all_similarities', []),
-                'audio_quality': recognition_result.get('audio_quality', 0.0),
-                'error': recognition_result.get('error')
-            }
+            return self._voice_result_from_recognition(recognition_result)
             
         except Exception as e:
             logger.error(f"Error in voice-based speaker identification: {e}")
@@ -207,6 +259,18 @@ class VoiceMatcher:
                 'error': str(e)
             }
     
+    def _voice_result_from_recognition(self, recognition_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Shape a model manager recognition result as a voice identification result."""
+        return {
+            'method': 'voice_recognition',
+            'speaker': recognition_result.get('recognized_speaker'),
+            'confidence': recognition_result.get('confidence_score', 0.0),
+            'confidence_level': recognition_result.get('confidence_level', 'very_low'),
+            'all_similarities': recognition_result.get('all_similarities', []),
+            'audio_quality': recognition_result.get('audio_quality', 0.0),
+            'error': recognition_result.get('error')
+        }
+    
     def _identify_speaker_by_text(
         self, 
         segment: Dict[str, Any], 
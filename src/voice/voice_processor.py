@@ -23,6 +23,16 @@ from sklearn.mixture import GaussianMixture
 from sklearn.preprocessing import StandardScaler
 import joblib
 
+from .model_bank import SpeakerModelBank
+
+try:
+    from ..audio.pcm_cache import DecodedAudio, get_pcm_cache, to_float
+except ImportError:
+    # Fallback for testing
+    import sys
+    sys.path.append(str(Path(__file__).parent.parent))
+    from audio.pcm_cache import DecodedAudio, get_pcm_cache, to_float
+
 
 logger = logging.getLogger(__name__)
 
@@ -59,17 +69,39 @@ class VoiceProcessor:
         
         # Feature scaler for normalization
         self.scaler = StandardScaler()
+        
+        # Resident stacked models for vectorized scoring
+        self.model_bank = SpeakerModelBank(self.models_dir)
     
     def extract_voice_features(self, audio_file: Path) -> Dict[str, Any]:
         """Extract comprehensive voice features from audio file."""
         try:
             logger.info(f"Extracting voice features from {audio_file}")
             
-            # Load audio
-            y, sr = librosa.load(audio_file, sr=self.sample_rate)
+            # Load audio from the shared decoded PCM (16kHz mono)
+            pcm = get_pcm_cache().get(audio_file)
+            y = to_float(pcm.samples)
+            
+            return self.extract_voice_features_from_samples(y, pcm.sample_rate, str(audio_file))
+            
+        except Exception as e:
+            logger.error(f"Error extracting features from {audio_file}: {e}")
+            return None
+    
+    def extract_voice_features_from_samples(
+        self, 
+        y: np.ndarray, 
+        sr: int, 
+        source: str = ''
+    ) -> Dict[str, Any]:
+        """Extract comprehensive voice features from in-memory float samples."""
+        try:
+            if sr != self.sample_rate:
+                y = librosa.resample(y, orig_sr=sr, target_sr=self.sample_rate)
+                sr = self.sample_rate
             
             if len(y) < self.sample_rate:  # Less than 1 second
-                logger.warning(f"Audio file too short: {len(y)/sr:.2f}s")
+                logger.warning(f"Audio too short: {len(y)/sr:.2f}s")
                 return None
             
             # Extract multiple feature types
@@ -90,13 +122,55 @@ class VoiceProcessor:
                 'audio_duration': len(y) / sr,
                 'sample_rate': sr,
                 'quality_score': features['quality']['overall_quality'],
-                'file_path': str(audio_file)
+                'file_path': source
             }
             
         except Exception as e:
-            logger.error(f"Error extracting features from {audio_file}: {e}")
+            logger.error(f"Error extracting features from {source or 'samples'}: {e}")
             return None
     
+    def extract_feature_matrix(
+        self, 
+        pcm: DecodedAudio, 
+        spans: List[Tuple[float, float]],
+        min_duration: float = 1.0
+    ) -> Dict[str, Any]:
+        """Extract feature vectors for many time spans of one decoded file as a stacked matrix."""
+        vectors = []
+        indices = []
+        quality_scores = []
+        
+        for index, (start_time, end_time) in enumerate(spans):
+            if end_time - start_time < min_duration:  # Too short for reliable voice recognition
+                continue
+            
+            try:
+                # Slice, extract and drop the samples so memory stays bounded per segment
+                features = self.extract_voice_features_from_samples(
+                    pcm.slice_float(start_time, end_time), 
+                    pcm.sample_rate,
+                    f"{pcm.source_path}:{start_time}-{end_time}"
+                )
+            except Exception as e:
+                logger.error(f"Error extracting features for span {start_time}-{end_time}: {e}")
+                continue
+            
+            if not features or len(features['feature_vector']) == 0:
+                continue
+            
+            vectors.append(features['feature_vector'])
+            indices.append(index)
+            quality_scores.append(features.get('quality_score', 0.0))
+        
+        feature_matrix = np.vstack(vectors) if vectors else np.empty((0, 0), dtype=np.float32)
+        
+        logger.info(f"Extracted feature matrix {feature_matrix.shape} from {len(spans)} spans")
+        return {
+            'feature_matrix': feature_matrix,
+            'indices': indices,
+            'quality_scores': quality_scores
+        }
+    
     def _extract_mfcc_features(self, y: np.ndarray, sr: int) -> Dict[str, Any]:
         """Extract MFCC (Mel-Frequency Cepstral Coefficients) features."""
         try:
@@ -389,6 +463,7 @@ class VoiceProcessor:
             # Save model
             model_path = self._save_speaker_model(senator_name, voice_model, gmm)
             voice_model['model_path'] = str(model_path)
+            self.model_bank.invalidate()
             
             logger.info(f"Created voice model for {senator_name}: {model_path}")
             return voice_model
@@ -454,47 +529,7 @@ class VoiceProcessor:
     ) -> Dict[str, Any]:
         """Calculate voice similarity with a speaker model."""
         try:
-            # Load speaker model
-            model_data = self.load_speaker_model(senator_name)
-            if not model_data:
-                return {
-                    'senator_name': senator_name,
-                    'similarity_score': 0.0,
-                    'confidence_level': 'none',
-                    'error': 'No voice model found'
-                }
-            
-            voice_model, gmm = model_data
-            
-            # Normalize feature vector
-            feature_normalized = self.scaler.transform(feature_vector.reshape(1, -1))
-            
-            # Calculate log-likelihood
-            log_likelihood = gmm.score(feature_normalized)
-            
-            # Convert to similarity score (0-1 range)
-            # Higher log-likelihood = higher similarity
-            baseline_likelihood = voice_model.get('log_likelihood', -100)
-            similarity_score = max(0, min(1, (log_likelihood - baseline_likelihood + 50) / 50))
-            
-            # Determine confidence level
-            if similarity_score >= self.similarity_thresholds['high_confidence']:
-                confidence_level = 'high'
-            elif similarity_score >= self.similarity_thresholds['medium_confidence']:
-                confidence_level = 'medium'
-            elif similarity_score >= self.similarity_thresholds['low_confidence']:
-                confidence_level = 'low'
-            else:
-                confidence_level = 'very_low'
-            
-            return {
-                'senator_name': senator_name,
-                'similarity_score': similarity_score,
-                'confidence_level': confidence_level,
-                'log_likelihood': log_likelihood,
-                'baseline_likelihood': baseline_likelihood,
-                'model_training_samples': voice_model.get('training_samples', 0)
-            }
+            return self._score_candidates(feature_vector, [senator_name])[0][0]
             
         except Exception as e:
             logger.error(f"Error calculating voice similarity for {senator_name}: {e}")
@@ -505,6 +540,61 @@ class VoiceProcessor:
                 'error': str(e)
             }
     
+    def _similarity_from_likelihood(self, log_likelihood, baseline_likelihood):
+        """Map log-likelihood relative to a model's training baseline onto 0-1 (works on arrays)."""
+        # Higher log-likelihood = higher similarity
+        return np.clip((log_likelihood - baseline_likelihood + 50) / 50, 0, 1)
+    
+    def _confidence_level(self, similarity_score: float) -> str:
+        """Bucket a similarity score into a confidence level."""
+        if similarity_score >= self.similarity_thresholds['high_confidence']:
+            return 'high'
+        elif similarity_score >= self.similarity_thresholds['medium_confidence']:
+            return 'medium'
+        elif similarity_score >= self.similarity_thresholds['low_confidence']:
+            return 'low'
+        return 'very_low'
+    
+    def _score_candidates(
+        self, 
+        feature_matrix: np.ndarray, 
+        candidate_senators: List[str] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """Score N feature vectors against all candidate models with one vectorized bank pass."""
+        feature_matrix = np.atleast_2d(feature_matrix)
+        
+        names, log_likelihoods, baselines, training_samples = self.model_bank.score_candidates(
+            feature_matrix, 
+            candidate_senators
+        )
+        similarity_scores = self._similarity_from_likelihood(log_likelihoods, baselines[None, :])
+        
+        # Candidates without a model keep an explicit zero-score entry
+        missing = [name for name in (candidate_senators or []) if name not in names]
+        
+        results = []
+        for row in range(len(feature_matrix)):
+            similarities = [
+                {
+                    'senator_name': senator_name,
+                    'similarity_score': float(similarity_scores[row, k]),
+                    'confidence_level': self._confidence_level(similarity_scores[row, k]),
+                    'log_likelihood': float(log_likelihoods[row, k]),
+                    'baseline_likelihood': float(baselines[k]),
+                    'model_training_samples': int(training_samples[k])
+                }
+                for k, senator_name in enumerate(names)
+            ]
+            similarities.extend({
+                'senator_name': senator_name,
+                'similarity_score': 0.0,
+                'confidence_level': 'none',
+                'error': 'No voice model found'
+            } for senator_name in missing)
+            results.append(similarities)
+        
+        return results
+    
     def identify_speaker(
         self, 
         feature_vector: np.ndarray, 
@@ -512,29 +602,14 @@ class VoiceProcessor:
     ) -> List[Dict[str, Any]]:
         """Identify speaker by comparing with all available voice models."""
         try:
-            # Get list of available models
-            if candidate_senators is None:
-                model_files = list(self.models_dir.glob("*_model.json"))
-                candidate_senators = []
-                for model_file in model_files:
-                    senator_name = model_file.stem.replace('_model', '').replace('_', ' ')
-                    candidate_senators.append(senator_name)
-            
-            if not candidate_senators:
-                logger.warning("No voice models available for speaker identification")
-                return []
+            similarities = self.identify_speakers_batch(
+                np.asarray(feature_vector).reshape(1, -1), 
+                candidate_senators
+            )[0]
             
-            # Calculate similarities with all candidates
-            similarities = []
-            for senator_name in candidate_senators:
-                similarity = self.calculate_voice_similarity(feature_vector, senator_name)
-                similarities.append(similarity)
-            
-            # Sort by similarity score
-            similarities.sort(key=lambda x: x.get('similarity_score', 0), reverse=True)
-            
-            logger.info(f"Speaker identification results: top match = {similarities[0]['senator_name']} "
-                       f"(score: {similarities[0]['similarity_score']:.3f})")
+            if similarities:
+                logger.info(f"Speaker identification results: top match = {similarities[0]['senator_name']} "
+                           f"(score: {similarities[0]['similarity_score']:.3f})")
             
             return similarities
             
@@ -542,6 +617,38 @@ class VoiceProcessor:
             logger.error(f"Error in speaker identification: {e}")
             return []
     
+    def identify_speakers_batch(
+        self, 
+        feature_matrix: np.ndarray, 
+        candidate_senators: List[str] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """Score every row of a feature matrix against all candidate models in one vectorized pass."""
+        try:
+            n_rows = len(feature_matrix)
+            if n_rows == 0:
+                return []
+            
+            if candidate_senators is None and len(self.model_bank) == 0:
+                logger.warning("No voice models available for speaker identification")
+                return [[] for _ in range(n_rows)]
+            
+            if candidate_senators is not None and not candidate_senators:
+                logger.warning("No voice models available for speaker identification")
+                return [[] for _ in range(n_rows)]
+            
+            results = self._score_candidates(feature_matrix, candidate_senators)
+            
+            # Sort each row by similarity score
+            for row in results:
+                row.sort(key=lambda x: x.get('similarity_score', 0), reverse=True)
+            
+            logger.info(f"Scored {n_rows} segments against {len(results[0])} voice models")
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error in batch speaker identification: {e}")
+            return [[] for _ in range(len(feature_matrix))]
+    
     def get_model_summary(self) -> Dict[str, Any]:
         """Get summary of all available voice models."""
         try:
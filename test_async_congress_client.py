@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Test the async Congress.gov client
+Checks that the shared token bucket paces every caller to one rate budget,
+the synchronous client included, that repeat fetches revalidate with
+conditional requests and reuse cached bodies, and that an all-committees
+fetch runs concurrently so it is bounded by the rate budget rather than by
+serial round-trips, timing each committee and keeping cache I/O off the loop
+"""
+
+import sys
+import json
+import time
+import asyncio
+import hashlib
+import logging
+import tempfile
+import threading
+from pathlib import Path
+from dataclasses import asdict
+from unittest.mock import MagicMock
+
+from aiohttp import web
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+from storage.connection_pool import get_connection_pool
+from sync.http_cache import HTTPCache
+from sync.congress_api_async import AsyncCongressAPI, TokenBucket
+from sync.congress_api_enhanced import CongressAPIEnhanced, get_congress_rate_limiter
+from api.congress_api_client import CongressAPIClient
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+class FakeCongressAPI:
+    """Local stand-in for api.congress.gov with ETags and fixed latency"""
+
+    def __init__(self, meetings_per_committee=10, latency=0.05):
+        self.meetings_per_committee = meetings_per_committee
+        self.latency = latency
+        self.revision = {}
+        self.stats = {'requests': 0, 'not_modified': 0, 'in_flight': 0, 'max_in_flight': 0, 'missing_key': 0}
+        self.base_url = None
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get('/v3/committee/{code}/meeting', self.meetings)
+        app.router.add_get('/v3/committee-meeting/{meeting_id}', self.meeting_detail)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}/v3"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+    async def respond(self, request, payload):
+        self.stats['requests'] += 1
+        self.stats['in_flight'] += 1
+        self.stats['max_in_flight'] = max(self.stats['max_in_flight'], self.stats['in_flight'])
+        try:
+            if request.query.get('api_key') != 'test-key':
+                self.stats['missing_key'] += 1
+            await asyncio.sleep(self.latency)
+            body = json.dumps(payload).encode()
+            etag = '"' + hashlib.md5(body).hexdigest() + '"'
+            if request.headers.get('If-None-Match') == etag:
+                self.stats['not_modified'] += 1
+                return web.Response(status=304, headers={'ETag': etag})
+            return web.Response(body=body, content_type='application/json', headers={'ETag': etag})
+        finally:
+            self.stats['in_flight'] -= 1
+
+    async def meetings(self, request):
+        code = request.match_info['code']
+        revision = self.revision.get(code, 0)
+        return await self.respond(request, {'meetings': [
+            {
+                'meetingId': f"{code}-{i}",
+                'title': f"{code} hearing {i}" + (f" (rev {revision})" if revision else ''),
+                'date': f"2025-06-{i + 1:02d}",
+                'url': f"{self.base_url}/committee-meeting/{code}-{i}?format=json"
+            }
+            for i in range(self.meetings_per_committee)
+        ]})
+
+    async def meeting_detail(self, request):
+        meeting_id = request.match_info['meeting_id']
+        return await self.respond(request, {'committeeMeeting': {
+            'room': '226',
+            'building': 'Dirksen',
+            'witnesses': [{'name': f"Witness for {meeting_id}"}]
+        }})
+
+COMMITTEES = ['SCOM', 'SSCI', 'SBAN', 'SSJU', 'HJUD', 'SFRC', 'SASC', 'SHELP']
+
+def make_client(server, cache, rate=200, capacity=20, max_connections=10):
+    return AsyncCongressAPI('test-key', rate_limiter=TokenBucket(rate, capacity), cache=cache,
+                            max_connections=max_connections, base_url=server.base_url)
+
+def test_token_bucket_paces_shared_callers():
+    """Callers sharing a bucket get one rate budget between them"""
+    async def run():
+        bucket = TokenBucket(rate=100, capacity=10)
+        start = time.perf_counter()
+        await asyncio.gather(*(bucket.acquire() for _ in range(10)))
+        burst = time.perf_counter() - start
+
+        # Two callers of 25 each: 50 tokens at 100/s after an empty bucket
+        start = time.perf_counter()
+        await asyncio.gather(*(bucket.acquire() for _ in range(25)), *(bucket.acquire() for _ in range(25)))
+        paced = time.perf_counter() - start
+        return burst, paced, bucket.get_stats()
+
+    burst, paced, stats = asyncio.run(run())
+    logger.info(f"Burst of 10 in {burst:.3f}s, then 50 in {paced:.3f}s ({stats})")
+
+    assert burst <= 0.05, "Burst capacity was not available immediately"
+    assert 0.45 <= paced < 0.9, f"50 tokens at 100/s took {paced:.3f}s"
+
+    logger.info("✅ Shared bucket paces all callers to its rate")
+
+def test_sync_client_shares_bucket():
+    """The synchronous client draws from the same bucket as async callers"""
+    bucket = TokenBucket(rate=100, capacity=10)
+    client = CongressAPIClient('test-key', rate_limiter=bucket)
+    client.session.get = MagicMock(return_value=MagicMock(status_code=200, headers={},
+                                                          json=lambda: {'ok': True}))
+
+    async def run():
+        start = time.perf_counter()
+        sync_calls = asyncio.to_thread(lambda: [client._make_request('committee') for _ in range(25)])
+        responses, *_ = await asyncio.gather(sync_calls, *(bucket.acquire() for _ in range(25)))
+        return responses, time.perf_counter() - start
+
+    responses, elapsed = asyncio.run(run())
+    logger.info(f"25 sync and 25 async requests in {elapsed:.3f}s ({bucket.get_stats()})")
+
+    assert all(response.success for response in responses) and bucket.get_stats()['acquired'] == 50, \
+        "Sync client requests did not go through the bucket"
+    assert 0.35 <= elapsed < 0.9, f"40 tokens past the burst at 100/s took {elapsed:.3f}s"
+
+    logger.info("✅ Sync and async clients share one rate budget")
+
+def test_clients_default_to_shared_bucket():
+    """Every Congress.gov client draws from the process-wide bucket unless given its own"""
+    shared = get_congress_rate_limiter()
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = HTTPCache(str(Path(tmp) / "http_cache.db"))
+        clients = [CongressAPIClient('test-key'), CongressAPIEnhanced('test-key'),
+                   AsyncCongressAPI('test-key', cache=cache)]
+        get_connection_pool(str(cache.db_path)).close_all()
+    assert all(client.rate_limiter is shared for client in clients), "A client kept its own rate limiter"
+
+    # The enhanced client's blocking requests pace against the same budget
+    bucket = TokenBucket(rate=100, capacity=5)
+    enhanced = CongressAPIEnhanced('test-key', rate_limiter=bucket)
+    enhanced.session.get = MagicMock(return_value=MagicMock(json=lambda: {'committees': []}))
+    start = time.perf_counter()
+    for _ in range(25):
+        enhanced._make_request('/committee')
+    elapsed = time.perf_counter() - start
+    assert bucket.get_stats()['acquired'] == 25, "Enhanced client requests did not go through the bucket"
+    assert 0.15 <= elapsed < 0.6, f"20 tokens past the burst at 100/s took {elapsed:.3f}s"
+
+    logger.info("✅ Sync, enhanced and async clients default to one shared bucket")
+
+def test_conditional_revalidation():
+    """Repeat fetches send validators, reuse cached bodies, and pick up changes"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = HTTPCache(str(Path(tmp) / "http_cache.db"))
+
+        async def run():
+            server = FakeCongressAPI(meetings_per_committee=5, latency=0)
+            await server.start()
+            try:
+                async with make_client(server, cache) as client:
+                    first = await client.fetch_committees(COMMITTEES[:3])
+                fresh_requests = server.stats['requests']
+
+                server.revision['intelligence'] = 1  # SSCI's API committee code
+                async with make_client(server, cache) as client:
+                    second = await client.fetch_committees(COMMITTEES[:3])
+                    client_stats = client.get_request_stats()
+                return first, second, fresh_requests, client_stats, dict(server.stats)
+            finally:
+                await server.stop()
+
+        first, second, fresh_requests, client_stats, server_stats = asyncio.run(run())
+        keys = [row[0] for row in cache.connection.execute("SELECT url FROM http_cache")]
+        get_connection_pool(str(cache.db_path)).close_all()
+
+        unchanged = all(
+            [asdict(record) for record in first[code]] == [asdict(record) for record in second[code]]
+            for code in ('SCOM', 'SBAN')
+        )
+        checks = [
+            ("details merged", all(record.witnesses and record.location_info['room'] == '226'
+                                   for records in first.values() for record in records)),
+            ("api key sent", server_stats['missing_key'] == 0),
+            ("api key not cached", keys and not any('api_key' in key for key in keys)),
+            # Everything revalidates; only the changed committee list is re-sent
+            ("revalidated", client_stats['not_modified'] == fresh_requests - 1),
+            ("unchanged reused", unchanged),
+            ("change picked up", second['SSCI'][0].hearing_title.endswith('(rev 1)'))
+        ]
+        failed = [name for name, ok in checks if not ok]
+        assert not failed, f"Revalidation checks failed: {failed} ({client_stats}, {server_stats})"
+
+        logger.info(f"✅ {client_stats['not_modified']} of {client_stats['requests']} repeat requests "
+                    f"answered 304 from {len(keys)} cached responses")
+
+def test_all_committees_bounded_by_quota():
+    """An all-committees fetch runs concurrently, as fast as the rate budget allows"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = HTTPCache(str(Path(tmp) / "http_cache.db"))
+        rate, capacity, latency = 200, 20, 0.05
+
+        # Note which threads touch the cache's SQLite connection
+        cache_threads = set()
+
+        def noting_thread(method):
+            def wrapper(*args):
+                cache_threads.add(threading.current_thread().name)
+                return method(*args)
+            return wrapper
+
+        for name in ('get', 'store', 'mark_validated'):
+            setattr(cache, name, noting_thread(getattr(cache, name)))
+
+        async def run():
+            server = FakeCongressAPI(meetings_per_committee=10, latency=latency)
+            await server.start()
+            try:
+                async with make_client(server, cache, rate=rate, capacity=capacity) as client:
+                    start = time.perf_counter()
+                    fetched = await client.fetch_committees(COMMITTEES)
+                    elapsed = time.perf_counter() - start
+                return fetched, elapsed, dict(server.stats), client.fetch_seconds, threading.current_thread().name
+            finally:
+                await server.stop()
+
+        fetched, elapsed, server_stats, fetch_seconds, loop_thread = asyncio.run(run())
+        get_connection_pool(str(cache.db_path)).close_all()
+
+        requests = server_stats['requests']
+        serial = requests * latency
+        quota_bound = (requests - capacity) / rate
+        logger.info(f"{requests} requests in {elapsed:.2f}s (serial round-trips: {serial:.2f}s, "
+                    f"rate budget: {quota_bound:.2f}s, peak {server_stats['max_in_flight']} in flight)")
+
+        checks = [
+            ("all fetched", all(len(records) == 10 for records in fetched.values())),
+            ("not serial", elapsed * 3 < serial),
+            ("within rate budget", elapsed >= quota_bound * 0.9),
+            ("connections pooled", 1 < server_stats['max_in_flight'] <= 10),
+            ("per-committee timings", sorted(fetch_seconds) == sorted(COMMITTEES)
+             and all(0 < seconds <= elapsed for seconds in fetch_seconds.values())),
+            ("cache off the loop", cache_threads and loop_thread not in cache_threads)
+        ]
+        failed = [name for name, ok in checks if not ok]
+        assert not failed, f"Concurrency checks failed: {failed}"
+
+        logger.info(f"✅ All committees in {elapsed:.2f}s instead of {serial:.2f}s of serial round-trips")
+
+def run_async_congress_client_tests():
+    """Run all async Congress client tests"""
+    logger.info("=" * 60)
+    logger.info("Async Congress Client Test")
+    logger.info("=" * 60)
+
+    tests = [
+        ("Token Bucket Paces Shared Callers", test_token_bucket_paces_shared_callers),
+        ("Sync Client Shares Bucket", test_sync_client_shares_bucket),
+        ("Clients Default To Shared Bucket", test_clients_default_to_shared_bucket),
+        ("Conditional Revalidation", test_conditional_revalidation),
+        ("All Committees Bounded By Quota", test_all_committees_bounded_by_quota)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        logger.info(f"\n🧪 Running: {test_name}")
+        try:
+            test_func()
+            passed += 1
+            logger.info(f"✅ {test_name}: PASSED")
+        except Exception as e:
+            logger.error(f"❌ {test_name}: FAILED - {e}")
+
+    logger.info(f"\n📊 Results: {passed}/{total} tests passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = run_async_congress_client_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Test async database access for route handlers
+Checks the awaitable query helpers and runs a mixed read/write load
+against blocking and async handlers to compare tail latency
+"""
+
+import sys
+import time
+import random
+import asyncio
+import logging
+import tempfile
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+from api.async_database import AsyncDatabase
+from storage.connection_pool import get_connection_pool
+from sync.database_schema import UnifiedHearingDatabase
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+COMMITTEES = ["SCOM", "SSCI", "SBAN", "SSJU", "SSAF", "SSHR", "SSFR", "SSEV"]
+HEARINGS = 60000
+
+def create_database(path, hearings):
+    """Hearing database with many rows so aggregate queries take real time"""
+    db = UnifiedHearingDatabase(path)
+    rng = random.Random(0)
+    db.connection.executemany("""
+        INSERT INTO hearings_unified (committee_code, hearing_title, hearing_date, sync_confidence,
+                                      created_at, updated_at)
+        VALUES (?, ?, ?, ?, datetime('now'), datetime('now'))
+    """, [
+        (rng.choice(COMMITTEES), f"Hearing {i} on Oversight Topic {i % 97}",
+         f"2025-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}", rng.random())
+        for i in range(hearings)
+    ])
+    db.connection.commit()
+    return db
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+def test_query_helpers():
+    """fetch helpers, transactions and run() use worker-thread connections"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = create_database(str(Path(tmp) / "hearings.db"), 100)
+        async_db = AsyncDatabase(db)
+
+        async def scenario():
+            loop_thread = threading.get_ident()
+            rows = await async_db.fetch_all("SELECT id FROM hearings_unified WHERE id <= ?", (5,))
+            hearing = await async_db.get_hearing(1)
+            count = await async_db.fetch_value("SELECT COUNT(*) FROM hearings_unified")
+            missing = await async_db.fetch_value("SELECT id FROM hearings_unified WHERE id = -1", default=0)
+
+            updated = await async_db.execute(
+                "UPDATE hearings_unified SET meeting_status = 'Completed' WHERE id <= ?", (3,))
+
+            def failing(conn):
+                conn.execute("UPDATE hearings_unified SET meeting_status = 'Broken'")
+                raise ValueError("abort")
+            try:
+                await async_db.transaction(failing)
+            except ValueError:
+                pass
+            broken = await async_db.fetch_value(
+                "SELECT COUNT(*) FROM hearings_unified WHERE meeting_status = 'Broken'")
+
+            worker_thread = await async_db.run(threading.get_ident)
+            new_id = await async_db.insert_hearing(
+                {"committee_code": "SCOM", "hearing_title": "Async Insert", "hearing_date": "2025-06-01"},
+                'congress_api')
+            return (len(rows), hearing["id"], count, missing, updated, broken,
+                    worker_thread != loop_thread, new_id)
+
+        result = asyncio.run(scenario())
+        get_connection_pool(str(db.db_path)).close_all()
+
+        assert result == (5, 1, 100, 0, 3, 0, True, 101), f"Unexpected helper results: {result}"
+
+        logger.info("✅ Async query helpers correct")
+
+async def run_load(handlers, requests=200, interval=0.01):
+    """
+    Open-loop mixed traffic; returns latency (ms) per request type
+
+    Latency counts from each request's scheduled arrival, so time a blocked
+    event loop spends unable to even accept requests is included.
+    """
+    rng = random.Random(1)
+    latencies = {"point": [], "aggregate": [], "write": []}
+
+    async def request(kind, arrival):
+        await handlers[kind]()
+        latencies[kind].append((time.perf_counter() - arrival) * 1000)
+
+    tasks = []
+    start = time.perf_counter()
+    for i in range(requests):
+        arrival = start + i * interval
+        await asyncio.sleep(max(0.0, arrival - time.perf_counter()))
+        roll = rng.random()
+        kind = "aggregate" if roll < 0.1 else "write" if roll < 0.2 else "point"
+        tasks.append(asyncio.create_task(request(kind, arrival)))
+    await asyncio.gather(*tasks)
+    return latencies
+
+def test_mixed_load_latency():
+    """Async handlers cut tail latency of short requests under mixed traffic"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = create_database(str(Path(tmp) / "hearings.db"), HEARINGS)
+        async_db = AsyncDatabase(db)
+        aggregate_sql = """
+            SELECT committee_code, COUNT(*), AVG(sync_confidence), MAX(hearing_date)
+            FROM hearings_unified GROUP BY committee_code
+        """
+        point_sql = "SELECT * FROM hearings_unified WHERE id = ?"
+        write_sql = "UPDATE hearings_unified SET sync_confidence = ? WHERE id = ?"
+
+        # Handlers as the routes were written: queries on the event loop thread
+        async def blocking_point():
+            db.connection.execute(point_sql, (random.randint(1, HEARINGS),)).fetchone()
+        async def blocking_aggregate():
+            db.connection.execute(aggregate_sql).fetchall()
+        async def blocking_write():
+            db.connection.execute(write_sql, (random.random(), random.randint(1, HEARINGS)))
+            db.connection.commit()
+
+        async def async_point():
+            await async_db.fetch_one(point_sql, (random.randint(1, HEARINGS),))
+        async def async_aggregate():
+            await async_db.fetch_all(aggregate_sql)
+        async def async_write():
+            await async_db.execute(write_sql, (random.random(), random.randint(1, HEARINGS)))
+
+        # Warm every worker's connection, as in a long-running server
+        async def warm_up():
+            await asyncio.gather(*[async_aggregate() for _ in range(16)])
+        asyncio.run(warm_up())
+        db.connection.execute(aggregate_sql).fetchall()
+
+        blocking = asyncio.run(run_load(
+            {"point": blocking_point, "aggregate": blocking_aggregate, "write": blocking_write}))
+        concurrent = asyncio.run(run_load(
+            {"point": async_point, "aggregate": async_aggregate, "write": async_write}))
+        get_connection_pool(str(db.db_path)).close_all()
+
+        for kind in ("point", "write", "aggregate"):
+            logger.info(f"{kind:>9} p99: blocking {percentile(blocking[kind], 99):.1f}ms, "
+                        f"async {percentile(concurrent[kind], 99):.1f}ms")
+
+        # Short requests no longer queue behind aggregates running on the loop
+        blocking_p99 = percentile(blocking["point"] + blocking["write"], 99)
+        async_p99 = percentile(concurrent["point"] + concurrent["write"], 99)
+        logger.info(f"Point read and write p99: blocking {blocking_p99:.1f}ms, async {async_p99:.1f}ms")
+        assert async_p99 < blocking_p99 / 2, "Async handlers should at least halve short-request p99 latency"
+
+        logger.info("✅ Async handlers keep short requests responsive during slow queries")
+
+def run_async_database_tests():
+    """Run all async database tests"""
+    logger.info("=" * 60)
+    logger.info("Async Database Test")
+    logger.info("=" * 60)
+
+    tests = [
+        ("Query Helpers", test_query_helpers),
+        ("Mixed Load Latency", test_mixed_load_latency)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        logger.info(f"\n🧪 Running: {test_name}")
+        try:
+            test_func()
+            passed += 1
+            logger.info(f"✅ {test_name}: PASSED")
+        except Exception as e:
+            logger.error(f"❌ {test_name}: FAILED - {e}")
+
+    logger.info(f"\n📊 Results: {passed}/{total} tests passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = run_async_database_tests()
+    sys.exit(0 if success else 1)
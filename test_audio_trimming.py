@@ -107,6 +107,116 @@ def test_silence_detection():
         logger.error(f"❌ Silence detection test failed: {e}")
         return False
 
+def test_pcm_cache_reuse():
+    """Test that repeated analysis reuses a single PCM decode"""
+    try:
+        sys.path.append(str(Path(__file__).parent))
+        from src.audio.pcm_cache import PCMCache
+        
+        test_audio_path = create_test_audio()
+        if not test_audio_path:
+            return False
+        
+        cache = PCMCache(Path(tempfile.gettempdir()) / "test_audio_trimming" / "pcm_cache")
+        first = cache.get(test_audio_path)
+        second = cache.get(test_audio_path)
+        
+        logger.info(f"✅ PCM cache stats: {cache.get_stats()}")
+        
+        # 17s of audio at 16kHz, decoded exactly once and sliced without copying
+        window = first.slice(5.0, 6.0)
+        if (first is second and cache.stats["decodes"] == 1 and
+                abs(first.duration - 17.0) < 0.1 and len(window) == first.sample_rate and
+                window.base is not None):
+            logger.info("✅ PCM cache reuses the decoded buffer")
+            return True
+        else:
+            logger.error("❌ PCM cache did not reuse the decoded buffer")
+            return False
+            
+    except Exception as e:
+        logger.error(f"❌ PCM cache test failed: {e}")
+        return False
+
+def test_pcm_cache_concurrent_decodes():
+    """Test that different files decode concurrently and one file decodes once"""
+    try:
+        sys.path.append(str(Path(__file__).parent))
+        import time
+        import threading
+        from src.audio.pcm_cache import PCMCache
+        
+        temp_dir = Path(tempfile.mkdtemp(prefix="pcm_concurrency_"))
+        sources = []
+        for name in ("a.wav", "b.wav"):
+            path = temp_dir / name
+            path.write_bytes(name.encode())
+            sources.append(path)
+        
+        cache = PCMCache(temp_dir / "pcm")
+        
+        def slow_decode(audio_path, pcm_path):
+            # Stand-in for an ffmpeg run
+            time.sleep(0.5)
+            pcm_path.write_bytes(b"\x00\x00" * 16000)
+            with cache._lock:
+                cache.stats["decodes"] += 1
+        
+        cache._decode = slow_decode
+        
+        threads = [threading.Thread(target=cache.get, args=(path,)) for path in sources * 2]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        
+        logger.info(f"Two files, two readers each: {elapsed:.2f}s, stats {cache.get_stats()}")
+        
+        if cache.stats["decodes"] == 2 and elapsed < 0.9:
+            logger.info("✅ PCM decodes of different files overlap")
+            return True
+        else:
+            logger.error("❌ PCM decodes were serialized or repeated")
+            return False
+            
+    except Exception as e:
+        logger.error(f"❌ PCM cache concurrency test failed: {e}")
+        return False
+
+def test_pcm_cache_failed_decode():
+    """Test that a failed decode raises, leaves no per-file lock behind, and can be retried"""
+    sys.path.append(str(Path(__file__).parent))
+    from src.audio.pcm_cache import PCMCache
+    
+    temp_dir = Path(tempfile.mkdtemp(prefix="pcm_failure_"))
+    source = temp_dir / "broken.wav"
+    source.write_bytes(b"not audio")
+    cache = PCMCache(temp_dir / "pcm")
+    
+    def failing_decode(audio_path, pcm_path):
+        raise RuntimeError("ffmpeg failed")
+    
+    cache._decode = failing_decode
+    for _ in range(3):
+        try:
+            cache.get(source)
+            raise AssertionError("Failed decode did not raise")
+        except RuntimeError:
+            pass
+    assert not cache._key_locks, f"Per-file locks left after failed decodes: {len(cache._key_locks)}"
+    
+    def working_decode(audio_path, pcm_path):
+        pcm_path.write_bytes(b"\x00\x00" * 16000)
+    
+    cache._decode = working_decode
+    decoded = cache.get(source)
+    assert abs(decoded.duration - 1.0) < 0.01 and not cache._key_locks, "Retry after a failed decode did not succeed"
+    
+    logger.info("✅ Failed PCM decodes release their per-file lock")
+    return True
+
 def test_audio_trimming():
     """Test audio trimming functionality"""
     try:
@@ -232,6 +342,9 @@ def run_audio_trimming_tests():
     tests = [
         ("AudioTrimmer Import", test_audio_trimmer_import),
         ("Silence Detection", test_silence_detection),
+        ("PCM Cache Reuse", test_pcm_cache_reuse),
+        ("PCM Cache Concurrent Decodes", test_pcm_cache_concurrent_decodes),
+        ("PCM Cache Failed Decode", test_pcm_cache_failed_decode),
         ("Audio Trimming", test_audio_trimming),
         ("Smart Trimming", test_smart_trimming),
         ("Pipeline Integration", test_pipeline_integration)
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Test the in-memory auto-complete index
+Checks prefix and word-start matching, popularity weighting from searches,
+incremental updates through UnifiedHearingDatabase and per-keystroke latency
+"""
+
+import sys
+import time
+import subprocess
+import sqlite3
+import logging
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+from api.autocomplete_index import AutocompleteIndex, get_autocomplete_index
+from sync.database_schema import UnifiedHearingDatabase
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+HEARINGS = [
+    {"committee_code": "SCOM", "hearing_title": "Artificial Intelligence in Commerce",
+     "hearing_date": "2025-01-15", "witnesses": [{"name": "Jane Alvarez"}]},
+    {"committee_code": "SSJU", "hearing_title": "Judicial Nominations",
+     "hearing_date": "2025-02-03", "witnesses": [{"name": "Robert Chen"}]},
+    {"committee_code": "SSCI", "hearing_title": "Annual Threat Assessment",
+     "hearing_date": "2025-03-11", "witnesses": []}
+]
+
+def create_database(path):
+    """UnifiedHearingDatabase seeded with the sample hearings"""
+    db = UnifiedHearingDatabase(path)
+    get_autocomplete_index(path).load_from_db(db.connection)
+    ids = [db.insert_hearing(hearing, 'congress_api') for hearing in HEARINGS]
+    return db, ids
+
+def texts(suggestions):
+    return [s["text"] for s in suggestions]
+
+def test_prefix_matching():
+    """Suggestions match the start of a term or of any word in it"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db, _ = create_database(str(Path(tmp) / "hearings.db"))
+        index = get_autocomplete_index(db.db_path)
+
+        assert texts(index.suggest("artif"))[:1] == ["Artificial Intelligence in Commerce"], \
+            f"Title prefix not suggested: {index.suggest('artif')}"
+
+        # Mid-title words and witness names match too
+        assert "Annual Threat Assessment" in texts(index.suggest("threat")), "Word-start match missing"
+        assert "Robert Chen" in texts(index.suggest("che")), "Witness name missing"
+
+        committees = [s for s in index.suggest("ss") if s["category"] == "committees"]
+        assert {s["text"] for s in committees} == {"SSJU", "SSCI"}, f"Committee suggestions wrong: {committees}"
+
+        assert not index.suggest("zzz") and not index.suggest("  "), "Unmatched prefix should return nothing"
+
+        logger.info("✅ Prefix and word-start suggestions correct")
+        db.close()
+
+def test_popularity_weighting():
+    """Frequently searched terms rise above equally matching ones"""
+    index = AutocompleteIndex()
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE hearings_unified (id INTEGER PRIMARY KEY, hearing_title TEXT, committee_code TEXT)")
+    conn.executemany("INSERT INTO hearings_unified VALUES (?, ?, ?)", [
+        (1, "Energy Policy Review", "SENR"),
+        (2, "Energy Security Outlook", "SENR")
+    ])
+    index.load_from_db(conn)
+
+    for _ in range(5):
+        index.record_search("Energy Security Outlook", 1)
+    assert texts(index.suggest("energy"))[0] == "Energy Security Outlook", \
+        f"Popular title not first: {index.suggest('energy')}"
+
+    # Queries that found results become suggestions; empty ones do not
+    index.record_search("grid reliability", 3)
+    index.record_search("gibberish query", 0)
+    assert "grid reliability" in texts(index.suggest("grid")) and not index.suggest("gibberish"), \
+        "Search history suggestions wrong"
+
+    logger.info("✅ Popularity reorders suggestions")
+
+def test_incremental_updates():
+    """Inserts and updates through UnifiedHearingDatabase refresh the index"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db, ids = create_database(str(Path(tmp) / "hearings.db"))
+        index = get_autocomplete_index(db.db_path)
+
+        db.update_hearing(ids[1], {"hearing_title": "Supreme Court Nominations"}, 'website_scraper')
+        assert "Judicial Nominations" not in texts(index.suggest("jud")), "Old title still suggested after update"
+        assert "Supreme Court Nominations" in texts(index.suggest("supreme")), "Updated title not suggested"
+        # Witnesses come back from the stored row, not the partial update
+        assert "Robert Chen" in texts(index.suggest("robert")), "Update dropped the hearing's other terms"
+
+        new_id = db.insert_hearing({"committee_code": "SSAF", "hearing_title": "Farm Bill Reauthorization",
+                                    "hearing_date": "2025-04-01"}, 'congress_api')
+        assert "Farm Bill Reauthorization" in texts(index.suggest("farm")), "Inserted hearing not suggested"
+
+        index.remove_hearing(new_id)
+        assert not index.suggest("farm") and not index.suggest("ssaf"), "Removed hearing still suggested"
+
+        logger.info(f"✅ Incremental updates applied: {index.get_stats()}")
+        db.close()
+
+def test_match_quality_before_truncation():
+    """A start-of-text match outranks mid-text matches even when many heavier entries match"""
+    index = AutocompleteIndex()
+    conn = sqlite3.connect(":memory:")
+    conn.execute("""CREATE TABLE hearings_unified (
+        id INTEGER PRIMARY KEY, hearing_title TEXT, committee_code TEXT, participant_list TEXT)""")
+    conn.executemany("INSERT INTO hearings_unified VALUES (?, ?, ?, ?)", [
+        (i, f"Budget Review of Energy Programs Part {i}", "SENR", "") for i in range(1, 41)
+    ] + [(41, "Nomination Hearing", "SENR", "Energy Secretary Wright")])
+    index.load_from_db(conn)
+
+    # 40 titles match mid-text (0.6 x 1.0); the participant matches at its start (0.8 x 0.8)
+    suggestions = index.suggest("energy", limit=20)
+    assert texts(suggestions)[:1] == ["Energy Secretary Wright"] and len(suggestions) == 20, \
+        f"Start match not ranked first: {texts(suggestions)[:3]}"
+    assert texts(index.suggest("energy secretary wright"))[:1] == ["Energy Secretary Wright"], \
+        "Exact match not ranked first"
+
+    logger.info("✅ Match quality applied before truncating to the limit")
+
+def test_keystroke_latency():
+    """Suggestions over thousands of hearings stay well under a millisecond"""
+    words = ["budget", "defense", "energy", "health", "immigration", "judiciary",
+             "banking", "commerce", "agriculture", "intelligence", "oversight", "security"]
+    conn = sqlite3.connect(":memory:")
+    conn.execute("""CREATE TABLE hearings_unified (
+        id INTEGER PRIMARY KEY, hearing_title TEXT, committee_code TEXT, search_keywords TEXT)""")
+    conn.executemany("INSERT INTO hearings_unified VALUES (?, ?, ?, ?)", [
+        (i, f"{words[i % 12].title()} {words[(i * 7) % 12].title()} Hearing {i}",
+         f"S{i % 40:03d}", f"{words[i % 12]},{words[(i * 5) % 12]}")
+        for i in range(1, 5001)
+    ])
+
+    index = AutocompleteIndex()
+    start = time.perf_counter()
+    index.load_from_db(conn)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    prefixes = ["b", "bu", "bud", "de", "energy", "hear", "hearing 12", "s0", "sec", "intel"]
+    for prefix in prefixes:
+        index.suggest(prefix)  # Warm up
+
+    rounds = 200
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for prefix in prefixes:
+            index.suggest(prefix)
+    per_call_ms = (time.perf_counter() - start) * 1000 / (rounds * len(prefixes))
+
+    logger.info(f"Built in {build_ms:.0f}ms, {per_call_ms * 1000:.1f}µs per suggestion lookup")
+    assert per_call_ms < 1.0, "Suggestion lookup should take under a millisecond"
+
+    logger.info("✅ Sub-millisecond suggestions")
+
+def test_sync_layer_independent():
+    """The sync database layer neither imports the API layer nor needs it to run"""
+    src = Path(__file__).parent / 'src'
+    imported = subprocess.run(
+        [sys.executable, "-c", "import sys; import sync.database_schema, sync.sync_orchestrator; "
+         "print(sorted(m for m in sys.modules if m == 'api' or m.startswith('api.')))"],
+        cwd=src, capture_output=True, text=True, timeout=60
+    )
+    assert imported.returncode == 0 and imported.stdout.strip() == "[]", \
+        f"Sync imported the API layer: {imported.stdout or imported.stderr}"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        script = subprocess.run(
+            [sys.executable, str(src / 'sync' / 'database_schema.py')],
+            cwd=tmp, capture_output=True, text=True, timeout=60
+        )
+    assert script.returncode == 0, f"database_schema.py failed as a script: {script.stderr[-500:]}"
+
+    logger.info("✅ Sync runs without the API layer; auto-complete registers as a listener")
+
+def run_autocomplete_tests():
+    """Run all auto-complete index tests"""
+    logger.info("=" * 60)
+    logger.info("Auto-complete Index Test")
+    logger.info("=" * 60)
+
+    tests = [
+        ("Prefix Matching", test_prefix_matching),
+        ("Popularity Weighting", test_popularity_weighting),
+        ("Incremental Updates", test_incremental_updates),
+        ("Match Quality Before Truncation", test_match_quality_before_truncation),
+        ("Keystroke Latency", test_keystroke_latency),
+        ("Sync Layer Independent", test_sync_layer_independent)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        logger.info(f"\n🧪 Running: {test_name}")
+        try:
+            test_func()
+            passed += 1
+            logger.info(f"✅ {test_name}: PASSED")
+        except Exception as e:
+            logger.error(f"❌ {test_name}: FAILED - {e}")
+
+    logger.info(f"\n📊 Results: {passed}/{total} tests passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = run_autocomplete_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Test batch hearing upserts for API ingestion
+Checks that a committee batch ends in the same rows and sync history as the
+per-hearing insert/update path, that it commits once, that a hearing that
+cannot be written fails without the rest of its batch, and that a 250-meeting
+committee sync is faster than one hearing at a time
+"""
+
+import sys
+import json
+import time
+import random
+import logging
+import tempfile
+from pathlib import Path
+from datetime import date, timedelta
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+from storage.connection_pool import get_connection_pool
+from sync.database_schema import UnifiedHearingDatabase
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+TOPICS = ["ai", "oversight", "privacy", "budget", "defense", "nomination", "cyber", "energy", "water",
+          "health", "trade", "veterans", "farm", "tax", "housing", "border", "security", "markup"]
+
+# Columns stamped with the wall clock at write time
+TIMESTAMPS = {'created_at', 'updated_at', 'last_api_sync', 'last_website_sync'}
+
+def make_meetings(count, seed, committee='SSJU', days=30):
+    """API meetings in database format, with repeats of the same meeting"""
+    rng = random.Random(seed)
+    meetings = []
+    for i in range(count):
+        if meetings and rng.random() < 0.15:
+            # The API lists the same meeting again, sometimes retitled or rescheduled
+            meeting = dict(rng.choice(meetings))
+            if rng.random() < 0.5:
+                meeting['hearing_title'] += ' (Continued)'
+            if rng.random() < 0.3:
+                meeting['hearing_date'] = meeting['hearing_date'][:10] + 'T14:00:00'
+        else:
+            meeting = {
+                'congress_api_id': f"{seed}-{i}",
+                'committee_code': committee,
+                'hearing_title': f"Hearing on {' '.join(rng.sample(TOPICS, 4))}",
+                'hearing_date': (date(2025, 6, 1) + timedelta(days=rng.randint(0, days))).isoformat() + 'T10:00:00',
+                'hearing_type': rng.choice(['Hearing', 'Markup']),
+                'meeting_status': 'Scheduled',
+                'location_info': {'room': rng.choice(['226', '106']), 'building': 'Dirksen'},
+                'documents': [],
+                'witnesses': [{'name': f"Witness {rng.randint(1, 50)}"}],
+                'streams': {},
+                'sync_confidence': 1.0
+            }
+        meetings.append(meeting)
+    return meetings
+
+def open_database(tmp, name, existing):
+    """Database seeded with already-synced hearings"""
+    db = UnifiedHearingDatabase(str(Path(tmp) / name))
+    for hearing in existing:
+        db.insert_hearing(hearing, 'website_scraper')
+    return db
+
+def upsert_one_at_a_time(db, meetings):
+    """The per-hearing path the API sync used before batching"""
+    for hearing_data in meetings:
+        duplicates = db.find_potential_duplicates(hearing_data)
+        if duplicates and duplicates[0]['similarity_score'] > 0.8:
+            db.update_hearing(duplicates[0]['id'], hearing_data, 'congress_api')
+        else:
+            db.insert_hearing(hearing_data, 'congress_api')
+
+def snapshot(db):
+    """Stored hearings and sync history without write timestamps"""
+    conn = db.connection
+    hearings = [{key: value for key, value in dict(row).items() if key not in TIMESTAMPS}
+                for row in conn.execute("SELECT * FROM hearings_unified ORDER BY id")]
+    history = [tuple(row) for row in conn.execute("""
+        SELECT hearing_id, sync_source, sync_type, changes_detected FROM sync_history ORDER BY id
+    """)]
+    return hearings, history
+
+def count_commits(db):
+    """Start counting COMMIT statements on the database's thread connection"""
+    commits = []
+    db.connection.set_trace_callback(lambda sql: sql.strip().upper() == 'COMMIT' and commits.append(sql))
+    return commits
+
+def test_matches_per_hearing_path():
+    """A batch upsert stores the same rows and history as upserting one hearing at a time"""
+    with tempfile.TemporaryDirectory() as tmp:
+        for seed in range(3):
+            existing = make_meetings(80, seed=100 + seed)
+            meetings = make_meetings(120, seed=seed)
+            meetings += [dict(hearing, hearing_title=hearing['hearing_title'] + ' Update')
+                         for hearing in existing[:10]]
+            meetings.append(dict(meetings[0], hearing_title=None))  # Unstorable, skipped
+
+            single = open_database(tmp, f"single-{seed}.db", existing)
+            batched = open_database(tmp, f"batched-{seed}.db", existing)
+            upsert_one_at_a_time(single, meetings[:-1])
+            result = batched.upsert_hearings(meetings, 'congress_api')
+
+            expected, actual = snapshot(single), snapshot(batched)
+            for db in (single, batched):
+                get_connection_pool(str(db.db_path)).close_all()
+
+            assert actual == expected, f"Seed {seed}: batch rows or history differ from the per-hearing path"
+            assert (result['updated'] > 0 and result['errors'] == 1 and result['hearing_ids'][-1] is None
+                    and result['discovered'] + result['updated'] == len(meetings) - 1), \
+                f"Seed {seed}: unexpected counts {result}"
+
+        logger.info(f"✅ Batch matches per-hearing upserts ({result['discovered']} new, "
+                    f"{result['updated']} updated in the last batch)")
+
+def test_single_commit():
+    """A committee batch commits once, and a hearing that cannot be written fails alone"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = open_database(tmp, "hearings.db", make_meetings(50, seed=1))
+        before = snapshot(db)
+
+        commits = count_commits(db)
+        result = db.upsert_hearings(make_meetings(250, seed=2), 'congress_api')
+        batch_commits = len(commits)
+
+        # A column the table lacks and a value SQLite cannot store fail only their hearings
+        after_batch = snapshot(db)
+        broken = make_meetings(20, seed=3)
+        broken.insert(5, dict(make_meetings(1, seed=1)[0], no_such_column=1))
+        broken.append(dict(make_meetings(1, seed=4)[0], hearing_type=['Hearing']))
+        del commits[:]
+        partial = db.upsert_hearings(broken, 'congress_api')
+        partial_commits = len(commits)
+        after_partial = snapshot(db)
+        in_transaction = db.connection.in_transaction
+        get_connection_pool(str(db.db_path)).close_all()
+
+        failed_ids = [partial['hearing_ids'][5], partial['hearing_ids'][-1]]
+        written_ids = partial['hearing_ids'][:5] + partial['hearing_ids'][6:-1]
+        checks = [
+            ("one commit", batch_commits == 1 and partial_commits == 1),
+            ("rows written", len(after_batch[0]) == len(before[0]) + result['discovered']),
+            ("history written", len(after_batch[1]) == len(before[1]) + 250),
+            ("failures counted", partial['errors'] == 2 and failed_ids == [None, None]),
+            ("rest of batch written", all(written_ids)
+             and partial['discovered'] + partial['updated'] == 20
+             and len(after_partial[1]) == len(after_batch[1]) + 20),
+            ("transaction closed", not in_transaction)
+        ]
+        failed_checks = [name for name, ok in checks if not ok]
+        assert not failed_checks, f"Transaction checks failed: {failed_checks} ({batch_commits} commits, {partial})"
+
+        logger.info(f"✅ 250 meetings in {batch_commits} commit; phases {result['timings']}")
+
+def test_committee_sync_speedup():
+    """A 250-meeting committee sync is faster batched than one hearing at a time"""
+    with tempfile.TemporaryDirectory() as tmp:
+        existing = make_meetings(2000, seed=5, days=365)
+        meetings = make_meetings(250, seed=6)
+
+        single = open_database(tmp, "single.db", existing)
+        commits = count_commits(single)
+        start = time.perf_counter()
+        upsert_one_at_a_time(single, meetings)
+        single_s = time.perf_counter() - start
+        single_commits = len(commits)
+
+        batched = open_database(tmp, "batched.db", existing)
+        start = time.perf_counter()
+        result = batched.upsert_hearings(meetings, 'congress_api')
+        batched_s = time.perf_counter() - start
+
+        same = snapshot(single) == snapshot(batched)
+        for db in (single, batched):
+            get_connection_pool(str(db.db_path)).close_all()
+
+        logger.info(f"One at a time: {single_s:.3f}s, {single_commits} commits; "
+                    f"batched: {batched_s:.3f}s ({json.dumps({k: round(v, 4) for k, v in result['timings'].items()})})")
+
+        assert same, "Batched sync stored different rows"
+        assert batched_s * 3 <= single_s, f"Batched sync only {single_s / batched_s:.1f}x faster"
+
+        logger.info(f"✅ Batched sync {single_s / batched_s:.1f}x faster, 1 commit instead of {single_commits}")
+
+def run_batch_upsert_tests():
+    """Run all batch upsert tests"""
+    logger.info("=" * 60)
+    logger.info("Batch Upsert Test")
+    logger.info("=" * 60)
+
+    tests = [
+        ("Matches Per-Hearing Path", test_matches_per_hearing_path),
+        ("Single Commit", test_single_commit),
+        ("Committee Sync Speedup", test_committee_sync_speedup)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        logger.info(f"\n🧪 Running: {test_name}")
+        try:
+            test_func()
+            passed += 1
+            logger.info(f"✅ {test_name}: PASSED")
+        except Exception as e:
+            logger.error(f"❌ {test_name}: FAILED - {e}")
+
+    logger.info(f"\n📊 Results: {passed}/{total} tests passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = run_batch_upsert_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Test silence-aligned chunk boundary planning in AudioChunker
+Builds synthetic hearing audio with known pauses directly in the PCM cache
+and checks that cuts land in pauses while chunks stay under the size limit
+"""
+
+import sys
+import logging
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from audio_analyzer import AudioAnalysis
+from audio_chunker import AudioChunker
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+from audio.pcm_cache import PCMCache, PCM_SAMPLE_RATE
+import audio.pcm_cache as pcm_cache_module
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def build_hearing(temp_dir, duration, pauses, file_size_mb, noise_floor=0):
+    """
+    Write a stand-in source file and its decoded PCM straight into a PCM cache
+
+    Speech is a loud tone; each (start, end) in pauses is near-silence.
+    """
+    source = temp_dir / "hearing.mp3"
+    source.write_bytes(b"\x00" * 1024)
+
+    t = np.arange(int(duration * PCM_SAMPLE_RATE)) / PCM_SAMPLE_RATE
+    samples = (8000 * np.sin(2 * np.pi * 220 * t)).astype(np.int16)
+    for start, end in pauses:
+        a, b = int(start * PCM_SAMPLE_RATE), int(end * PCM_SAMPLE_RATE)
+        samples[a:b] = noise_floor
+
+    cache = PCMCache(cache_dir=temp_dir / "pcm")
+    (cache.cache_dir / f"{cache._cache_key(source)}.pcm").write_bytes(samples.tobytes())
+    pcm_cache_module._pcm_cache = cache
+
+    analysis = AudioAnalysis(
+        file_path=source,
+        file_size_bytes=int(file_size_mb * 1024 * 1024),
+        file_size_mb=file_size_mb,
+        duration_seconds=duration,
+        duration_minutes=duration / 60,
+        format="mp3",
+        sample_rate=PCM_SAMPLE_RATE,
+        channels=1,
+        bitrate=0,
+        needs_chunking=True,
+        estimated_chunks=int(file_size_mb / 20.0) + 1
+    )
+    return analysis
+
+def test_cuts_snap_to_pauses():
+    """Every cut lands inside a pause near its ideal position"""
+    with tempfile.TemporaryDirectory() as tmp:
+        # 30 minutes, 45 MB -> 3 chunks; pauses near the 10 and 20 minute marks
+        pauses = [(585.0, 586.2), (612.0, 612.5), (1190.0, 1191.0), (1230.0, 1230.4)]
+        analysis = build_hearing(Path(tmp), 1800.0, pauses, 45.0)
+
+        chunker = AudioChunker(temp_base_dir=Path(tmp) / "chunks", use_streaming=False)
+        params = chunker._calculate_chunk_parameters(analysis)
+
+        logger.info(f"Cut points: {params['cut_points']} ({params['boundary_method']})")
+        assert params['boundary_method'] == 'silence_aligned' and len(params['cut_points']) == 2, \
+            "Expected two silence-aligned cuts"
+
+        # The longest pause in each window wins
+        expected = [(585.0, 586.2), (1190.0, 1191.0)]
+        for cut, (start, end) in zip(params['cut_points'], expected):
+            assert start <= cut <= end, f"Cut {cut:.2f}s is not inside pause {start}-{end}"
+
+        logger.info("✅ Cuts snapped to the longest nearby pauses")
+
+def test_size_limit_respected():
+    """A pause beyond the size limit is never chosen"""
+    with tempfile.TemporaryDirectory() as tmp:
+        # 40 MB over 1200 s -> ~35 KB/s; the 20 MB limit allows ~568 s per chunk
+        pauses = [(590.0, 595.0)]  # Long pause just past the size limit
+        analysis = build_hearing(Path(tmp), 1200.0, pauses, 40.0)
+        analysis.estimated_chunks = 2  # Even split would put the cut right in that pause
+
+        chunker = AudioChunker(temp_base_dir=Path(tmp) / "chunks", use_streaming=False)
+        params = chunker._calculate_chunk_parameters(analysis)
+        spans = chunker._chunk_spans(params)
+
+        bytes_per_second = analysis.file_size_bytes / analysis.duration_seconds
+        limit = chunker.max_chunk_size_mb * 1024 * 1024
+        assert not any(590.0 <= cut <= 595.0 for cut in params['cut_points'][:1]), \
+            "First cut moved past the size limit into the pause"
+
+        for span in spans:
+            estimated = span['duration'] * bytes_per_second
+            assert estimated <= limit, f"Chunk {span['chunk_index']} estimated at {estimated / 1024 / 1024:.2f}MB"
+
+        assert spans[-1]['end_time'] == analysis.duration_seconds and spans[0]['start_time'] == 0.0, \
+            "Chunks do not cover the whole recording"
+
+        logger.info(f"✅ {len(spans)} chunks, all under {chunker.max_chunk_size_mb}MB")
+
+def test_quiet_point_fallback():
+    """Without a clean pause the cut goes to the quietest moment in the window"""
+    with tempfile.TemporaryDirectory() as tmp:
+        # A dip to low-level noise is too loud for pause detection but quieter than speech
+        analysis = build_hearing(Path(tmp), 1200.0, [(610.0, 610.6)], 30.0, noise_floor=200)
+
+        chunker = AudioChunker(temp_base_dir=Path(tmp) / "chunks", use_streaming=False)
+        params = chunker._calculate_chunk_parameters(analysis)
+
+        cut = params['cut_points'][0]
+        assert 610.0 <= cut <= 610.6, f"Fallback cut {cut:.2f}s missed the quiet dip"
+
+        logger.info(f"✅ Fallback cut at quiet point {cut:.2f}s")
+
+def test_spans_overlap():
+    """Adjacent chunks share exactly the configured overlap around each cut"""
+    chunker = AudioChunker(use_streaming=False)
+    params = {
+        'overlap_duration': chunker.overlap_duration,
+        'total_duration': 900.0,
+        'cut_points': [301.5, 598.2]
+    }
+    spans = chunker._chunk_spans(params)
+
+    for prev, nxt, cut in zip(spans, spans[1:], params['cut_points']):
+        assert abs(prev['end_time'] - (cut + chunker.overlap_duration)) <= 1e-9, f"Chunk before {cut}s ends early"
+        assert abs(nxt['start_time'] - (cut - chunker.overlap_duration)) <= 1e-9, f"Chunk after {cut}s starts late"
+
+    logger.info(f"✅ {len(spans)} spans with {chunker.overlap_duration}s overlap per side")
+
+def run_chunk_boundary_tests():
+    """Run all chunk boundary tests"""
+    logger.info("=" * 60)
+    logger.info("Silence-Aligned Chunk Boundary Test")
+    logger.info("=" * 60)
+
+    tests = [
+        ("Cuts Snap To Pauses", test_cuts_snap_to_pauses),
+        ("Size Limit Respected", test_size_limit_respected),
+        ("Quiet Point Fallback", test_quiet_point_fallback),
+        ("Span Overlap", test_spans_overlap)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        logger.info(f"\n🧪 Running: {test_name}")
+        try:
+            test_func()
+            passed += 1
+            logger.info(f"✅ {test_name}: PASSED")
+        except Exception as e:
+            logger.error(f"❌ {test_name}: FAILED - {e}")
+
+    logger.info(f"\n📊 Results: {passed}/{total} tests passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = run_chunk_boundary_tests()
+    sys.exit(0 if success else 1)
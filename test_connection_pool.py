@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Test the SQLite connection pool
+Checks connection tuning, checkout reuse, per-thread connections for the
+hearing databases and that reads proceed during a long write
+"""
+
+import sys
+import time
+import sqlite3
+import logging
+import tempfile
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+from storage.connection_pool import SQLiteConnectionPool, get_connection_pool
+from sync.database_schema import UnifiedHearingDatabase
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def test_connection_tuning():
+    """Pooled connections use WAL, NORMAL sync, busy timeout and mmap"""
+    with tempfile.TemporaryDirectory() as tmp:
+        pool = SQLiteConnectionPool(str(Path(tmp) / "tuning.db"))
+        with pool.connection() as conn:
+            settings = {
+                "journal_mode": conn.execute("PRAGMA journal_mode").fetchone()[0],
+                "synchronous": conn.execute("PRAGMA synchronous").fetchone()[0],
+                "busy_timeout": conn.execute("PRAGMA busy_timeout").fetchone()[0],
+                "mmap_size": conn.execute("PRAGMA mmap_size").fetchone()[0]
+            }
+        pool.close_all()
+
+        expected = {"journal_mode": "wal", "synchronous": 1, "busy_timeout": pool.busy_timeout_ms,
+                    "mmap_size": pool.mmap_size}
+        assert settings == expected, f"Connection settings {settings} != {expected}"
+
+        logger.info(f"✅ Connection tuning applied: {settings}")
+
+def test_checkout_reuse():
+    """close() returns connections to the pool with no transaction left open"""
+    with tempfile.TemporaryDirectory() as tmp:
+        pool = SQLiteConnectionPool(str(Path(tmp) / "reuse.db"))
+        conn = pool.acquire()
+        conn.execute("CREATE TABLE items (name TEXT)")
+        conn.commit()
+        conn.execute("INSERT INTO items VALUES ('uncommitted')")
+        conn.close()
+
+        conn = pool.acquire(row_factory=sqlite3.Row)
+        count = conn.execute("SELECT COUNT(*) AS n FROM items").fetchone()["n"]
+        conn.close()
+        assert count == 0, "Uncommitted work leaked to the next borrower"
+
+        # Row factory is per checkout, not sticky
+        conn = pool.acquire()
+        row = conn.execute("SELECT 1").fetchone()
+        conn.close()
+        assert isinstance(row, tuple), "Row factory leaked between checkouts"
+
+        try:
+            conn.execute("SELECT 1")
+            raise AssertionError("Released connection should not be usable")
+        except sqlite3.ProgrammingError:
+            pass
+
+        stats = pool.get_stats()
+        pool.close_all()
+        assert stats["created"] == 1 and stats["reused"] == 2 and stats["in_use"] == 0, \
+            f"Connections not reused: {stats}"
+
+        logger.info(f"✅ Connections reused: {stats}")
+
+def test_thread_connections():
+    """Each thread using a hearing database gets its own connection"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = UnifiedHearingDatabase(str(Path(tmp) / "hearings.db"))
+        connections = {}
+
+        def worker(name):
+            connections[name] = db.connection
+            db.connection.execute("SELECT COUNT(*) FROM hearings_unified").fetchone()
+
+        threads = [threading.Thread(target=worker, args=(f"worker-{i}",)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        connections["main"] = db.connection
+
+        assert len({id(c) for c in connections.values()}) == 5, "Threads shared a connection"
+        assert db.connection is connections["main"], "Thread connection not reused within a thread"
+
+        get_connection_pool(str(db.db_path)).close_all()
+        logger.info("✅ Per-thread connections")
+
+def test_reads_during_long_write():
+    """Dashboard reads are not blocked by an open sync write transaction"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = UnifiedHearingDatabase(str(Path(tmp) / "hearings.db"))
+        db.insert_hearing({"committee_code": "SCOM", "hearing_title": "Existing Hearing",
+                           "hearing_date": "2025-01-15"}, 'congress_api')
+
+        write_started = threading.Event()
+        finish_write = threading.Event()
+
+        def sync_writer():
+            conn = db.connection
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("UPDATE hearings_unified SET meeting_status = 'Completed'")
+            write_started.set()
+            finish_write.wait(5)
+            conn.commit()
+
+        writer = threading.Thread(target=sync_writer)
+        writer.start()
+        write_started.wait(5)
+
+        start = time.perf_counter()
+        status = db.connection.execute("SELECT meeting_status FROM hearings_unified").fetchone()[0]
+        read_ms = (time.perf_counter() - start) * 1000
+
+        finish_write.set()
+        writer.join()
+        get_connection_pool(str(db.db_path)).close_all()
+
+        assert status == "Scheduled", f"Read saw uncommitted status {status}"
+        assert read_ms <= 100, f"Read waited {read_ms:.0f}ms on the writer"
+
+        logger.info(f"✅ Read during open write took {read_ms:.2f}ms")
+
+def run_connection_pool_tests():
+    """Run all connection pool tests"""
+    logger.info("=" * 60)
+    logger.info("Connection Pool Test")
+    logger.info("=" * 60)
+
+    tests = [
+        ("Connection Tuning", test_connection_tuning),
+        ("Checkout Reuse", test_checkout_reuse),
+        ("Thread Connections", test_thread_connections),
+        ("Reads During Long Write", test_reads_during_long_write)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        logger.info(f"\n🧪 Running: {test_name}")
+        try:
+            test_func()
+            passed += 1
+            logger.info(f"✅ {test_name}: PASSED")
+        except Exception as e:
+            logger.error(f"❌ {test_name}: FAILED - {e}")
+
+    logger.info(f"\n📊 Results: {passed}/{total} tests passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = run_connection_pool_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Test materialized dashboard statistics
+Checks that trigger-maintained stats match direct aggregates over the base
+tables through inserts, updates, deletes, review and alert changes, and
+that dashboard reads stay cheap as the hearing table grows
+"""
+
+import sys
+import json
+import time
+import random
+import logging
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+from src.api.database_enhanced import EnhancedUIDatabase
+from src.api import dashboard_stats
+from storage.connection_pool import get_connection_pool
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+COMMITTEES = ["SCOM", "SSCI", "SBAN", "SSJU"]
+
+def direct_stats(conn):
+    """Dashboard numbers computed straight from the base tables"""
+    hearings = conn.execute("""
+        SELECT COUNT(*), IFNULL(SUM(source_api = 1), 0), IFNULL(SUM(source_website = 1), 0),
+               IFNULL(SUM(streams IS NOT NULL AND streams != '{}'), 0), COUNT(DISTINCT committee_code)
+        FROM hearings_unified WHERE created_at >= date('now', '-30 days')
+    """).fetchone()
+    reviews = conn.execute("""
+        SELECT COUNT(*), IFNULL(SUM(status = 'pending'), 0), IFNULL(SUM(status = 'in_progress'), 0),
+               IFNULL(SUM(status = 'completed'), 0),
+               AVG(CASE WHEN status = 'completed' THEN actual_duration_minutes END)
+        FROM review_assignments WHERE created_at >= date('now', '-30 days')
+    """).fetchone()
+    alerts = conn.execute("""
+        SELECT COUNT(*), IFNULL(SUM(resolved = FALSE), 0),
+               IFNULL(SUM(severity = 'critical' AND resolved = FALSE), 0)
+        FROM system_alerts WHERE created_at >= date('now', '-7 days')
+    """).fetchone()
+    committees = [
+        {"committee_code": row[0], "hearing_count": row[1], "latest_hearing": row[2], "avg_confidence": row[3]}
+        for row in conn.execute("""
+            SELECT committee_code, COUNT(*), MAX(hearing_date), AVG(sync_confidence)
+            FROM hearings_unified GROUP BY committee_code ORDER BY COUNT(*) DESC, committee_code
+        """).fetchall()
+    ]
+    queue = conn.execute("""
+        SELECT COUNT(*), IFNULL(SUM(r.pending), 0), IFNULL(SUM(r.in_progress), 0),
+               IFNULL(SUM(h.streams IS NOT NULL AND h.streams != '{}'), 0)
+        FROM hearings_unified h
+        LEFT JOIN (
+            SELECT hearing_id, SUM(status = 'pending') AS pending, SUM(status = 'in_progress') AS in_progress
+            FROM review_assignments GROUP BY hearing_id
+        ) r ON r.hearing_id = CAST(h.id AS TEXT)
+        WHERE h.created_at >= date('now', '-14 days')
+    """).fetchone()
+    types = {
+        code: sorted(((row[0], row[1]) for row in conn.execute("""
+            SELECT hearing_type, COUNT(*) FROM hearings_unified WHERE committee_code = ? GROUP BY hearing_type
+        """, (code,)).fetchall()), key=str)
+        for code in COMMITTEES
+    }
+    return {
+        "hearings": list(hearings),
+        "reviews": [reviews[0], reviews[1], reviews[2], reviews[3], round(reviews[4] or 0, 6)],
+        "alerts": list(alerts),
+        "committees": [{**c, "avg_confidence": round(c["avg_confidence"], 6)} for c in committees],
+        "queue": list(queue),
+        "types": types
+    }
+
+def materialized_stats(db):
+    """The same numbers read from the stats tables"""
+    stats = db.get_dashboard_stats()
+    committees = sorted(db.get_committee_summaries(), key=lambda c: (-c["hearing_count"], c["committee_code"]))
+    return {
+        "hearings": list(stats["hearings"].values()),
+        "reviews": [*list(stats["reviews"].values())[:4], round(stats["reviews"]["avg_review_time"] or 0, 6)],
+        "alerts": list(stats["alerts"].values()),
+        "committees": [{**c, "avg_confidence": round(c["avg_confidence"], 6)} for c in committees],
+        "queue": list(db.get_queue_summary(days=14).values()),
+        "types": {
+            code: sorted(((t["type"], t["count"]) for t in db.get_committee_stats(code)["hearing_types"]), key=str)
+            for code in COMMITTEES
+        }
+    }
+
+def add_hearing(db, rng, i, source='congress_api'):
+    return db.insert_hearing({
+        "committee_code": rng.choice(COMMITTEES),
+        "hearing_title": f"Hearing {i}",
+        "hearing_date": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        "hearing_type": rng.choice(["Hearing", "Markup", None]),
+        "streams": {"isvp_stream": f"https://example.gov/{i}"} if rng.random() < 0.5 else {},
+        "sync_confidence": round(rng.random(), 2)
+    }, source)
+
+def compare(db, stage):
+    expected = direct_stats(db.connection)
+    actual = materialized_stats(db)
+    if expected != actual:
+        for key in expected:
+            if expected[key] != actual[key]:
+                logger.error(f"{stage}: {key} expected {expected[key]}, got {actual[key]}")
+        return False
+    return True
+
+def test_stats_follow_writes():
+    """Stats match direct aggregates after every kind of dashboard-relevant write"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = EnhancedUIDatabase(str(Path(tmp) / "hearings.db"))
+        rng = random.Random(7)
+        conn = db.connection
+
+        ids = [add_hearing(db, rng, i, rng.choice(['congress_api', 'website_scraper'])) for i in range(60)]
+        # Older hearings fall outside the dashboard windows
+        conn.execute("UPDATE hearings_unified SET created_at = datetime('now', '-60 days') WHERE id <= 10")
+        conn.commit()
+        stages = [("inserts", compare(db, "inserts"))]
+
+        assignments = [db.create_review_assignment(str(hearing_id)) for hearing_id in ids[5:30]]
+        for assignment_id in assignments[:8]:
+            db.update_assignment_status(assignment_id, 'in_progress')
+        for assignment_id in assignments[8:14]:
+            db.update_assignment_status(assignment_id, 'completed')
+        conn.execute("UPDATE review_assignments SET actual_duration_minutes = 20 + rowid % 7 "
+                     "WHERE status = 'completed'")
+        conn.commit()
+        stages.append(("reviews", compare(db, "reviews")))
+
+        alerts = [db.create_alert('sync_failure', rng.choice(['low', 'high', 'critical']),
+                                  f"Alert {i}", component='api') for i in range(12)]
+        for alert_id in alerts[:5]:
+            db.resolve_alert(alert_id, 'admin')
+        stages.append(("alerts", compare(db, "alerts")))
+
+        db.update_hearing(ids[20], {"streams": {}, "hearing_type": "Markup"}, 'website_scraper')
+        conn.execute("UPDATE hearings_unified SET committee_code = 'SSJU', hearing_date = '2026-01-05' "
+                     "WHERE id = ?", (ids[21],))
+        conn.execute("DELETE FROM hearings_unified WHERE id IN (?, ?)", (ids[22], ids[40]))
+        conn.execute("DELETE FROM review_assignments WHERE assignment_id = ?", (assignments[0],))
+        conn.execute("DELETE FROM system_alerts WHERE alert_id = ?", (alerts[6],))
+        conn.commit()
+        stages.append(("updates and deletes", compare(db, "updates and deletes")))
+
+        get_connection_pool(str(db.db_path)).close_all()
+        failed = [name for name, ok in stages if not ok]
+        assert not failed, f"Stats diverged after: {failed}"
+
+        logger.info("✅ Materialized stats match direct aggregates")
+
+def test_existing_database_backfill():
+    """Stats are built from existing rows the first time a database is opened"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "hearings.db")
+        db = EnhancedUIDatabase(path)
+        rng = random.Random(3)
+        for i in range(40):
+            add_hearing(db, rng, i)
+        db.create_alert('system_error', 'critical', "Disk full", component='database')
+
+        # Simulate a database from before the stats tables existed
+        for table in dashboard_stats.STATS_TABLES:
+            db.connection.execute(f"DROP TABLE {table}")
+        db.connection.commit()
+
+        reopened = EnhancedUIDatabase(path)
+        matches = compare(reopened, "backfill")
+        rebuilt = dashboard_stats.ensure_dashboard_stats(reopened.connection)
+        get_connection_pool(path).close_all()
+
+        assert matches, "Backfilled stats differ from direct aggregates"
+        assert not rebuilt, "Existing stats tables were rebuilt again"
+
+        logger.info("✅ Stats backfilled for an existing database")
+
+def test_read_cost_independent_of_size():
+    """Dashboard reads touch the small stats tables, not the hearing table"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = EnhancedUIDatabase(str(Path(tmp) / "hearings.db"))
+        rng = random.Random(11)
+        db.connection.executemany("""
+            INSERT INTO hearings_unified (committee_code, hearing_title, hearing_date, hearing_type,
+                                          source_api, streams, sync_confidence)
+            VALUES (?, ?, ?, 'Hearing', 1, ?, ?)
+        """, [
+            (rng.choice(COMMITTEES), f"Hearing {i}", f"2025-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}",
+             json.dumps({"isvp_stream": "x"} if i % 2 else {}), rng.random())
+            for i in range(30000)
+        ])
+        db.connection.commit()
+
+        def timed(func, repeat=20):
+            start = time.perf_counter()
+            for _ in range(repeat):
+                func()
+            return (time.perf_counter() - start) / repeat * 1000
+
+        materialized_ms = timed(lambda: (db.get_dashboard_stats(), db.get_committee_summaries(),
+                                         db.get_queue_summary()))
+        direct_ms = timed(lambda: direct_stats(db.connection), repeat=5)
+        totals = db.get_dashboard_stats()["hearings"]["total_hearings"]
+        get_connection_pool(str(db.db_path)).close_all()
+
+        logger.info(f"Dashboard read: materialized {materialized_ms:.2f}ms, direct {direct_ms:.2f}ms")
+        assert totals == 30000, f"Expected 30000 hearings in stats, got {totals}"
+        assert materialized_ms * 10 <= direct_ms, "Materialized reads should be at least 10x cheaper than scanning"
+
+        logger.info("✅ Dashboard reads independent of table size")
+
+def run_dashboard_stats_tests():
+    """Run all dashboard stats tests"""
+    logger.info("=" * 60)
+    logger.info("Dashboard Stats Test")
+    logger.info("=" * 60)
+
+    tests = [
+        ("Stats Follow Writes", test_stats_follow_writes),
+        ("Existing Database Backfill", test_existing_database_backfill),
+        ("Read Cost Independent Of Size", test_read_cost_independent_of_size)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        logger.info(f"\n🧪 Running: {test_name}")
+        try:
+            test_func()
+            passed += 1
+            logger.info(f"✅ {test_name}: PASSED")
+        except Exception as e:
+            logger.error(f"❌ {test_name}: FAILED - {e}")
+
+    logger.info(f"\n📊 Results: {passed}/{total} tests passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = run_dashboard_stats_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Test voice-activity-based dead air removal
+Builds synthetic hearing audio with a pre-gavel silence and a recess directly
+in the PCM cache, then checks span detection and timestamp restoration
+"""
+
+import sys
+import logging
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+from audio.pcm_cache import PCMCache, PCM_SAMPLE_RATE
+from audio.dead_air import DeadAirRemover, OffsetMap
+import audio.pcm_cache as pcm_cache_module
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def build_hearing(temp_dir, duration, quiet_spans, bursts=()):
+    """
+    Write a stand-in source file and its decoded PCM straight into a PCM cache
+
+    Speech is a loud tone; quiet_spans are low room noise and bursts are
+    short loud events (gavels, coughs) inside them.
+    """
+    source = temp_dir / "hearing.mp3"
+    source.write_bytes(b"\x00" * 1024)
+
+    t = np.arange(int(duration * PCM_SAMPLE_RATE)) / PCM_SAMPLE_RATE
+    samples = (8000 * np.sin(2 * np.pi * 220 * t)).astype(np.int16)
+    rng = np.random.default_rng(0)
+    for start, end in quiet_spans:
+        a, b = int(start * PCM_SAMPLE_RATE), int(end * PCM_SAMPLE_RATE)
+        samples[a:b] = rng.integers(-50, 50, b - a)
+    for start, end in bursts:
+        a, b = int(start * PCM_SAMPLE_RATE), int(end * PCM_SAMPLE_RATE)
+        samples[a:b] = 20000
+
+    cache = PCMCache(cache_dir=temp_dir / "pcm")
+    (cache.cache_dir / f"{cache._cache_key(source)}.pcm").write_bytes(samples.tobytes())
+    pcm_cache_module._pcm_cache = cache
+    return cache.get(source)
+
+def test_detects_all_dead_air():
+    """Head silence and a mid-hearing recess are found; short pauses are kept"""
+    with tempfile.TemporaryDirectory() as tmp:
+        # Pre-gavel silence, a 2 s pause, and a recess interrupted by a gavel strike
+        quiet = [(0.0, 120.0), (300.0, 302.0), (400.0, 700.0)]
+        pcm = build_hearing(Path(tmp), 900.0, quiet, bursts=[(550.0, 550.1)])
+
+        remover = DeadAirRemover(min_dead_air=20.0, padding=1.0)
+        dead_air = remover.detect_dead_air(pcm)
+        logger.info(f"Dead air spans: {dead_air}")
+
+        assert len(dead_air) == 2, f"Expected 2 dead air spans, found {len(dead_air)}"
+
+        head, recess = dead_air
+        assert head['start'] == 0.0 and 118.5 <= head['end'] <= 119.5, \
+            f"Head span {head} should stop one padding second before speech"
+        assert 400.5 <= recess['start'] <= 401.5 and 698.5 <= recess['end'] <= 699.5, \
+            f"Recess span {recess} should ignore the gavel strike"
+
+        offset_map = remover.build_offset_map(pcm.duration, dead_air)
+        removed = head['duration'] + recess['duration']
+        assert abs(offset_map.removed_seconds - removed) <= 0.01, \
+            "Offset map does not account for every removed second"
+
+        logger.info(f"✅ Removed {offset_map.removed_seconds:.1f}s of {pcm.duration:.0f}s")
+
+def test_restores_timestamps():
+    """Segment and word timestamps map back to the original recording"""
+    # Kept: 100-200 (compacted 0-100) and 500-600 (compacted 100-200)
+    offset_map = OffsetMap.from_kept_ranges([(100.0, 200.0), (500.0, 600.0)], 600.0)
+
+    transcript = {
+        'duration': 200.0,
+        'segments': [
+            {'start': 10.0, 'end': 20.0, 'text': 'first',
+             'words': [{'word': 'first', 'start': 10.0, 'end': 10.4}]},
+            {'start': 95.0, 'end': 100.0, 'text': 'before recess'},
+            {'start': 100.0, 'end': 104.0, 'text': 'after recess',
+             'words': [{'word': 'after', 'start': 100.0, 'end': 100.3}]}
+        ],
+        'words': [{'word': 'late', 'start': 150.0, 'end': 150.5}]
+    }
+
+    restored = offset_map.restore_transcript(transcript)
+    segments = restored['segments']
+    expected = [(110.0, 120.0), (195.0, 200.0), (500.0, 504.0)]
+    actual = [(s['start'], s['end']) for s in segments]
+    assert actual == expected, f"Segment times {actual} != {expected}"
+
+    assert segments[0]['words'][0]['start'] == 110.0 and segments[2]['words'][0]['start'] == 500.0, \
+        "Nested word timestamps were not restored"
+    assert restored['words'][0]['start'] == 550.0, "Top-level word timestamps were not restored"
+    assert transcript['segments'][0]['start'] == 10.0, "Input transcript was modified in place"
+    assert restored['duration'] == 600.0 and restored['dead_air_removal']['removed_seconds'] == 400.0, \
+        "Transcript duration/removal metadata not updated"
+
+    reloaded = OffsetMap.from_dict(offset_map.to_dict())
+    assert reloaded.to_original(150.0) == 550.0, "Offset map did not survive serialization"
+
+    logger.info("✅ Timestamps restored across the removed recess")
+
+def test_no_dead_air():
+    """Continuous speech yields an identity map"""
+    with tempfile.TemporaryDirectory() as tmp:
+        pcm = build_hearing(Path(tmp), 300.0, [(100.0, 110.0)])
+        remover = DeadAirRemover(min_dead_air=20.0)
+        dead_air = remover.detect_dead_air(pcm)
+        offset_map = remover.build_offset_map(pcm.duration, dead_air)
+
+        assert not dead_air and offset_map.removed_seconds == 0.0 and offset_map.to_original(123.4) == 123.4, \
+            "Short pause should not be removed"
+
+        logger.info("✅ No dead air removed from continuous speech")
+
+def run_dead_air_tests():
+    """Run all dead air removal tests"""
+    logger.info("=" * 60)
+    logger.info("Dead Air Removal Test")
+    logger.info("=" * 60)
+
+    tests = [
+        ("Detects All Dead Air", test_detects_all_dead_air),
+        ("Restores Timestamps", test_restores_timestamps),
+        ("No Dead Air", test_no_dead_air)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        logger.info(f"\n🧪 Running: {test_name}")
+        try:
+            test_func()
+            passed += 1
+            logger.info(f"✅ {test_name}: PASSED")
+        except Exception as e:
+            logger.error(f"❌ {test_name}: FAILED - {e}")
+
+    logger.info(f"\n📊 Results: {passed}/{total} tests passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = run_dead_air_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Test blocked candidate generation in the deduplication engine
+Checks candidate pairs are exactly the committee/date-compatible pairs,
+that blocked and pruned matching gives the same matches as scoring every
+pair, and that candidate work grows linearly with the number of hearings
+"""
+
+import sys
+import time
+import random
+import logging
+from pathlib import Path
+from datetime import date, timedelta
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+from sync.deduplication_engine import DeduplicationEngine
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+TOPICS = ["ai", "oversight", "privacy", "budget", "defense", "nomination", "cyber", "energy", "water",
+          "health", "trade", "veterans", "markup", "hearing", "session", "executive", "the", "on"]
+
+def make_hearings(count, seed, committees=4, days=180, undated=0.05):
+    """Hearings with near-duplicate titles, missing dates and JSON-string fields"""
+    rng = random.Random(seed)
+    hearings = []
+    for i in range(count):
+        hearing = {
+            'id': i,
+            'committee_code': rng.choice([f"C{c:02d}" for c in range(committees)] + [None]),
+            'hearing_title': ' '.join(rng.choices(TOPICS, k=rng.randint(0, 6))),
+            'hearing_date': (date(2025, 1, 1) + timedelta(days=rng.randint(0, days))).isoformat()
+        }
+        if rng.random() < undated:
+            hearing['hearing_date'] = rng.choice(["", None, "TBD"])
+        if rng.random() < 0.4:
+            hearing['witnesses'] = rng.choice([[{'name': 'Dr. Smith'}], '[{"name": "Dr. Smith"}]', []])
+        if rng.random() < 0.4:
+            hearing['location_info'] = rng.choice([{'room': '253', 'building': 'Hart'}, '{"room": "106"}'])
+        if rng.random() < 0.2:
+            hearing['hearing_title'] += ' 10:00 AM'
+        hearings.append(hearing)
+    return hearings
+
+def test_candidates_are_compatible_pairs():
+    """Candidate pairs are exactly the pairs the compatibility check accepts"""
+    engine = DeduplicationEngine()
+    hearings = make_hearings(400, seed=1)
+    profiles = [engine.profile_hearing(hearing) for hearing in hearings]
+
+    candidates = list(engine.candidate_pairs(profiles))
+    compatible = {
+        (i, j) for i in range(len(hearings)) for j in range(i + 1, len(hearings))
+        if engine._quick_compatibility_check(hearings[i], hearings[j])
+    }
+
+    assert len(candidates) == len(set(candidates)), "Candidate pairs contain repeats"
+    assert set(candidates) == compatible, \
+        f"Candidates differ from compatible pairs: {len(set(candidates) ^ compatible)} pairs"
+
+    logger.info(f"✅ {len(candidates)} candidate pairs, all compatible, none missed")
+
+def test_matches_equal_all_pairs():
+    """Blocking and title pruning find the same matches as scoring every pair"""
+    engine = DeduplicationEngine()
+    for seed in range(3):
+        hearings = make_hearings(500, seed=seed)
+
+        # Reference: score every pair in input order, no pruning
+        reference = []
+        for i, hearing1 in enumerate(hearings):
+            for hearing2 in hearings[i + 1:]:
+                if hearing1.get('id') == hearing2.get('id'):
+                    continue
+                match = engine._calculate_similarity(hearing1, hearing2)
+                if match and match.similarity_score >= engine.manual_review_threshold:
+                    reference.append(match)
+        reference.sort(key=lambda m: m.similarity_score, reverse=True)
+
+        matches = engine.find_duplicates(hearings)
+        assert matches == reference, \
+            f"Seed {seed}: {len(matches)} blocked matches vs {len(reference)} from all pairs"
+
+    logger.info("✅ Blocked matches equal all-pairs matches")
+
+def test_backfill_is_near_linear():
+    """Candidate pairs grow linearly with dated hearings spread over a multi-year backfill"""
+    engine = DeduplicationEngine()
+    results = {}
+    for count in (5000, 20000):
+        # Same density per committee-day: more hearings span more years. Undated
+        # hearings still pair with their whole committee, so none here.
+        hearings = make_hearings(count, seed=7, committees=20, days=count // 5, undated=0)
+        profiles = [engine.profile_hearing(hearing) for hearing in hearings]
+        pairs = sum(1 for _ in engine.candidate_pairs(profiles))
+
+        start = time.perf_counter()
+        matches = engine.find_duplicates(hearings)
+        elapsed = time.perf_counter() - start
+        results[count] = pairs
+        logger.info(f"{count} hearings: {pairs} candidate pairs of {count * (count - 1) // 2}, "
+                    f"{len(matches)} matches in {elapsed:.1f}s")
+
+    growth = results[20000] / results[5000]
+    assert growth <= 4 * 1.5, f"Candidate pairs grew {growth:.1f}x for 4x the hearings"
+
+    logger.info(f"✅ Candidate pairs grew {growth:.1f}x for 4x the hearings")
+
+def run_deduplication_blocking_tests():
+    """Run all deduplication blocking tests"""
+    logger.info("=" * 60)
+    logger.info("Deduplication Blocking Test")
+    logger.info("=" * 60)
+
+    tests = [
+        ("Candidates Are Compatible Pairs", test_candidates_are_compatible_pairs),
+        ("Matches Equal All Pairs", test_matches_equal_all_pairs),
+        ("Backfill Is Near Linear", test_backfill_is_near_linear)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        logger.info(f"\n🧪 Running: {test_name}")
+        try:
+            test_func()
+            passed += 1
+            logger.info(f"✅ {test_name}: PASSED")
+        except Exception as e:
+            logger.error(f"❌ {test_name}: FAILED - {e}")
+
+    logger.info(f"\n📊 Results: {passed}/{total} tests passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = run_deduplication_blocking_tests()
+    sys.exit(0 if success else 1)
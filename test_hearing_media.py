@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Test derived media columns on hearings_unified
+Checks stream and witness facts are derived from the JSON columns on every
+write path, backfilled on existing databases, and that listing from them
+beats parsing the JSON per row
+"""
+
+import sys
+import json
+import time
+import logging
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+from storage.hearing_media import MEDIA_COLUMNS, MEDIA_INDEXES, MEDIA_TRIGGERS, split_stream_types
+from storage.connection_pool import get_connection_pool
+from sync.database_schema import UnifiedHearingDatabase
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# (streams JSON, witnesses JSON, expected derived values)
+CASES = [
+    ({"isvp_stream": "https://senate.gov/isvp/1", "youtube": "https://youtube.com/x"}, ["A. Smith", "B. Jones"],
+     (1, "isvp_stream", "https://senate.gov/isvp/1", ["isvp_stream", "youtube"], 2)),
+    ({}, [], (0, None, None, [], 0)),
+    ({"audio_stream": ""}, None, (0, None, None, [], 0)),
+    ({"video_stream": {"url": "https://senate.gov/v/2"}}, [{"name": "C. Lee"}],
+     (1, "video_stream", "https://senate.gov/v/2", ["video_stream"], 1)),
+    ("not json", "not json", (0, None, None, [], 0))
+]
+
+def derived(conn, hearing_id):
+    row = conn.execute("""
+        SELECT has_audio_stream, primary_stream_type, primary_stream_url, stream_types, witness_count
+        FROM hearings_unified WHERE id = ?
+    """, (hearing_id,)).fetchone()
+    return (row[0], row[1], row[2], split_stream_types(row[3]), row[4])
+
+def raw_insert(conn, streams, witnesses, title="Hearing"):
+    encode = lambda value: value if isinstance(value, str) or value is None else json.dumps(value)
+    cursor = conn.execute("""
+        INSERT INTO hearings_unified (committee_code, hearing_title, hearing_date, streams, witnesses)
+        VALUES ('SCOM', ?, '2025-03-01', ?, ?)
+    """, (title, encode(streams), encode(witnesses)))
+    return cursor.lastrowid
+
+def test_columns_follow_writes():
+    """Derived columns are set on insert and follow stream and witness updates"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = UnifiedHearingDatabase(str(Path(tmp) / "hearings.db"))
+        conn = db.connection
+        failures = []
+
+        for streams, witnesses, expected in CASES:
+            hearing_id = raw_insert(conn, streams, witnesses)
+            if derived(conn, hearing_id) != expected:
+                failures.append(("insert", streams, derived(conn, hearing_id)))
+
+        # Writes through the database API
+        hearing_id = db.insert_hearing({"committee_code": "SSCI", "hearing_title": "Open Hearing",
+                                        "hearing_date": "2025-04-02",
+                                        "streams": {"isvp_stream": "https://senate.gov/isvp/9"},
+                                        "witnesses": ["D. Park"]}, 'congress_api')
+        if derived(conn, hearing_id) != (1, "isvp_stream", "https://senate.gov/isvp/9", ["isvp_stream"], 1):
+            failures.append(("insert_hearing", derived(conn, hearing_id)))
+
+        db.update_hearing(hearing_id, {"streams": {}, "witnesses": ["D. Park", "E. Wu", "F. Diaz"]},
+                          'website_scraper')
+        if derived(conn, hearing_id) != (0, None, None, [], 3):
+            failures.append(("update_hearing", derived(conn, hearing_id)))
+
+        get_connection_pool(str(db.db_path)).close_all()
+        assert not failures, f"Derived columns wrong: {failures}"
+
+        logger.info("✅ Derived media columns follow writes")
+
+def test_existing_database_backfill():
+    """Opening a database without the columns adds and fills them"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "hearings.db")
+        db = UnifiedHearingDatabase(path)
+        conn = db.connection
+
+        # Roll the table back to its shape before the derived columns existed
+        for trigger in MEDIA_TRIGGERS:
+            conn.execute(f"DROP TRIGGER {trigger}")
+        for index_sql in MEDIA_INDEXES:
+            conn.execute(f"DROP INDEX {index_sql.split()[5]}")
+        for column in MEDIA_COLUMNS:
+            conn.execute(f"ALTER TABLE hearings_unified DROP COLUMN {column.split()[0]}")
+        ids = [raw_insert(conn, streams, witnesses) for streams, witnesses, _ in CASES]
+        conn.commit()
+        get_connection_pool(path).close_all()
+
+        reopened = UnifiedHearingDatabase(path)
+        results = [derived(reopened.connection, hearing_id) for hearing_id in ids]
+        get_connection_pool(path).close_all()
+
+        assert results == [expected for _, _, expected in CASES], f"Backfilled values wrong: {results}"
+
+        logger.info("✅ Derived media columns backfilled")
+
+def test_listing_skips_json_parsing():
+    """Listing a committee from derived columns is faster than parsing JSON per row"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = UnifiedHearingDatabase(str(Path(tmp) / "hearings.db"))
+        conn = db.connection
+        streams = json.dumps({"isvp_stream": "https://senate.gov/isvp/x", "youtube": "https://youtube.com/y",
+                              "archive_links": [f"https://senate.gov/archive/{i}" for i in range(5)]})
+        witnesses = json.dumps([{"name": f"Witness {i}", "title": "Director", "organization": "Agency"}
+                                for i in range(8)])
+        conn.executemany("""
+            INSERT INTO hearings_unified (committee_code, hearing_title, hearing_date, streams, witnesses)
+            VALUES ('SCOM', ?, '2025-05-01', ?, ?)
+        """, [(f"Hearing {i}", streams, witnesses) for i in range(5000)])
+        conn.commit()
+
+        def parse_listing():
+            return [{"streams": json.loads(row[0]), "witness_count": len(json.loads(row[1]))}
+                    for row in conn.execute("SELECT streams, witnesses FROM hearings_unified "
+                                            "WHERE committee_code = 'SCOM'").fetchall()]
+
+        def derived_listing():
+            return [{"stream_types": split_stream_types(row[0]), "witness_count": row[1],
+                     "has_audio_stream": bool(row[2])}
+                    for row in conn.execute("SELECT stream_types, witness_count, has_audio_stream "
+                                            "FROM hearings_unified WHERE committee_code = 'SCOM'").fetchall()]
+
+        def timed(func, repeat=5):
+            func()
+            start = time.perf_counter()
+            for _ in range(repeat):
+                func()
+            return (time.perf_counter() - start) / repeat * 1000
+
+        parsed_ms = timed(parse_listing)
+        derived_ms = timed(derived_listing)
+        sample = derived_listing()[0]
+        get_connection_pool(str(db.db_path)).close_all()
+
+        logger.info(f"5000-row listing: JSON parsing {parsed_ms:.1f}ms, derived columns {derived_ms:.1f}ms")
+        assert sample == {"stream_types": ["isvp_stream", "youtube", "archive_links"], "witness_count": 8,
+                          "has_audio_stream": True}, f"Unexpected derived listing row: {sample}"
+        assert derived_ms * 2 <= parsed_ms, "Derived column listing should be at least twice as fast"
+
+        logger.info("✅ Listing avoids per-row JSON parsing")
+
+def run_hearing_media_tests():
+    """Run all hearing media tests"""
+    logger.info("=" * 60)
+    logger.info("Hearing Media Columns Test")
+    logger.info("=" * 60)
+
+    tests = [
+        ("Columns Follow Writes", test_columns_follow_writes),
+        ("Existing Database Backfill", test_existing_database_backfill),
+        ("Listing Skips JSON Parsing", test_listing_skips_json_parsing)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        logger.info(f"\n🧪 Running: {test_name}")
+        try:
+            test_func()
+            passed += 1
+            logger.info(f"✅ {test_name}: PASSED")
+        except Exception as e:
+            logger.error(f"❌ {test_name}: FAILED - {e}")
+
+    logger.info(f"\n📊 Results: {passed}/{total} tests passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = run_hearing_media_tests()
+    sys.exit(0 if success else 1)
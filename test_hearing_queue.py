@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Test hearing queue keyset pagination
+Checks the trigger-maintained typed join and queue priority columns, that
+cursor pages walk the same order as the full queue, the migration for
+existing databases, and that deep pages cost the same as the first
+"""
+
+import sys
+import time
+import random
+import sqlite3
+import logging
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+from src.api.database_enhanced import EnhancedUIDatabase
+from src.api.hearing_queue import (fetch_queue_page, encode_queue_cursor, decode_queue_cursor,
+                                   QueueCountCache, QUEUE_ORDER)
+from src.api.queue_migration import QueueMigration
+from storage.connection_pool import get_connection_pool
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+COMMITTEES = ["SCOM", "SSCI", "SBAN", "SSJU"]
+
+def populate(db, hearings, seed=0):
+    rng = random.Random(seed)
+    db.connection.executemany("""
+        INSERT INTO hearings_unified (committee_code, hearing_title, hearing_date, streams)
+        VALUES (?, ?, ?, '{}')
+    """, [
+        (rng.choice(COMMITTEES), f"Hearing {i}", f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}")
+        for i in range(hearings)
+    ])
+    db.connection.commit()
+    return rng
+
+def expected_queue_columns(conn):
+    """hearing_ref and queue_priority recomputed from scratch"""
+    refs = conn.execute("""
+        SELECT assignment_id, CASE WHEN CAST(CAST(hearing_id AS INTEGER) AS TEXT) = hearing_id
+                                   THEN CAST(hearing_id AS INTEGER) END
+        FROM review_assignments ORDER BY assignment_id
+    """).fetchall()
+    priorities = conn.execute("""
+        SELECT h.id, IFNULL(MAX(ra.priority), 0) FROM hearings_unified h
+        LEFT JOIN review_assignments ra ON CAST(h.id AS TEXT) = ra.hearing_id
+        GROUP BY h.id ORDER BY h.id
+    """).fetchall()
+    return [tuple(r) for r in refs], [tuple(p) for p in priorities]
+
+def actual_queue_columns(conn):
+    refs = conn.execute("SELECT assignment_id, hearing_ref FROM review_assignments ORDER BY assignment_id").fetchall()
+    priorities = conn.execute("SELECT id, queue_priority FROM hearings_unified ORDER BY id").fetchall()
+    return [tuple(r) for r in refs], [tuple(p) for p in priorities]
+
+def test_queue_columns_follow_assignments():
+    """Typed join and queue priority track review assignment writes"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = EnhancedUIDatabase(str(Path(tmp) / "hearings.db"))
+        rng = populate(db, 50)
+        conn = db.connection
+
+        assignments = [db.create_review_assignment(str(rng.randint(1, 50)), priority=rng.randint(0, 9))
+                       for _ in range(30)]
+        assignments.append(db.create_review_assignment("not-a-hearing", priority=5))
+        checks = [("inserts", expected_queue_columns(conn) == actual_queue_columns(conn))]
+
+        conn.execute("UPDATE review_assignments SET priority = 10 WHERE assignment_id = ?", (assignments[0],))
+        conn.execute("UPDATE review_assignments SET hearing_id = '7' WHERE assignment_id = ?", (assignments[1],))
+        conn.execute("DELETE FROM review_assignments WHERE assignment_id IN (?, ?)", tuple(assignments[2:4]))
+        conn.commit()
+        checks.append(("updates and deletes", expected_queue_columns(conn) == actual_queue_columns(conn)))
+
+        get_connection_pool(str(db.db_path)).close_all()
+        failed = [name for name, ok in checks if not ok]
+        assert not failed, f"Queue columns diverged after: {failed}"
+
+        logger.info("✅ Queue columns maintained by triggers")
+
+def test_cursor_pages_cover_queue():
+    """Following next_cursor visits every hearing once, in queue order"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = EnhancedUIDatabase(str(Path(tmp) / "hearings.db"))
+        rng = populate(db, 230, seed=4)
+        for _ in range(60):
+            db.create_review_assignment(str(rng.randint(1, 230)), priority=rng.randint(0, 3))
+        conn = db.connection
+
+        results = []
+        for conditions, params in [([], []), (["h.committee_code IN (?, ?)"], ["SCOM", "SBAN"])]:
+            where_clause = " AND " + " AND ".join(conditions) if conditions else ""
+            expected = [row[0] for row in conn.execute(
+                f"SELECT h.id FROM hearings_unified h WHERE 1=1 {where_clause} ORDER BY {QUEUE_ORDER}",
+                params).fetchall()]
+
+            seen, cursor, pages = [], None, 0
+            while True:
+                rows, cursor = fetch_queue_page(conn, conditions, params, limit=25, cursor=cursor)
+                seen.extend(row["id"] for row in rows)
+                pages += 1
+                if cursor is None:
+                    break
+            results.append(seen == expected and pages == -(-len(expected) // 25))
+
+        try:
+            decode_queue_cursor("not-a-cursor")
+            results.append(False)
+        except ValueError:
+            results.append(True)
+
+        get_connection_pool(str(db.db_path)).close_all()
+        assert all(results), f"Cursor paging mismatch: {results}"
+
+        logger.info("✅ Cursor pages cover the queue in order")
+
+def test_migration_backfills_existing():
+    """The migration adds and fills the queue columns on an older database"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "hearings.db")
+        db = EnhancedUIDatabase(path)
+        rng = populate(db, 40, seed=2)
+        conn = db.connection
+
+        # Roll the database back to its shape before the queue columns existed
+        for trigger in ("queue_review_assignments_ai", "queue_review_assignments_au",
+                        "queue_review_assignments_ad"):
+            conn.execute(f"DROP TRIGGER {trigger}")
+        for index in ("idx_review_assignments_hearing_ref", "idx_hearings_queue_order",
+                      "idx_hearings_committee_queue_order"):
+            conn.execute(f"DROP INDEX {index}")
+        conn.execute("ALTER TABLE review_assignments DROP COLUMN hearing_ref")
+        conn.execute("ALTER TABLE hearings_unified DROP COLUMN queue_priority")
+        for i in range(20):
+            conn.execute("INSERT INTO review_assignments (assignment_id, hearing_id, priority) VALUES (?, ?, ?)",
+                         (f"a{i}", str(rng.randint(1, 40)), rng.randint(0, 9)))
+        conn.commit()
+        get_connection_pool(path).close_all()
+
+        migrated = QueueMigration(path).run_migration()
+
+        check = sqlite3.connect(path)
+        matches = expected_queue_columns(check) == actual_queue_columns(check)
+        plan = check.execute(f"EXPLAIN QUERY PLAN SELECT h.id FROM hearings_unified h "
+                             f"ORDER BY {QUEUE_ORDER} LIMIT 10").fetchall()
+        check.close()
+
+        assert migrated and matches, f"Migration result {migrated}, columns match {matches}"
+        assert not any("TEMP B-TREE" in row[-1] for row in plan), f"Queue order needs a sort: {plan}"
+
+        logger.info("✅ Migration backfilled queue columns and indexes")
+
+def test_deep_pages_cost_like_first():
+    """A page deep in the queue loads about as fast as page one"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = EnhancedUIDatabase(str(Path(tmp) / "hearings.db"))
+        rng = populate(db, 60000, seed=9)
+        conn = db.connection
+        conn.executemany("INSERT INTO review_assignments (assignment_id, hearing_id, priority) VALUES (?, ?, ?)",
+                         [(f"a{i}", str(rng.randint(1, 60000)), rng.randint(0, 5)) for i in range(3000)])
+        conn.commit()
+
+        # Cursor for a page about 55,000 hearings in
+        deep_row = conn.execute(f"SELECT h.queue_priority, h.hearing_date, h.id FROM hearings_unified h "
+                                f"ORDER BY {QUEUE_ORDER} LIMIT 1 OFFSET 55000").fetchone()
+        deep_cursor = encode_queue_cursor(dict(deep_row))
+
+        def timed(func, repeat=10):
+            func()
+            start = time.perf_counter()
+            for _ in range(repeat):
+                func()
+            return (time.perf_counter() - start) / repeat * 1000
+
+        first_ms = timed(lambda: fetch_queue_page(conn, [], [], limit=100))
+        deep_ms = timed(lambda: fetch_queue_page(conn, [], [], limit=100, cursor=deep_cursor))
+        offset_ms = timed(lambda: fetch_queue_page(conn, [], [], limit=100, offset=55000), repeat=3)
+
+        counts = QueueCountCache()
+        conditions, params = ["h.hearing_date >= ?"], ["2025-06-01"]
+        counts.count(conn, conditions, params)
+        cached_ms = timed(lambda: counts.count(conn, conditions, params))
+        get_connection_pool(str(db.db_path)).close_all()
+
+        logger.info(f"Page 1 {first_ms:.2f}ms, cursor page at 55k {deep_ms:.2f}ms, "
+                    f"offset 55k {offset_ms:.2f}ms, cached count {cached_ms:.3f}ms")
+        assert deep_ms <= first_ms * 3 + 1, "Deep cursor page is much slower than the first page"
+        assert cached_ms <= 1, "Filtered count was not served from cache"
+
+        logger.info("✅ Deep pages load in first-page time")
+
+def run_hearing_queue_tests():
+    """Run all hearing queue tests"""
+    logger.info("=" * 60)
+    logger.info("Hearing Queue Test")
+    logger.info("=" * 60)
+
+    tests = [
+        ("Queue Columns Follow Assignments", test_queue_columns_follow_assignments),
+        ("Cursor Pages Cover Queue", test_cursor_pages_cover_queue),
+        ("Migration Backfills Existing", test_migration_backfills_existing),
+        ("Deep Pages Cost Like First", test_deep_pages_cost_like_first)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        logger.info(f"\n🧪 Running: {test_name}")
+        try:
+            test_func()
+            passed += 1
+            logger.info(f"✅ {test_name}: PASSED")
+        except Exception as e:
+            logger.error(f"❌ {test_name}: FAILED - {e}")
+
+    logger.info(f"\n📊 Results: {passed}/{total} tests passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = run_hearing_queue_tests()
+    sys.exit(0 if success else 1)
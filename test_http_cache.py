@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Test the HTTP response cache used for committee website scraping
+Checks conditional revalidation and body-hash change detection, that the
+scraper skips parsing unchanged pages and fetching pages of hearings it
+already knows, and that hit rates are reported per domain
+"""
+
+import sys
+import logging
+import tempfile
+import threading
+from pathlib import Path
+from datetime import datetime
+from unittest.mock import patch
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+from storage.connection_pool import get_connection_pool
+from sync.http_cache import HTTPCache
+from sync import committee_scraper
+from sync.committee_scraper import CommitteeWebsiteScraper
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+class PageServer:
+    """Local web server with editable pages, optionally sending ETags"""
+
+    def __init__(self):
+        self.pages = {}  # path -> (body, etag or None)
+        self.requests = {}
+        self.not_modified = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests[self.path] = server.requests.get(self.path, 0) + 1
+                if self.path not in server.pages:
+                    self.send_error(404)
+                    return
+                body, etag = server.pages[self.path]
+                if etag and self.headers.get('If-None-Match') == etag:
+                    server.not_modified += 1
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                if etag:
+                    self.send_header('ETag', etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.port = self.httpd.server_address[1]
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def url(self, path, host='127.0.0.1'):
+        return f"http://{host}:{self.port}{path}"
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+def hearing_page(number, witness):
+    today = datetime.now().strftime('%m/%d/%Y')
+    return (f"<html><h1>Oversight Hearing {number}</h1><span class='date'>{today}</span>"
+            f"<div class='witness'>{witness}</div><iframe src='https://www.senate.gov/isvp/?comm={number}'>"
+            f"</iframe></html>").encode()
+
+def test_conditional_revalidation():
+    """Validators give 304s, same bodies are detected by hash, and parses follow the body"""
+    server = PageServer()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = HTTPCache(str(Path(tmp) / "http_cache.db"))
+            session = requests.Session()
+            tagged, untagged = server.url('/tagged'), server.url('/untagged')
+            server.pages['/tagged'] = (b"<p>v1</p>", '"v1"')
+            server.pages['/untagged'] = (b"<p>same</p>", None)
+
+            first = [cache.fetch(session, url) for url in (tagged, untagged)]
+            cache.set_parsed(tagged, {'links': ['a']})
+            cache.set_parsed(untagged, {'links': ['b']})
+            second = [cache.fetch(session, url) for url in (tagged, untagged)]
+
+            server.pages['/tagged'] = (b"<p>v2</p>", '"v2"')
+            changed_entry, changed = cache.fetch(session, tagged)
+            stored = cache.get(tagged)
+            stats = cache.get_domain_stats()
+            get_connection_pool(str(cache.db_path)).close_all()
+
+            checks = [
+                ("first fetch changed", all(changed for _, changed in first)),
+                ("304 reused body", not second[0][1] and second[0][0].body == b"<p>v1</p>"
+                 and server.not_modified == 1),
+                ("same body unchanged", not second[1][1]),
+                ("parse kept while unchanged", second[0][0].parsed == {'links': ['a']}
+                 and second[1][0].parsed == {'links': ['b']}),
+                ("change detected", changed and changed_entry.text == "<p>v2</p>"),
+                ("parse cleared on change", stored.parsed is None and stored.etag == '"v2"'),
+                ("hit rate", stats['127.0.0.1:' + str(server.port)]['hit_rate'] == 0.4)
+            ]
+            failed = [name for name, ok in checks if not ok]
+            assert not failed, f"Revalidation checks failed: {failed} ({stats})"
+
+            logger.info("✅ 304s and unchanged bodies keep their parse; changed bodies drop it")
+    finally:
+        server.close()
+
+def test_scraper_skips_unchanged_and_known():
+    """Unchanged pages are not re-parsed, and known hearings' pages are not re-fetched"""
+    server = PageServer()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = HTTPCache(str(Path(tmp) / "http_cache.db"))
+            scraper = CommitteeWebsiteScraper(cache=cache)
+            scraper.committee_configs['TEST'] = {
+                'base_url': server.url(''),
+                'hearings_path': '/hearings',
+                'date_format': '%m/%d/%Y',
+                'selectors': {
+                    'hearing_links': 'a[href*="/hearings/"]',
+                    'title': 'h1',
+                    'date': '.date',
+                    'streams': 'iframe',
+                    'documents': 'a[href$=".pdf"]',
+                    'witnesses': '.witness'
+                }
+            }
+            server.pages['/hearings'] = (
+                b"<a href='/hearings/1'>One</a><a href='/hearings/2'>Two</a><a href='/hearings/3'>Three</a>", '"list"'
+            )
+            for number in (1, 2):
+                server.pages[f'/hearings/{number}'] = (hearing_page(number, 'Dr. Smith'), f'"h{number}"')
+            server.pages['/hearings/3'] = (hearing_page(3, 'Dr. Jones'), None)  # No validators
+
+            parses = []
+            soup = committee_scraper.BeautifulSoup
+
+            def counting_soup(markup, *args, **kwargs):
+                parses.append(markup)
+                return soup(markup, *args, **kwargs)
+
+            with patch.object(committee_scraper, 'BeautifulSoup', counting_soup), patch('time.sleep'):
+                first = scraper.scrape_committee_hearings('TEST')
+                first_parses = len(parses)
+
+                # Nothing changed: every page revalidates, nothing is parsed
+                second = scraper.scrape_committee_hearings('TEST')
+                second_parses = len(parses) - first_parses
+
+                # Hearing 2 gains a witness; hearing 1 is already stored
+                server.pages['/hearings/2'] = (hearing_page(2, 'Dr. Lee'), '"h2-v2"')
+                requests_before = dict(server.requests)
+                known = {hearing.committee_source_id for hearing in first if hearing.source_url.endswith('/1')}
+                third = scraper.scrape_committee_hearings('TEST', known_source_ids=known)
+                third_parses = len(parses) - first_parses - second_parses
+
+            stats = cache.get_stats()['domains']['127.0.0.1:' + str(server.port)]
+            get_connection_pool(str(cache.db_path)).close_all()
+
+            fetched = {path: server.requests[path] - requests_before.get(path, 0) for path in server.requests}
+            checks = [
+                ("all scraped", len(first) == 3 and all(hearing.streams.get('isvp_stream') for hearing in first)),
+                ("same results from cache", [(h.committee_source_id, h.witnesses) for h in second] ==
+                 [(h.committee_source_id, h.witnesses) for h in first]),
+                ("no re-parse when unchanged", (first_parses, second_parses) == (4, 0)),
+                ("known page not fetched", fetched.get('/hearings/1', 0) == 0 and len(third) == 2),
+                ("changed page re-parsed", third_parses == 1 and
+                 next(h for h in third if h.source_url.endswith('/2')).witnesses[0]['name'] == 'Dr. Lee'),
+                ("hits counted", stats['skipped'] == 1 and stats['not_modified'] >= 4 and stats['unchanged'] >= 1)
+            ]
+            failed = [name for name, ok in checks if not ok]
+            assert not failed, (f"Scraper cache checks failed: {failed} ({first_parses}, {second_parses}, "
+                                f"{third_parses}, {fetched}, {stats})")
+
+            logger.info(f"✅ Repeat scrape parsed nothing; hit rate {stats['hit_rate']} over {stats['lookups']} lookups")
+    finally:
+        server.close()
+
+def test_hit_rates_per_domain():
+    """Hit rates are reported separately for each domain"""
+    server = PageServer()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = HTTPCache(str(Path(tmp) / "http_cache.db"))
+            session = requests.Session()
+            server.pages['/page'] = (b"<p>page</p>", '"page"')
+
+            # Same server under two host names: one revisited, one fetched once
+            for _ in range(4):
+                cache.fetch(session, server.url('/page'))
+            cache.fetch(session, server.url('/page', host='localhost'))
+            cache.record(server.url('/known', host='localhost'), 'skipped')
+            stats = cache.get_stats()
+            get_connection_pool(str(cache.db_path)).close_all()
+
+            ip = stats['domains'][f"127.0.0.1:{server.port}"]
+            host = stats['domains'][f"localhost:{server.port}"]
+            checks = [
+                ("entries per URL", stats['entries'] == 2),
+                ("revisited domain", (ip['lookups'], ip['hits'], ip['hit_rate']) == (4, 3, 0.75)),
+                ("other domain", (host['lookups'], host['new'], host['skipped'], host['hit_rate']) == (2, 1, 1, 0.5))
+            ]
+            failed = [name for name, ok in checks if not ok]
+            assert not failed, f"Domain stats checks failed: {failed} ({stats})"
+
+            logger.info(f"✅ Per-domain hit rates: {ip['hit_rate']} and {host['hit_rate']}")
+    finally:
+        server.close()
+
+def run_http_cache_tests():
+    """Run all HTTP cache tests"""
+    logger.info("=" * 60)
+    logger.info("HTTP Cache Test")
+    logger.info("=" * 60)
+
+    tests = [
+        ("Conditional Revalidation", test_conditional_revalidation),
+        ("Scraper Skips Unchanged And Known", test_scraper_skips_unchanged_and_known),
+        ("Hit Rates Per Domain", test_hit_rates_per_domain)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        logger.info(f"\n🧪 Running: {test_name}")
+        try:
+            test_func()
+            passed += 1
+            logger.info(f"✅ {test_name}: PASSED")
+        except Exception as e:
+            logger.error(f"❌ {test_name}: FAILED - {e}")
+
+    logger.info(f"\n📊 Results: {passed}/{total} tests passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = run_http_cache_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Test incremental deduplication
+Checks that only hearings changed since the last run are deduplicated, that
+pair decisions are stored and never rescored while both hearings are
+unchanged, that incremental runs find the same matches as a full scan, and
+that dedup work after a small change is proportional to the change
+"""
+
+import sys
+import json
+import time
+import random
+import logging
+import tempfile
+from pathlib import Path
+from datetime import date, timedelta
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+from storage.connection_pool import get_connection_pool
+from sync.database_schema import UnifiedHearingDatabase
+from sync.deduplication_engine import DeduplicationEngine
+from sync.incremental_dedup import IncrementalDeduplicator
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+TOPICS = ["ai", "oversight", "privacy", "budget", "defense", "nomination", "cyber", "energy", "water",
+          "health", "trade", "veterans", "farm", "tax", "housing", "border", "security", "markup"]
+
+def add_hearings(conn, count, seed, committees=10, days=365):
+    """Bulk insert hearings, some as near-duplicate pairs"""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        title = f"Hearing on {' '.join(rng.sample(TOPICS, 4))}"
+        hearing_date = (date(2025, 1, 1) + timedelta(days=rng.randint(0, days))).isoformat()
+        committee = f"C{rng.randint(0, committees - 1):02d}"
+        location = json.dumps({"room": rng.choice(["253", "106", "562"]), "building": "Hart"})
+        rows.append((committee, title, hearing_date, location))
+        if rng.random() < 0.05:
+            # Same hearing scraped from the committee website
+            rows.append((committee, title.replace("Hearing on ", "") + " Hearing", hearing_date, location))
+    conn.executemany("""
+        INSERT INTO hearings_unified (committee_code, hearing_title, hearing_date, location_info)
+        VALUES (?, ?, ?, ?)
+    """, rows)
+    conn.commit()
+    return len(rows)
+
+def active_hearings(conn):
+    rows = conn.execute("""
+        SELECT * FROM hearings_unified WHERE sync_status NOT LIKE 'merged_into_%' ORDER BY id
+    """).fetchall()
+    return [dict(row) for row in rows]
+
+def stored_matches(conn, threshold):
+    rows = conn.execute("""
+        SELECT primary_id, secondary_id, similarity_score FROM dedup_decisions d
+        WHERE similarity_score >= ?
+        AND NOT EXISTS (SELECT 1 FROM hearings_unified h
+                        WHERE h.id IN (d.primary_id, d.secondary_id) AND h.sync_status LIKE 'merged_into_%')
+    """, (threshold,)).fetchall()
+    return {(row[0], row[1]): round(row[2], 9) for row in rows}
+
+def test_only_changes_are_rescored():
+    """Runs handle only changed hearings and reuse stored decisions"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = UnifiedHearingDatabase(str(Path(tmp) / "hearings.db"))
+        conn = db.connection
+        engine = DeduplicationEngine(auto_merge_threshold=1.1)  # review only, nothing merged
+        dedup = IncrementalDeduplicator(db, engine)
+        total = add_hearings(conn, 300, seed=1)
+
+        first = dedup.run("run-1")
+        quiet = dedup.run("run-2")
+
+        # A no-op write and a write to a field dedup ignores change nothing
+        hearing = active_hearings(conn)[0]
+        conn.execute("UPDATE hearings_unified SET hearing_title = ?, review_status = 'in_review' WHERE id = ?",
+                     (hearing['hearing_title'], hearing['id']))
+        conn.commit()
+        untouched = dedup.run("run-3")
+
+        # Retitling one hearing rescores only its pairs
+        pairs = conn.execute("""
+            SELECT COUNT(*) FROM dedup_decisions WHERE ? IN (primary_id, secondary_id)
+        """, (hearing['id'],)).fetchone()[0]
+        db.update_hearing(hearing['id'], {"hearing_title": hearing['hearing_title'] + " Part II"},
+                          'website_scraper')
+        retitled = dedup.run("run-4")
+        no_match = conn.execute("""
+            SELECT match_factors FROM dedup_decisions WHERE recommended_action = 'ignore' LIMIT 1
+        """).fetchone()
+
+        get_connection_pool(str(db.db_path)).close_all()
+
+        checks = [
+            ("first run sees all", first['hearings_checked'] == total and first['pairs_scored'] > 0),
+            ("quiet run idle", (quiet['hearings_checked'], quiet['pairs_scored']) == (0, 0)),
+            ("no-op write ignored", untouched['hearings_checked'] == 0),
+            ("retitle rescored", (retitled["hearings_checked"], retitled["pairs_scored"]) == (1, pairs)),
+            ("no-match factors kept", no_match is not None and
+             set(json.loads(no_match[0])) >= {"title_similarity", "date_proximity"})
+        ]
+        failed = [name for name, ok in checks if not ok]
+        assert not failed, f"Change tracking checks failed: {failed} ({first}, {quiet}, {retitled})"
+
+        logger.info(f"✅ First run scored {first['pairs_scored']} pairs; a retitle rescored {pairs}")
+
+def test_matches_equal_full_scan():
+    """Incremental runs over several batches find the same matches as a full scan"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = UnifiedHearingDatabase(str(Path(tmp) / "hearings.db"))
+        conn = db.connection
+        engine = DeduplicationEngine(auto_merge_threshold=1.1)
+        dedup = IncrementalDeduplicator(db, engine)
+
+        for batch in range(3):
+            add_hearings(conn, 200, seed=10 + batch)
+            dedup.run(f"batch-{batch}")
+
+        full = {(m.primary_id, m.secondary_id): round(m.similarity_score, 9)
+                for m in engine.find_duplicates(active_hearings(conn))}
+        incremental = stored_matches(conn, engine.manual_review_threshold)
+        get_connection_pool(str(db.db_path)).close_all()
+
+        assert full and incremental == full, \
+            f"Incremental matches differ: {len(incremental)} vs {len(full)} from a full scan"
+
+        logger.info(f"✅ {len(full)} matches, same as a full scan")
+
+def test_unparseable_dates_are_undated():
+    """Hearings whose date the engine cannot parse are candidates for every hearing in their committee"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = UnifiedHearingDatabase(str(Path(tmp) / "hearings.db"))
+        conn = db.connection
+        engine = DeduplicationEngine(auto_merge_threshold=1.1)
+        dedup = IncrementalDeduplicator(db, engine)
+        location = json.dumps({"room": "253", "building": "Hart"})
+
+        def add(title, hearing_date):
+            conn.execute("""
+                INSERT INTO hearings_unified (committee_code, hearing_title, hearing_date, location_info)
+                VALUES ('C00', ?, ?, ?)
+            """, (title, hearing_date, location))
+            conn.commit()
+
+        # Matches the date pattern but no such day, blank, and unpadded
+        for hearing_date in ('2025-02-30', '', '2025-3-1'):
+            add("AI Oversight Privacy Budget Hearing", hearing_date)
+        dedup.run("undated")
+
+        # A dated hearing added later, outside 2025-02-30's text range, still finds it
+        add("Hearing on AI Oversight Privacy Budget", '2025-06-01')
+        dedup.run("dated")
+
+        full = {(m.primary_id, m.secondary_id): round(m.similarity_score, 9)
+                for m in engine.find_duplicates(active_hearings(conn))}
+        incremental = stored_matches(conn, engine.manual_review_threshold)
+        get_connection_pool(str(db.db_path)).close_all()
+
+        assert {(1, 4), (2, 4)} <= set(full) and incremental == full, \
+            f"Undated matches differ: {sorted(incremental)} vs {sorted(full)} from a full scan"
+
+        logger.info(f"✅ {len(full)} matches with unparseable dates, same as a full scan")
+
+def test_merges_and_proportional_work():
+    """Auto-merges happen once, and dedup after a small change is proportional to it"""
+    with tempfile.TemporaryDirectory() as tmp:
+        db = UnifiedHearingDatabase(str(Path(tmp) / "hearings.db"))
+        conn = db.connection
+        dedup = IncrementalDeduplicator(db, DeduplicationEngine(auto_merge_threshold=0.85))
+        add_hearings(conn, 4000, seed=3, committees=20, days=730)
+
+        start = time.perf_counter()
+        first = dedup.run("backfill")
+        first_s = time.perf_counter() - start
+        merged = conn.execute(
+            "SELECT COUNT(*) FROM hearings_unified WHERE sync_status LIKE 'merged_into_%'"
+        ).fetchone()[0]
+
+        # A scheduled sync later finds a handful of new hearings
+        add_hearings(conn, 10, seed=99, committees=20, days=730)
+        start = time.perf_counter()
+        later = dedup.run("scheduled")
+        later_s = time.perf_counter() - start
+        get_connection_pool(str(db.db_path)).close_all()
+
+        logger.info(f"Backfill: {first['hearings_checked']} hearings, {first['pairs_scored']} pairs, "
+                    f"{first['auto_merged']} merged in {first_s:.2f}s; scheduled: "
+                    f"{later['hearings_checked']} hearings, {later['pairs_scored']} pairs in {later_s:.3f}s")
+
+        checks = [
+            ("duplicates merged", first['auto_merged'] > 0 and merged == first['auto_merged']),
+            # New hearings plus the primaries whose merge rewrote them
+            ("only changes checked", later['hearings_checked'] <= 12 + first['auto_merged']),
+            ("merges not repeated", later['auto_merged'] <= 2),
+            # Merged primaries are rechecked, but their unchanged pairs are reused
+            ("work proportional", later['pairs_scored'] * 100 < first['pairs_scored'] and later_s * 5 < first_s)
+        ]
+        failed = [name for name, ok in checks if not ok]
+        assert not failed, f"Merge and proportional work checks failed: {failed}"
+
+        logger.info("✅ Scheduled dedup work follows what changed")
+
+def run_incremental_dedup_tests():
+    """Run all incremental deduplication tests"""
+    logger.info("=" * 60)
+    logger.info("Incremental Deduplication Test")
+    logger.info("=" * 60)
+
+    tests = [
+        ("Only Changes Are Rescored", test_only_changes_are_rescored),
+        ("Matches Equal Full Scan", test_matches_equal_full_scan),
+        ("Unparseable Dates Are Undated", test_unparseable_dates_are_undated),
+        ("Merges And Proportional Work", test_merges_and_proportional_work)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        logger.info(f"\n🧪 Running: {test_name}")
+        try:
+            test_func()
+            passed += 1
+            logger.info(f"✅ {test_name}: PASSED")
+        except Exception as e:
+            logger.error(f"❌ {test_name}: FAILED - {e}")
+
+    logger.info(f"\n📊 Results: {passed}/{total} tests passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = run_incremental_dedup_tests()
+    sys.exit(0 if success else 1)
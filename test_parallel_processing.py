@@ -21,6 +21,7 @@ from enhanced_async_transcription_service import (
     IntelligentRetryManager,
     ResourcePool
 )
+from audio_chunker import AudioChunk, ChunkingResult
 from async_transcription_integration import (
     AsyncTranscriptionIntegrator,
     initialize_parallel_processing,
@@ -326,6 +327,79 @@ class TestAsyncTranscriptionService(unittest.TestCase):
                 self.assertEqual(result['chunks_processed'], 3)
                 self.assertEqual(mock_api.call_count, 3)  # One call per chunk
 
+class TestChunkCheckpointing(unittest.TestCase):
+    """Test resumable chunk-level checkpointing."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.service = EnhancedAsyncTranscriptionService(max_concurrent_chunks=2)
+        self.service.chunker.temp_base_dir = self.temp_dir
+        # Fail fast instead of backing off between attempts
+        self.service.retry_manager.retry_patterns['api_error'] = {'max_retries': 0, 'base_delay': 0}
+    
+    def _create_chunk_set(self, hearing_id: str, chunk_count: int = 4) -> Path:
+        """Write a source file and a chunk set as an interrupted run would leave it."""
+        audio_file = self.temp_dir / 'hearing.mp3'
+        audio_file.write_bytes(b'\x00' * 1024)
+        
+        chunk_dir = self.temp_dir / f"{hearing_id}_20250101_000000"
+        chunk_dir.mkdir()
+        chunks = []
+        for i in range(chunk_count):
+            chunk_path = chunk_dir / f"chunk_{i:03d}.mp3"
+            chunk_path.write_bytes(bytes([i + 1]) * 512)
+            chunks.append(AudioChunk(i, chunk_path, i * 300.0, (i + 1) * 300.0, 300.0, 512, 512 / (1024 * 1024)))
+        
+        chunker = self.service.chunker
+        chunker._save_metadata(ChunkingResult(
+            original_file=audio_file,
+            chunks=chunks,
+            total_chunks=chunk_count,
+            temp_directory=chunk_dir,
+            overlap_duration=chunker.overlap_duration,
+            metadata_file=chunk_dir / "chunking_metadata.json",
+            created_at='2025-01-01T00:00:00',
+            source_signature=chunker._source_signature(audio_file)
+        ))
+        return audio_file
+    
+    async def test_resume_only_failed_chunks(self):
+        """A restarted job re-transcribes only chunks without a successful checkpoint."""
+        audio_file = self._create_chunk_set('777')
+        calls = []
+        fail_chunks = {'chunk_002.mp3'}
+        
+        async def fake_api(path):
+            calls.append(Path(path).name)
+            if Path(path).name in fail_chunks:
+                raise Exception("Whisper API error: 502 - bad gateway")
+            return {'text': Path(path).name, 'segments': [{'start': 0, 'end': 10, 'text': Path(path).name}]}
+        
+        try:
+            with patch.object(self.service, '_call_whisper_api', side_effect=fake_api):
+                with self.assertRaises(Exception):
+                    await self.service._transcribe_chunked_parallel(
+                        str(audio_file), 777, None, ParallelProgressTracker(777)
+                    )
+                self.assertEqual(len(calls), 4)
+                
+                # Network recovers; restart the job
+                calls.clear()
+                fail_chunks.clear()
+                tracker = ParallelProgressTracker(777)
+                result = await self.service._transcribe_chunked_parallel(
+                    str(audio_file), 777, None, tracker
+                )
+            
+            self.assertEqual(calls, ['chunk_002.mp3'])
+            self.assertEqual(result['resumed_chunks'], 3)
+            self.assertEqual(result['fresh_chunks'], 1)
+            self.assertEqual(tracker.resumed_chunks, {0, 1, 3})
+            self.assertFalse((self.temp_dir / "777_20250101_000000").exists(), "Chunks cleaned up after success")
+        finally:
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+
 class TestIntegration(unittest.TestCase):
     """Test integration layer functionality."""
     
@@ -428,6 +502,7 @@ async def run_all_tests():
         TestIntelligentRetryManager,
         TestResourcePool,
         TestAsyncTranscriptionService,
+        TestChunkCheckpointing,
         TestIntegration
     ]
     
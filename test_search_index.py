@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Test the FTS5 full-text search index for hearings and transcripts
+Checks trigger sync with hearings_unified, loading hearings stored before
+the index existed, transcript indexing, BM25 ranking, snippet highlighting
+and the migration backfill
+"""
+
+import sys
+import json
+import time
+import sqlite3
+import logging
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+from api.search_index import (
+    ensure_search_index, index_transcript, rebuild_search_index, build_match_query, search_segments, BM25_WEIGHTS
+)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+SEARCH_SQL = f"""
+    SELECT h.id, bm25(hearings_fts, {", ".join(str(w) for w in BM25_WEIGHTS)}) AS score,
+           snippet(hearings_fts, 0, '<mark>', '</mark>', '…', 16),
+           snippet(hearings_fts, 5, '<mark>', '</mark>', '…', 24)
+    FROM hearings_unified h JOIN hearings_fts ON hearings_fts.rowid = h.id
+    WHERE hearings_fts MATCH ?
+    ORDER BY score
+"""
+
+def create_database(path):
+    """hearings_unified with the columns added by the search migration"""
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE hearings_unified (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            committee_code TEXT NOT NULL,
+            hearing_title TEXT NOT NULL,
+            hearing_date TEXT NOT NULL,
+            status TEXT,
+            search_keywords TEXT,
+            participant_list TEXT,
+            content_summary TEXT,
+            full_text_content TEXT
+        )
+    """)
+    return conn
+
+def insert_hearing(conn, title, committee="SCOM", keywords="", summary=""):
+    cursor = conn.execute(
+        "INSERT INTO hearings_unified (committee_code, hearing_title, hearing_date, search_keywords, content_summary) "
+        "VALUES (?, ?, '2025-01-15', ?, ?)",
+        (committee, title, keywords, summary)
+    )
+    return cursor.lastrowid
+
+def search(conn, text):
+    return conn.execute(SEARCH_SQL, (build_match_query(text),)).fetchall()
+
+def test_triggers_keep_index_in_sync():
+    """Inserts, updates and deletes on hearings_unified reach the FTS table"""
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = create_database(Path(tmp) / "test.db")
+        assert ensure_search_index(conn), "Index could not be created"
+
+        hearing_id = insert_hearing(conn, "Artificial Intelligence Oversight")
+        assert [row[0] for row in search(conn, "intelligence")] == [hearing_id], "Inserted hearing not found"
+
+        conn.execute("UPDATE hearings_unified SET hearing_title = 'Spectrum Auctions' WHERE id = ?", (hearing_id,))
+        assert not search(conn, "intelligence") and search(conn, "spectrum"), "Update did not reach the index"
+
+        # Status changes do not touch indexed columns
+        conn.execute("UPDATE hearings_unified SET status = 'reviewed' WHERE id = ?", (hearing_id,))
+
+        conn.execute("DELETE FROM hearings_unified WHERE id = ?", (hearing_id,))
+        assert not search(conn, "spectrum"), "Deleted hearing still indexed"
+
+        logger.info("✅ Triggers kept the index in sync")
+
+def test_index_created_on_populated_table():
+    """Creating the index on a database that already has hearings makes them searchable at once"""
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = create_database(Path(tmp) / "test.db")
+        existing = [insert_hearing(conn, f"Pipeline Safety Oversight {i}", keywords="pipelines") for i in range(5)]
+        insert_hearing(conn, "Spectrum Auctions")
+        conn.commit()
+
+        assert ensure_search_index(conn), "Index could not be created"
+        assert not conn.in_transaction, "Index creation left a transaction open"
+        assert conn.execute("SELECT COUNT(*) FROM hearings_fts").fetchone()[0] == 6, "Existing hearings not loaded"
+        assert sorted(row[0] for row in search(conn, "pipeline")) == existing, "Existing hearings not searchable"
+
+        # Later writes still go through the triggers
+        added = insert_hearing(conn, "Pipeline Permitting")
+        assert sorted(row[0] for row in search(conn, "pipeline")) == existing + [added], "New hearing not indexed"
+
+        logger.info("✅ Index created on a populated table found every existing hearing")
+
+def test_bm25_ranking_and_snippets():
+    """Title matches outrank transcript mentions; transcript hits come with snippets"""
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = create_database(Path(tmp) / "test.db")
+        ensure_search_index(conn)
+
+        transcript_only = insert_hearing(conn, "Coast Guard Readiness")
+        title_match = insert_hearing(conn, "Broadband Deployment in Rural America")
+        index_transcript(conn, transcript_only, {
+            "transcription": {"segments": [
+                {"start": 0.0, "end": 4.0, "text": "The committee will come to order."},
+                {"start": 4.0, "end": 9.0, "text": "Rural broadband reaches our stations slowly."}
+            ]}
+        })
+
+        rows = search(conn, "broadband")
+        assert [row[0] for row in rows] == [title_match, transcript_only], f"Unexpected ranking: {rows}"
+
+        transcript_snippet = rows[1][3]
+        assert "<mark>broadband</mark>" in transcript_snippet.lower(), \
+            f"Transcript snippet missing highlight: {transcript_snippet}"
+
+        # Porter stemming and prefix matching while typing
+        assert search(conn, "deployments") and search(conn, "broadb"), "Stemmed or prefix query did not match"
+
+        logger.info(f"✅ BM25 ranking with snippet: {transcript_snippet}")
+
+def test_match_query_sanitized():
+    """User punctuation and FTS5 operators cannot break the query"""
+    cases = {
+        "C++ AND (": '"c" "and"',
+        'NEAR("ai" OR': '"near" "ai" "or"*',
+        "senator cruz ": '"senator" "cruz"',
+        "???": None,
+        "": None
+    }
+    for text, expected in cases.items():
+        actual = build_match_query(text)
+        assert actual == expected, f"build_match_query({text!r}) = {actual!r}, expected {expected!r}"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = create_database(Path(tmp) / "test.db")
+        ensure_search_index(conn)
+        insert_hearing(conn, "C and AI Policy")
+        search(conn, "C++ AND (")
+
+    logger.info("✅ Match queries sanitized")
+
+def test_backfill_and_flat_latency():
+    """Backfill indexes existing rows and transcripts; latency stays flat as rows grow"""
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = create_database(Path(tmp) / "test.db")
+        transcript_dir = Path(tmp) / "transcripts"
+        transcript_dir.mkdir()
+
+        latencies = {}
+        total = 0
+        for size in (500, 5000):
+            rows = [(f"Hearing {i} on Appropriations", f"2025-01-{i % 28 + 1:02d}") for i in range(total, size)]
+            conn.executemany(
+                "INSERT INTO hearings_unified (committee_code, hearing_title, hearing_date) VALUES ('SSAP', ?, ?)",
+                rows
+            )
+            total = size
+
+            # Hearings loaded before the index exists are picked up by the backfill
+            (transcript_dir / "hearing_7_transcript.json").write_text(json.dumps(
+                {"segments": [{"start_time": 0.0, "end_time": 5.0, "text": "Hypersonic missile testing"}]}
+            ))
+            counts = rebuild_search_index(conn, transcript_dir)
+            assert counts == {"hearings": size, "transcripts": 1}, f"Unexpected backfill counts {counts}"
+
+            start = time.perf_counter()
+            for _ in range(20):
+                hits = search(conn, "hypersonic")
+            latencies[size] = (time.perf_counter() - start) / 20 * 1000
+            assert [row[0] for row in hits] == [7], "Backfilled transcript not searchable"
+
+        logger.info(f"Search latency: {latencies[500]:.3f} ms at 500 rows, {latencies[5000]:.3f} ms at 5000 rows")
+        logger.info("✅ Backfill indexed hearings and transcripts")
+
+def hearing_transcript(lines):
+    """Transcript with one 10-second labeled segment per (speaker, text) line"""
+    return {"transcription": {"segments": [
+        {"start": i * 10.0, "end": (i + 1) * 10.0, "text": text,
+         "enhanced_speaker": {"speaker_name": speaker}}
+        for i, (speaker, text) in enumerate(lines)
+    ]}}
+
+def test_segment_hits_with_timestamps():
+    """Segment search returns where in which hearing a phrase was said, with context"""
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = create_database(Path(tmp) / "test.db")
+        ensure_search_index(conn)
+        first = insert_hearing(conn, "Spectrum Policy", committee="SCOM")
+        second = insert_hearing(conn, "Intelligence Threats", committee="SSCI")
+
+        index_transcript(conn, first, hearing_transcript([
+            ("Chair Cantwell", "The committee will come to order."),
+            ("Senator Cruz", "I want to ask about spectrum auctions."),
+            ("Witness", "Spectrum auctions raised record revenue."),
+            ("Chair Cantwell", "Thank you.")
+        ]))
+        index_transcript(conn, second, hearing_transcript([
+            ("Chair Warner", "Foreign actors target spectrum infrastructure.")
+        ]))
+
+        found = search_segments(conn, "spectrum auctions")
+        hits = found["hits"]
+        assert found["total_count"] == 2 and {hit["hearing_id"] for hit in hits} == {first}, \
+            f"Unexpected hits: {hits}"
+
+        cruz = next(hit for hit in hits if hit["speaker"] == "Senator Cruz")
+        assert (cruz["start_time"], cruz["end_time"]) == (10.0, 20.0) and cruz["hearing_title"] == "Spectrum Policy", \
+            f"Hit lost its timestamps or hearing: {cruz}"
+        assert [c["text"] for c in cruz["context"]["before"]] == ["The committee will come to order."], \
+            f"Wrong context before hit: {cruz['context']}"
+        assert "<mark>spectrum</mark>" in cruz["snippet"].lower(), f"Snippet missing highlight: {cruz['snippet']}"
+
+        # Filters and pagination
+        by_committee = search_segments(conn, "spectrum", committee="SSCI")
+        by_speaker = search_segments(conn, "spectrum", speaker="Cruz")
+        page = search_segments(conn, "spectrum", limit=2, offset=2)
+        assert [h["hearing_id"] for h in by_committee["hits"]] == [second] and len(by_speaker["hits"]) == 1, \
+            "Committee or speaker filter failed"
+        assert page["total_count"] == 3 and len(page["hits"]) == 1, \
+            f"Pagination returned {len(page['hits'])} of {page['total_count']}"
+
+        logger.info(f"✅ Segment hit at {cruz['start_time']}s: {cruz['snippet']}")
+
+def test_incremental_segment_ingestion():
+    """Re-writing a transcript replaces its segments; unchanged rewrites are skipped"""
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = create_database(Path(tmp) / "test.db")
+        hearing_id = insert_hearing(conn, "Budget Hearing")
+        transcript = hearing_transcript([("Chair", "We begin with the budget request.")])
+
+        index_transcript(conn, hearing_id, transcript)
+        indexed_at = conn.execute("SELECT indexed_at FROM transcript_index_state").fetchone()[0]
+
+        # Same transcript written again: nothing re-indexed
+        index_transcript(conn, hearing_id, transcript)
+        assert conn.execute("SELECT indexed_at FROM transcript_index_state").fetchone()[0] == indexed_at, \
+            "Unchanged transcript was re-indexed"
+
+        # Corrected transcript replaces the old segments
+        index_transcript(conn, hearing_id, hearing_transcript([("Chair", "We begin with the appropriations request.")]))
+        assert search_segments(conn, "budget")["total_count"] == 0, "Stale segment still searchable"
+        assert search_segments(conn, "appropriations")["total_count"] == 1, "Updated segment not searchable"
+
+        logger.info("✅ Segment ingestion is incremental per transcript write")
+
+def test_string_enhanced_speaker():
+    """Segments labeled by VoiceMatcher carry enhanced_speaker as a plain name"""
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = create_database(Path(tmp) / "test.db")
+        hearing_id = insert_hearing(conn, "Voice Labeled Hearing")
+
+        index_transcript(conn, hearing_id, {"segments": [
+            {"start": 0.0, "end": 5.0, "text": "Opening remarks on broadband.",
+             "speaker": "SPEAKER_00", "enhanced_speaker": "Chair Cantwell"},
+            {"start": 5.0, "end": 10.0, "text": "Questions on broadband maps.",
+             "enhanced_speaker": {"speaker_name": "Senator Cruz"}},
+            {"start": 10.0, "end": 15.0, "text": "Broadband testimony follows.",
+             "speaker": "Witness", "enhanced_speaker": None}
+        ]})
+
+        speakers = [hit["speaker"] for hit in search_segments(conn, "broadband")["hits"]]
+        by_speaker = search_segments(conn, "broadband", speaker="Cantwell")["hits"]
+        assert sorted(speakers) == ["Chair Cantwell", "Senator Cruz", "Witness"], \
+            f"Unexpected segment speakers: {speakers}"
+        assert [hit["start_time"] for hit in by_speaker] == [0.0], \
+            f"Speaker filter missed the string label: {by_speaker}"
+
+        logger.info("✅ String, nested and missing enhanced speakers all indexed")
+
+def run_search_index_tests():
+    """Run all search index tests"""
+    logger.info("=" * 60)
+    logger.info("Full-Text Search Index Test")
+    logger.info("=" * 60)
+
+    tests = [
+        ("Triggers Keep Index In Sync", test_triggers_keep_index_in_sync),
+        ("Index Created On Populated Table", test_index_created_on_populated_table),
+        ("BM25 Ranking And Snippets", test_bm25_ranking_and_snippets),
+        ("Match Query Sanitized", test_match_query_sanitized),
+        ("Backfill And Flat Latency", test_backfill_and_flat_latency),
+        ("Segment Hits With Timestamps", test_segment_hits_with_timestamps),
+        ("Incremental Segment Ingestion", test_incremental_segment_ingestion),
+        ("String Enhanced Speaker", test_string_enhanced_speaker)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        logger.info(f"\n🧪 Running: {test_name}")
+        try:
+            test_func()
+            passed += 1
+            logger.info(f"✅ {test_name}: PASSED")
+        except Exception as e:
+            logger.error(f"❌ {test_name}: FAILED - {e}")
+
+    logger.info(f"\n📊 Results: {passed}/{total} tests passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = run_search_index_tests()
+    sys.exit(0 if success else 1)
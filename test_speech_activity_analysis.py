@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Test vectorized speech-activity analysis in AudioPreprocessor
+Checks the single-pass window features against a straightforward
+per-window computation on synthetic audio in the PCM cache
+"""
+
+import sys
+import time
+import logging
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+from audio.pcm_cache import PCMCache, PCM_SAMPLE_RATE
+import audio.pcm_cache as pcm_cache_module
+from audio_preprocessing import AudioPreprocessor
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def synthesize(start_time, end_time, speech_start, rng):
+    """Low noise before speech_start, then syllable-modulated tone"""
+    t = np.arange(int(start_time * PCM_SAMPLE_RATE), int(end_time * PCM_SAMPLE_RATE)) / PCM_SAMPLE_RATE
+    envelope = 0.5 + 0.5 * np.sign(np.sin(2 * np.pi * 3 * t))  # ~3 syllables per second
+    samples = 6000 * envelope * np.sin(2 * np.pi * 180 * t)
+    quiet = t < speech_start
+    samples[quiet] = rng.normal(0, 60, int(np.sum(quiet)))
+    return samples.astype(np.int16)
+
+def build_hearing(temp_dir, duration, speech_start, block_seconds=600.0):
+    """
+    Write a stand-in source file and its decoded PCM straight into a PCM cache
+
+    Written in blocks so multi-hour fixtures stay within memory.
+    """
+    source = temp_dir / "hearing.mp3"
+    source.write_bytes(b"\x00" * 1024)
+
+    rng = np.random.default_rng(0)
+    cache = PCMCache(cache_dir=temp_dir / "pcm")
+    with open(cache.cache_dir / f"{cache._cache_key(source)}.pcm", 'wb') as f:
+        for block_start in np.arange(0.0, duration, block_seconds):
+            f.write(synthesize(block_start, min(block_start + block_seconds, duration), speech_start, rng).tobytes())
+    pcm_cache_module._pcm_cache = cache
+    return source, cache.get(source).samples
+
+def reference_window(window, frame_size):
+    """Per-window features computed one window at a time"""
+    audio_float = window.astype(np.float64) / 32768.0
+    rms = np.sqrt(np.mean(audio_float ** 2))
+    signs = np.signbit(window)
+    zcr = np.count_nonzero(signs[1:] != signs[:-1]) / max(len(window) - 1, 1)
+    n_frames = len(window) // frame_size
+    energies = [np.mean(audio_float[i * frame_size:(i + 1) * frame_size] ** 2) for i in range(n_frames)]
+    return rms, zcr, float(np.var(energies)) if energies else 0.0
+
+def test_matches_reference():
+    """Vectorized features equal the per-window computation, including the partial tail"""
+    with tempfile.TemporaryDirectory() as tmp:
+        source, samples = build_hearing(Path(tmp), 605.0, 185.0)
+        preprocessor = AudioPreprocessor(segment_duration=30.0)
+        analysis = preprocessor.analyze_speech_activity(source)
+
+        segments = analysis['segments']
+        assert len(segments) == 21 and abs(segments[-1]['duration'] - 5.0) <= 1e-6, \
+            f"Expected 21 windows ending in a 5s tail, got {len(segments)}"
+
+        window_size = 30 * PCM_SAMPLE_RATE
+        frame_size = int(preprocessor.energy_frame_duration * PCM_SAMPLE_RATE)
+        for i, segment in enumerate(segments):
+            rms, zcr, variance = reference_window(samples[i * window_size:(i + 1) * window_size], frame_size)
+            assert (np.isclose(segment['rms'], rms, rtol=1e-4) and
+                    np.isclose(segment['zero_crossing_rate'], zcr) and
+                    np.isclose(segment['energy_variance'], variance, rtol=1e-3, atol=1e-12)), \
+                f"Window {i} features differ from reference"
+
+        expected_keys = {"start_time", "end_time", "duration", "rms", "has_speech", "speech_confidence"}
+        assert expected_keys <= set(segments[0]), "Segment dictionaries lost existing keys"
+
+        # Speech starts 5 s into the 180-210 window, which still clears the RMS threshold
+        assert analysis['content_start_time'] == 180.0, f"Content start {analysis['content_start_time']} != 180.0"
+
+        speech_variance = segments[10]['energy_variance']
+        noise_variance = segments[0]['energy_variance']
+        logger.info(f"Energy variance speech {speech_variance:.2e} vs noise {noise_variance:.2e}")
+        assert speech_variance > noise_variance * 100, \
+            "Syllabic speech should show far higher energy variance than noise"
+
+        logger.info(f"✅ {len(segments)} windows match the per-window reference")
+
+def test_long_hearing_single_pass():
+    """A 4-hour hearing is analyzed in one pass over the cached decode"""
+    with tempfile.TemporaryDirectory() as tmp:
+        source, _ = build_hearing(Path(tmp), 4 * 3600.0, 600.0)
+        preprocessor = AudioPreprocessor()
+
+        start = time.perf_counter()
+        analysis = preprocessor.analyze_speech_activity(source)
+        elapsed = time.perf_counter() - start
+
+        assert analysis['segments_analyzed'] == 480, f"Expected 480 windows, got {analysis['segments_analyzed']}"
+
+        logger.info(f"✅ 4-hour analysis: {analysis['segments_analyzed']} windows in {elapsed:.2f}s")
+
+def run_speech_activity_tests():
+    """Run all speech activity analysis tests"""
+    logger.info("=" * 60)
+    logger.info("Speech Activity Analysis Test")
+    logger.info("=" * 60)
+
+    tests = [
+        ("Matches Reference", test_matches_reference),
+        ("Long Hearing Single Pass", test_long_hearing_single_pass)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        logger.info(f"\n🧪 Running: {test_name}")
+        try:
+            test_func()
+            passed += 1
+            logger.info(f"✅ {test_name}: PASSED")
+        except Exception as e:
+            logger.error(f"❌ {test_name}: FAILED - {e}")
+
+    logger.info(f"\n📊 Results: {passed}/{total} tests passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = run_speech_activity_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Test the transcript catalog
+Checks catalog rows follow transcript files through the mtime scan and
+writers, that only new or changed files are parsed, correction flags, and
+that listing from the catalog beats globbing and loading every file
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import sqlite3
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+from api.transcript_catalog import (TranscriptCatalog, catalog_transcript, reconcile_catalog,
+                                    set_has_corrections, speaker_review_status)
+from storage.connection_pool import get_connection_pool
+from review.correction_store import CorrectionStore
+from src.api.database_enhanced import EnhancedUIDatabase
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def segments(speakers, length=30.0):
+    return [{"start_time": i * length, "end_time": (i + 1) * length, "speaker": speaker,
+             "text": f"Statement {i} for the record on appropriations and oversight."}
+            for i, speaker in enumerate(speakers)]
+
+def write_transcript(path, transcript, mtime=None):
+    with open(path, 'w') as f:
+        json.dump(transcript, f)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+def catalog_rows(conn):
+    conn.row_factory = sqlite3.Row
+    rows = conn.execute("SELECT * FROM transcript_catalog ORDER BY filename").fetchall()
+    return {row["filename"]: dict(row) for row in rows}
+
+def test_scan_follows_files():
+    """Scans add, refresh and drop rows, parsing only new or changed files"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "demo_transcription"
+        root.mkdir()
+        write_transcript(root / "hearing_7_transcript.json", {
+            "committee": "SCOM", "confidence_score": 0.85, "total_duration": 90.0,
+            "segments": segments(["CHAIRPERSON", "UNKNOWN", "WITNESS_1"])
+        }, mtime=1_700_000_000)
+        write_transcript(root / "hearing_8_transcript.json", {
+            "hearing_id": 8, "audio_file": "hearing_8.wav", "pipeline_version": "6.0",
+            "transcription": {"confidence": 0.9, "segments": segments(["Speaker", "", "Sen. Cruz"])}
+        }, mtime=1_700_000_100)
+        (root / "broken.json").write_text("{not json")
+        (root / "notes.txt").write_text("not a transcript")
+
+        conn = sqlite3.connect(":memory:")
+        first = reconcile_catalog(conn, root)
+        rows = catalog_rows(conn)
+        checks = [
+            ("first scan", first == {"added": 3, "updated": 0, "removed": 0, "unchanged": 0}),
+            ("top-level layout", (rows["hearing_7_transcript.json"]["hearing_id"],
+                                  rows["hearing_7_transcript.json"]["segment_count"],
+                                  rows["hearing_7_transcript.json"]["unknown_speaker_segments"],
+                                  rows["hearing_7_transcript.json"]["duration"],
+                                  rows["hearing_7_transcript.json"]["confidence"]) == (7, 3, 1, 90.0, 0.85)),
+            ("nested layout", (rows["hearing_8_transcript.json"]["segment_count"],
+                               rows["hearing_8_transcript.json"]["unknown_speaker_segments"],
+                               rows["hearing_8_transcript.json"]["duration"],
+                               rows["hearing_8_transcript.json"]["audio_file"]) == (3, 2, 90.0, "hearing_8.wav")),
+            ("parse error kept", rows["broken.json"]["parse_error"] is not None)
+        ]
+
+        cataloged_at = rows["hearing_8_transcript.json"]["cataloged_at"]
+        write_transcript(root / "hearing_7_transcript.json", {
+            "committee": "SCOM", "segments": segments(["CHAIRPERSON"] * 5)
+        }, mtime=1_700_000_200)
+        (root / "broken.json").unlink()
+        write_transcript(root / "hearing_9_transcript.json", {"segments": []})
+
+        second = reconcile_catalog(conn, root)
+        rows = catalog_rows(conn)
+        checks += [
+            ("second scan", second == {"added": 1, "updated": 1, "removed": 1, "unchanged": 1}),
+            ("changed file reparsed", rows["hearing_7_transcript.json"]["segment_count"] == 5),
+            ("unchanged file not reparsed", rows["hearing_8_transcript.json"]["cataloged_at"] == cataloged_at),
+            ("removed file dropped", "broken.json" not in rows),
+            ("quiet rescan", reconcile_catalog(conn, root)["unchanged"] == 3)
+        ]
+
+        listed = TranscriptCatalog(root).list_transcripts(conn, name_glob="hearing_*_transcript.json")
+        checks.append(("newest first", [row["filename"] for row in listed] ==
+                       ["hearing_9_transcript.json", "hearing_7_transcript.json", "hearing_8_transcript.json"]))
+        checks.append(("review status", [speaker_review_status(3, 0), speaker_review_status(3, 1),
+                                         speaker_review_status(3, 2), speaker_review_status(0, 0)] ==
+                       ["complete", "partial", "needs_review", "no_transcript"]))
+        conn.close()
+
+        failed = [name for name, ok in checks if not ok]
+        assert not failed, f"Catalog scan checks failed: {failed}"
+
+        logger.info("✅ Catalog follows transcript files")
+
+def test_writers_and_corrections():
+    """Writers catalog in their own transaction; corrections and hearings join in"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "demo_transcription"
+        root.mkdir()
+        db = EnhancedUIDatabase(str(Path(tmp) / "hearings.db"))
+        hearing_id = db.insert_hearing({"committee_code": "SSCI", "hearing_title": "Open Hearing",
+                                        "hearing_date": "2025-04-02"}, 'congress_api')
+        conn = db.connection
+
+        transcript = {"hearing_id": hearing_id, "segments": segments(["CHAIR", "UNKNOWN"])}
+        transcript_file = root / f"hearing_{hearing_id}_transcript.json"
+        write_transcript(transcript_file, transcript)
+
+        # A writer catalogs inside its own update; nothing is committed for it
+        conn.execute("UPDATE hearings_unified SET hearing_type = 'Open' WHERE id = ?", (hearing_id,))
+        catalog_transcript(conn, transcript_file, transcript)
+        in_transaction = conn.in_transaction
+        conn.commit()
+
+        catalog = TranscriptCatalog(root)
+        listed = catalog.list_transcripts(conn, include_hearings=True)
+        # processing_stage is only present after the status migration
+        joined = len(listed) == 1 and (listed[0]["hearing_title"], listed[0]["hearing_type"],
+                                       listed[0]["processing_stage"]) == ("Open Hearing", "Open", None)
+
+        # Corrections live in their own database, with that catalog beside them
+        store = CorrectionStore(Path(tmp) / "corrections.db")
+        store.save_correction(str(transcript_file), 1, "Sen. Warner", reviewer_id="reviewer")
+        with sqlite3.connect(store.db_path) as review_conn:
+            review_catalog = TranscriptCatalog(root)
+            review_catalog.reconcile(review_conn, corrected_paths=store.corrected_transcripts)
+            flagged = review_catalog.list_transcripts(review_conn)[0]["has_corrections"]
+            throttled = review_catalog.reconcile(review_conn) is None
+            set_has_corrections(review_conn, [transcript_file], False)
+            cleared = review_catalog.list_transcripts(review_conn)[0]["has_corrections"]
+        get_connection_pool(str(db.db_path)).close_all()
+
+        checks = [("writer transaction left open", in_transaction), ("hearing join", joined),
+                  ("corrections flagged", flagged == 1), ("rescan throttled", throttled),
+                  ("flag cleared", cleared == 0)]
+        failed = [name for name, ok in checks if not ok]
+        assert not failed, f"Writer and correction checks failed: {failed}"
+
+        logger.info("✅ Writers and corrections keep the catalog current")
+
+def test_listing_skips_file_loads():
+    """Listing from the catalog is much faster than globbing and loading files"""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "demo_transcription"
+        root.mkdir()
+        speakers = ["CHAIRPERSON", "WITNESS_1", "UNKNOWN", "Sen. Cruz"] * 75
+        for i in range(1000):
+            write_transcript(root / f"hearing_{i}_transcript.json", {
+                "hearing_id": i, "committee": "SCOM", "confidence": 0.8, "segments": segments(speakers)
+            })
+
+        def glob_listing():
+            listing = []
+            for transcript_file in root.glob("hearing_*_transcript.json"):
+                with open(transcript_file, 'r') as f:
+                    transcript = json.load(f)
+                listing.append({"hearing_id": transcript["hearing_id"],
+                                "segment_count": len(transcript["segments"]),
+                                "file_size": transcript_file.stat().st_size})
+            return listing
+
+        conn = sqlite3.connect(":memory:")
+        catalog = TranscriptCatalog(root)
+        catalog.reconcile(conn)
+
+        def catalog_listing():
+            # Every request rescans, as if the scan interval had passed
+            catalog.reconcile(conn, force=True)
+            return catalog.list_transcripts(conn, name_glob="hearing_*_transcript.json")
+
+        def timed(func, repeat=3):
+            func()
+            start = time.perf_counter()
+            for _ in range(repeat):
+                result = func()
+            return (time.perf_counter() - start) / repeat * 1000, result
+
+        glob_ms, globbed = timed(glob_listing)
+        catalog_ms, cataloged = timed(catalog_listing)
+        conn.close()
+
+        logger.info(f"1000-transcript listing: glob and load {glob_ms:.0f}ms, catalog {catalog_ms:.0f}ms")
+        assert len(cataloged) == len(globbed) and {r["segment_count"] for r in cataloged} == {300}, \
+            "Catalog listing does not match the files"
+        assert catalog_ms * 3 <= glob_ms, "Catalog listing should be at least three times faster"
+
+        logger.info("✅ Listing reads only the catalog")
+
+def run_transcript_catalog_tests():
+    """Run all transcript catalog tests"""
+    logger.info("=" * 60)
+    logger.info("Transcript Catalog Test")
+    logger.info("=" * 60)
+
+    tests = [
+        ("Scan Follows Files", test_scan_follows_files),
+        ("Writers And Corrections", test_writers_and_corrections),
+        ("Listing Skips File Loads", test_listing_skips_file_loads)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        logger.info(f"\n🧪 Running: {test_name}")
+        try:
+            test_func()
+            passed += 1
+            logger.info(f"✅ {test_name}: PASSED")
+        except Exception as e:
+            logger.error(f"❌ {test_name}: FAILED - {e}")
+
+    logger.info(f"\n📊 Results: {passed}/{total} tests passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = run_transcript_catalog_tests()
+    sys.exit(0 if success else 1)
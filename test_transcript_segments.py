@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Test transcript segment paging
+Checks the segment index finds every segment in both transcript layouts
+(including non-ASCII text), that index and time-window pages and the NDJSON
+stream match the full transcript, that indexes are rebuilt when a file
+changes and reloaded from disk, and that a page is much faster than loading
+a long transcript whole
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+from api.transcript_segments import (SegmentIndexCache, build_segment_index, stream_transcript_ndjson,
+                                     transcript_page)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+def segments(count, length=10.0, words=0):
+    return [{"id": i, "start": i * length, "end": (i + 1) * length,
+             "speaker": "CHAIR" if i % 3 else "UNKNOWN",
+             "text": f"Statement {i} — señor testimony on appropriations",
+             "words": [{"word": f"w{j}", "start": i * length + j * 0.1, "end": i * length + j * 0.1 + 0.1,
+                        "probability": 0.9} for j in range(words)]}
+            for i in range(count)]
+
+def write_transcript(path, transcript, indent=None, mtime=None):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(transcript, f, indent=indent, ensure_ascii=False)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+def test_index_layouts():
+    """Indexes find segments in both layouts and read back the exact segments"""
+    with tempfile.TemporaryDirectory() as tmp:
+        nested = {"hearing_id": 8, "transcription": {"language": "en", "segments": segments(40)},
+                  "enrichment": {"committee_members": [{"name": "Sen. Cantwell"}]}}
+        top_level = {"committee": "SCOM", "segments": [{"start_time": 0.0, "end_time": 5.0, "text": "Ünïcode"},
+                                                       {"start_time": 5.0, "end_time": 9.0, "text": "ok"}]}
+        nested_file = Path(tmp) / "nested.json"
+        top_file = Path(tmp) / "top.json"
+        write_transcript(nested_file, nested, indent=2)
+        write_transcript(top_file, top_level)
+        (Path(tmp) / "broken.json").write_text('{"segments": [')
+
+        nested_index = build_segment_index(nested_file)
+        top_index = build_segment_index(top_file)
+        try:
+            build_segment_index(Path(tmp) / "broken.json")
+            rejected = False
+        except ValueError:
+            rejected = True
+
+        checks = [
+            ("nested path", nested_index.segments_path == ["transcription", "segments"]),
+            ("nested segments", nested_index.read_segments(0, 40) == nested["transcription"]["segments"]),
+            ("nested envelope", nested_index.with_segments(nested["transcription"]["segments"]) == nested),
+            ("top-level path", top_index.segments_path == ["segments"]),
+            ("non-ASCII offsets", top_index.read_segments(0, 2) == top_level["segments"]),
+            ("times", list(top_index.starts) == [0.0, 5.0] and list(top_index.ends) == [5.0, 9.0]),
+            ("invalid JSON rejected", rejected)
+        ]
+
+        failed = [name for name, ok in checks if not ok]
+        assert not failed, f"Index layout checks failed: {failed}"
+
+        logger.info("✅ Segment index reads both layouts")
+
+def test_pages_and_cache():
+    """Pages, time windows and the NDJSON stream match the file; the cache follows changes"""
+    with tempfile.TemporaryDirectory() as tmp:
+        transcript_file = Path(tmp) / "hearing_5_transcript.json"
+        transcript = {"hearing_id": 5, "transcription": {"segments": segments(100)}}
+        full = transcript["transcription"]["segments"]
+        write_transcript(transcript_file, transcript, mtime=1_700_000_000)
+
+        cache = SegmentIndexCache(Path(tmp) / "index")
+        index = cache.get(transcript_file)
+
+        # Walk the whole transcript page by page
+        walked, start = [], 0
+        while start is not None:
+            page = transcript_page(index, start, 30)
+            walked += page["transcription"]["segments"]
+            start = page["pagination"]["next_start"]
+
+        window = transcript_page(index, start_time=95.0, end_time=130.0)
+        window_page = transcript_page(index, start=10, limit=2, start_time=95.0, end_time=130.0)
+        lines = [json.loads(line) for line in b"".join(
+            stream_transcript_ndjson(index, 98, 5)).decode().splitlines()]
+
+        checks = [
+            ("paged walk", walked == full),
+            ("page envelope", page["hearing_id"] == 5 and page["pagination"]["total_segments"] == 100),
+            ("time window", [s["id"] for s in window["transcription"]["segments"]] == [9, 10, 11, 12]),
+            ("window paging", [s["id"] for s in window_page["transcription"]["segments"]] == [10, 11]
+             and window_page["pagination"]["next_start"] == 12),
+            ("ndjson header", lines[0]["type"] == "header" and lines[0]["pagination"]["count"] == 2
+             and lines[0]["pagination"]["next_start"] is None),
+            ("ndjson segments", lines[1:] == full[98:])
+        ]
+
+        # A changed file is reindexed; a fresh cache reloads the index from disk
+        transcript["transcription"]["segments"] = segments(10)
+        write_transcript(transcript_file, transcript, mtime=1_700_000_100)
+        rebuilt = cache.get(transcript_file)
+        cache.get(transcript_file)
+        reloaded = SegmentIndexCache(Path(tmp) / "index")
+        from_disk = reloaded.get(transcript_file)
+        checks += [
+            ("rebuilt on change", len(rebuilt) == 10 and cache.stats["builds"] == 2),
+            ("memory hit", cache.stats["memory_hits"] == 1),
+            ("disk reload", reloaded.stats == {"memory_hits": 0, "disk_hits": 1, "builds": 0}
+             and from_disk.read_segments(0, 10) == transcript["transcription"]["segments"])
+        ]
+
+        failed = [name for name, ok in checks if not ok]
+        assert not failed, f"Paging checks failed: {failed}"
+
+        logger.info("✅ Pages and streams match the transcript")
+
+def test_page_skips_full_load():
+    """A page from the index is much faster than loading a long transcript"""
+    with tempfile.TemporaryDirectory() as tmp:
+        transcript_file = Path(tmp) / "hearing_1_transcript.json"
+        write_transcript(transcript_file, {"hearing_id": 1,
+                                           "transcription": {"segments": segments(3000, words=40)}})
+        size_mb = transcript_file.stat().st_size / 1024 / 1024
+        cache = SegmentIndexCache(Path(tmp) / "index")
+        cache.get(transcript_file)
+
+        def full_load():
+            with open(transcript_file, 'r') as f:
+                transcript = json.load(f)
+            return transcript["transcription"]["segments"][1500:1550]
+
+        def paged():
+            return transcript_page(cache.get(transcript_file), 1500, 50)["transcription"]["segments"]
+
+        def timed(func, repeat=5):
+            func()
+            start = time.perf_counter()
+            for _ in range(repeat):
+                result = func()
+            return (time.perf_counter() - start) / repeat * 1000, result
+
+        full_ms, expected = timed(full_load)
+        page_ms, page = timed(paged)
+
+        logger.info(f"{size_mb:.0f}MB transcript, 50 segments: full load {full_ms:.1f}ms, "
+                    f"indexed page {page_ms:.1f}ms")
+        assert page == expected, "Indexed page does not match the transcript"
+        assert page_ms * 10 <= full_ms, "Indexed page should be at least ten times faster"
+
+        logger.info("✅ Pages read only their segments")
+
+def run_transcript_segment_tests():
+    """Run all transcript segment paging tests"""
+    logger.info("=" * 60)
+    logger.info("Transcript Segment Paging Test")
+    logger.info("=" * 60)
+
+    tests = [
+        ("Index Layouts", test_index_layouts),
+        ("Pages And Cache", test_pages_and_cache),
+        ("Page Skips Full Load", test_page_skips_full_load)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        logger.info(f"\n🧪 Running: {test_name}")
+        try:
+            test_func()
+            passed += 1
+            logger.info(f"✅ {test_name}: PASSED")
+        except Exception as e:
+            logger.error(f"❌ {test_name}: FAILED - {e}")
+
+    logger.info(f"\n📊 Results: {passed}/{total} tests passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = run_transcript_segment_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Test word-timestamp overlap stitching for chunked transcripts
+Simulates adjacent chunk transcripts that both cover the overlap window
+and checks that every spoken word is emitted exactly once
+"""
+
+import sys
+import logging
+from pathlib import Path
+
+from audio_chunker import AudioChunk
+from transcript_stitcher import TranscriptStitcher
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+WORD_INTERVAL = 0.5
+
+def spoken_words(count):
+    """Ground-truth word stream: (word, absolute start time)"""
+    vocabulary = ["the", "committee", "will", "come", "to", "order", "senator",
+                  "thank", "you", "chair", "witness", "testimony", "hearing", "today"]
+    return [(f"{vocabulary[i % len(vocabulary)]}{i // len(vocabulary)}", i * WORD_INTERVAL)
+            for i in range(count)]
+
+def make_chunk(index, start_time, end_time):
+    return AudioChunk(index, Path(f"chunk_{index:03d}.mp3"), start_time, end_time,
+                      end_time - start_time, 1024, 0.001)
+
+def transcribe_chunk(words, chunk, jitter=0.0, words_per_segment=8, top_level_words=False, garble=()):
+    """Chunk-relative Whisper-style result for the words audible in a chunk"""
+    audible = [(w, t) for w, t in words if chunk.start_time <= t and t + WORD_INTERVAL <= chunk.end_time]
+    word_entries = []
+    for word, start in audible:
+        text = "[inaudible]" if word in garble else word
+        relative = start - chunk.start_time + jitter
+        word_entries.append({'word': text, 'start': relative, 'end': relative + WORD_INTERVAL * 0.8})
+
+    segments = []
+    for i in range(0, len(word_entries), words_per_segment):
+        group = word_entries[i:i + words_per_segment]
+        segment = {
+            'start': group[0]['start'],
+            'end': group[-1]['end'],
+            'text': ' ' + ' '.join(w['word'] for w in group)
+        }
+        if not top_level_words:
+            segment['words'] = group
+        segments.append(segment)
+
+    result = {'segments': segments}
+    if top_level_words:
+        result['words'] = word_entries
+    return result
+
+def chunk_layout(total_duration, base_duration, overlap):
+    """Same geometry as AudioChunker._create_chunks"""
+    chunks = []
+    current_start = 0.0
+    index = 0
+    while current_start < total_duration:
+        chunk_end = min(current_start + base_duration + overlap, total_duration)
+        actual_start = current_start if index == 0 else max(0, current_start - overlap)
+        chunks.append(make_chunk(index, actual_start, chunk_end))
+        current_start += base_duration
+        index += 1
+    return chunks
+
+def emitted_words(stitched):
+    return [w['word'] for segment in stitched['segments'] for w in segment['words']]
+
+def test_each_word_once():
+    """Overlap words appear exactly once with segment-nested word timestamps"""
+    words = spoken_words(600)  # 300 seconds of speech
+    chunks = chunk_layout(300.0, 100.0, 10.0)
+    results = [transcribe_chunk(words, chunk, jitter=0.05 * (i % 2)) for i, chunk in enumerate(chunks)]
+
+    stitched = TranscriptStitcher().stitch(list(zip(chunks, results)))
+    output = emitted_words(stitched)
+    expected = [w for w, _ in words]
+
+    logger.info(f"Stitch points: {stitched['stitch_points']}")
+    assert output == expected, f"Expected {len(expected)} words, got {len(output)}"
+
+    assert not any(point['method'] != 'word_alignment' for point in stitched['stitch_points']), \
+        "Expected every boundary to be word aligned"
+
+    starts = [segment['start'] for segment in stitched['segments']]
+    assert starts == sorted(starts), "Stitched segments are not in time order"
+
+    logger.info(f"✅ {len(output)} words emitted once across {len(chunks)} chunks")
+
+def test_api_top_level_words():
+    """API responses with a top-level words list are assigned to segments and stitched"""
+    words = spoken_words(400)
+    chunks = chunk_layout(200.0, 100.0, 10.0)
+    results = [transcribe_chunk(words, chunk, top_level_words=True) for chunk in chunks]
+
+    stitcher = TranscriptStitcher()
+    assigned = stitcher.assign_words(results[0])
+    assert sum(len(group) for group in assigned) == len(results[0]['words']), \
+        "Not every top-level word was assigned to a segment"
+
+    output = emitted_words(stitcher.stitch(list(zip(chunks, results))))
+    assert output == [w for w, _ in words], "Top-level word stitching duplicated or dropped words"
+
+    logger.info("✅ Top-level API word timestamps stitched correctly")
+
+def test_garbled_chunk_edge():
+    """Alignment survives words mis-transcribed near a chunk edge"""
+    words = spoken_words(400)
+    chunks = chunk_layout(200.0, 100.0, 10.0)
+    # Chunk 0 garbles words right at its trailing edge
+    edge_words = {w for w, t in words if chunks[0].end_time - 3.0 <= t < chunks[0].end_time}
+    results = [
+        transcribe_chunk(words, chunks[0], garble=edge_words),
+        transcribe_chunk(words, chunks[1])
+    ]
+
+    stitched = TranscriptStitcher().stitch(list(zip(chunks, results)))
+    output = emitted_words(stitched)
+    assert "[inaudible]" not in output, "Garbled edge words leaked into the stitched transcript"
+    assert output == [w for w, _ in words], "Garbled edge caused duplicated or dropped words"
+
+    logger.info("✅ Cut point avoided the garbled chunk edge")
+
+def test_segment_level_fallback():
+    """Without word timestamps each overlapping segment is kept on one side only"""
+    words = spoken_words(400)
+    chunks = chunk_layout(200.0, 100.0, 10.0)
+    results = []
+    for chunk in chunks:
+        result = transcribe_chunk(words, chunk)
+        for segment in result['segments']:
+            segment.pop('words')
+        results.append(result)
+
+    stitched = TranscriptStitcher().stitch(list(zip(chunks, results)))
+    assert stitched['stitch_points'][0]['method'] == 'window_midpoint', \
+        "Expected midpoint fallback without word timestamps"
+
+    text_words = stitched['text'].split()
+    duplicates = len(text_words) - len(set(text_words))
+    assert not duplicates, f"{duplicates} duplicated words in fallback stitching"
+
+    logger.info(f"✅ Segment-level fallback kept {len(text_words)}/{len(words)} words without duplicates")
+
+def run_transcript_stitching_tests():
+    """Run all transcript stitching tests"""
+    logger.info("=" * 60)
+    logger.info("Transcript Overlap Stitching Test")
+    logger.info("=" * 60)
+
+    tests = [
+        ("Each Word Once", test_each_word_once),
+        ("API Top-Level Words", test_api_top_level_words),
+        ("Garbled Chunk Edge", test_garbled_chunk_edge),
+        ("Segment-Level Fallback", test_segment_level_fallback)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_name, test_func in tests:
+        logger.info(f"\n🧪 Running: {test_name}")
+        try:
+            test_func()
+            passed += 1
+            logger.info(f"✅ {test_name}: PASSED")
+        except Exception as e:
+            logger.error(f"❌ {test_name}: FAILED - {e}")
+
+    logger.info(f"\n📊 Results: {passed}/{total} tests passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = run_transcript_stitching_tests()
+    sys.exit(0 if success else 1)
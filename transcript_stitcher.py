@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Overlap stitching for chunked Senate hearing transcripts.
+Aligns word-level timestamps from adjacent chunks inside their shared overlap
+window, picks a cut point, and emits every word exactly once.
+"""
+
+import re
+from difflib import SequenceMatcher
+from typing import List, Dict, Any, Tuple
+
+from audio_chunker import AudioChunk
+
+class TranscriptStitcher:
+    """Stitches per-chunk Whisper results into one transcript without duplicated overlap text."""
+
+    def __init__(self, min_match_words: int = 3, match_tolerance: float = 1.5):
+        """
+        Initialize the transcript stitcher.
+
+        Args:
+            min_match_words: Shortest run of identical words accepted as an alignment
+            match_tolerance: Maximum timestamp disagreement (seconds) between aligned words
+        """
+        self.min_match_words = min_match_words
+        self.match_tolerance = match_tolerance
+
+    @staticmethod
+    def assign_words(whisper_result: Dict[str, Any]) -> List[List[Dict[str, Any]]]:
+        """
+        Word lists for each segment of a Whisper result.
+
+        The API returns words as a top-level list while local Whisper nests them
+        in each segment; both are returned here as one list per segment.
+        """
+        segments = whisper_result.get('segments', [])
+        if any(segment.get('words') for segment in segments):
+            return [list(segment.get('words') or []) for segment in segments]
+
+        words_by_segment = [[] for _ in segments]
+        if not segments:
+            return words_by_segment
+
+        segment_index = 0
+        for word in whisper_result.get('words') or []:
+            midpoint = (word.get('start', 0) + word.get('end', 0)) / 2
+            # Words and segments are both time-ordered; advance to the segment containing this word
+            while (segment_index < len(segments) - 1 and
+                   midpoint >= segments[segment_index].get('end', 0)):
+                segment_index += 1
+            words_by_segment[segment_index].append(word)
+
+        return words_by_segment
+
+    def stitch(self, chunk_results: List[Tuple[AudioChunk, Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Stitch chunk transcripts into a single transcript.
+
+        Args:
+            chunk_results: (chunk, Whisper result) pairs in chunk order; result
+                           timestamps are relative to the start of each chunk
+
+        Returns:
+            Dictionary with absolute-time segments, full text and the chosen stitch points
+        """
+        prepared = [self._prepare_chunk(chunk, result) for chunk, result in chunk_results]
+
+        # Each chunk keeps words starting within [lower, upper)
+        bounds = [[float('-inf'), float('inf')] for _ in prepared]
+        stitch_points = []
+
+        for i in range(len(prepared) - 1):
+            prev_chunk = chunk_results[i][0]
+            next_chunk = chunk_results[i + 1][0]
+
+            prev_cut, next_cut, method = self._find_cut(
+                prepared[i], prepared[i + 1], next_chunk.start_time, prev_chunk.end_time
+            )
+            bounds[i][1] = prev_cut
+            bounds[i + 1][0] = next_cut
+
+            stitch_points.append({
+                'after_chunk': prev_chunk.chunk_index,
+                'cut_time': round(next_cut, 3),
+                'method': method
+            })
+
+        segments = []
+        for chunk_segments, (lower, upper) in zip(prepared, bounds):
+            segments.extend(self._clip_segments(chunk_segments, lower, upper))
+
+        return {
+            'segments': segments,
+            'text': ' '.join(segment['text'].strip() for segment in segments if segment['text'].strip()),
+            'stitch_points': stitch_points
+        }
+
+    def _prepare_chunk(self, chunk: AudioChunk, result: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Shift a chunk's segments and words to absolute time."""
+        offset = chunk.start_time
+        prepared = []
+
+        for segment, words in zip(result.get('segments', []), self.assign_words(result)):
+            shifted = dict(segment)
+            shifted['start'] = segment.get('start', 0) + offset
+            shifted['end'] = segment.get('end', 0) + offset
+            shifted['words'] = [
+                {**word, 'start': word.get('start', 0) + offset, 'end': word.get('end', 0) + offset}
+                for word in words
+            ]
+            prepared.append(shifted)
+
+        return prepared
+
+    @staticmethod
+    def _normalize(word: str) -> str:
+        """Comparison form of a word: lowercase without punctuation."""
+        return re.sub(r"[^\w']", '', word.lower())
+
+    def _find_cut(
+        self,
+        prev_segments: List[Dict[str, Any]],
+        next_segments: List[Dict[str, Any]],
+        window_start: float,
+        window_end: float
+    ) -> Tuple[float, float, str]:
+        """
+        Choose where the previous chunk stops and the next chunk takes over.
+
+        Returns:
+            (cut for previous chunk, cut for next chunk, method) where method is
+            'word_alignment', 'window_midpoint' or 'boundary'
+        """
+        if window_end <= window_start:
+            return window_start, window_start, 'boundary'
+
+        midpoint = (window_start + window_end) / 2
+
+        prev_words = [
+            word for segment in prev_segments for word in segment['words']
+            if window_start - self.match_tolerance <= word['start'] < window_end
+        ]
+        next_words = [
+            word for segment in next_segments for word in segment['words']
+            if window_start <= word['start'] < window_end + self.match_tolerance
+        ]
+
+        if prev_words and next_words:
+            prev_tokens = [self._normalize(word.get('word', '')) for word in prev_words]
+            next_tokens = [self._normalize(word.get('word', '')) for word in next_words]
+
+            matcher = SequenceMatcher(None, prev_tokens, next_tokens, autojunk=False)
+            best = None
+            for block in matcher.get_matching_blocks():
+                if block.size < self.min_match_words:
+                    continue
+
+                # Both chunks must place the matched words at (nearly) the same time
+                drift = max(
+                    abs(prev_words[block.a + k]['start'] - next_words[block.b + k]['start'])
+                    for k in range(block.size)
+                )
+                if drift > self.match_tolerance:
+                    continue
+
+                # Cut in the middle of the run, preferring runs near the centre of the window
+                k = block.size // 2
+                cut_time = next_words[block.b + k]['start']
+                score = (block.size, -abs(cut_time - midpoint))
+                if best is None or score > best[0]:
+                    best = (score, prev_words[block.a + k]['start'], cut_time)
+
+            if best is not None:
+                return best[1], best[2], 'word_alignment'
+
+        # No reliable alignment (or no word timestamps): cut at the centre of the overlap,
+        # where both chunks have the most surrounding context
+        return midpoint, midpoint, 'window_midpoint'
+
+    def _clip_segments(self, segments: List[Dict[str, Any]], lower: float, upper: float) -> List[Dict[str, Any]]:
+        """Keep only the part of each segment whose words fall within [lower, upper)."""
+        clipped = []
+
+        for segment in segments:
+            words = segment['words']
+
+            if not words:
+                # Segment-level fallback: keep the segment on the side holding its midpoint
+                segment_midpoint = (segment['start'] + segment['end']) / 2
+                if lower <= segment_midpoint < upper:
+                    clipped.append(segment)
+                continue
+
+            kept = [word for word in words if lower <= word['start'] < upper]
+            if not kept:
+                continue
+
+            if len(kept) == len(words):
+                clipped.append(segment)
+                continue
+
+            partial = dict(segment)
+            partial['start'] = kept[0]['start']
+            partial['end'] = kept[-1]['end']
+            partial['words'] = kept
+            partial['text'] = ' '.join(word.get('word', '').strip() for word in kept)
+            clipped.append(partial)
+
+        return clipped
@@ -5,6 +5,7 @@ Supports both small files and chunked processing for large files.
 """
 
 import os
+import sys
 import json
 import sqlite3
 import requests
@@ -16,6 +17,12 @@ import time
 
 from audio_analyzer import AudioAnalyzer
 from audio_chunker import AudioChunker, ChunkingResult, AudioChunk
+from transcript_stitcher import TranscriptStitcher
+
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+from transcription.result_cache import get_transcription_cache
+from api.search_index import index_transcript
+from api.transcript_catalog import catalog_transcript
 
 class EnhancedTranscriptionService:
     """Enhanced service for handling audio transcription with chunking support."""
@@ -29,6 +36,7 @@ class EnhancedTranscriptionService:
         # Initialize components
         self.analyzer = AudioAnalyzer()
         self.chunker = AudioChunker()
+        self.stitcher = TranscriptStitcher()
         
         # Get OpenAI API key from keyring
         self.api_key = self._get_openai_key()
@@ -37,6 +45,10 @@ class EnhancedTranscriptionService:
         self.max_retries = 3
         self.retry_delay = 2.0  # seconds
         self.api_delay = 1.0  # delay between API calls to avoid rate limits
+        self.model = 'whisper-1'
+        
+        # Results keyed by audio content so re-transcription skips the API
+        self.result_cache = get_transcription_cache()
         
     def _get_openai_key(self):
         """Get OpenAI API key from keyring storage."""
@@ -117,7 +129,7 @@ class EnhancedTranscriptionService:
                 progress_callback("chunking", 10, f"Created {len(chunking_result.chunks)} chunks successfully")
             
             # Process each chunk
-            all_segments = []
+            chunk_results = []
             total_chunks = len(chunking_result.chunks)
             base_progress = 10
             chunk_progress_range = 80  # 10% to 90% for chunk processing
@@ -133,10 +145,7 @@ class EnhancedTranscriptionService:
                 # Transcribe chunk with retries
                 chunk_segments = self._transcribe_chunk_with_retries(chunk, hearing_info, i)
                 
-                # Adjust timestamps for chunk position in original audio
-                adjusted_segments = self._adjust_chunk_timestamps(chunk_segments, chunk)
-                
-                all_segments.extend(adjusted_segments)
+                chunk_results.append((chunk, {'segments': chunk_segments}))
                 
                 if progress_callback:
                     progress_callback("processing", chunk_end_progress, 
@@ -149,8 +158,8 @@ class EnhancedTranscriptionService:
             if progress_callback:
                 progress_callback("merging", 90, "Merging chunk transcripts...")
             
-            # Merge segments and handle overlaps
-            merged_segments = self._merge_overlapping_segments(all_segments)
+            # Stitch chunk transcripts at word-aligned cut points in each overlap
+            merged_segments = self._stitch_chunk_segments(chunk_results)
             
             # Create final transcript
             full_text = " ".join([segment['text'].strip() for segment in merged_segments])
@@ -204,35 +213,15 @@ class EnhancedTranscriptionService:
     def _transcribe_single_chunk(self, chunk: AudioChunk, hearing_info: Dict, chunk_index: int) -> List[Dict]:
         """Transcribe a single audio chunk using OpenAI Whisper API."""
         
-        url = "https://api.openai.com/v1/audio/transcriptions"
-        
-        headers = {
-            "Authorization": f"Bearer {self.api_key}"
-        }
+        # Add prompt for better transcription
+        prompt = f"This is chunk {chunk_index + 1} of a US Senate hearing: {hearing_info.get('hearing_title', 'Senate Hearing')}"
         
-        # Prepare audio file for upload
-        with open(chunk.file_path, 'rb') as f:
-            files = {
-                'file': (chunk.file_path.name, f, 'audio/mpeg'),
-                'model': (None, 'whisper-1'),
-                'response_format': (None, 'verbose_json'),
-                'timestamp_granularities[]': (None, 'segment')
-            }
-            
-            # Add prompt for better transcription
-            prompt = f"This is chunk {chunk_index + 1} of a US Senate hearing: {hearing_info.get('hearing_title', 'Senate Hearing')}"
-            files['prompt'] = (None, prompt)
-            
-            response = requests.post(url, headers=headers, files=files, timeout=300)  # 5 minute timeout
+        whisper_result = self._request_whisper(chunk.file_path, prompt)
         
-        if response.status_code != 200:
-            raise Exception(f"Whisper API error: {response.status_code} - {response.text}")
-        
-        whisper_result = response.json()
-        
-        # Convert segments to our format
+        # Convert segments to our format, keeping word timestamps for overlap stitching
         segments = []
-        for segment in whisper_result.get('segments', []):
+        words_by_segment = self.stitcher.assign_words(whisper_result)
+        for segment, words in zip(whisper_result.get('segments', []), words_by_segment):
             segments.append({
                 'start': segment.get('start', 0),
                 'end': segment.get('end', 0),
@@ -240,6 +229,7 @@ class EnhancedTranscriptionService:
                 'speaker': 'Unknown',  # Default speaker
                 'confidence': 1.0,
                 'chunk_index': chunk_index,
+                'words': words,
                 'review_metadata': {
                     'needs_review': False,
                     'has_correction': False,
@@ -251,44 +241,52 @@ class EnhancedTranscriptionService:
         print(f"✅ Chunk {chunk_index}: {len(segments)} segments, {whisper_result.get('duration', 0):.1f}s")
         return segments
     
-    def _adjust_chunk_timestamps(self, segments: List[Dict], chunk: AudioChunk) -> List[Dict]:
-        """Adjust segment timestamps to reflect position in original audio."""
+    def _request_whisper(self, audio_file: Path, prompt: str) -> Dict[str, Any]:
+        """Transcribe a file with the Whisper API, reusing a cached result for identical audio."""
         
-        adjusted_segments = []
+        cache_key = self.result_cache.make_key(audio_file, self.model, prompt)
+        cached_result = self.result_cache.get(cache_key)
+        if cached_result is not None:
+            print(f"♻️  Using cached transcription for {audio_file.name}")
+            return cached_result
         
-        for segment in segments:
-            # Adjust timestamps by adding chunk start time
-            adjusted_segment = segment.copy()
-            adjusted_segment['start'] = segment['start'] + chunk.start_time
-            adjusted_segment['end'] = segment['end'] + chunk.start_time
+        url = "https://api.openai.com/v1/audio/transcriptions"
+        
+        headers = {
+            "Authorization": f"Bearer {self.api_key}"
+        }
+        
+        # Prepare audio file for upload (list form so both timestamp granularities are sent)
+        with open(audio_file, 'rb') as f:
+            files = [
+                ('file', (audio_file.name, f, 'audio/mpeg')),
+                ('model', (None, self.model)),
+                ('response_format', (None, 'verbose_json')),
+                ('timestamp_granularities[]', (None, 'segment')),
+                ('timestamp_granularities[]', (None, 'word')),  # Word timestamps for overlap stitching
+                ('prompt', (None, prompt))
+            ]
             
-            adjusted_segments.append(adjusted_segment)
+            response = requests.post(url, headers=headers, files=files, timeout=300)  # 5 minute timeout
         
-        return adjusted_segments
-    
-    def _merge_overlapping_segments(self, all_segments: List[Dict]) -> List[Dict]:
-        """Merge overlapping segments from different chunks."""
+        if response.status_code != 200:
+            raise Exception(f"Whisper API error: {response.status_code} - {response.text}")
         
-        if not all_segments:
-            return []
+        whisper_result = response.json()
+        self.result_cache.put(cache_key, whisper_result)
         
-        # Sort segments by start time
-        sorted_segments = sorted(all_segments, key=lambda x: x['start'])
+        return whisper_result
+    
+    def _stitch_chunk_segments(self, chunk_results: List[tuple]) -> List[Dict]:
+        """Stitch chunk-relative segments into one timeline with each overlap word kept once."""
         
-        merged_segments = []
-        overlap_threshold = 25.0  # 25 seconds (less than 30s overlap to account for processing differences)
+        stitched = self.stitcher.stitch(chunk_results)
         
-        for segment in sorted_segments:
-            # Check if this segment overlaps with the last merged segment
-            if (merged_segments and 
-                segment['start'] < merged_segments[-1]['end'] and
-                segment['start'] > merged_segments[-1]['end'] - overlap_threshold):
-                
-                # This is likely an overlapping segment, skip it
-                # (keep the earlier segment which is likely more complete)
-                continue
-            
-            merged_segments.append(segment)
+        for point in stitched['stitch_points']:
+            print(f"🧵 Chunk {point['after_chunk']} -> {point['after_chunk'] + 1}: "
+                  f"cut at {point['cut_time']:.2f}s ({point['method']})")
+        
+        merged_segments = stitched['segments']
         
         # Renumber segments
         for i, segment in enumerate(merged_segments):
@@ -302,34 +300,13 @@ class EnhancedTranscriptionService:
         if progress_callback:
             progress_callback("processing", 20, "Processing audio with Whisper API...")
         
-        url = "https://api.openai.com/v1/audio/transcriptions"
+        # Add prompt for better transcription
+        prompt = f"This is a transcript of a US Senate hearing: {hearing_info.get('hearing_title', 'Senate Hearing')}"
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}"
-        }
-        
-        # Prepare audio file for upload
-        with open(audio_file, 'rb') as f:
-            files = {
-                'file': (audio_file.name, f, 'audio/mpeg'),
-                'model': (None, 'whisper-1'),
-                'response_format': (None, 'verbose_json'),
-                'timestamp_granularities[]': (None, 'segment')
-            }
-            
-            # Add prompt for better transcription
-            prompt = f"This is a transcript of a US Senate hearing: {hearing_info.get('hearing_title', 'Senate Hearing')}"
-            files['prompt'] = (None, prompt)
-            
-            if progress_callback:
-                progress_callback("processing", 50, "Sending to OpenAI Whisper API...")
-            
-            response = requests.post(url, headers=headers, files=files, timeout=300)
-        
-        if response.status_code != 200:
-            raise Exception(f"Whisper API error: {response.status_code} - {response.text}")
+        if progress_callback:
+            progress_callback("processing", 50, "Sending to OpenAI Whisper API...")
         
-        whisper_result = response.json()
+        whisper_result = self._request_whisper(audio_file, prompt)
         
         if progress_callback:
             progress_callback("processing", 80, "Processing Whisper API response...")
@@ -431,6 +408,18 @@ class EnhancedTranscriptionService:
             WHERE id = ?
         ''', (full_text, hearing_id))
         
+        # Make the transcript segments searchable
+        try:
+            index_transcript(conn, hearing_id, transcript_data)
+        except sqlite3.Error as e:
+            print(f"⚠️ Could not index transcript for search: {e}")
+        
+        # List the transcript without rereading the file
+        try:
+            catalog_transcript(conn, self.output_dir / f'hearing_{hearing_id}_transcript.json', transcript_data)
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️ Could not catalog transcript: {e}")
+        
         conn.commit()
         conn.close()
 